@@ -0,0 +1,58 @@
+"""벤치마크 실행
+
+python -m benchmarks                                   # 전체 실행
+python -m benchmarks -k tokens --output result.json   # 이름에 tokens 가 포함된 벤치마크만 실행 후 저장
+python -m benchmarks --baseline baseline.json         # baseline 대비 tolerance 이상 느려지면 exit code 1
+"""
+import argparse
+import sys
+
+from benchmarks import bench_tokens, bench_repository, bench_login, bench_projection, bench_metrics  # noqa: F401
+from benchmarks import bench_stream, bench_envelope, bench_groups, bench_bulk, bench_health  # noqa: F401
+from benchmarks import bench_unit_of_work, bench_imports, bench_shared_state, bench_tenants, bench_limiter, bench_verifier  # noqa: F401
+from benchmarks.suite import BENCHMARKS, run_sync, save, load, compare, regressions
+
+
+def print_result(result):
+    throughput = f"  {result.mb_per_sec:>10,.1f} MB/s" if result.mb_per_sec is not None else ""
+    print(f"{result.name:<48} {result.ops_per_sec:>14,.1f} ops/s{throughput}", flush=True)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="paip auth 벤치마크")
+    parser.add_argument("-k", "--filter", action="append", default=[], help="이름에 포함된 벤치마크만 실행")
+    parser.add_argument("--list", action="store_true", help="벤치마크 목록 출력")
+    parser.add_argument("--rounds", type=int, default=3, help="반복 측정 횟수 (중앙값 사용)")
+    parser.add_argument("--scale", type=float, default=1.0, help="반복 횟수 배율 (빠른 확인은 0.1)")
+    parser.add_argument("--output", help="결과를 저장할 json 경로")
+    parser.add_argument("--baseline", help="비교할 baseline json 경로")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="허용하는 성능 저하 비율")
+    args = parser.parse_args(argv)
+
+    names = [name for name in BENCHMARKS if not args.filter or any(f in name for f in args.filter)]
+    if args.list:
+        print("\n".join(names))
+        return 0
+
+    results = run_sync(names, rounds=args.rounds, scale=args.scale, report=print_result)
+    if args.output:
+        save(results, args.output)
+
+    if not args.baseline:
+        return 0
+
+    comparisons = compare(results, load(args.baseline))
+    print()
+    for comparison in comparisons:
+        print(f"{comparison.name:<48} {comparison.baseline:>14,.1f} -> {comparison.current:>14,.1f} "
+              f"({comparison.change:+.1%})")
+    if slower := regressions(comparisons, args.tolerance):
+        print(f"\n{len(slower)}개의 벤치마크가 baseline 보다 {args.tolerance:.0%} 이상 느려졌습니다.")
+        for comparison in slower:
+            print(f"  - {comparison.name}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""사용자 대량 import/export 벤치마크"""
+import csv
+import os
+from itertools import count
+
+from src.users.bulk import UserExporter, UserImporter
+from src.users.password import DEFAULT_ITERATIONS
+from src.users.repository import UserRepository
+
+from benchmarks.suite import benchmark, BenchContext, PASSWORD, seeded_user
+
+IMPORT_ROWS = 1000
+# 비밀번호 hash 가 대부분의 시간을 차지하는 것을 확인하기 위해 운영과 같은 반복 횟수도 측정합니다.
+FAST_ITERATIONS = 1000
+
+
+def _write_users(fpath: str, start: int, rows: int) -> None:
+    with open(fpath, "w", newline="") as f:
+        writer = csv.DictWriter(f, ["account_id", "name", "role", "group", "email", "password"])
+        writer.writeheader()
+        for i in range(start, start + rows):
+            user = seeded_user(i)
+            writer.writerow({"account_id": user.account_id, "name": user.name, "role": user.role.value,
+                             "group": user.group, "email": user.email, "password": PASSWORD})
+
+
+async def _import_factory(ctx: BenchContext, rows: int, iterations: int):
+    repository = UserRepository(await ctx.session_manager())
+    importer = UserImporter(repository, chunk_size=1000, iterations=iterations)
+    batches = count()
+
+    async def import_users():
+        # 매번 새로운 account_id 로 파일을 만들어 import 합니다.
+        fpath = os.path.join(ctx.workdir, "users.csv")
+        _write_users(fpath, next(batches) * rows, rows)
+        await importer.run(fpath)
+    return import_users
+
+
+@benchmark(f"bulk.import_{IMPORT_ROWS}_rows_fast_hash", iterations=3)
+async def bench_import_fast_hash(ctx: BenchContext):
+    return await _import_factory(ctx, IMPORT_ROWS, FAST_ITERATIONS)
+
+
+@benchmark("bulk.import_10_rows_default_hash", iterations=1)
+async def bench_import_default_hash(ctx: BenchContext):
+    return await _import_factory(ctx, 10, DEFAULT_ITERATIONS)
+
+
+@benchmark("bulk.export_1000_rows", iterations=10)
+async def bench_export(ctx: BenchContext):
+    exporter = UserExporter(await ctx.user_repository(), chunk_size=200)
+    fpath = os.path.join(ctx.workdir, "users.jsonl")
+    return lambda: exporter.run(fpath)
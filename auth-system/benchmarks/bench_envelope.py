@@ -0,0 +1,65 @@
+"""Envelope 암호화 처리량"""
+import io
+
+from Crypto.PublicKey import RSA
+
+from src.tokens.envelope import EnvelopeEncryptor, EnvelopeDecryptor
+
+from benchmarks.suite import benchmark, BenchContext
+
+FIELD = "pai-cm@publicai.co.kr".encode("utf-8")
+STREAM_SIZE = 64 * 1024 * 1024
+
+
+def _keys(ctx: BenchContext):
+    private_key = RSA.import_key(ctx.private_pem())
+    return private_key, private_key.public_key()
+
+
+@benchmark("envelope.encrypt_field", iterations=5000)
+def bench_encrypt_field(ctx: BenchContext):
+    _, public_key = _keys(ctx)
+    encryptor = EnvelopeEncryptor(public_key)
+    return lambda: encryptor.encrypt(FIELD)
+
+
+@benchmark("envelope.decrypt_field_cached", iterations=5000)
+def bench_decrypt_field_cached(ctx: BenchContext):
+    private_key, public_key = _keys(ctx)
+    blob = EnvelopeEncryptor(public_key).encrypt(FIELD)
+    decryptor = EnvelopeDecryptor(private_key)
+    return lambda: decryptor.decrypt(blob)
+
+
+@benchmark("envelope.decrypt_field_uncached", iterations=100)
+def bench_decrypt_field_uncached(ctx: BenchContext):
+    private_key, public_key = _keys(ctx)
+    blob = EnvelopeEncryptor(public_key).encrypt(FIELD)
+    decryptor = EnvelopeDecryptor(private_key, cache_size=0)
+    return lambda: decryptor.decrypt(blob)
+
+
+@benchmark("envelope.encrypt_stream", iterations=3, bytes_per_op=STREAM_SIZE)
+def bench_encrypt_stream(ctx: BenchContext):
+    _, public_key = _keys(ctx)
+    encryptor = EnvelopeEncryptor(public_key)
+    fpath = ctx.data_file(STREAM_SIZE)
+
+    def encrypt():
+        with open(fpath, "rb") as src:
+            encryptor.encrypt_stream(src, io.BytesIO())
+    return encrypt
+
+
+@benchmark("envelope.decrypt_stream", iterations=3, bytes_per_op=STREAM_SIZE)
+def bench_decrypt_stream(ctx: BenchContext):
+    private_key, public_key = _keys(ctx)
+    encrypted = io.BytesIO()
+    with open(ctx.data_file(STREAM_SIZE), "rb") as src:
+        EnvelopeEncryptor(public_key).encrypt_stream(src, encrypted)
+    decryptor = EnvelopeDecryptor(private_key)
+
+    def decrypt():
+        encrypted.seek(0)
+        decryptor.decrypt_stream(encrypted, io.BytesIO())
+    return decrypt
@@ -0,0 +1,97 @@
+"""그룹 소속 확인 벤치마크 (사용자 100k 명, 깊은 그룹 트리)"""
+from typing import List, Tuple
+
+from src.domain import Group, GroupMembership
+from src.groups.directory import GroupDirectory
+from src.groups.index import GroupIndex
+from src.groups.repository import GroupRepository, MembershipRepository
+
+from benchmarks.suite import benchmark, BenchContext
+
+GROUP_USER_COUNT = 100_000
+# fanout 4, depth 8 트리(21845 그룹) + depth 200 의 일자 그룹
+TREE_FANOUT = 4
+TREE_DEPTH = 8
+CHAIN_DEPTH = 200
+MEMBERSHIPS_PER_USER = 3
+
+
+def group_hierarchy() -> List[Group]:
+    groups = [Group("g", "root")]
+    level = ["g"]
+    for _ in range(TREE_DEPTH - 1):
+        next_level = []
+        for parent_id in level:
+            for i in range(TREE_FANOUT):
+                group_id = f"{parent_id}.{i}"
+                groups.append(Group(group_id, group_id, parent_id))
+                next_level.append(group_id)
+        level = next_level
+    parent_id = None
+    for i in range(CHAIN_DEPTH):
+        groups.append(Group(f"chain-{i}", f"chain-{i}", parent_id))
+        parent_id = f"chain-{i}"
+    return groups
+
+
+def group_memberships(ctx: BenchContext, groups: List[Group]) -> List[GroupMembership]:
+    group_ids = [group.group_id for group in groups]
+    return [
+        GroupMembership(f"user-{i:06d}", ctx.rng.choice(group_ids))
+        for i in range(GROUP_USER_COUNT) for _ in range(MEMBERSHIPS_PER_USER)
+    ]
+
+
+def _index(ctx: BenchContext) -> Tuple[GroupIndex, List[Group]]:
+    groups = group_hierarchy()
+    return GroupIndex.build(groups, group_memberships(ctx, groups)), groups
+
+
+@benchmark("groups.build_index_100k", iterations=1)
+def bench_build_index(ctx: BenchContext):
+    groups = group_hierarchy()
+    memberships = group_memberships(ctx, groups)
+    return lambda: GroupIndex.build(groups, memberships)
+
+
+@benchmark("groups.is_member_100k", iterations=100000)
+def bench_is_member(ctx: BenchContext):
+    index, groups = _index(ctx)
+    group_ids = [group.group_id for group in groups]
+    return lambda: index.is_member(ctx.random_account_id(GROUP_USER_COUNT), ctx.rng.choice(group_ids))
+
+
+@benchmark("groups.add_remove_membership_deep", iterations=10000)
+def bench_add_remove_membership(ctx: BenchContext):
+    index, _ = _index(ctx)
+    membership = GroupMembership(ctx.random_account_id(GROUP_USER_COUNT), f"chain-{CHAIN_DEPTH - 1}")
+
+    def add_remove():
+        index.add_membership(membership)
+        index.remove_membership(membership)
+    return add_remove
+
+
+@benchmark("groups.move_subtree", iterations=100)
+def bench_move_subtree(ctx: BenchContext):
+    # 1365 개 그룹을 가진 하위 트리를 두 상위 그룹 사이에서 옮깁니다.
+    index, _ = _index(ctx)
+    subtree = [Group("g.0.0", "g.0.0", "g.1"), Group("g.0.0", "g.0.0", "g.0")]
+    state = {"i": 0}
+
+    def move():
+        state["i"] ^= 1
+        index.put_group(subtree[state["i"]])
+    return move
+
+
+@benchmark("groups.load_directory_100k", iterations=1)
+async def bench_load_directory(ctx: BenchContext):
+    session_manager = await ctx.session_manager()
+    groups = group_hierarchy()
+    directory = GroupDirectory(GroupRepository(session_manager), MembershipRepository(session_manager))
+    await directory.group_repository.create_many(groups)
+    await directory.membership_repository.create_many(list({
+        (m.account_id, m.group_id): m for m in group_memberships(ctx, groups)
+    }.values()))
+    return directory.load
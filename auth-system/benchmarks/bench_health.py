@@ -0,0 +1,28 @@
+"""readiness probe, warmup 벤치마크"""
+from src.health import HealthChecker
+from src.users.repository import UserRepository
+from src.warmup import warmup
+
+from benchmarks.suite import benchmark, BenchContext
+
+
+@benchmark("health.readiness_cached", iterations=10000)
+async def bench_readiness_cached(ctx: BenchContext):
+    health_checker = HealthChecker(await ctx.session_manager(), ttl=60)
+    health_checker.mark_warmed_up()
+    return health_checker.readiness
+
+
+@benchmark("health.readiness_uncached", iterations=1000)
+async def bench_readiness_uncached(ctx: BenchContext):
+    health_checker = HealthChecker(await ctx.session_manager(), ttl=0)
+    health_checker.mark_warmed_up()
+    return health_checker.readiness
+
+
+@benchmark("warmup.full", iterations=20)
+async def bench_warmup(ctx: BenchContext):
+    session_manager = await ctx.session_manager()
+    token_manager = ctx.token_manager()
+    repositories = [UserRepository(session_manager)]
+    return lambda: warmup(session_manager, 1, token_manager, repositories)
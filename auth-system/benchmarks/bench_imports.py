@@ -0,0 +1,65 @@
+"""import 시간 (cold start) 벤치마크
+
+CLI, sidecar 처럼 짧게 실행되는 프로세스는 실행 시간 대부분이 import 입니다.
+벤치마크 프로세스는 이미 모든 모듈을 불러온 상태이기 때문에, 새 interpreter 에서 `python -X importtime` 으로 측정합니다.
+
+- ops/s: interpreter 시작 + import 한 번 (cold start) 처리량
+- 예산: -X importtime 의 누적 import 시간이 IMPORT_BUDGETS 를 넘으면 측정 전에 ImportBudgetExceeded 가 발생합니다.
+  (무거운 모듈이 다시 top-level import 되면 실패합니다.)
+"""
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict
+
+from benchmarks.suite import benchmark, BenchContext
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 모듈별 누적 import 시간 예산(초)
+IMPORT_BUDGETS: Dict[str, float] = {
+    # PyJWT, cryptography, PyCryptodome, pydantic-settings 없이 불러와야 합니다.
+    "src.tokens.manager": 0.15,
+    # --help 나 인자 오류는 SQLAlchemy 없이 끝나야 합니다.
+    "src.users.cli": 0.3,
+    # SQLAlchemy (orm, asyncio) 는 entity 선언에 필요하지만 pydantic-settings, dialect 모듈은 필요 없습니다.
+    "src.abstracts.database.repository": 1.0,
+}
+
+
+class ImportBudgetExceeded(Exception):
+    """import 시간이 예산을 넘었을 때"""
+
+
+def import_time(module: str) -> float:
+    """새 interpreter 에서 module 을 import 하는 데 걸린 누적 시간(초)을 -X importtime 으로 측정합니다."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_DIR, capture_output=True, text=True, check=True,
+    )
+    # import time: self [us] | cumulative | imported package
+    for line in completed.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative) / 1_000_000
+    raise ValueError(f"-X importtime 결과에 {module} 이 없습니다.")
+
+
+def check_budget(module: str, samples: int = 3) -> float:
+    """samples 번 측정한 중앙값이 예산을 넘으면 ImportBudgetExceeded 가 발생합니다."""
+    elapsed = statistics.median(import_time(module) for _ in range(samples))
+    if elapsed > IMPORT_BUDGETS[module]:
+        raise ImportBudgetExceeded(f"{module} import 에 {elapsed:.3f}초가 걸렸습니다. (예산 {IMPORT_BUDGETS[module]}초)")
+    return elapsed
+
+
+def _register(module: str) -> None:
+    @benchmark(f"imports.{module}", iterations=5)
+    def bench_import(ctx: BenchContext):
+        check_budget(module)
+        return lambda: import_time(module)
+
+
+for _module in IMPORT_BUDGETS:
+    _register(_module)
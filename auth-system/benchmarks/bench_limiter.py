@@ -0,0 +1,74 @@
+"""AdaptiveLimiter 벤치마크: DB 가 느려졌을 때 대기열이 쌓이는 것과 바로 거절하는 것 비교
+
+connection 2개짜리 pool(semaphore) 에서 connection 을 SLOW_QUERY 초씩 잡는 요청을 BURST 개 동시에 보냅니다.
+- limiter.burst_unlimited: 모든 요청이 pool 앞에서 기다립니다.
+- limiter.burst_limited: limit 을 넘은 요청은 바로 OverloadedException 으로 거절합니다.
+ops/s 는 burst 처리량이고, 끝나면 성공한 요청의 지연 시간(p50, p99)과 거절 비율을 stderr 로 출력합니다.
+"""
+import asyncio
+import statistics
+import sys
+import time
+from typing import List, Optional
+
+from src.exceptions import OverloadedException
+from src.limiter import AdaptiveLimiter
+
+from benchmarks.suite import benchmark, BenchContext
+
+POOL_SIZE = 2
+SLOW_QUERY = 0.002
+BURST = 50
+TARGET_LATENCY = 0.01
+
+
+def _burst(ctx: BenchContext, name: str, limiter: Optional[AdaptiveLimiter]):
+    pool = asyncio.Semaphore(POOL_SIZE)
+    latencies: List[float] = []
+    rejected = [0]
+
+    async def request():
+        started = time.perf_counter()
+        try:
+            if limiter is None:
+                async with pool:
+                    await asyncio.sleep(SLOW_QUERY)
+            else:
+                async with limiter.acquire():
+                    async with pool:
+                        await asyncio.sleep(SLOW_QUERY)
+        except OverloadedException:
+            rejected[0] += 1
+            return
+        latencies.append(time.perf_counter() - started)
+
+    async def report():
+        quantiles = statistics.quantiles(latencies, n=100)
+        total = len(latencies) + rejected[0]
+        print(f"{name}: 성공 p50 {quantiles[49] * 1000:.1f} ms, p99 {quantiles[98] * 1000:.1f} ms, "
+              f"거절 {rejected[0] / total:.0%}", file=sys.stderr)
+    ctx.add_cleanup(report)
+
+    async def burst():
+        await asyncio.gather(*(request() for _ in range(BURST)))
+    return burst
+
+
+@benchmark("limiter.burst_unlimited", iterations=20)
+def bench_burst_unlimited(ctx: BenchContext):
+    return _burst(ctx, "limiter.burst_unlimited", None)
+
+
+@benchmark("limiter.burst_limited", iterations=20)
+def bench_burst_limited(ctx: BenchContext):
+    return _burst(ctx, "limiter.burst_limited", AdaptiveLimiter("bench", TARGET_LATENCY, initial_limit=POOL_SIZE * 2))
+
+
+@benchmark("limiter.acquire", iterations=100_000)
+def bench_acquire(ctx: BenchContext):
+    limiter = AdaptiveLimiter("bench", target_latency=1.0)
+
+    async def acquire():
+        async with limiter.acquire():
+            pass
+    return acquire
@@ -0,0 +1,50 @@
+"""LoginManager sign_up, login, refresh 벤치마크"""
+import itertools
+
+from src.audit.logger import AuditLogger
+from src.audit.repository import AuditRepository
+from src.domain import LoginRequest
+from src.sessions.registry import SessionRegistry
+from src.sessions.repository import SessionRepository
+
+from benchmarks.suite import benchmark, BenchContext, seeded_user, USER_COUNT, PASSWORD
+
+
+@benchmark("login.sign_up", iterations=100)
+async def bench_sign_up(ctx: BenchContext):
+    login_manager = await ctx.login_manager()
+    counter = itertools.count(USER_COUNT)
+    return lambda: login_manager.sign_up(seeded_user(next(counter)), PASSWORD)
+
+
+@benchmark("login.login", iterations=100)
+async def bench_login(ctx: BenchContext):
+    login_manager = await ctx.login_manager()
+    return lambda: login_manager.login(LoginRequest(ctx.random_account_id(), PASSWORD))
+
+
+@benchmark("login.refresh", iterations=50)
+async def bench_refresh(ctx: BenchContext):
+    login_manager = await ctx.login_manager()
+    token = await login_manager.login(LoginRequest(ctx.random_account_id(), PASSWORD))
+    return lambda: login_manager.refresh(token.refresh)
+
+
+@benchmark("login.login_with_session_registry", iterations=100)
+async def bench_login_with_session_registry(ctx: BenchContext):
+    login_manager = await ctx.login_manager()
+    registry = SessionRegistry(SessionRepository(await ctx.session_manager()))
+    await registry.start()
+    ctx.add_cleanup(registry.stop)
+    login_manager.session_registry = registry
+    return lambda: login_manager.login(LoginRequest(ctx.random_account_id(), PASSWORD))
+
+
+@benchmark("login.login_with_audit_logger", iterations=100)
+async def bench_login_with_audit_logger(ctx: BenchContext):
+    login_manager = await ctx.login_manager()
+    audit_logger = AuditLogger(AuditRepository(await ctx.session_manager()))
+    await audit_logger.start()
+    ctx.add_cleanup(audit_logger.stop)
+    login_manager.audit_logger = audit_logger
+    return lambda: login_manager.login(LoginRequest(ctx.random_account_id(), PASSWORD))
@@ -0,0 +1,25 @@
+"""metric 기록 비용 벤치마크
+
+tokens.verify_access_token 등 hot path 의 ops/s 와 비교하면 instrumentation 비용을 확인할 수 있습니다.
+"""
+import time
+
+from src.metrics import Registry
+
+from benchmarks.suite import benchmark, BenchContext
+
+
+@benchmark("metrics.counter_inc", iterations=100_000)
+def bench_counter_inc(ctx: BenchContext):
+    counter = Registry().counter("bench_counter", "benchmark", ["operation", "outcome"])
+    return lambda: counter.labels("login", "success").inc()
+
+
+@benchmark("metrics.histogram_observe", iterations=100_000)
+def bench_histogram_observe(ctx: BenchContext):
+    histogram = Registry().histogram("bench_seconds", "benchmark", ["operation"])
+
+    def observe():
+        started = time.perf_counter()
+        histogram.labels("verify_access").observe(time.perf_counter() - started)
+    return observe
@@ -0,0 +1,45 @@
+"""full entity 조회와 projection 조회 비교"""
+from benchmarks.suite import benchmark, BenchContext
+
+
+@benchmark("projection.find_by_full_entity", iterations=1000)
+async def bench_find_by_full_entity(ctx: BenchContext):
+    repository = await ctx.user_repository()
+
+    async def full_entity():
+        users = await repository.find_by(account_id=ctx.random_account_id())
+        return users[0].to_user_auth()
+    return full_entity
+
+
+@benchmark("projection.find_user_auth", iterations=1000)
+async def bench_find_user_auth(ctx: BenchContext):
+    repository = await ctx.user_repository()
+    return lambda: repository.find_user_auth(ctx.random_account_id())
+
+
+@benchmark("projection.count_by_find_by_len", iterations=20)
+async def bench_count_by_find_by_len(ctx: BenchContext):
+    repository = await ctx.user_repository()
+
+    async def count_members():
+        return len(await repository.find_by(user_role="MEMBER"))
+    return count_members
+
+
+@benchmark("projection.count", iterations=1000)
+async def bench_count(ctx: BenchContext):
+    repository = await ctx.user_repository()
+    return lambda: repository.count(user_role="MEMBER")
+
+
+@benchmark("projection.count_by_role", iterations=500)
+async def bench_count_by_role(ctx: BenchContext):
+    repository = await ctx.user_repository()
+    return repository.count_by_role
+
+
+@benchmark("projection.exists", iterations=1000)
+async def bench_exists(ctx: BenchContext):
+    repository = await ctx.user_repository()
+    return lambda: repository.exists(account_id=ctx.random_account_id())
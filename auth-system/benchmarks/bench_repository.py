@@ -0,0 +1,99 @@
+"""BaseRepository CRUD 벤치마크 (UserRepository, in-memory sqlite)"""
+import itertools
+
+from benchmarks.suite import benchmark, BenchContext, seeded_user, PASSWORD, USER_COUNT
+from src.exceptions import DBIntegrityException, NotFoundException
+
+
+@benchmark("repository.create", iterations=500)
+async def bench_create(ctx: BenchContext):
+    repository = await ctx.user_repository()
+    counter = itertools.count(USER_COUNT)
+    return lambda: repository.create(seeded_user(next(counter)))
+
+
+@benchmark("repository.create_user_duplicate", iterations=500)
+async def bench_create_user_duplicate(ctx: BenchContext):
+    """이미 있는 아이디 저장 (IntegrityError + rollback)"""
+    repository = await ctx.user_repository()
+
+    async def create_duplicate():
+        try:
+            await repository.create_user(seeded_user(ctx.rng.randrange(USER_COUNT)), PASSWORD)
+        except DBIntegrityException:
+            pass
+    return create_duplicate
+
+
+@benchmark("repository.create_if_absent_duplicate", iterations=500)
+async def bench_create_if_absent_duplicate(ctx: BenchContext):
+    """이미 있는 아이디 저장 (ON CONFLICT DO NOTHING)"""
+    repository = await ctx.user_repository()
+    return lambda: repository.create_if_absent(seeded_user(ctx.rng.randrange(USER_COUNT)), password=PASSWORD)
+
+
+@benchmark("repository.get_by_id", iterations=1000)
+async def bench_get_by_id(ctx: BenchContext):
+    repository = await ctx.user_repository()
+    return lambda: repository.get_by_id(ctx.random_account_id())
+
+
+@benchmark("repository.get_by_id_not_found", iterations=1000)
+async def bench_get_by_id_not_found(ctx: BenchContext):
+    """없는 아이디 조회 (NotFoundException 경로, 로그인 실패 폭주 상황)"""
+    repository = await ctx.user_repository()
+
+    async def get_missing():
+        try:
+            await repository.get_by_id(f"missing-{ctx.rng.randrange(USER_COUNT)}")
+        except NotFoundException:
+            pass
+    return get_missing
+
+
+@benchmark("repository.find_by", iterations=1000)
+async def bench_find_by(ctx: BenchContext):
+    repository = await ctx.user_repository()
+    return lambda: repository.find_by(account_id=ctx.random_account_id())
+
+
+@benchmark("repository.find_by_in", iterations=1000)
+async def bench_find_by_in(ctx: BenchContext):
+    repository = await ctx.user_repository()
+    return lambda: repository.find_by(account_id__in=[ctx.random_account_id() for _ in range(10)])
+
+
+@benchmark("repository.find_by_prefix", iterations=1000)
+async def bench_find_by_prefix(ctx: BenchContext):
+    """account_id 앞 자리로 10명 조회 (LIKE 대신 primary key 범위 조건)"""
+    repository = await ctx.user_repository()
+    return lambda: repository.find_by(account_id__startswith=ctx.random_account_id()[:-1], limit=10)
+
+
+@benchmark("repository.update", iterations=500)
+async def bench_update(ctx: BenchContext):
+    repository = await ctx.user_repository()
+
+    async def update():
+        user = seeded_user(ctx.rng.randrange(USER_COUNT))
+        user.name = "변경"
+        await repository.update(user)
+    return update
+
+
+@benchmark("repository.save", iterations=500)
+async def bench_save(ctx: BenchContext):
+    repository = await ctx.user_repository()
+    return lambda: repository.save(seeded_user(ctx.rng.randrange(USER_COUNT * 2)))
+
+
+@benchmark("repository.delete", iterations=500)
+async def bench_delete(ctx: BenchContext):
+    repository = await ctx.user_repository()
+    counter = itertools.count(USER_COUNT)
+
+    async def create_and_delete():
+        user = seeded_user(next(counter))
+        await repository.create(user)
+        await repository.delete(user.account_id)
+    return create_and_delete
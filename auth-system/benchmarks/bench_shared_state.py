@@ -0,0 +1,88 @@
+"""worker 간 공유 검증 상태 (shared memory) 벤치마크
+
+- ops/s: 폐기 여부 조회 지연 (shared memory table vs worker 마다 들고 있는 dict)
+- worker 당 메모리: 측정 전에 stderr 로 출력합니다.
+  dict 는 worker 마다 전체 상태를 복사해서 들고 있고, shared memory 는 segment 하나를 모든 worker 가 map 합니다.
+"""
+import sys
+import time
+import tracemalloc
+from typing import Dict
+
+from src.tokens.shared_state import SharedStateReader, SharedStateWriter
+
+from benchmarks.suite import benchmark, BenchContext
+
+REVOKED = 100_000
+WATERMARKS = 10_000
+TTL = 3600
+
+
+def _writer(ctx: BenchContext) -> SharedStateWriter:
+    writer = SharedStateWriter(watermark_capacity=1 << 15, revoked_capacity=1 << 18)
+    for i in range(REVOKED):
+        writer.revoke(f"session-{i:06d}", TTL)
+    for i in range(WATERMARKS):
+        writer.set_watermark(f"user-{i:06d}", time.time(), TTL)
+
+    async def close():
+        writer.close()
+    ctx.add_cleanup(close)
+    return writer
+
+
+def _reader(ctx: BenchContext, name: str) -> SharedStateReader:
+    reader = SharedStateReader(name)
+
+    async def close():
+        reader.close()
+    ctx.add_cleanup(close)
+    return reader
+
+
+def _dict_state() -> Dict[str, Dict[str, float]]:
+    now = time.time()
+    return {
+        "revoked": {f"session-{i:06d}": now + TTL for i in range(REVOKED)},
+        "watermarks": {f"user-{i:06d}": now for i in range(WATERMARKS)},
+    }
+
+
+def memory_per_worker(segment_size: int, name: str) -> Dict[str, int]:
+    """worker 하나가 검증 상태를 위해 추가로 쓰는 heap 메모리(bytes)"""
+    tracemalloc.start()
+    try:
+        state = _dict_state()
+        per_worker_dict = tracemalloc.get_traced_memory()[0]
+        del state
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        reader = SharedStateReader(name)
+        per_worker_shared = tracemalloc.get_traced_memory()[0] - baseline
+        reader.close()
+    finally:
+        tracemalloc.stop()
+    return {"dict": per_worker_dict, "shared": per_worker_shared, "segment": segment_size}
+
+
+@benchmark("shared_state.is_revoked", iterations=100_000)
+def bench_is_revoked(ctx: BenchContext):
+    writer = _writer(ctx)
+    memory = memory_per_worker(writer.layout.size, writer.name)
+    print(f"shared_state: worker 당 메모리 dict {memory['dict']:,} bytes, shared {memory['shared']:,} bytes "
+          f"(+ 모든 worker 가 공유하는 segment {memory['segment']:,} bytes)", file=sys.stderr)
+    reader = _reader(ctx, writer.name)
+    return lambda: reader.is_revoked(f"session-{ctx.rng.randrange(REVOKED):06d}")
+
+
+@benchmark("shared_state.dict_is_revoked", iterations=100_000)
+def bench_dict_is_revoked(ctx: BenchContext):
+    revoked = _dict_state()["revoked"]
+    return lambda: f"session-{ctx.rng.randrange(REVOKED):06d}" in revoked
+
+
+@benchmark("shared_state.check", iterations=100_000)
+def bench_check(ctx: BenchContext):
+    reader = _reader(ctx, _writer(ctx).name)
+    payload = {"account_id": "user-000001", "iat": time.time(), "sid": "session-not-revoked"}
+    return lambda: reader.check(payload)
@@ -0,0 +1,48 @@
+"""큰 파일 스트리밍 서명/검증 처리량 (MB/s)"""
+import asyncio
+
+from src.tokens.signature import Signer, Verifier, CHUNK_SIZE
+
+from benchmarks.suite import benchmark, BenchContext
+
+DATA_SIZE = 64 * 1024 * 1024
+
+
+@benchmark("stream.sign_path_mmap", iterations=5, bytes_per_op=DATA_SIZE)
+def bench_sign_path(ctx: BenchContext):
+    signer = Signer.from_file(ctx.key_path())
+    fpath = ctx.data_file(DATA_SIZE)
+    return lambda: signer.sign_stream(fpath)
+
+
+@benchmark("stream.verify_path_mmap", iterations=5, bytes_per_op=DATA_SIZE)
+def bench_verify_path(ctx: BenchContext):
+    fpath = ctx.data_file(DATA_SIZE)
+    signature = Signer.from_file(ctx.key_path()).sign_stream(fpath)
+    verifier = Verifier.from_file(ctx.key_path(public=True))
+    return lambda: verifier.verify_stream(fpath, signature)
+
+
+@benchmark("stream.sign_file_object", iterations=5, bytes_per_op=DATA_SIZE)
+def bench_sign_file_object(ctx: BenchContext):
+    signer = Signer.from_file(ctx.key_path())
+    fpath = ctx.data_file(DATA_SIZE)
+
+    def sign():
+        with open(fpath, "rb") as f:
+            return signer.sign_stream(f)
+    return sign
+
+
+@benchmark("stream.sign_async_iterator", iterations=5, bytes_per_op=DATA_SIZE)
+def bench_sign_async_iterator(ctx: BenchContext):
+    signer = Signer.from_file(ctx.key_path())
+    fpath = ctx.data_file(DATA_SIZE)
+
+    async def chunks():
+        with open(fpath, "rb") as f:
+            while chunk := f.read(CHUNK_SIZE):
+                yield chunk
+                await asyncio.sleep(0)
+
+    return lambda: signer.sign_async_stream(chunks())
@@ -0,0 +1,83 @@
+"""noisy neighbour 벤치마크: 한 tenant 의 bulk 작업이 다른 tenant 의 조회를 얼마나 느리게 하는지
+
+noisy tenant 의 worker 들이 connection 을 잡고 오래 걸리는 작업을 계속하는 동안 quiet tenant 의 사용자 조회를 측정합니다.
+- tenants.shared_pool: 두 tenant 가 SessionManager(pool) 하나를 같이 사용
+- tenants.isolated_pool: TenantRegistry 로 tenant 마다 database, pool 을 따로 사용
+
+끝나면 tenant 별 DB session 평균 사용 시간(DB_SESSION_SECONDS, connection 대기 포함)을 stderr 로 출력합니다.
+(shared_pool 은 pool 이 하나라 noisy 작업도 quiet tenant 로 기록됩니다.)
+"""
+import asyncio
+import os
+import sys
+
+from sqlalchemy import text
+
+from src.abstracts.database.base import SessionManager
+from src.metrics import DB_SESSION_SECONDS
+from src.settings import Settings, TenantSettings
+from src.tenants import TenantRegistry
+from src.users.repository import UserRepository
+
+from benchmarks.suite import benchmark, BenchContext, seeded_user
+
+QUIET_USERS = 200
+NOISY_WORKERS = 8
+# noisy worker 가 connection 을 잡고 있는 시간(초), bulk 작업의 긴 transaction
+NOISY_HOLD = 0.002
+POOL = {"db_pool_size": 2, "db_max_overflow": 0}
+
+
+def _settings(ctx: BenchContext) -> Settings:
+    return ctx.settings().model_copy(update={
+        "db_type": f"sqlite+aiosqlite:///{os.path.join(ctx.workdir, 'default.db')}",
+        "tenants": {
+            tenant: TenantSettings(
+                db_type=f"sqlite+aiosqlite:///{os.path.join(ctx.workdir, f'{tenant}.db')}", **POOL,
+            )
+            for tenant in ("quiet", "noisy")
+        },
+    })
+
+
+async def _noisy(session_manager: SessionManager, stopped: asyncio.Event) -> None:
+    while not stopped.is_set():
+        async with session_manager.session(read_only=True) as session:
+            await session.execute(text("SELECT 1"))
+            await asyncio.sleep(NOISY_HOLD)
+
+
+async def _run(ctx: BenchContext, quiet: SessionManager, noisy: SessionManager, registry: TenantRegistry):
+    await quiet.create_database()
+    repository = UserRepository(quiet)
+    for i in range(QUIET_USERS):
+        await repository.create_user(seeded_user(i), "hash")
+    DB_SESSION_SECONDS.clear()
+    stopped = asyncio.Event()
+    tasks = [asyncio.create_task(_noisy(noisy, stopped)) for _ in range(NOISY_WORKERS)]
+
+    async def stop():
+        # pool 을 기다리는 중에 cancel 하면 connection 이 반환되지 않을 수 있어서 loop 가 끝나기를 기다립니다.
+        stopped.set()
+        await asyncio.gather(*tasks)
+        for tenant in ("quiet", "noisy"):
+            count = DB_SESSION_SECONDS.count(tenant, "ok")
+            if count:
+                mean = DB_SESSION_SECONDS.sum(tenant, "ok") / count
+                print(f"tenants: {tenant} session 평균 {mean * 1000:.3f} ms ({count}회)", file=sys.stderr)
+        await registry.dispose()
+    ctx.add_cleanup(stop)
+    return lambda: repository.get_by_id(f"user-{ctx.rng.randrange(QUIET_USERS):06d}")
+
+
+@benchmark("tenants.shared_pool", iterations=50)
+async def bench_shared_pool(ctx: BenchContext):
+    registry = TenantRegistry(_settings(ctx))
+    quiet = registry.session_manager("quiet")
+    return await _run(ctx, quiet, quiet, registry)
+
+
+@benchmark("tenants.isolated_pool", iterations=50)
+async def bench_isolated_pool(ctx: BenchContext):
+    registry = TenantRegistry(_settings(ctx))
+    return await _run(ctx, registry.session_manager("quiet"), registry.session_manager("noisy"), registry)
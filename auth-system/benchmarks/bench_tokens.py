@@ -0,0 +1,100 @@
+"""토큰 생성/검증, RSA 서명/검증 벤치마크"""
+from src.domain import TokenType
+from src.permissions import Permission, has_permissions, permissions_from_payload
+from src.tokens.manager import create_jwt_token
+from src.tokens.batch import verify_batch_by_rsa
+from src.tokens.signature import sign_data_by_rsa, verify_data_by_rsa, Signer, Verifier
+
+from benchmarks.suite import benchmark, BenchContext, seeded_user
+
+MESSAGE = b'{"account_id": "paicm", "user_role": "ADMIN", "user_group": "paip"}'
+
+
+@benchmark("tokens.create_jwt_token", iterations=200)
+def bench_create_jwt_token(ctx: BenchContext):
+    payload = seeded_user(0).to_jwt_payload()
+    private_pem = ctx.private_pem()
+    return lambda: create_jwt_token(payload, TokenType.ACCESS, private_pem, 3600)
+
+
+@benchmark("tokens.generate_token", iterations=100)
+def bench_generate_token(ctx: BenchContext):
+    token_manager = ctx.token_manager()
+    user = seeded_user(0)
+    return lambda: token_manager.generate_token(user)
+
+
+@benchmark("tokens.verify_access_token", iterations=100)
+def bench_verify_access_token(ctx: BenchContext):
+    token_manager = ctx.token_manager()
+    access = token_manager.generate_token(seeded_user(0)).access
+    return lambda: token_manager.verify_access_token(access)
+
+
+@benchmark("tokens.verify_refresh_token", iterations=100)
+def bench_verify_refresh_token(ctx: BenchContext):
+    token_manager = ctx.token_manager()
+    refresh = token_manager.generate_token(seeded_user(0)).refresh
+    return lambda: token_manager.verify_refresh_token(refresh)
+
+
+@benchmark("signature.sign_data_by_rsa", iterations=200)
+def bench_sign_data_by_rsa(ctx: BenchContext):
+    private_key_path = ctx.key_path()
+    return lambda: sign_data_by_rsa(MESSAGE, private_key_path)
+
+
+@benchmark("signature.verify_data_by_rsa", iterations=500)
+def bench_verify_data_by_rsa(ctx: BenchContext):
+    signature = sign_data_by_rsa(MESSAGE, ctx.key_path())
+    public_key_path = ctx.key_path(public=True)
+    return lambda: verify_data_by_rsa(MESSAGE, signature, public_key_path)
+
+
+@benchmark("signature.signer_sign", iterations=200)
+def bench_signer_sign(ctx: BenchContext):
+    signer = Signer.from_file(ctx.key_path())
+    return lambda: signer.sign(MESSAGE)
+
+
+@benchmark("signature.verifier_verify", iterations=1000)
+def bench_verifier_verify(ctx: BenchContext):
+    signature = sign_data_by_rsa(MESSAGE, ctx.key_path())
+    verifier = Verifier.from_file(ctx.key_path(public=True))
+    return lambda: verifier.verify(MESSAGE, signature)
+
+
+@benchmark("signature.sign_data_by_rsa_uncached", iterations=200)
+def bench_sign_data_by_rsa_uncached(ctx: BenchContext):
+    private_key_path = ctx.key_path()
+    return lambda: Signer.from_file(private_key_path).sign(MESSAGE)
+
+
+BATCH_SIZE = 2000
+
+
+def _signed_pairs(ctx: BenchContext):
+    signer = Signer.from_file(ctx.key_path())
+    return [(f"{MESSAGE}-{i}".encode(), signer.sign(f"{MESSAGE}-{i}".encode())) for i in range(BATCH_SIZE)]
+
+
+@benchmark(f"signature.verify_data_by_rsa_x{BATCH_SIZE}", iterations=2)
+def bench_verify_data_by_rsa_sequential(ctx: BenchContext):
+    pairs = _signed_pairs(ctx)
+    public_key_path = ctx.key_path(public=True)
+    return lambda: [verify_data_by_rsa(message, signature, public_key_path) for message, signature in pairs]
+
+
+@benchmark(f"signature.verify_batch_by_rsa_x{BATCH_SIZE}", iterations=2)
+def bench_verify_batch_by_rsa(ctx: BenchContext):
+    pairs = _signed_pairs(ctx)
+    public_key_path = ctx.key_path(public=True)
+    return lambda: list(verify_batch_by_rsa(pairs, public_key_path))
+
+
+@benchmark("permissions.check_from_access_payload", iterations=100000)
+def bench_check_permissions(ctx: BenchContext):
+    token_manager = ctx.token_manager()
+    payload = token_manager.verify_access_token(token_manager.generate_token(seeded_user(0)).access)
+    required = Permission.READ_DATA | Permission.READ_PROFILE
+    return lambda: has_permissions(permissions_from_payload(payload), required)
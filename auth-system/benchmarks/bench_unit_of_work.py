@@ -0,0 +1,57 @@
+"""repository 메서드마다 commit 하는 것과 UnitOfWork 로 한 번에 commit 하는 것 비교 (파일 sqlite)
+
+한 번의 작업에서 세션 4개를 만들고 사용자 1명을 수정합니다. ops/s 가 곧 작업(commit) 처리량입니다.
+"""
+from dataclasses import replace
+from datetime import datetime, timedelta
+from itertools import count
+
+from src.abstracts.database.unit_of_work import UnitOfWork
+from src.domain import UserSession
+from src.sessions.repository import SessionRepository
+from src.users.repository import UserRepository
+
+from benchmarks.suite import benchmark, BenchContext, PASSWORD, seeded_user
+
+SESSIONS_PER_WORKFLOW = 4
+
+
+async def _repositories(ctx: BenchContext):
+    session_manager = await ctx.file_session_manager()
+    user_repository = UserRepository(session_manager)
+    user = seeded_user(0)
+    await user_repository.create_user(user, PASSWORD)
+    return session_manager, user_repository, SessionRepository(session_manager), user
+
+
+def _sessions(ids, account_id: str):
+    now = datetime.now()
+    return [
+        UserSession(f"session-{next(ids)}", account_id, now, now + timedelta(hours=1))
+        for _ in range(SESSIONS_PER_WORKFLOW)
+    ]
+
+
+@benchmark("uow.workflow_separate_commits", iterations=50)
+async def bench_separate_commits(ctx: BenchContext):
+    _, user_repository, session_repository, user = await _repositories(ctx)
+    ids = count()
+
+    async def workflow():
+        for session in _sessions(ids, user.account_id):
+            await session_repository.create(session)
+        await user_repository.update(replace(user, name=f"사용자-{next(ids)}"))
+    return workflow
+
+
+@benchmark("uow.workflow_unit_of_work", iterations=50)
+async def bench_unit_of_work(ctx: BenchContext):
+    session_manager, user_repository, session_repository, user = await _repositories(ctx)
+    ids = count()
+
+    async def workflow():
+        async with UnitOfWork(session_manager) as uow:
+            for session in _sessions(ids, user.account_id):
+                uow.create(session_repository, session)
+            uow.update(user_repository, replace(user, name=f"사용자-{next(ids)}"))
+    return workflow
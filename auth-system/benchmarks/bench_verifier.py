@@ -0,0 +1,101 @@
+"""sidecar 토큰 검증: HTTP introspection 과 Unix domain socket daemon 비교
+
+한 번의 op 는 access token BATCH 개 검증입니다. (ops/s * BATCH = 초당 검증 토큰 수)
+- verifier.http_introspect: POST /introspect 를 ASGI app 에 직접 호출 (JSON 변환, routing, sidecar 토큰 인증 포함)
+  TCP 와 HTTP parsing 은 빠져 있어서, 실제 HTTP 보다 빠르게 나옵니다.
+- verifier.uds: daemon 에 토큰 하나씩 보내고 응답을 기다립니다.
+- verifier.uds_pipelined: daemon 에 BATCH 개를 한 번에 보내고 응답을 순서대로 받습니다.
+"""
+import json
+import os
+from dataclasses import replace
+from typing import List, Tuple
+
+from fastapi import FastAPI
+
+from src.domain import UserRole
+from src.tenants import TenantRegistry
+from src.verifier.client import VerifierClient
+from src.verifier.server import VerificationServer
+from webapp.dependencies import get_tenant_registry
+from webapp.routers import introspect
+
+from benchmarks.suite import benchmark, BenchContext, seeded_user
+
+BATCH = 64
+
+
+def _tokens(ctx: BenchContext) -> Tuple[TenantRegistry, List[str]]:
+    registry = TenantRegistry(ctx.settings())
+    token_manager = registry.token_manager()
+    return registry, [token_manager.generate_token(seeded_user(i)).access for i in range(BATCH)]
+
+
+async def _client(ctx: BenchContext, registry: TenantRegistry) -> VerifierClient:
+    server = VerificationServer(registry.verify_access_token, os.path.join(ctx.workdir, "verify.sock"))
+    await server.start()
+    client = await VerifierClient(server.path).connect()
+
+    async def close():
+        await client.close()
+        await server.stop()
+    ctx.add_cleanup(close)
+    return client
+
+
+async def _post(app: FastAPI, path: str, authorization: str, body: bytes) -> bytes:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "POST",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"", "root_path": "",
+        "headers": [
+            (b"authorization", authorization.encode()),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+        "client": ("127.0.0.1", 50000), "server": ("127.0.0.1", 80),
+    }
+    chunks = []
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return b"".join(chunks)
+
+
+@benchmark("verifier.http_introspect", iterations=20)
+async def bench_http_introspect(ctx: BenchContext):
+    registry, tokens = _tokens(ctx)
+    app = FastAPI()
+    app.include_router(introspect.router)
+    app.dependency_overrides[get_tenant_registry] = lambda: registry
+    sidecar = registry.token_manager().generate_token(replace(seeded_user(0), role=UserRole.SIDECAR))
+    authorization = f"Bearer {sidecar.access}"
+
+    async def introspect_all():
+        for token in tokens:
+            response = json.loads(await _post(app, "/introspect", authorization, json.dumps({"token": token}).encode()))
+            assert response["active"]
+    return introspect_all
+
+
+@benchmark("verifier.uds", iterations=20)
+async def bench_uds(ctx: BenchContext):
+    registry, tokens = _tokens(ctx)
+    client = await _client(ctx, registry)
+
+    async def verify_all():
+        for token in tokens:
+            await client.verify(token)
+    return verify_all
+
+
+@benchmark("verifier.uds_pipelined", iterations=20)
+async def bench_uds_pipelined(ctx: BenchContext):
+    registry, tokens = _tokens(ctx)
+    client = await _client(ctx, registry)
+    return lambda: client.verify_many(tokens)
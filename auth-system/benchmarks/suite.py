@@ -0,0 +1,275 @@
+"""벤치마크 등록, 실행, 결과 저장 및 baseline 비교
+
+벤치마크 함수는 BenchContext 를 받아 측정할 callable(동기 또는 비동기)을 반환합니다.
+```
+@benchmark("tokens.create_jwt_token", iterations=200)
+def bench_create_jwt_token(ctx: BenchContext):
+    return lambda: create_jwt_token(...)
+```
+"""
+import asyncio
+import inspect
+import json
+import os
+import platform
+import random
+import statistics
+import tempfile
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from Crypto.PublicKey import RSA
+
+from src.abstracts.database.base import SessionManager
+from src.domain import User, UserRole
+from src.settings import Settings
+from src.tokens.manager import TokenManager
+from src.users.login_manager import LoginManager
+from src.users.repository import UserRepository
+
+SEED = 20240701
+KEY_BITS = 2048
+USER_COUNT = 1000
+PASSWORD = "password"
+
+
+@dataclass
+class Benchmark:
+    name: str
+    factory: Callable
+    iterations: int
+    bytes_per_op: Optional[int] = None
+
+
+@dataclass
+class BenchResult:
+    name: str
+    iterations: int
+    rounds: List[float] = field(default_factory=list)
+    bytes_per_op: Optional[int] = None
+
+    @property
+    def ops_per_sec(self) -> float:
+        return statistics.median(self.rounds)
+
+    @property
+    def mb_per_sec(self) -> Optional[float]:
+        if self.bytes_per_op is None:
+            return None
+        return self.ops_per_sec * self.bytes_per_op / (1024 * 1024)
+
+    def to_dict(self):
+        result = {
+            "iterations": self.iterations,
+            "ops_per_sec": self.ops_per_sec,
+            "rounds": self.rounds,
+        }
+        if self.bytes_per_op is not None:
+            result["mb_per_sec"] = self.mb_per_sec
+        return result
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, iterations: int, bytes_per_op: Optional[int] = None):
+    """벤치마크로 등록합니다. bytes_per_op 를 주면 MB/s 도 함께 기록합니다."""
+    def decorator(factory):
+        if name in BENCHMARKS:
+            raise ValueError(f"이미 등록된 벤치마크입니다. {name}")
+        BENCHMARKS[name] = Benchmark(name, factory, iterations, bytes_per_op)
+        return factory
+    return decorator
+
+
+def seeded_user(index: int) -> User:
+    roles = [UserRole.MEMBER, UserRole.VIP, UserRole.ADMIN]
+    return User(
+        account_id=f"user-{index:06d}",
+        name=f"사용자{index}",
+        role=roles[index % len(roles)],
+        group=f"group-{index % 10}",
+        email=f"user-{index}@publicai.co.kr",
+        phone="010-0000-0000",
+        signup_at=datetime(2024, 1, 1),
+    )
+
+
+class BenchContext:
+    """벤치마크마다 새로 만드는 실행 환경 (고정 seed, 고정 key 크기, in-memory sqlite)"""
+
+    _private_pem: Optional[bytes] = None
+
+    def __init__(self, workdir: str):
+        self.workdir = workdir
+        self.rng = random.Random(SEED)
+        self._session_manager: Optional[SessionManager] = None
+        self._file_session_manager: Optional[SessionManager] = None
+        self._cleanups: List[Callable] = []
+
+    @classmethod
+    def private_pem(cls) -> bytes:
+        # 같은 seed 로 항상 같은 key 를 만들어서 실행마다 결과를 비교할 수 있게 합니다.
+        if cls._private_pem is None:
+            randfunc = random.Random(SEED).randbytes
+            cls._private_pem = RSA.generate(KEY_BITS, randfunc=randfunc).export_key()
+        return cls._private_pem
+
+    def public_pem(self) -> bytes:
+        return RSA.import_key(self.private_pem()).public_key().export_key()
+
+    def data_file(self, size: int) -> str:
+        """size 바이트의 seed 고정 데이터 파일을 만들고 경로를 반환합니다."""
+        fpath = os.path.join(self.workdir, f"data-{size}.bin")
+        if not os.path.exists(fpath):
+            block = random.Random(SEED).randbytes(1024 * 1024)
+            with open(fpath, "wb") as f:
+                for offset in range(0, size, len(block)):
+                    f.write(block[:size - offset])
+        return fpath
+
+    def key_path(self, public: bool = False) -> str:
+        fpath = os.path.join(self.workdir, "public.pem" if public else "private.pem")
+        if not os.path.exists(fpath):
+            with open(fpath, "wb") as f:
+                f.write(self.public_pem() if public else self.private_pem())
+        return fpath
+
+    def settings(self) -> Settings:
+        return Settings(db_type="sqlite+aiosqlite:///:memory:", private_key=self.private_pem())
+
+    def token_manager(self) -> TokenManager:
+        return TokenManager(self.settings())
+
+    async def session_manager(self) -> SessionManager:
+        if self._session_manager is None:
+            self._session_manager = SessionManager(self.settings())
+            await self._session_manager.create_database()
+        return self._session_manager
+
+    async def file_session_manager(self) -> SessionManager:
+        """commit(fsync) 비용까지 측정할 때 사용하는 파일 sqlite"""
+        if self._file_session_manager is None:
+            fpath = os.path.join(self.workdir, "bench.db")
+            self._file_session_manager = SessionManager(self.settings().model_copy(
+                update={"db_type": f"sqlite+aiosqlite:///{fpath}"}))
+            await self._file_session_manager.create_database()
+        return self._file_session_manager
+
+    async def user_repository(self, user_count: int = USER_COUNT) -> UserRepository:
+        """user_count 명의 사용자가 저장된 repository 를 반환합니다."""
+        repository = UserRepository(await self.session_manager())
+        for i in range(user_count):
+            await repository.create_user(seeded_user(i), PASSWORD)
+        return repository
+
+    async def login_manager(self, user_count: int = USER_COUNT) -> LoginManager:
+        return LoginManager(await self.user_repository(user_count), self.token_manager())
+
+    def random_account_id(self, user_count: int = USER_COUNT) -> str:
+        return f"user-{self.rng.randrange(user_count):06d}"
+
+    def add_cleanup(self, cleanup: Callable) -> None:
+        """벤치마크가 끝난 뒤 실행할 비동기 함수를 등록합니다. (background task 정리 등)"""
+        self._cleanups.append(cleanup)
+
+    async def close(self):
+        for cleanup in reversed(self._cleanups):
+            await cleanup()
+        if self._session_manager is not None:
+            await self._session_manager.drop_database()
+        if self._file_session_manager is not None:
+            await self._file_session_manager.drop_database()
+            await self._file_session_manager._engine.dispose()
+
+
+async def _measure(operation: Callable, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        result = operation()
+        if inspect.isawaitable(result):
+            await result
+    return iterations / (time.perf_counter() - started)
+
+
+async def run_benchmark(bench: Benchmark, rounds: int, scale: float = 1.0) -> BenchResult:
+    iterations = max(1, int(bench.iterations * scale))
+    with tempfile.TemporaryDirectory() as workdir:
+        ctx = BenchContext(workdir)
+        try:
+            operation = bench.factory(ctx)
+            if inspect.isawaitable(operation):
+                operation = await operation
+            # warmup
+            await _measure(operation, max(1, iterations // 10))
+            result = BenchResult(bench.name, iterations, bytes_per_op=bench.bytes_per_op)
+            for _ in range(rounds):
+                result.rounds.append(await _measure(operation, iterations))
+            return result
+        finally:
+            await ctx.close()
+
+
+async def run(names: List[str], rounds: int = 3, scale: float = 1.0,
+              report: Callable[[BenchResult], None] = lambda result: None) -> List[BenchResult]:
+    results = []
+    for name in names:
+        result = await run_benchmark(BENCHMARKS[name], rounds, scale)
+        report(result)
+        results.append(result)
+    return results
+
+
+def run_sync(names: List[str], **kwargs) -> List[BenchResult]:
+    return asyncio.run(run(names, **kwargs))
+
+
+def to_json(results: List[BenchResult]) -> dict:
+    return {
+        "meta": {
+            "created_at": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": SEED,
+            "key_bits": KEY_BITS,
+            "user_count": USER_COUNT,
+        },
+        "results": {result.name: result.to_dict() for result in results},
+    }
+
+
+def save(results: List[BenchResult], fpath: str) -> None:
+    with open(fpath, "w") as f:
+        json.dump(to_json(results), f, indent=2, ensure_ascii=False)
+
+
+def load(fpath: str) -> Dict[str, float]:
+    """저장된 결과 파일에서 벤치마크 이름별 ops/s 를 불러옵니다."""
+    with open(fpath) as f:
+        data = json.load(f)
+    return {name: result["ops_per_sec"] for name, result in data["results"].items()}
+
+
+@dataclass
+class Comparison:
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        return self.current / self.baseline - 1
+
+
+def compare(results: List[BenchResult], baseline: Dict[str, float]) -> List[Comparison]:
+    return [
+        Comparison(result.name, baseline[result.name], result.ops_per_sec)
+        for result in results if result.name in baseline
+    ]
+
+
+def regressions(comparisons: List[Comparison], tolerance: float) -> List[Comparison]:
+    """baseline 대비 tolerance 이상 느려진 벤치마크 목록"""
+    return [comparison for comparison in comparisons if comparison.change < -tolerance]
@@ -0,0 +1,175 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Generic, List, Optional, TypeVar
+
+from src.metrics import BATCH_FLUSH_SECONDS, BATCH_ITEMS
+
+logger = logging.getLogger(__name__)
+
+Item = TypeVar("Item")
+
+# queue 에 넣는 제어용 marker
+_STOP = object()
+
+
+class _Flush:
+    """flush marker, 이 marker 앞의 item 을 모두 저장하면 future 를 완료합니다."""
+
+    __slots__ = ("future",)
+
+    def __init__(self):
+        self.future = asyncio.get_running_loop().create_future()
+
+    def done(self) -> None:
+        if not self.future.done():
+            self.future.set_result(None)
+
+
+class BatchWriter(Generic[Item]):
+    """요청 경로에서는 queue 에 넣기만 하고, background task 가 모아서 한 번에 저장합니다.
+
+    batch_size 만큼 모이거나 첫 item 이후 linger_ms 가 지나면 write 를 호출합니다.
+    ```
+    writer = BatchWriter("sessions", repository.create_many, batch_size=100, linger_ms=10)
+    await writer.start()
+    writer.submit(item)
+    await writer.stop()  # 남은 item 을 모두 저장
+    ```
+    """
+
+    def __init__(
+            self,
+            name: str,
+            write: Callable[[List[Item]], Awaitable[None]],
+            batch_size: int = 100,
+            linger_ms: float = 10,
+            max_queue_size: int = 0,
+    ):
+        """
+        Args:
+            name: metric label 로 사용할 이름
+            write: item 목록을 한 번에 저장하는 함수
+            batch_size: 한 번에 저장할 최대 item 개수
+            linger_ms: 첫 item 이후 batch 를 채우기 위해 기다리는 최대 시간
+            max_queue_size: queue 최대 크기, 0 이면 제한 없음
+                가득 차면 submit 은 버리고(dropped 로 기록), put 은 자리가 날 때까지 기다립니다.
+        """
+        self.name = name
+        self._write = write
+        self._batch_size = batch_size
+        self._linger = linger_ms / 1000
+        self._queue: asyncio.Queue = asyncio.Queue(max_queue_size)
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def pending(self) -> int:
+        """아직 저장하지 않은 item 개수"""
+        return self._queue.qsize()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """background task 를 멈추고 남은 item 을 모두 저장합니다."""
+        if self.running:
+            await self._queue.put(_STOP)
+            await self._task
+        self._task = None
+        await self.flush()
+
+    def submit(self, item: Item) -> bool:
+        """item 을 queue 에 넣습니다. (기다리지 않음)
+
+        Returns:
+            bool: queue 가 가득 차서 버렸으면 False
+        """
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except asyncio.QueueFull:
+            BATCH_ITEMS.labels(self.name, "dropped").inc()
+            return False
+
+    async def put(self, item: Item) -> None:
+        """item 을 queue 에 넣습니다. queue 가 가득 차면 자리가 날 때까지 기다립니다. (backpressure)"""
+        await self._queue.put(item)
+
+    async def flush(self) -> None:
+        """flush 를 호출하기 전에 submit 한 item 이 모두 저장될 때까지 기다립니다.
+        (그 뒤에 submit 한 item 은 기다리지 않기 때문에, submit 이 계속 들어와도 끝납니다.)
+        """
+        if self.running:
+            # linger 를 기다리지 않고 바로 저장하도록 알림
+            marker = _Flush()
+            await self._queue.put(marker)
+            await marker.future
+            return
+        while not self._queue.empty():
+            batch = []
+            for item in self._take(self._batch_size):
+                if isinstance(item, _Flush):
+                    item.done()
+                elif item is not _STOP:
+                    batch.append(item)
+            await self._write_batch(batch)
+
+    async def _run(self) -> None:
+        while True:
+            item = await self._queue.get()
+            if item is _STOP:
+                return
+            if isinstance(item, _Flush):
+                item.done()
+                continue
+
+            batch = [item]
+            marker = await self._collect(batch)
+            await self._write_batch(batch)
+            if isinstance(marker, _Flush):
+                marker.done()
+            elif marker is _STOP:
+                return
+
+    async def _collect(self, batch: List[Item]):
+        """batch_size 또는 linger 시간까지 item 을 모읍니다. 중간에 받은 marker(_Flush, _STOP)를 반환합니다."""
+        deadline = time.monotonic() + self._linger
+        while len(batch) < self._batch_size:
+            if self._queue.empty():
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    return None
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    return None
+            else:
+                item = self._queue.get_nowait()
+            if isinstance(item, _Flush) or item is _STOP:
+                return item
+            batch.append(item)
+        return None
+
+    def _take(self, limit: int) -> list:
+        items = []
+        while len(items) < limit and not self._queue.empty():
+            items.append(self._queue.get_nowait())
+        return items
+
+    async def _write_batch(self, batch: List[Item]) -> None:
+        if not batch:
+            return
+        started = time.perf_counter()
+        try:
+            await self._write(batch)
+            BATCH_ITEMS.labels(self.name, "written").inc(len(batch))
+        except Exception:
+            BATCH_ITEMS.labels(self.name, "failed").inc(len(batch))
+            logger.exception("%s batch 저장에 실패했습니다. (%d건)", self.name, len(batch))
+        finally:
+            BATCH_FLUSH_SECONDS.labels(self.name).observe(time.perf_counter() - started)
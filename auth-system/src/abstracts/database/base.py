@@ -1,18 +1,26 @@
 import asyncio
+import time
 from contextlib import AbstractContextManager, asynccontextmanager
-from typing import Callable, TypeVar, Generic
+from typing import TYPE_CHECKING, Callable, List, TypeVar, Generic
 import logging
 
 import sqlalchemy.exc
+from sqlalchemy import event, inspect, text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.ext.asyncio import async_sessionmaker, async_scoped_session
 from sqlalchemy.ext.asyncio import AsyncAttrs
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session
 
-from src.exceptions import DatabaseException, NotFoundException, DBIntegrityException
-from src.settings import Settings
+from src.domain import DEFAULT_TENANT
+from src.exceptions import DatabaseException, NotFoundException, DBIntegrityException, PaipAuthException
+from src.log_sampling import SampledLogger
+from src.metrics import DB_SESSION_ACQUIRE_SECONDS, DB_SESSION_ERRORS, DB_SESSION_SECONDS
+
+if TYPE_CHECKING:
+    from src.settings import Settings
 
 logger = logging.getLogger(__name__)
+_error_logger = SampledLogger(logger)
 
 DomainKey = TypeVar("DomainKey")
 Domain = TypeVar("Domain")
@@ -35,15 +43,52 @@ class Base(AsyncAttrs, DeclarativeBase, Generic[DomainKey, Domain]):
         raise NotImplementedError("primary_key method is not implemented")
 
 
+class _TimedSession(Session):
+    """pool 에서 connection 을 꺼내는 (가득 차 있으면 기다리는) 시간을 DB_SESSION_ACQUIRE_SECONDS 로 기록합니다.
+    session 은 첫 query 에서 transaction 을 시작하면서 connection 을 꺼내기 때문에, transaction 을 만든 때부터
+    connection 으로 시작(after_begin)할 때까지를 잽니다.
+    """
+
+
+@event.listens_for(_TimedSession, "after_transaction_create")
+def _checkout_started(session: Session, transaction) -> None:
+    if transaction.parent is None:
+        session.info["checkout_started"] = time.perf_counter()
+
+
+@event.listens_for(_TimedSession, "after_begin")
+def _checkout_finished(session: Session, transaction, connection) -> None:
+    started = session.info.pop("checkout_started", None)
+    if started is not None:
+        DB_SESSION_ACQUIRE_SECONDS.labels(session.info["tenant"]).observe(time.perf_counter() - started)
+
+
+async def _rollback(session: AsyncSession, read_only: bool) -> None:
+    if not session.in_transaction():
+        return
+    if read_only and not (session.new or session.dirty or session.deleted):
+        return
+    await session.rollback()
+
+
 class SessionManager:
     """비동기 데이터베이스 클래스"""
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: "Settings", tenant: str = DEFAULT_TENANT):
+        """
+        Args:
+            settings: DB 설정 (tenant 별 설정은 settings.for_tenant(tenant))
+            tenant: metric 의 tenant label
+        """
+        self.tenant = tenant
+        options = _pool_options(settings)
         if settings.db_type.startswith('sqlite'):
-            self._engine = create_async_engine(settings.db_type)
+            self._engine = create_async_engine(settings.db_type, **options)
         elif settings.db_type.startswith("postgresql"):
             url = f"postgresql+asyncpg://{settings.db_user}:{settings.db_password}@{settings.db_host}/{settings.db_name}"
-            self._engine = create_async_engine(url)
+            if settings.db_schema:
+                options["connect_args"] = {"server_settings": {"search_path": settings.db_schema}}
+            self._engine = create_async_engine(url, **options)
         else:
             raise DatabaseException(f"지원하지 않는 database type입니다. {settings.db_type}")
 
@@ -51,6 +96,8 @@ class SessionManager:
             async_sessionmaker(
                 autocommit=False,
                 bind=self._engine,
+                sync_session_class=_TimedSession,
+                info={"tenant": tenant},
             ),
             scopefunc=asyncio.current_task,
         )
@@ -67,27 +114,152 @@ class SessionManager:
         async with self._engine.begin() as conn:
             await conn.run_sync(Base.metadata.drop_all)
 
+    async def create_indexes(self) -> List[str]:
+        """이미 운영 중인 데이터베이스에 모델에 선언된 index 중 없는 것을 생성합니다.
+        create_database 를 쓸 수 없는 기존 DB 의 migration 용도이며, 여러 번 실행해도 안전합니다.
+
+        Returns:
+            List[str]: 새로 생성한 index 이름 목록
+
+        Raises:
+            DBIntegrityException: unique index 를 만들 수 없는 중복 데이터가 있을 때 발생합니다.
+        """
+        try:
+            async with self._engine.begin() as conn:
+                return await conn.run_sync(_create_missing_indexes)
+        except sqlalchemy.exc.IntegrityError as e:
+            raise DBIntegrityException(f"index 를 생성할 수 없습니다. {e}")
+
     @asynccontextmanager
-    async def session(self) -> Callable[..., AbstractContextManager[AsyncSession]]:
+    async def session(self, read_only: bool = False) -> Callable[..., AbstractContextManager[AsyncSession]]:
+        """session 을 열고, 블록이 끝나면 닫습니다.
+
+        - 도메인 exception(PaipAuthException)은 예상된 실패라 traceback 로그 없이 그대로 전달합니다.
+        - 그 외 exception 은 DB_SESSION_ERRORS 로 모두 세고, 로그는 종류별로 일정 간격마다 한 번만 남깁니다.
+
+        Args:
+            read_only: 조회만 하는 session 이면 True,
+                실패해도 ORM 에 변경된 객체가 없으면 rollback 을 생략합니다. (close 할 때 connection 이 정리됩니다.)
+        """
+        started = time.perf_counter()
         session: AsyncSession = self._session_factory()
+        status = "error"
         try:
             yield session
+            status = "ok"
         except sqlalchemy.exc.NoResultFound:
-            await session.rollback()
+            status = "rejected"
+            await _rollback(session, read_only)
             raise NotFoundException("데이터를 못 발견 했어요")
         except sqlalchemy.exc.IntegrityError:
-            await session.rollback()
+            status = "rejected"
+            await _rollback(session, read_only)
             raise DBIntegrityException("데이터를 못 발견 했어요")
-        except DatabaseException as e:
-            await session.rollback()
-            raise e
+        except PaipAuthException:
+            status = "rejected"
+            await _rollback(session, read_only)
+            raise
         except Exception as e:
-            logger.exception("Session rollback because of exception")
+            reason = type(e).__name__
+            DB_SESSION_ERRORS.labels(self.tenant, reason).inc()
+            _error_logger.exception(reason, "Session rollback because of exception")
             await session.rollback()
             raise DatabaseException(f"{e}")
         finally:
             await session.close()
             await self._session_factory.remove()
+            DB_SESSION_SECONDS.labels(self.tenant, status).observe(time.perf_counter() - started)
+
+    async def dispose(self) -> None:
+        """connection pool 의 connection 을 모두 닫습니다."""
+        await self._engine.dispose()
 
     async def connect(self):
         return await self._engine.connect()
+
+    async def ping(self) -> None:
+        """DB 에 SELECT 1 을 실행해서 접속 가능한지 확인합니다.
+
+        Raises:
+            DatabaseException: DB 에 접속할 수 없을 때 발생합니다.
+        """
+        try:
+            connection = await self.connect()
+            try:
+                await connection.execute(text("SELECT 1"))
+            finally:
+                await connection.close()
+        except (sqlalchemy.exc.SQLAlchemyError, OSError) as e:
+            # driver 에 따라 SQLAlchemyError 로 감싸지 않은 OSError(ConnectionRefusedError 등)가 올라옵니다.
+            raise DatabaseException(f"DB 에 접속할 수 없습니다. {e}")
+
+    async def prewarm(self, connections: int) -> int:
+        """connection 을 동시에 connections 개 열어서 pool 에 넣어 둡니다.
+        첫 요청이 connection 생성 비용을 내지 않도록 시작할 때 호출합니다.
+        하나라도 실패하면 이미 연 connection 을 모두 pool 에 돌려주고 exception 을 전달합니다.
+
+        Returns:
+            int: 연 connection 수
+
+        Raises:
+            DatabaseException: DB 에 접속할 수 없을 때 발생합니다.
+        """
+        async def open_connection():
+            connection = await self.connect()
+            try:
+                await connection.execute(text("SELECT 1"))
+            except BaseException:
+                await connection.close()
+                raise
+            return connection
+
+        results = await asyncio.gather(*(open_connection() for _ in range(connections)), return_exceptions=True)
+        opened = [result for result in results if not isinstance(result, BaseException)]
+        for connection in opened:
+            await connection.close()
+        for result in results:
+            if isinstance(result, (sqlalchemy.exc.SQLAlchemyError, OSError)):
+                raise DatabaseException(f"DB 에 접속할 수 없습니다. {result}") from result
+            if isinstance(result, BaseException):
+                raise result
+        return len(opened)
+
+
+def _pool_options(settings: "Settings") -> dict:
+    # tenant 마다 pool 크기를 따로 제한합니다. (in-memory sqlite 는 connection 하나를 공유하는 StaticPool 이라 제외)
+    if settings.db_type.endswith(":memory:"):
+        return {}
+    options = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+    }
+    return {name: value for name, value in options.items() if value is not None}
+
+
+def _create_missing_indexes(connection) -> List[str]:
+    inspector = inspect(connection)
+    created = []
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = _get_index_names(connection, inspector, table.name)
+        for index in table.indexes:
+            if index.name not in existing and _is_for_dialect(index, connection.dialect.name):
+                index.create(connection)
+                created.append(index.name)
+    return created
+
+
+def _is_for_dialect(index, dialect_name: str) -> bool:
+    # ddl_if(dialect=...) 로 특정 database 에서만 만드는 index (예: PostgreSQL 의 COLLATE "C" index)
+    ddl_if = index._ddl_if
+    return ddl_if is None or ddl_if.dialect in (None, dialect_name)
+
+
+def _get_index_names(connection, inspector, table_name: str) -> set:
+    if connection.dialect.name == "sqlite":
+        # sqlite inspector 는 lower(column) 같은 expression index 를 반환하지 않아서 직접 조회
+        stmt = "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ?"
+        return {row[0] for row in connection.exec_driver_sql(stmt, (table_name,))}
+    return {index["name"] for index in inspector.get_indexes(table_name)}
@@ -1,13 +1,39 @@
 import abc
-from typing import Generic, List, Optional
+import functools
+import sys
+import time
+from typing import Any, Callable, Dict, Generic, List, Optional, Sequence, Tuple, TypeVar, Union
 
 from dataclasses import fields
 import sqlalchemy
-from sqlalchemy import select, inspect, delete, update
+from sqlalchemy import select, inspect, delete, update, insert, func, exists, literal, and_
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import joinedload
+from sqlalchemy.sql.functions import FunctionElement
 
 from src.abstracts.database.base import SessionManager, DomainKey, Domain, Base
-from src.exceptions import NotFoundException, AlreadyExistsException
+from src.exceptions import NotFoundException, AlreadyExistsException, DatabaseException
+from src.metrics import REPOSITORY_SECONDS, REPOSITORY_ERRORS
+
+View = TypeVar("View")
+
+
+def instrumented(operation: str):
+    """repository 연산의 소요 시간과 실패 사유를 entity 별로 기록합니다."""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            entity_name = self.entity.__tablename__
+            started = time.perf_counter()
+            try:
+                return await func(self, *args, **kwargs)
+            except Exception as e:
+                REPOSITORY_ERRORS.labels(entity_name, operation, type(e).__name__).inc()
+                raise
+            finally:
+                REPOSITORY_SECONDS.labels(entity_name, operation).observe(time.perf_counter() - started)
+        return wrapper
+    return decorator
 
 
 def reflect_domain(src, dst):
@@ -22,11 +48,50 @@ class BaseRepository(abc.ABC, Generic[DomainKey, Domain]):
     def __init__(self, session_manager: SessionManager):
         self.session_manager = session_manager
 
+    @instrumented("create")
     async def create(self, domain: Domain) -> None:
         async with self.session_manager.session() as session:
             await self._create(session, domain)
             await session.commit()
 
+    @instrumented("create_many")
+    async def create_many(self, domains: Sequence[Domain]) -> None:
+        """여러 도메인을 하나의 INSERT (executemany) 로 저장합니다.
+        create 와 달리 flush 후 생성된 값(autoincrement 등)을 도메인에 다시 반영하지 않습니다.
+        """
+        if not domains:
+            return
+        async with self.session_manager.session() as session:
+            values = [entity_values(self.entity.from_domain(domain)) for domain in domains]
+            await insert_many(await session.connection(), self.entity, values)
+            await session.commit()
+
+    @instrumented("create_if_absent")
+    async def create_if_absent(self, domain: Domain, **kwargs) -> bool:
+        """같은 primary key 나 unique 값이 없을 때만 저장합니다.
+        INSERT ... ON CONFLICT DO NOTHING 한 번으로 처리하기 때문에, 중복이어도 IntegrityError 와 rollback 이 없습니다.
+        create_many 처럼 생성된 값(autoincrement 등)을 도메인에 다시 반영하지 않습니다.
+        ```
+        if not await repository.create_if_absent(domain):
+            ...  # 이미 있음
+        ```
+
+        Args:
+            domain: 저장할 도메인
+            kwargs: entity.from_domain 에 추가로 넘길 값 (예: UserEntity 의 password)
+
+        Returns:
+            bool: 저장했으면 True, 이미 있어서 저장하지 않았으면 False
+        """
+        values = entity_values(self.entity.from_domain(domain, **kwargs))
+        async with self.session_manager.session() as session:
+            connection = await session.connection()
+            stmt = insert_if_absent(connection.dialect.name, self.entity)
+            inserted = (await connection.execute(stmt, values)).rowcount == 1
+            await session.commit()
+            return inserted
+
+    @instrumented("update")
     async def update(self, domain: Domain) -> None:
         async with self.session_manager.session() as session:
             entity_primary_key = get_primary_key(self.entity, domain)
@@ -45,6 +110,7 @@ class BaseRepository(abc.ABC, Generic[DomainKey, Domain]):
             raise NotImplementedError("몰라")
             await session.commit()
 
+    @instrumented("save")
     async def save(self, domain: Domain) -> None:
         async with self.session_manager.session() as session:
             entity_primary_key = get_primary_key(self.entity, domain)
@@ -54,6 +120,7 @@ class BaseRepository(abc.ABC, Generic[DomainKey, Domain]):
                 await self._create(session, domain)
             await session.commit()
 
+    @instrumented("delete")
     async def delete(self, key: DomainKey) -> None:
         async with self.session_manager.session() as session:
             criteria = create_id_criteria(self.entity, key)
@@ -62,6 +129,7 @@ class BaseRepository(abc.ABC, Generic[DomainKey, Domain]):
                 raise NotFoundException(f"{self.entity}의 {key}가 발견되지 않았습니다.")
             await session.commit()
 
+    @instrumented("get_by_id")
     async def get_by_id(self, key: DomainKey) -> Domain:
         """ key를 통해 도메인을 가져옵니다.
         (1) key가 단일키인 경우,
@@ -74,38 +142,139 @@ class BaseRepository(abc.ABC, Generic[DomainKey, Domain]):
         await repository.get_by_id([1, 1])
         ```
         """
-        async with self.session_manager.session() as session:
+        async with self.session_manager.session(read_only=True) as session:
             try:
                 entity = await self._get_by_id(session, key)
             except sqlalchemy.orm.exc.NoResultFound:
                 raise NotFoundException(f"{self.entity}의 {key}가 발견되지 않았습니다.")
             return entity.to_domain()
 
+    @instrumented("find_by_id")
     async def find_by_id(self, key: DomainKey) -> Optional[Domain]:
-        async with self.session_manager.session() as session:
+        async with self.session_manager.session(read_only=True) as session:
             if entity := await self._find_by_id(session, key):
                 return entity.to_domain()
 
+    @instrumented("find_all")
     async def find_all(self) -> List[Domain]:
-        async with self.session_manager.session() as session:
+        async with self.session_manager.session(read_only=True) as session:
             stmt = self._get_joined_select()
             entities = (await session.execute(stmt)).scalars().all()
             return [entity.to_domain() for entity in entities]
 
-    async def find_by(self, **kwargs) -> List[Domain]:
-        async with self.session_manager.session() as session:
-            criteria = create_field_criteria(self.entity, kwargs)
-            stmt = self._get_joined_select().filter(*criteria)
+    @instrumented("find_by")
+    async def find_by(self, order_by: Union[str, Sequence[str], None] = None, limit: Optional[int] = None,
+                      **kwargs) -> List[Domain]:
+        """조건에 맞는 도메인을 조회합니다. 조건 형식은 create_field_criteria 를 참고하세요.
+        ```
+        await repository.find_by(signup_at__gte=last_week, user_group__in=["A", "B"], order_by="-signup_at", limit=10)
+        ```
 
+        Args:
+            order_by: 정렬할 컬럼 이름 (- 를 붙이면 내림차순)
+            limit: 최대 조회 개수
+            kwargs: 조회 조건
+
+        Raises:
+            ValueError: 없는 컬럼이나 지원하지 않는 연산자를 사용했을 때 발생합니다.
+        """
+        # 조건 검증(ValueError)이 DB 오류로 바뀌지 않도록 session 밖에서 만듭니다.
+        stmt = self._find_by_select(order_by=order_by, limit=limit, **kwargs)
+        async with self.session_manager.session(read_only=True) as session:
             entities = (await session.execute(stmt)).scalars().all()
             return [entity.to_domain() for entity in entities]
 
+    @instrumented("find_columns")
+    async def find_columns(self, columns: Sequence[str], order_by: Union[str, Sequence[str], None] = None,
+                           limit: Optional[int] = None, **kwargs) -> List[Tuple]:
+        """엔티티를 만들지 않고 필요한 컬럼만 조회합니다.
+        ORM identity map을 거치지 않고 connection 에서 바로 실행하기 때문에, 조회 전용 hot path 에 사용합니다.
+        ```
+        await repository.find_columns(["user_role", "user_group"], account_id="paicm")
+        ```
+
+        Args:
+            columns: 조회할 컬럼 이름 목록
+            order_by: find_by 와 동일한 정렬 조건
+            limit: 최대 조회 개수
+            kwargs: find_by 와 동일한 조회 조건
+
+        Returns:
+            List[Tuple]: columns 순서대로 값을 담은 tuple 목록
+        """
+        stmt = select(*create_columns(self.entity, columns))
+        stmt = _apply_options(self.entity, stmt, kwargs, order_by, limit)
+        async with self.session_manager.session(read_only=True) as session:
+            connection = await session.connection()
+            return [tuple(row) for row in (await connection.execute(stmt)).all()]
+
+    @instrumented("exists")
+    async def exists(self, **kwargs) -> bool:
+        """조건에 맞는 row 가 있는지 확인합니다. (SELECT EXISTS, row 를 읽지 않습니다.)
+        ```
+        await repository.exists(account_id="paicm")
+        ```
+        """
+        criteria = create_field_criteria(self.entity, kwargs)
+        stmt = select(exists(select(literal(1)).select_from(self.entity).filter(*criteria)))
+        return bool(await self._scalar(stmt))
+
+    @instrumented("count")
+    async def count(self, **kwargs) -> int:
+        """조건에 맞는 row 개수 (SELECT count(*))"""
+        stmt = select(func.count()).select_from(self.entity).filter(*create_field_criteria(self.entity, kwargs))
+        return await self._scalar(stmt)
+
+    @instrumented("count_by")
+    async def count_by(self, column: str, **kwargs) -> Dict[Any, int]:
+        """column 값별 row 개수 (SELECT column, count(*) ... GROUP BY column)
+        ```
+        await repository.count_by("user_role")  # {"ADMIN": 1, "MEMBER": 10}
+        ```
+
+        Args:
+            column: 묶을 컬럼 이름
+            kwargs: find_by 와 동일한 조회 조건
+
+        Returns:
+            Dict[Any, int]: 컬럼 값별 개수 (row 가 없는 값은 포함하지 않습니다.)
+        """
+        [group_column] = create_columns(self.entity, [column])
+        stmt = select(group_column, func.count()).filter(*create_field_criteria(self.entity, kwargs))
+        stmt = stmt.group_by(group_column)
+        async with self.session_manager.session(read_only=True) as session:
+            connection = await session.connection()
+            return {value: count for value, count in (await connection.execute(stmt)).all()}
+
+    async def find_projection(self, view: Callable[..., View], columns: Sequence[str], **kwargs) -> List[View]:
+        """find_columns 결과를 가벼운 도메인 객체(view)로 변환해 반환합니다.
+
+        Args:
+            view: 컬럼 값을 순서대로 받아 객체를 만드는 함수
+            columns: 조회할 컬럼 이름 목록
+            kwargs: find_by 와 동일한 조회 조건
+        """
+        return [view(*row) for row in await self.find_columns(columns, **kwargs)]
+
+    async def _scalar(self, stmt):
+        async with self.session_manager.session(read_only=True) as session:
+            connection = await session.connection()
+            return (await connection.execute(stmt)).scalar_one()
+
+    async def warmup(self) -> None:
+        """hot path 쿼리를 미리 한 번 실행해서 SQLAlchemy compiled cache 에 올려 둡니다.
+        repository 마다 요청 경로에서 자주 쓰는 조회를 override 합니다.
+        """
+
     def _get_joined_select(self):
         query = select(self.entity)
         for attr in inspect(self.entity).relationships:
             query = query.options(joinedload(attr.class_attribute))
         return query
 
+    def _find_by_select(self, order_by=None, limit=None, **kwargs):
+        return _apply_options(self.entity, self._get_joined_select(), kwargs, order_by, limit)
+
     async def _get_by_id(self, session, key: DomainKey):
         criteria = create_id_criteria(self.entity, key)
         stmt = self._get_joined_select().filter(*criteria)
@@ -142,7 +311,186 @@ def create_id_criteria(entity: Base, key: DomainKey):
 
 
 def create_field_criteria(entity, kwargs):
-    return [getattr(entity, key) == value for key, value in kwargs.items()]
+    """조회 조건을 SQL 조건식 목록으로 변환합니다.
+
+    key 는 `컬럼` 또는 `컬럼__연산자` 형식이고, 모두 컬럼에 함수를 씌우지 않는 (index 를 탈 수 있는) 조건식이 됩니다.
+    ```
+    create_field_criteria(UserEntity, {
+        "signup_at__gte": last_week,          # signup_at >= :value
+        "user_group__in": ["A", "B"],         # user_group IN (...)
+        "account_id__startswith": "user-",    # account_id >= 'user-' AND account_id < 'user.'
+    })
+    ```
+    연산자: eq(기본값), ne, lt, lte, gt, gte, in, startswith, isnull
+
+    Raises:
+        ValueError: entity 에 없는 컬럼이거나 지원하지 않는 연산자일 때 발생합니다.
+    """
+    criteria = []
+    for key, value in kwargs.items():
+        column, operator = _compile_filter(entity, key)
+        criteria.append(FILTER_OPERATORS[operator](column, value))
+    return criteria
+
+
+class binary_collate(FunctionElement):
+    """컬럼을 code point 순서(binary collation)로 비교합니다.
+    PostgreSQL 은 `컬럼 COLLATE "C"`, SQLite 는 기본 collation 이 BINARY 라서 컬럼 그대로입니다.
+    """
+    inherit_cache = True
+
+    def __init__(self, column):
+        super().__init__(column)
+        self.type = column.type
+
+
+@compiles(binary_collate)
+def _compile_binary_collate(element, compiler, **kw):
+    return compiler.process(element.clauses.clauses[0], **kw)
+
+
+@compiles(binary_collate, "postgresql")
+def _compile_binary_collate_postgresql(element, compiler, **kw):
+    return f'{compiler.process(element.clauses.clauses[0], **kw)} COLLATE "C"'
+
+
+def _prefix_range(column, prefix: str):
+    # LIKE 'prefix%' 는 collation 에 따라 index 를 못 타기 때문에 범위 조건으로 바꿉니다.
+    # 다음 문자로 끝을 정하는 범위는 code point 순서에서만 맞기 때문에 binary collation 으로 비교합니다.
+    # (PostgreSQL 은 COLLATE "C" index 가 있어야 index 를 탑니다. 예: UserEntity 의 ix_users_account_id_c)
+    if not prefix:
+        return sqlalchemy.true()
+    column = binary_collate(column)
+    last = ord(prefix[-1])
+    if last == sys.maxunicode:
+        return column >= prefix
+    return and_(column >= prefix, column < prefix[:-1] + chr(last + 1))
+
+
+def _in(column, values):
+    values = list(values)
+    return column.in_(values) if values else sqlalchemy.false()
+
+
+FILTER_OPERATORS: Dict[str, Callable] = {
+    "eq": lambda column, value: column == value,
+    "ne": lambda column, value: column != value,
+    "lt": lambda column, value: column < value,
+    "lte": lambda column, value: column <= value,
+    "gt": lambda column, value: column > value,
+    "gte": lambda column, value: column >= value,
+    "in": _in,
+    "startswith": _prefix_range,
+    "isnull": lambda column, value: column.is_(None) if value else column.is_not(None),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _mapped_columns(entity) -> Dict[str, Any]:
+    """entity class 의 컬럼 이름별 attribute (class 마다 한 번만 만듭니다.)"""
+    return {attr.key: getattr(entity, attr.key) for attr in inspect(entity).column_attrs}
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_filter(entity, key: str) -> Tuple[Any, str]:
+    name, _, operator = key.partition("__")
+    operator = operator or "eq"
+    if operator not in FILTER_OPERATORS:
+        raise ValueError(f"지원하지 않는 연산자입니다. {key} (지원: {', '.join(FILTER_OPERATORS)})")
+    return _get_column(entity, name), operator
+
+
+def _get_column(entity, name: str):
+    try:
+        return _mapped_columns(entity)[name]
+    except KeyError:
+        raise ValueError(f"{entity.__tablename__} 에 {name} 컬럼이 없습니다.")
+
+
+def _apply_options(entity, stmt, kwargs, order_by, limit):
+    stmt = stmt.filter(*create_field_criteria(entity, kwargs))
+    if order_by is not None:
+        stmt = stmt.order_by(*create_order_by(entity, order_by))
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
+
+
+def create_order_by(entity, order_by: Union[str, Sequence[str], None]) -> list:
+    """정렬 조건을 변환합니다. 컬럼 이름 앞에 - 를 붙이면 내림차순입니다. ex. ["-signup_at", "account_id"]"""
+    if order_by is None:
+        return []
+    names = [order_by] if isinstance(order_by, str) else order_by
+    return [
+        _get_column(entity, name[1:]).desc() if name.startswith("-") else _get_column(entity, name).asc()
+        for name in names
+    ]
+
+
+def create_columns(entity, columns: Sequence[str]):
+    if not columns:
+        raise ValueError("조회할 컬럼이 없습니다.")
+    return [_get_column(entity, column) for column in columns]
+
+
+@functools.lru_cache(maxsize=None)
+def insert_if_absent(dialect_name: str, entity):
+    """충돌(primary key, unique)이 나면 아무것도 하지 않는 INSERT 문을 만듭니다. 값은 execute 할 때 넘깁니다."""
+    # dialect 모듈은 처음 호출할 때만 불러옵니다. (결과는 lru_cache)
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects import postgresql
+        return postgresql.insert(entity).on_conflict_do_nothing()
+    if dialect_name == "sqlite":
+        from sqlalchemy.dialects import sqlite
+        return sqlite.insert(entity).on_conflict_do_nothing()
+    raise DatabaseException(f"ON CONFLICT 를 지원하지 않는 database 입니다. {dialect_name}")
+
+
+def entity_values(entity: Base) -> dict:
+    """entity 객체의 컬럼 값을 dict 로 반환합니다.
+
+    None 인 값은 컬럼의 python default 가 있으면 그 값을, 없으면 None(NULL)을 넣어서
+    같은 entity 의 row 들이 항상 같은 컬럼을 갖게 합니다. (executemany 의 parameter 가 모두 같은 key 여야 합니다.)
+    DB 가 값을 만드는 컬럼(autoincrement primary key, server_default)만 None 일 때 제외합니다.
+    """
+    mapper = inspect(entity).mapper
+    autoincrement_column = mapper.local_table.autoincrement_column
+    values = {}
+    for attr in mapper.column_attrs:
+        column = attr.columns[0]
+        value = getattr(entity, attr.key)
+        if value is None:
+            if column is autoincrement_column or column.server_default is not None:
+                continue
+            value = _python_default(column)
+        values[column.key] = value
+    return values
+
+
+def _python_default(column) -> Any:
+    default = column.default
+    if default is None or not (default.is_scalar or default.is_callable):
+        return None
+    # callable default 는 SQLAlchemy 가 context 인자를 받도록 감싸 둡니다.
+    return default.arg(None) if default.is_callable else default.arg
+
+
+async def insert_many(connection, entity, rows: Sequence[dict], if_absent: bool = False) -> None:
+    """entity_values 로 만든 row 들을 INSERT (executemany) 합니다.
+    DB 가 값을 만드는 컬럼이 일부 row 에만 있으면 컬럼 조합이 같은 row 끼리 나누어 실행합니다.
+
+    Args:
+        connection: session.connection()
+        entity: 저장할 entity class
+        rows: entity_values 로 만든 row 목록
+        if_absent: True 면 이미 있는 row (primary key, unique 충돌)는 건너뜁니다. (insert_if_absent)
+    """
+    stmt = insert_if_absent(connection.dialect.name, entity) if if_absent else insert(entity)
+    groups: Dict[Tuple[str, ...], List[dict]] = {}
+    for row in rows:
+        groups.setdefault(tuple(row), []).append(row)
+    for same_rows in groups.values():
+        await connection.execute(stmt, same_rows)
 
 
 def get_primary_key(entity: Base, domain: Domain):
@@ -0,0 +1,176 @@
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import and_, bindparam, delete, inspect, update
+
+from src.abstracts.database.base import SessionManager, Domain, DomainKey
+from src.abstracts.database.repository import BaseRepository, entity_values, insert_many
+from src.exceptions import NotFoundException
+from src.metrics import REPOSITORY_SECONDS, REPOSITORY_ERRORS
+
+CREATE = "create"
+UPDATE = "update"
+DELETE = "delete"
+
+# sqlalchemy 는 컬럼 이름과 같은 bind parameter 를 쓸 수 없어서 prefix 를 붙입니다.
+_KEY_PREFIX = "_key_"
+_VALUE_PREFIX = "_value_"
+
+
+class UnitOfWork:
+    """여러 repository 의 create/update/delete 를 모아서 하나의 transaction 으로 저장합니다.
+
+    stage 한 연산은 commit 전까지 DB 에 보내지 않고, commit 할 때 entity 와 연산 종류별로 묶어서
+    묶음마다 executemany 한 번으로 실행합니다. (session 1개, commit 1번)
+    ```
+    async with UnitOfWork(session_manager) as uow:
+        uow.create(session_repository, user_session)
+        uow.update(user_repository, user)
+        uow.delete(session_repository, old_session_id)
+    # 블록이 정상적으로 끝나면 commit, exception 이 발생하면 아무것도 저장하지 않습니다.
+    ```
+
+    - 묶음은 처음 stage 한 순서대로 실행합니다.
+    - 묶어서 실행하면 순서가 바뀔 수 있기 때문에 같은 row 에 두 번 stage 할 수 없습니다.
+    - 하나라도 실패하면 전체를 rollback 하고 stage 한 연산을 모두 버립니다.
+    - create 는 create_many 처럼 autoincrement 값을 도메인에 다시 반영하지 않습니다.
+    """
+
+    def __init__(self, session_manager: SessionManager):
+        self.session_manager = session_manager
+        self._groups: Dict[Tuple[type, str], List[dict]] = {}
+        self._staged_keys: Set[Tuple[type, tuple]] = set()
+
+    @property
+    def pending(self) -> int:
+        """stage 한 연산 개수"""
+        return sum(len(rows) for rows in self._groups.values())
+
+    async def __aenter__(self) -> "UnitOfWork":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            await self.commit()
+        else:
+            self.rollback()
+
+    def create(self, repository: BaseRepository, domain: Domain, **kwargs) -> None:
+        """도메인 저장을 stage 합니다.
+
+        Args:
+            repository: 도메인의 repository
+            domain: 저장할 도메인
+            kwargs: entity.from_domain 에 추가로 넘길 값 (예: UserEntity 의 password)
+        """
+        entity = repository.entity.from_domain(domain, **kwargs)
+        self._stage(repository.entity, CREATE, entity.primary_key(), entity_values(entity))
+
+    def update(self, repository: BaseRepository, domain: Domain) -> None:
+        """도메인 수정을 stage 합니다. entity.update 가 바꾸는 컬럼만 수정합니다.
+
+        Raises:
+            NotFoundException: (commit 시) 수정할 row 가 없을 때 발생합니다.
+        """
+        entity_class = repository.entity
+        key = entity_class.from_domain(domain).primary_key()
+        changed = entity_class()
+        changed.update(domain)
+        values = {
+            _VALUE_PREFIX + attr.key: getattr(changed, attr.key)
+            for attr in inspect(entity_class).column_attrs if attr.key in changed.__dict__
+        }
+        values.update(_key_params(entity_class, key))
+        self._stage(entity_class, UPDATE, key, values)
+
+    def delete(self, repository: BaseRepository, key: DomainKey) -> None:
+        """primary key 로 삭제를 stage 합니다.
+
+        Raises:
+            NotFoundException: (commit 시) 삭제할 row 가 없을 때 발생합니다.
+        """
+        self._stage(repository.entity, DELETE, key, _key_params(repository.entity, key))
+
+    async def commit(self) -> None:
+        """stage 한 연산을 하나의 transaction 으로 저장합니다. 실패하면 아무것도 저장하지 않습니다.
+
+        Raises:
+            NotFoundException: 수정/삭제할 row 가 없을 때 발생합니다.
+            DBIntegrityException: 무결성 제약을 위반했을 때 발생합니다.
+        """
+        groups, self._groups = self._groups, {}
+        self._staged_keys = set()
+        if not groups:
+            return
+        async with self.session_manager.session() as session:
+            connection = await session.connection()
+            for (entity_class, operation), rows in groups.items():
+                await _execute_group(connection, entity_class, operation, rows)
+            await session.commit()
+
+    def rollback(self) -> None:
+        """stage 한 연산을 모두 버립니다. (DB 에는 아무것도 보내지 않았기 때문에 되돌릴 것이 없습니다.)"""
+        self._groups = {}
+        self._staged_keys = set()
+
+    def _stage(self, entity_class: type, operation: str, key: Optional[DomainKey], row: dict) -> None:
+        if key is not None:
+            staged_key = (entity_class, tuple(key) if isinstance(key, (list, tuple)) else (key,))
+            if staged_key in self._staged_keys:
+                raise ValueError(f"{entity_class.__tablename__} 의 {key} 에 이미 stage 한 연산이 있습니다.")
+            self._staged_keys.add(staged_key)
+        self._groups.setdefault((entity_class, operation), []).append(row)
+
+
+async def _execute_group(connection, entity_class: type, operation: str, rows: List[dict]) -> None:
+    table_name = entity_class.__tablename__
+    label = f"uow_{operation}"
+    started = time.perf_counter()
+    try:
+        if operation == CREATE:
+            await insert_many(connection, entity_class, rows)
+            return
+        stmt = update(entity_class) if operation == UPDATE else delete(entity_class)
+        stmt = stmt.where(_key_criteria(entity_class))
+        if operation == UPDATE:
+            # 묶음 안에서 수정할 컬럼이 같아야 executemany 가 가능하기 때문에 컬럼 조합별로 실행합니다.
+            for columns, same_rows in _group_by_columns(rows).items():
+                stmt_values = stmt.values({column: bindparam(_VALUE_PREFIX + column) for column in columns})
+                await _execute_checked(connection, stmt_values, same_rows, table_name, operation)
+        else:
+            await _execute_checked(connection, stmt, rows, table_name, operation)
+    except Exception as e:
+        REPOSITORY_ERRORS.labels(table_name, label, type(e).__name__).inc()
+        raise
+    finally:
+        REPOSITORY_SECONDS.labels(table_name, label).observe(time.perf_counter() - started)
+
+
+async def _execute_checked(connection, stmt, rows: List[dict], table_name: str, operation: str) -> None:
+    if len(rows) == 1 or connection.dialect.supports_sane_multi_rowcount:
+        matched = (await connection.execute(stmt, rows)).rowcount
+    else:
+        # executemany 의 rowcount 가 정확하지 않은 driver (asyncpg 등)는 row 마다 실행해서 셉니다.
+        matched = 0
+        for row in rows:
+            matched += (await connection.execute(stmt, row)).rowcount
+    if matched != len(rows):
+        raise NotFoundException(f"{table_name} 에서 {operation} 할 row 중 {len(rows) - matched}개가 없습니다.")
+
+
+def _group_by_columns(rows: List[dict]) -> Dict[Tuple[str, ...], List[dict]]:
+    groups: Dict[Tuple[str, ...], List[dict]] = {}
+    for row in rows:
+        columns = tuple(column[len(_VALUE_PREFIX):] for column in row if column.startswith(_VALUE_PREFIX))
+        groups.setdefault(columns, []).append(row)
+    return groups
+
+
+def _key_criteria(entity_class: type):
+    return and_(*[column == bindparam(_KEY_PREFIX + column.key) for column in inspect(entity_class).primary_key])
+
+
+def _key_params(entity_class: type, key: DomainKey) -> dict:
+    columns = inspect(entity_class).primary_key
+    values = key if len(columns) > 1 else [key]
+    return {_KEY_PREFIX + column.key: value for column, value in zip(columns, values)}
@@ -0,0 +1,84 @@
+import asyncio
+import json
+from typing import List, Optional
+
+from src.abstracts.batching import BatchWriter
+from src.audit.repository import AuditRepository
+from src.domain import AuditEvent
+
+
+class JsonlAuditSink:
+    """audit log 를 한 줄에 하나씩 json 으로 파일 끝에 덧붙입니다. (append only)"""
+
+    def __init__(self, fpath: str):
+        self.fpath = fpath
+
+    def write(self, events: List[AuditEvent]) -> None:
+        lines = "".join(json.dumps(event.to_dict(), ensure_ascii=False) + "\n" for event in events)
+        with open(self.fpath, "a", encoding="utf-8") as f:
+            f.write(lines)
+
+
+class AuditLogger:
+    """인증 이벤트를 bounded queue 에 넣고, background task 가 batch 단위로 저장합니다.
+
+    queue 가 가득 차면 backpressure=True 일 때는 자리가 날 때까지 기다리고,
+    False 일 때는 버린 뒤 paip_auth_batch_items{writer="audit",status="dropped"} 로 기록합니다.
+    """
+
+    def __init__(
+            self,
+            repository: AuditRepository,
+            batch_size: int = 200,
+            linger_ms: float = 50,
+            max_queue_size: int = 10000,
+            backpressure: bool = False,
+            sink: Optional[JsonlAuditSink] = None,
+    ):
+        """
+        Args:
+            repository: AuditRepository
+            batch_size: 한 번에 INSERT 할 최대 이벤트 개수
+            linger_ms: batch 를 채우기 위해 기다리는 최대 시간
+            max_queue_size: 저장 대기 중인 이벤트 최대 개수
+            backpressure: queue 가 가득 찼을 때 기다릴지(True), 버릴지(False)
+            sink: DB 와 함께 기록할 jsonl 파일 sink
+        """
+        self.repository = repository
+        self.sink = sink
+        self.backpressure = backpressure
+        self.writer = BatchWriter("audit", self._write, batch_size, linger_ms, max_queue_size)
+
+    async def start(self) -> None:
+        await self.writer.start()
+
+    async def stop(self) -> None:
+        """남은 이벤트를 모두 저장하고 멈춥니다."""
+        await self.writer.stop()
+
+    async def flush(self) -> None:
+        await self.writer.flush()
+
+    async def record(self, event: AuditEvent) -> bool:
+        """이벤트를 저장 대기열에 넣습니다.
+
+        Returns:
+            bool: queue 가 가득 차서 버렸으면 False
+        """
+        if self.backpressure:
+            await self.writer.put(event)
+            return True
+        return self.record_nowait(event)
+
+    def record_nowait(self, event: AuditEvent) -> bool:
+        """backpressure 와 관계없이 기다리지 않고 저장 대기열에 넣습니다. (취소 중인 task 에서 사용)
+
+        Returns:
+            bool: queue 가 가득 차서 버렸으면 False
+        """
+        return self.writer.submit(event)
+
+    async def _write(self, events: List[AuditEvent]) -> None:
+        if self.sink is not None:
+            await asyncio.to_thread(self.sink.write, events)
+        await self.repository.create_many(events)
@@ -0,0 +1,44 @@
+from sqlalchemy import Column, Integer, String, DateTime
+
+from src.domain import AuditEvent, AuditEventType
+
+from src.abstracts.database.base import Base, DomainKey
+
+
+class AuditEntity(Base):
+
+    __tablename__ = "audit_logs"
+
+    audit_id = Column(Integer, primary_key=True, autoincrement=True)
+    event_type = Column(String, nullable=False)
+    account_id = Column(String, nullable=True, index=True)
+    client_ip = Column(String, nullable=True)
+    outcome = Column(String, nullable=False)
+    occurred_at = Column(DateTime, nullable=False, index=True)
+
+    @staticmethod
+    def from_domain(domain: AuditEvent):
+        return AuditEntity(
+            audit_id=domain.audit_id,
+            event_type=domain.event_type.value,
+            account_id=domain.account_id,
+            client_ip=domain.client_ip,
+            outcome=domain.outcome,
+            occurred_at=domain.occurred_at,
+        )
+
+    def to_domain(self) -> AuditEvent:
+        return AuditEvent(
+            audit_id=self.audit_id,
+            event_type=AuditEventType(self.event_type),
+            account_id=self.account_id,
+            client_ip=self.client_ip,
+            outcome=self.outcome,
+            occurred_at=self.occurred_at,
+        )
+
+    def update(self, domain: AuditEvent):
+        raise NotImplementedError("audit log 는 수정할 수 없습니다.")
+
+    def primary_key(self) -> DomainKey:
+        return self.audit_id
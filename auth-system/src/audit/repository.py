@@ -0,0 +1,6 @@
+from src.abstracts.database.repository import BaseRepository
+from src.audit.models import AuditEntity
+
+
+class AuditRepository(BaseRepository):
+    entity = AuditEntity
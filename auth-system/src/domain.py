@@ -5,6 +5,10 @@ from typing import Optional
 
 from src.exceptions import InvalidTokenException
 
+# tenant 를 나누지 않은 배포와 tenant claim 이 없는 기존 토큰은 이 tenant 로 취급합니다.
+DEFAULT_TENANT = "default"
+TENANT_CLAIM = "tenant"
+
 
 class UserRole(Enum):
     PENDING = 'PENDING'
@@ -52,6 +56,7 @@ class LoginRequest:
     """ 로그인에 필요한 필수 정보"""
     account_id: str
     password: Optional[str]
+    client_ip: Optional[str] = None
 
 
 @dataclass
@@ -62,12 +67,14 @@ class UserAuth:
     account_id: str
     role: UserRole
     group: str
+    tenant: str = DEFAULT_TENANT
 
     def to_dict(self):
         return {
             "account_id": self.account_id,
             "user_role": self.role.value,
             "user_group": self.group,
+            TENANT_CLAIM: self.tenant,
         }
 
 
@@ -111,6 +118,31 @@ class Token:
     """JWT Token 객체"""
     access: str
     refresh: str
+    session_id: Optional[str] = None  # refresh token 의 jti
+
+
+@dataclass
+class UserSession:
+    """발급된 refresh token 단위의 로그인 세션"""
+    session_id: str
+    account_id: str
+    issued_at: datetime
+    expires_at: datetime
+
+
+@dataclass
+class Group:
+    """사용자 그룹 (parent_id 가 있으면 상위 그룹에 포함됩니다.)"""
+    group_id: str
+    name: str
+    parent_id: Optional[str] = None
+
+
+@dataclass
+class GroupMembership:
+    """사용자가 직접 속한 그룹 (상위 그룹 소속은 GroupIndex 가 계산합니다.)"""
+    account_id: str
+    group_id: str
 
 
 class TokenType(Enum):
@@ -123,3 +155,40 @@ class TokenType(Enum):
             if token_type.value.lower().strip() == text.lower().strip():
                 return token_type
         raise InvalidTokenException("유효하지 않은 토큰 타입입니다.")
+
+
+class AuditEventType(Enum):
+    SIGN_UP = "SIGN_UP"
+    LOGIN = "LOGIN"
+    REFRESH = "REFRESH"
+
+
+@dataclass
+class AuditEvent:
+    """인증 감사 로그 (outcome 은 성공 시 success, 실패 시 exception 이름)"""
+    audit_id: Optional[int]
+    event_type: AuditEventType
+    account_id: Optional[str]
+    client_ip: Optional[str]
+    outcome: str
+    occurred_at: datetime
+
+    @staticmethod
+    def new(event_type: AuditEventType, account_id: Optional[str], client_ip: Optional[str], outcome: str):
+        return AuditEvent(
+            audit_id=None,
+            event_type=event_type,
+            account_id=account_id,
+            client_ip=client_ip,
+            outcome=outcome,
+            occurred_at=datetime.now(),
+        )
+
+    def to_dict(self):
+        return {
+            "event_type": self.event_type.value,
+            "account_id": self.account_id,
+            "client_ip": self.client_ip,
+            "outcome": self.outcome,
+            "occurred_at": self.occurred_at.isoformat(),
+        }
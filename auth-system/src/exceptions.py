@@ -31,3 +31,36 @@ class InvalidTokenException(PaipAuthException):
 
 class ExpiredTokenException(InvalidTokenException):
     """만료된 토큰일 때"""
+
+
+class VerifierException(PaipAuthException):
+    """토큰 검증 daemon 이 오류로 토큰을 검증하지 못했을 때 (토큰이 잘못된 것은 아님)"""
+
+
+class CryptoException(PaipAuthException):
+    """암호화/복호화에 실패했을 때"""
+
+
+class InvalidKeyException(CryptoException):
+    """key 를 읽거나 파싱할 수 없을 때"""
+
+
+class ForbiddenException(PaipAuthException):
+    """인증은 되었지만 권한이 없을 때"""
+
+
+class UnknownTenantException(PaipAuthException):
+    """설정에 없는 tenant 일 때"""
+
+
+class OverloadedException(PaipAuthException):
+    """처리 중인 요청이 많아서 바로 거절할 때"""
+
+    def __init__(self, message: str, retry_after: float):
+        """
+        Args:
+            message: 오류 메시지
+            retry_after: 다시 시도하기 전에 기다릴 시간(초)
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
@@ -0,0 +1,79 @@
+from typing import FrozenSet
+
+from src.domain import Group, GroupMembership
+from src.groups.index import GroupIndex
+from src.groups.repository import GroupRepository, MembershipRepository
+
+
+class GroupDirectory:
+    """그룹/membership 을 DB 에 저장하고, 같은 변경을 GroupIndex 에도 반영합니다.
+
+    조회(is_member, groups_of)는 DB 를 거치지 않고 index 만 사용합니다.
+    index 는 이 프로세스에서 일어난 변경만 반영하기 때문에, 다른 프로세스에서 변경했다면 load 로 다시 적재해야 합니다.
+    ```
+    directory = GroupDirectory(GroupRepository(session_manager), MembershipRepository(session_manager))
+    await directory.load()
+    directory.is_member("paicm", "paip")
+    ```
+    """
+
+    def __init__(self, group_repository: GroupRepository, membership_repository: MembershipRepository):
+        self.group_repository = group_repository
+        self.membership_repository = membership_repository
+        self.index = GroupIndex()
+
+    async def load(self) -> None:
+        """DB 의 전체 그룹과 membership 으로 index 를 다시 만듭니다."""
+        groups = await self.group_repository.find_all_groups()
+        memberships = await self.membership_repository.find_all_memberships()
+        self.index = GroupIndex.build(groups, memberships)
+
+    def is_member(self, account_id: str, group_id: str) -> bool:
+        return self.index.is_member(account_id, group_id)
+
+    def groups_of(self, account_id: str) -> FrozenSet[str]:
+        return self.index.groups_of(account_id)
+
+    async def save_group(self, group: Group) -> None:
+        """그룹을 추가하거나 이름/상위 그룹을 변경합니다.
+
+        Raises:
+            NotFoundException: 상위 그룹이 없을 때 발생합니다.
+            ValueError: 하위 그룹을 상위 그룹으로 지정할 때 발생합니다.
+        """
+        self.index.validate_group(group)
+        await self.group_repository.save(group)
+        self.index.put_group(group)
+
+    async def delete_group(self, group_id: str) -> None:
+        """하위 그룹이 없는 그룹과 그 membership 을 삭제합니다.
+
+        Raises:
+            ValueError: 하위 그룹이 있을 때 발생합니다.
+        """
+        self.index.validate_removal(group_id)
+        await self.membership_repository.delete_by_group(group_id)
+        await self.group_repository.delete(group_id)
+        self.index.remove_group(group_id)
+
+    async def add_member(self, account_id: str, group_id: str) -> None:
+        """사용자를 그룹에 추가합니다.
+
+        Raises:
+            NotFoundException: 그룹이 없을 때 발생합니다.
+            AlreadyExistsException: 이미 그룹에 속해 있을 때 발생합니다.
+        """
+        membership = GroupMembership(account_id, group_id)
+        self.index.check_group(group_id)
+        await self.membership_repository.create(membership)
+        self.index.add_membership(membership)
+
+    async def remove_member(self, account_id: str, group_id: str) -> None:
+        """사용자를 그룹에서 제외합니다.
+
+        Raises:
+            NotFoundException: 그룹에 속해 있지 않을 때 발생합니다.
+        """
+        membership = GroupMembership(account_id, group_id)
+        await self.membership_repository.delete([account_id, group_id])
+        self.index.remove_membership(membership)
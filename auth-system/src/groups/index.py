@@ -0,0 +1,207 @@
+"""그룹 소속 여부를 O(1) 로 확인하기 위한 in-memory transitive closure index
+
+그룹은 parent_id 로 트리를 이루고, 사용자는 여러 그룹에 직접 속할 수 있습니다.
+사용자가 그룹 G 에 속한다는 것은 직접 속한 그룹 중 하나가 G 이거나 G 의 하위 그룹이라는 뜻입니다.
+
+요청마다 재귀 쿼리를 하지 않도록 다음을 미리 계산해 둡니다.
+    _ancestors[group_id]   그룹 자신과 모든 상위 그룹
+    _effective[account_id] 직접 속한 그룹들의 _ancestors 합집합 (사용자가 속한 모든 그룹)
+그래서 is_member 는 set 조회 한 번이고, 변경이 생기면 영향을 받는 그룹/사용자만 다시 계산합니다.
+"""
+import gc
+from typing import Dict, FrozenSet, Iterable, Optional, Set
+
+from src.domain import Group, GroupMembership
+from src.exceptions import NotFoundException
+
+
+class GroupIndex:
+
+    def __init__(self):
+        self._parents: Dict[str, Optional[str]] = {}
+        self._children: Dict[str, Set[str]] = {}
+        self._ancestors: Dict[str, FrozenSet[str]] = {}
+        # group_id -> 직접 속한 account_id
+        self._members: Dict[str, Set[str]] = {}
+        # account_id -> 직접 속한 group_id
+        self._direct: Dict[str, Set[str]] = {}
+        self._effective: Dict[str, FrozenSet[str]] = {}
+
+    @staticmethod
+    def build(groups: Iterable[Group], memberships: Iterable[GroupMembership]) -> "GroupIndex":
+        """전체 그룹과 membership 으로 index 를 만듭니다. (그룹 순서는 상관없습니다.)
+
+        Raises:
+            NotFoundException: 없는 상위 그룹이나 그룹을 참조할 때 발생합니다.
+            ValueError: 그룹 상속에 순환이 있을 때 발생합니다.
+        """
+        index = GroupIndex()
+        # 수십만 개의 set 을 한 번에 만들 때 cyclic GC 가 반복해서 도는 비용을 피합니다. (참조 순환은 만들지 않습니다.)
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            index._build(groups, memberships)
+        finally:
+            if gc_enabled:
+                gc.enable()
+        return index
+
+    def _build(self, groups: Iterable[Group], memberships: Iterable[GroupMembership]) -> None:
+        for group in groups:
+            self._parents[group.group_id] = group.parent_id
+            self._children.setdefault(group.group_id, set())
+        for group_id, parent_id in self._parents.items():
+            if parent_id is not None:
+                if parent_id not in self._parents:
+                    raise NotFoundException(f"상위 그룹이 없습니다. {parent_id}")
+                self._children[parent_id].add(group_id)
+        for root in [group_id for group_id, parent_id in self._parents.items() if parent_id is None]:
+            self._refresh_ancestors(root)
+        if len(self._ancestors) != len(self._parents):
+            raise ValueError("그룹 상속에 순환이 있습니다.")
+
+        for membership in memberships:
+            self.check_group(membership.group_id)
+            self._members.setdefault(membership.group_id, set()).add(membership.account_id)
+            self._direct.setdefault(membership.account_id, set()).add(membership.group_id)
+        for account_id in self._direct:
+            self._refresh_effective(account_id)
+
+    def __len__(self) -> int:
+        return len(self._parents)
+
+    def __contains__(self, group_id: str) -> bool:
+        return group_id in self._parents
+
+    def is_member(self, account_id: str, group_id: str) -> bool:
+        """사용자가 그룹(또는 그 하위 그룹)에 속해 있는지 확인합니다."""
+        effective = self._effective.get(account_id)
+        return effective is not None and group_id in effective
+
+    def groups_of(self, account_id: str) -> FrozenSet[str]:
+        """사용자가 속한 모든 그룹 (상위 그룹 포함)"""
+        return self._effective.get(account_id, frozenset())
+
+    def ancestors_of(self, group_id: str) -> FrozenSet[str]:
+        """그룹 자신과 모든 상위 그룹"""
+        self.check_group(group_id)
+        return self._ancestors[group_id]
+
+    def put_group(self, group: Group) -> None:
+        """그룹을 추가하거나 상위 그룹을 변경합니다.
+        상위 그룹이 바뀌면 하위 트리의 그룹과 그 그룹에 직접 속한 사용자만 다시 계산합니다.
+
+        Raises:
+            NotFoundException: 상위 그룹이 없을 때 발생합니다.
+            ValueError: 자기 자신이나 하위 그룹을 상위 그룹으로 지정할 때 발생합니다.
+        """
+        self.validate_group(group)
+        group_id, parent_id = group.group_id, group.parent_id
+        if group_id in self._parents:
+            if self._parents[group_id] == parent_id:
+                return
+            old_parent_id = self._parents[group_id]
+            if old_parent_id is not None:
+                self._children[old_parent_id].discard(group_id)
+        else:
+            self._children[group_id] = set()
+
+        self._parents[group_id] = parent_id
+        if parent_id is not None:
+            self._children[parent_id].add(group_id)
+        affected_groups = self._refresh_ancestors(group_id)
+        self._refresh_members_of(affected_groups)
+
+    def remove_group(self, group_id: str) -> None:
+        """하위 그룹이 없는 그룹을 삭제합니다. 그룹에 직접 속한 membership 도 함께 삭제합니다.
+
+        Raises:
+            ValueError: 하위 그룹이 있을 때 발생합니다.
+        """
+        self.validate_removal(group_id)
+        parent_id = self._parents.pop(group_id)
+        if parent_id is not None:
+            self._children[parent_id].discard(group_id)
+        del self._children[group_id]
+        del self._ancestors[group_id]
+        for account_id in self._members.pop(group_id, set()):
+            self._direct[account_id].discard(group_id)
+            self._refresh_effective(account_id)
+
+    def validate_group(self, group: Group) -> None:
+        """put_group 할 수 있는 그룹인지 검증합니다. (index 는 바꾸지 않습니다.)
+
+        Raises:
+            NotFoundException: 상위 그룹이 없을 때 발생합니다.
+            ValueError: 자기 자신이나 하위 그룹을 상위 그룹으로 지정할 때 발생합니다.
+        """
+        if group.parent_id is not None:
+            self.check_group(group.parent_id)
+            if group.group_id in self._ancestors[group.parent_id]:
+                raise ValueError(f"하위 그룹을 상위 그룹으로 지정할 수 없습니다. {group.group_id} -> {group.parent_id}")
+
+    def validate_removal(self, group_id: str) -> None:
+        """remove_group 할 수 있는 그룹인지 검증합니다.
+
+        Raises:
+            NotFoundException: 그룹이 없을 때 발생합니다.
+            ValueError: 하위 그룹이 있을 때 발생합니다.
+        """
+        self.check_group(group_id)
+        if self._children[group_id]:
+            raise ValueError(f"하위 그룹이 있는 그룹은 삭제할 수 없습니다. {group_id}")
+
+    def check_group(self, group_id: str) -> None:
+        """
+        Raises:
+            NotFoundException: 그룹이 없을 때 발생합니다.
+        """
+        if group_id not in self._parents:
+            raise NotFoundException(f"그룹이 없습니다. {group_id}")
+
+    def add_membership(self, membership: GroupMembership) -> None:
+        """사용자를 그룹에 추가합니다. 추가한 그룹의 상위 그룹만 합치면 되기 때문에 O(depth) 입니다."""
+        account_id, group_id = membership.account_id, membership.group_id
+        self.check_group(group_id)
+        self._members.setdefault(group_id, set()).add(account_id)
+        self._direct.setdefault(account_id, set()).add(group_id)
+        self._effective[account_id] = self._effective.get(account_id, frozenset()) | self._ancestors[group_id]
+
+    def remove_membership(self, membership: GroupMembership) -> None:
+        """사용자를 그룹에서 제외합니다. (다른 그룹을 통해 같은 상위 그룹에 속할 수 있어서 해당 사용자만 다시 계산합니다.)"""
+        account_id, group_id = membership.account_id, membership.group_id
+        self._members.get(group_id, set()).discard(account_id)
+        self._direct.get(account_id, set()).discard(group_id)
+        self._refresh_effective(account_id)
+
+    def _refresh_ancestors(self, group_id: str) -> Set[str]:
+        """group_id 와 하위 트리의 _ancestors 를 다시 계산하고, 계산한 그룹 목록을 반환합니다."""
+        parent_id = self._parents[group_id]
+        parent_ancestors = self._ancestors[parent_id] if parent_id is not None else frozenset()
+        refreshed = set()
+        stack = [(group_id, parent_ancestors)]
+        while stack:
+            current, inherited = stack.pop()
+            ancestors = self._ancestors[current] = inherited | {current}
+            refreshed.add(current)
+            stack.extend((child, ancestors) for child in self._children[current])
+        return refreshed
+
+    def _refresh_members_of(self, group_ids: Iterable[str]) -> None:
+        account_ids = set()
+        for group_id in group_ids:
+            account_ids.update(self._members.get(group_id, ()))
+        for account_id in account_ids:
+            self._refresh_effective(account_id)
+
+    def _refresh_effective(self, account_id: str) -> None:
+        direct = self._direct.get(account_id)
+        if not direct:
+            self._direct.pop(account_id, None)
+            self._effective.pop(account_id, None)
+            return
+        if len(direct) == 1:
+            # 그룹 하나에만 속하면 그룹의 _ancestors 를 복사하지 않고 같이 씁니다.
+            self._effective[account_id] = self._ancestors[next(iter(direct))]
+        else:
+            self._effective[account_id] = frozenset().union(*(self._ancestors[group_id] for group_id in direct))
@@ -0,0 +1,63 @@
+from sqlalchemy import Column, String
+
+from src.domain import Group, GroupMembership
+
+from src.abstracts.database.base import Base, DomainKey
+
+
+class GroupEntity(Base):
+
+    __tablename__ = "user_groups"
+
+    group_id = Column(String, primary_key=True)
+    name = Column(String, nullable=False)
+    parent_id = Column(String, nullable=True, index=True)
+
+    @staticmethod
+    def from_domain(domain: Group):
+        return GroupEntity(
+            group_id=domain.group_id,
+            name=domain.name,
+            parent_id=domain.parent_id,
+        )
+
+    def to_domain(self) -> Group:
+        return Group(
+            group_id=self.group_id,
+            name=self.name,
+            parent_id=self.parent_id,
+        )
+
+    def update(self, domain: Group):
+        self.name = domain.name
+        self.parent_id = domain.parent_id
+
+    def primary_key(self) -> DomainKey:
+        return self.group_id
+
+
+class MembershipEntity(Base):
+
+    __tablename__ = "group_memberships"
+
+    account_id = Column(String, primary_key=True)
+    group_id = Column(String, primary_key=True, index=True)
+
+    @staticmethod
+    def from_domain(domain: GroupMembership):
+        return MembershipEntity(
+            account_id=domain.account_id,
+            group_id=domain.group_id,
+        )
+
+    def to_domain(self) -> GroupMembership:
+        return GroupMembership(
+            account_id=self.account_id,
+            group_id=self.group_id,
+        )
+
+    def update(self, domain: GroupMembership):
+        raise NotImplementedError("membership 은 수정하지 않고 삭제 후 다시 추가합니다.")
+
+    def primary_key(self) -> DomainKey:
+        return [self.account_id, self.group_id]
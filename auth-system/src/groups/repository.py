@@ -0,0 +1,36 @@
+from typing import List
+
+from sqlalchemy import delete
+
+from src.abstracts.database.repository import BaseRepository, instrumented
+from src.domain import Group, GroupMembership
+from src.groups.models import GroupEntity, MembershipEntity
+
+
+class GroupRepository(BaseRepository):
+    entity = GroupEntity
+
+    async def find_all_groups(self) -> List[Group]:
+        """전체 그룹 목록 (GroupIndex 적재용, ORM 객체를 만들지 않습니다.)"""
+        return await self.find_projection(Group, ["group_id", "name", "parent_id"])
+
+
+class MembershipRepository(BaseRepository):
+    entity = MembershipEntity
+
+    async def find_all_memberships(self) -> List[GroupMembership]:
+        """전체 membership 목록 (GroupIndex 적재용, ORM 객체를 만들지 않습니다.)"""
+        return await self.find_projection(GroupMembership, ["account_id", "group_id"])
+
+    @instrumented("delete_by_group")
+    async def delete_by_group(self, group_id: str) -> int:
+        """그룹의 모든 membership 을 삭제합니다.
+
+        Returns:
+            int: 삭제된 membership 개수
+        """
+        async with self.session_manager.session() as session:
+            stmt = delete(MembershipEntity).filter(MembershipEntity.group_id == group_id)
+            count = (await session.execute(stmt)).rowcount
+            await session.commit()
+            return count
@@ -0,0 +1,104 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from src.abstracts.database.base import SessionManager
+from src.exceptions import DatabaseException
+
+
+@dataclass
+class HealthStatus:
+    ok: bool
+    # 마지막 DB ping 결과
+    database: Optional[bool]
+    warmed_up: bool
+    checked_at: Optional[datetime]
+    error: Optional[str] = None
+
+    def to_dict(self):
+        return {
+            "status": "ok" if self.ok else "unavailable",
+            "database": self.database,
+            "warmed_up": self.warmed_up,
+            "checked_at": self.checked_at.isoformat() if self.checked_at else None,
+            "error": self.error,
+        }
+
+
+class HealthChecker:
+    """liveness/readiness probe
+
+    probe 마다 DB 에 쿼리하지 않도록 ping 결과를 ttl 초 동안 재사용하고,
+    동시에 들어온 probe 는 진행 중인 ping 하나를 같이 기다립니다. (DB ping 은 ttl 당 최대 한 번)
+    """
+
+    def __init__(self, session_manager: SessionManager, ttl: float = 5.0, timeout: float = 1.0):
+        """
+        Args:
+            session_manager: SessionManager
+            ttl: ping 결과를 재사용하는 시간(초)
+            timeout: ping 최대 대기 시간(초)
+        """
+        self.session_manager = session_manager
+        self.ttl = ttl
+        self.timeout = timeout
+        self.warmed_up = False
+        self.ping_count = 0
+        self._database: Optional[bool] = None
+        self._error: Optional[str] = None
+        self._checked_at: Optional[float] = None
+        self._checked_time: Optional[datetime] = None
+        self._pinging: Optional[asyncio.Task] = None
+
+    def mark_warmed_up(self) -> None:
+        self.warmed_up = True
+
+    async def liveness(self) -> HealthStatus:
+        """프로세스가 응답할 수 있는지 확인합니다.
+        DB 장애로 모든 인스턴스가 재시작되지 않도록 DB 상태는 결과에 포함만 하고 판단에는 쓰지 않습니다.
+        """
+        return self._status(ok=True)
+
+    async def readiness(self) -> HealthStatus:
+        """warmup 이 끝났고 DB 에 접속할 수 있으면 요청을 받을 준비가 된 것입니다."""
+        database = await self.check_database()
+        return self._status(ok=self.warmed_up and database)
+
+    async def check_database(self) -> bool:
+        """DB 접속 가능 여부 (ttl 동안은 마지막 결과를 반환합니다.)"""
+        if self._checked_at is not None and time.monotonic() - self._checked_at < self.ttl:
+            return self._database
+        if self._pinging is None:
+            self._pinging = asyncio.create_task(self._ping())
+        pinging = self._pinging
+        # probe 하나가 취소되어도 다른 probe 가 기다리는 ping 은 계속 진행합니다.
+        return await asyncio.shield(pinging)
+
+    async def _ping(self) -> bool:
+        self.ping_count += 1
+        try:
+            await asyncio.wait_for(self.session_manager.ping(), self.timeout)
+            self._database, self._error = True, None
+        except asyncio.TimeoutError:
+            self._database, self._error = False, f"DB ping 이 {self.timeout}초 안에 끝나지 않았습니다."
+        except DatabaseException as e:
+            self._database, self._error = False, e.message
+        except Exception as e:
+            # 결과를 갱신하지 않으면 ttl 동안 이전 결과(정상)를 반환합니다.
+            self._database, self._error = False, f"DB ping 에 실패했습니다. {e!r}"
+        finally:
+            self._checked_at = time.monotonic()
+            self._checked_time = datetime.now()
+            self._pinging = None
+        return self._database
+
+    def _status(self, ok: bool) -> HealthStatus:
+        return HealthStatus(
+            ok=ok,
+            database=self._database,
+            warmed_up=self.warmed_up,
+            checked_at=self._checked_time,
+            error=self._error,
+        )
@@ -0,0 +1,31 @@
+"""무거운 모듈을 처음 사용할 때 불러오기
+
+CLI 나 sidecar 처럼 짧게 실행되는 프로세스는 실행 시간의 대부분을 import 에 씁니다.
+hot path 에서만 쓰는 모듈은 module 수준에서 lazy_import 로 받아 두면, 속성에 처음 접근할 때 import 합니다.
+```
+jwt = lazy_import("jwt")   # 여기서는 모듈을 찾기만 하고
+jwt.decode(...)            # 여기서 import 합니다.
+```
+"""
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """name 모듈을 속성에 처음 접근할 때 import 하는 모듈 객체를 반환합니다. (이미 import 했으면 그대로 반환)
+
+    Raises:
+        ModuleNotFoundError: 모듈이 설치되어 있지 않을 때 발생합니다. (없는 모듈은 바로 알 수 있습니다.)
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
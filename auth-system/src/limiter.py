@@ -0,0 +1,95 @@
+"""관찰한 지연 시간에 맞춰 동시 처리 개수를 조절하는 limiter (AIMD)
+
+DB 가 느려지면 로그인 요청이 connection pool 앞에 계속 쌓이고, 대기 시간이 끝없이 늘어나다가 모두 timeout 됩니다.
+처리 중인 요청이 limit 이상이면 기다리게 하지 않고 바로 OverloadedException(retry_after)으로 거절합니다.
+
+- 요청이 target_latency 안에 끝나면 limit 을 천천히 늘립니다. (limit 마다 +1, TCP congestion avoidance 와 같음)
+- target_latency 를 넘기거나 DB 오류로 끝나면 limit 을 backoff 배로 줄입니다.
+  동시에 끝난 요청들이 한 번에 여러 번 줄이지 않도록, 최근 지연 시간(smoothed) 안에는 한 번만 줄입니다.
+
+budget(limiter)을 흐름마다 따로 두어서 느린 로그인이 refresh 를 막지 않게 합니다.
+토큰 검증은 DB 를 사용하지 않기 때문에 limiter 를 거치지 않습니다.
+"""
+import asyncio
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from src.exceptions import DatabaseException, OverloadedException
+from src.metrics import LIMITER_REJECTIONS
+
+
+class AdaptiveLimiter:
+    """budget 하나의 동시 처리 개수 제한"""
+
+    def __init__(
+            self,
+            name: str,
+            target_latency: float,
+            initial_limit: int = 20,
+            min_limit: int = 1,
+            max_limit: int = 200,
+            backoff: float = 0.9,
+            min_retry_after: float = 1.0,
+    ):
+        """
+        Args:
+            name: budget 이름 (metric label)
+            target_latency: 이 시간(초) 안에 끝나면 정상으로 보고 limit 을 늘립니다.
+            initial_limit: 처음 limit
+            min_limit: limit 의 최솟값 (DB 가 느려도 이만큼은 처리합니다.)
+            max_limit: limit 의 최댓값
+            backoff: 느려졌을 때 limit 에 곱하는 값
+            min_retry_after: 거절할 때 알려 줄 최소 재시도 대기 시간(초)
+        """
+        self.name = name
+        self.target_latency = target_latency
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.min_retry_after = min_retry_after
+        self.limit = float(initial_limit)
+        self.in_flight = 0
+        # 최근 지연 시간의 지수 이동 평균 (retry_after, limit 을 줄이는 간격)
+        self.latency = target_latency
+        self._decreased_at = -math.inf
+
+    @property
+    def retry_after(self) -> float:
+        """지금 거절하면 알려 줄 재시도 대기 시간(초)"""
+        return max(self.min_retry_after, self.latency)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        """limit 안이면 블록을 실행하고, 끝난 시간으로 limit 을 조절합니다.
+
+        Raises:
+            OverloadedException: 처리 중인 요청이 limit 이상일 때 바로 발생합니다.
+        """
+        if self.in_flight >= int(self.limit):
+            LIMITER_REJECTIONS.labels(self.name).inc()
+            raise OverloadedException(f"{self.name} 요청이 많습니다. 잠시 후 다시 시도해 주세요.", self.retry_after)
+        self.in_flight += 1
+        started = time.monotonic()
+        overloaded = False
+        try:
+            yield
+        except (DatabaseException, asyncio.TimeoutError) as e:
+            # NotFoundException 등 도메인 실패는 정상 응답이고, DatabaseException 그 자체(pool timeout 등)만 과부하로 봅니다.
+            overloaded = type(e) in (DatabaseException, asyncio.TimeoutError)
+            raise
+        finally:
+            self.in_flight -= 1
+            self._update(time.monotonic() - started, overloaded)
+
+    def _update(self, latency: float, overloaded: bool) -> None:
+        now = time.monotonic()
+        self.latency += (latency - self.latency) * 0.1
+        if overloaded or latency > self.target_latency:
+            if now - self._decreased_at >= self.latency:
+                self.limit = max(self.min_limit, self.limit * self.backoff)
+                self._decreased_at = now
+        elif self.in_flight + 1 >= self.limit / 2:
+            # limit 의 절반도 쓰지 않을 때는 늘리지 않습니다. (한가할 때 limit 이 끝없이 커지지 않도록)
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
@@ -0,0 +1,47 @@
+"""같은 오류가 몰릴 때 traceback 로그를 구간마다 한 번만 남기는 logger
+
+장애 상황에서는 같은 exception 이 초당 수천 번 발생하는데, 매번 traceback 을 포맷하면
+로그 자체가 CPU 를 차지합니다. 발생 횟수는 metric 으로 모두 세고, 로그는 key 별로
+interval 초에 한 번만 남기면서 그 사이에 생략한 횟수를 같이 기록합니다.
+"""
+import logging
+import time
+from typing import Dict, Hashable, Tuple
+
+
+class SampledLogger:
+    """key 별로 interval 초에 한 번만 로그를 남깁니다."""
+
+    def __init__(self, logger: logging.Logger, interval: float = 10.0):
+        """
+        Args:
+            logger: 로그를 남길 logger
+            interval: key 별로 로그를 남기는 최소 간격(초)
+        """
+        self.logger = logger
+        self.interval = interval
+        # key -> (마지막으로 로그를 남긴 시각, 그 뒤로 생략한 횟수)
+        self._state: Dict[Hashable, Tuple[float, int]] = {}
+
+    def exception(self, key: Hashable, msg: str, *args) -> bool:
+        """except 블록 안에서 호출하면 traceback 과 함께 로그를 남깁니다.
+
+        Returns:
+            bool: 로그를 남겼으면 True, 생략했으면 False
+        """
+        return self._log(key, logging.ERROR, msg, args, exc_info=True)
+
+    def error(self, key: Hashable, msg: str, *args) -> bool:
+        return self._log(key, logging.ERROR, msg, args, exc_info=False)
+
+    def _log(self, key: Hashable, level: int, msg: str, args: tuple, exc_info: bool) -> bool:
+        now = time.monotonic()
+        logged_at, suppressed = self._state.get(key, (None, 0))
+        if logged_at is not None and now - logged_at < self.interval:
+            self._state[key] = (logged_at, suppressed + 1)
+            return False
+        self._state[key] = (now, 0)
+        if suppressed:
+            msg = f"{msg} (직전 {self.interval:g}초 동안 {suppressed}건 생략)"
+        self.logger.log(level, msg, *args, exc_info=exc_info)
+        return True
@@ -0,0 +1,219 @@
+"""Prometheus text format 으로 내보내는 가벼운 metric 모음
+
+prometheus_client 의존성 없이 counter, histogram 만 제공합니다.
+label 값 조합마다 child 를 한 번만 만들고 dict 로 찾기 때문에, hot path 에서의 비용은
+dict 조회 + 덧셈 정도입니다. (asyncio 단일 스레드에서 갱신하는 것을 기준으로 lock 을 쓰지 않습니다.)
+"""
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+)
+
+
+class _CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class _HistogramChild:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        # 마지막 칸은 +Inf
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class _Metric:
+    type_name: str
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        if not self.labelnames:
+            self._default = self.labels()
+
+    def labels(self, *labelvalues: str):
+        """label 값에 해당하는 child 를 반환합니다. (없으면 생성)"""
+        try:
+            return self._children[labelvalues]
+        except KeyError:
+            if len(labelvalues) != len(self.labelnames):
+                raise ValueError(f"{self.name} 의 label 은 {self.labelnames} 입니다.")
+            child = self._children[labelvalues] = self._new_child()
+            return child
+
+    def clear(self) -> None:
+        self._children.clear()
+        if not self.labelnames:
+            self._default = self.labels()
+
+    def _new_child(self):
+        raise NotImplementedError("_new_child method is not implemented")
+
+    def _label_text(self, labelvalues: Tuple[str, ...], extra: str = "") -> str:
+        pairs = [f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, labelvalues)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        for labelvalues, child in list(self._children.items()):
+            lines.extend(self._render_child(labelvalues, child))
+        return lines
+
+    def _render_child(self, labelvalues, child) -> List[str]:
+        raise NotImplementedError("_render_child method is not implemented")
+
+
+class Counter(_Metric):
+    """단조 증가 counter"""
+    type_name = "counter"
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default.inc(amount)
+
+    def value(self, *labelvalues: str) -> float:
+        child = self._children.get(labelvalues)
+        return child.value if child else 0.0
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def _render_child(self, labelvalues, child) -> List[str]:
+        return [f"{self.name}_total{self._label_text(labelvalues)} {_format(child.value)}"]
+
+
+class Histogram(_Metric):
+    """누적 bucket 을 가진 histogram (단위: 초)"""
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def observe(self, value: float) -> None:
+        self._default.observe(value)
+
+    def count(self, *labelvalues: str) -> int:
+        child = self._children.get(labelvalues)
+        return child.count if child else 0
+
+    def sum(self, *labelvalues: str) -> float:
+        child = self._children.get(labelvalues)
+        return child.sum if child else 0.0
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def _render_child(self, labelvalues, child) -> List[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), child.counts):
+            cumulative += count
+            le = 'le="+Inf"' if bound == float("inf") else f'le="{_format(bound)}"'
+            lines.append(f"{self.name}_bucket{self._label_text(labelvalues, le)} {cumulative}")
+        lines.append(f"{self.name}_sum{self._label_text(labelvalues)} {_format(child.sum)}")
+        lines.append(f"{self.name}_count{self._label_text(labelvalues)} {child.count}")
+        return lines
+
+
+class Registry:
+    """metric 목록을 모아서 text format 으로 내보냅니다."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"이미 등록된 metric 입니다. {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        for metric in self._metrics.values():
+            metric.clear()
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format(value: float) -> str:
+    return repr(float(value))
+
+
+REGISTRY = Registry()
+
+TOKEN_SECONDS = REGISTRY.histogram(
+    "paip_auth_token_seconds", "토큰 서명/검증 소요 시간", ["operation"]
+)
+TOKEN_FAILURES = REGISTRY.counter(
+    "paip_auth_token_failures", "토큰 검증 실패 횟수", ["operation", "reason"]
+)
+DB_SESSION_ACQUIRE_SECONDS = REGISTRY.histogram(
+    "paip_auth_db_session_acquire_seconds", "DB session 획득 소요 시간", ["tenant"]
+)
+DB_SESSION_SECONDS = REGISTRY.histogram(
+    "paip_auth_db_session_seconds", "DB session 사용 시간", ["tenant", "status"]
+)
+DB_SESSION_ERRORS = REGISTRY.counter(
+    "paip_auth_db_session_errors", "DB session 에서 발생한 예상하지 못한 exception 횟수", ["tenant", "reason"]
+)
+REPOSITORY_SECONDS = REGISTRY.histogram(
+    "paip_auth_repository_seconds", "repository 연산 소요 시간", ["entity", "operation"]
+)
+REPOSITORY_ERRORS = REGISTRY.counter(
+    "paip_auth_repository_errors", "repository 연산 실패 횟수", ["entity", "operation", "reason"]
+)
+LOGIN_RESULTS = REGISTRY.counter(
+    "paip_auth_login_results", "LoginManager 처리 결과", ["operation", "outcome"]
+)
+BATCH_FLUSH_SECONDS = REGISTRY.histogram(
+    "paip_auth_batch_flush_seconds", "BatchWriter 저장 소요 시간", ["writer"]
+)
+BATCH_ITEMS = REGISTRY.counter(
+    "paip_auth_batch_items", "BatchWriter 처리 item 개수", ["writer", "status"]
+)
+WARMUP_SECONDS = REGISTRY.histogram(
+    "paip_auth_warmup_seconds", "시작 시 warmup 단계별 소요 시간", ["step"]
+)
+LIMITER_REJECTIONS = REGISTRY.counter(
+    "paip_auth_limiter_rejections", "동시 처리 limit 을 넘어서 바로 거절한 요청 수", ["budget"]
+)
+VERIFIER_REQUESTS = REGISTRY.counter(
+    "paip_auth_verifier_requests", "로컬 검증 daemon 요청 처리 결과", ["status"]
+)
@@ -0,0 +1,119 @@
+"""역할(UserRole)별 권한 모델
+
+역할마다 상속할 역할과 추가 권한을 선언하면, import 시점에 역할별 bitset(int)으로 펼쳐 둡니다.
+권한 확인은 `granted & required == required` 한 번이고, access token 에는 perm claim(int)으로 담기 때문에
+토큰만 있으면 DB 조회 없이 확인할 수 있습니다.
+```
+if not has_permissions(permissions_from_payload(payload), Permission.WRITE_DATA):
+    raise ForbiddenException(...)
+```
+"""
+from enum import IntFlag
+from functools import reduce
+from operator import or_
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+
+from src.domain import UserRole
+from src.exceptions import ForbiddenException
+
+PERMISSION_CLAIM = "perm"
+
+
+class Permission(IntFlag):
+    """권한 bit
+    발급된 토큰에 값이 그대로 남기 때문에, 기존 bit 의 값을 바꾸지 말고 새 권한은 뒤에 추가해야 합니다.
+    """
+    READ_PROFILE = 1 << 0
+    UPDATE_PROFILE = 1 << 1
+    READ_DATA = 1 << 2
+    WRITE_DATA = 1 << 3
+    MANAGE_DATA = 1 << 4
+    MANAGE_USERS = 1 << 5
+    ISSUE_TOKEN = 1 << 6
+    VERIFY_TOKEN = 1 << 7
+
+
+# 역할: (상속할 역할 목록, 추가 권한)
+ROLE_POLICY: Dict[UserRole, Tuple[Tuple[UserRole, ...], Permission]] = {
+    UserRole.PENDING: ((), Permission.READ_PROFILE),
+    UserRole.MEMBER: ((UserRole.PENDING,), Permission.UPDATE_PROFILE | Permission.READ_DATA),
+    UserRole.VIP: ((UserRole.MEMBER,), Permission.WRITE_DATA),
+    UserRole.DATA_MANAGEMENT: ((UserRole.VIP,), Permission.MANAGE_DATA),
+    UserRole.ADMIN: ((UserRole.DATA_MANAGEMENT,), Permission.MANAGE_USERS),
+    UserRole.AUTH: ((), Permission.ISSUE_TOKEN | Permission.VERIFY_TOKEN),
+    UserRole.SIDECAR: ((), Permission.VERIFY_TOKEN),
+    UserRole.WITHDRAWAL: ((), Permission(0)),
+    UserRole.UNKNOWN: ((), Permission(0)),
+}
+
+
+def compile_policy(policy: Mapping[UserRole, Tuple[Tuple[UserRole, ...], Permission]]) -> Dict[UserRole, int]:
+    """상속 관계를 펼쳐서 역할별 권한 bitset 을 만듭니다.
+
+    Args:
+        policy: 역할별 (상속할 역할 목록, 추가 권한)
+
+    Returns:
+        Dict[UserRole, int]: 역할별 권한 bitset
+
+    Raises:
+        ValueError: 상속 관계에 순환이 있거나, 정의되지 않은 역할을 상속할 때 발생합니다.
+    """
+    compiled: Dict[UserRole, int] = {}
+
+    def resolve(role: UserRole, visiting: Tuple[UserRole, ...]) -> int:
+        if role in compiled:
+            return compiled[role]
+        if role in visiting:
+            raise ValueError(f"역할 상속에 순환이 있습니다. {' -> '.join(r.value for r in visiting + (role,))}")
+        if role not in policy:
+            raise ValueError(f"정의되지 않은 역할입니다. {role.value}")
+        parents, granted = policy[role]
+        bits = int(granted)
+        for parent in parents:
+            bits |= resolve(parent, visiting + (role,))
+        compiled[role] = bits
+        return bits
+
+    for role in policy:
+        resolve(role, ())
+    return compiled
+
+
+ROLE_PERMISSIONS = compile_policy(ROLE_POLICY)
+
+
+def permissions_of(role: UserRole) -> int:
+    """역할의 권한 bitset"""
+    return ROLE_PERMISSIONS.get(role, 0)
+
+
+def combine(permissions: Iterable[Permission]) -> int:
+    """권한 목록을 하나의 bitset 으로 합칩니다."""
+    return reduce(or_, permissions, 0)
+
+
+def has_permissions(granted: int, required: int) -> bool:
+    """granted 가 required 의 모든 bit 를 가지고 있는지 확인합니다."""
+    return granted & required == required
+
+
+def permissions_from_payload(payload: Mapping) -> int:
+    """access token payload 의 권한 bitset
+    perm claim 이 없는 (이전에 발급된) 토큰은 user_role 로 계산합니다.
+    """
+    permissions: Optional[int] = payload.get(PERMISSION_CLAIM)
+    if permissions is None:
+        return permissions_of(UserRole.from_text(payload.get("user_role", "")))
+    return permissions
+
+
+def check_permissions(granted: int, required: int) -> None:
+    """권한을 확인합니다.
+
+    Raises:
+        ForbiddenException: required 중 없는 권한이 있을 때 발생합니다.
+    """
+    if granted & required != required:
+        missing = Permission(required & ~granted)
+        raise ForbiddenException(f"권한이 없습니다. {missing.name}")
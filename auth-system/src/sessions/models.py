@@ -0,0 +1,39 @@
+from sqlalchemy import Column, String, DateTime
+
+from src.domain import UserSession
+
+from src.abstracts.database.base import Base, DomainKey
+
+
+class SessionEntity(Base):
+
+    __tablename__ = "user_sessions"
+
+    session_id = Column(String, primary_key=True)
+    account_id = Column(String, nullable=False, index=True)
+
+    issued_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+    @staticmethod
+    def from_domain(domain: UserSession):
+        return SessionEntity(
+            session_id=domain.session_id,
+            account_id=domain.account_id,
+            issued_at=domain.issued_at,
+            expires_at=domain.expires_at,
+        )
+
+    def to_domain(self) -> UserSession:
+        return UserSession(
+            session_id=self.session_id,
+            account_id=self.account_id,
+            issued_at=self.issued_at,
+            expires_at=self.expires_at,
+        )
+
+    def update(self, domain: UserSession):
+        self.expires_at = domain.expires_at
+
+    def primary_key(self) -> DomainKey:
+        return self.session_id
@@ -0,0 +1,154 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, List, Optional, Union
+
+from src.abstracts.batching import BatchWriter
+from src.domain import Token, UserSession
+from src.exceptions import NotFoundException
+from src.sessions.repository import SessionRepository
+
+if TYPE_CHECKING:
+    from src.tokens.shared_state import SharedStateWriter
+    from src.tokens.state_writer import StateWriterClient
+
+logger = logging.getLogger(__name__)
+
+
+class SessionRegistry:
+    """발급한 refresh token(세션)을 기록하고 조회/폐기합니다.
+
+    로그인 경로에서는 record 로 queue 에 넣기만 하고, BatchWriter 가 모아서 INSERT 합니다.
+    만료된 세션은 background task 가 cleanup_chunk 개씩 나눠서 삭제합니다.
+    """
+
+    def __init__(
+            self,
+            repository: SessionRepository,
+            batch_size: int = 100,
+            linger_ms: float = 10,
+            cleanup_interval: float = 60,
+            cleanup_chunk: int = 1000,
+            shared_state: Optional[Union["SharedStateWriter", "StateWriterClient"]] = None,
+            revocation_ttl: float = 86400,
+    ):
+        """
+        Args:
+            repository: SessionRepository
+            batch_size: 한 번에 INSERT 할 최대 세션 개수
+            linger_ms: batch 를 채우기 위해 기다리는 최대 시간
+            cleanup_interval: 만료 세션 정리 주기(초)
+            cleanup_chunk: 한 번의 DELETE 로 삭제할 최대 세션 개수
+            shared_state: 폐기한 세션을 worker 들에게 알릴 검증 상태 writer
+                (이 process 가 writer 면 SharedStateWriter, worker 면 writer daemon 으로 보내는 StateWriterClient)
+            revocation_ttl: shared state 에 폐기 기록을 유지할 시간(초), access token 수명 이상이어야 합니다.
+        """
+        self.repository = repository
+        self.writer = BatchWriter("sessions", repository.create_many, batch_size, linger_ms)
+        self.cleanup_interval = cleanup_interval
+        self.cleanup_chunk = cleanup_chunk
+        self.shared_state = shared_state
+        self.revocation_ttl = revocation_ttl
+        self._cleanup_task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        await self.writer.start()
+        if self._cleanup_task is None:
+            self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+
+    async def stop(self) -> None:
+        if self._cleanup_task is not None:
+            self._cleanup_task.cancel()
+            try:
+                await self._cleanup_task
+            except asyncio.CancelledError:
+                pass
+            self._cleanup_task = None
+        await self.writer.stop()
+
+    def record(self, account_id: str, token: Token, lifetime: int) -> None:
+        """발급한 토큰의 세션을 기록합니다. (기다리지 않음)
+
+        Args:
+            account_id: 사용자 계정
+            token: 발급한 토큰 (session_id 포함)
+            lifetime: refresh token 수명(초)
+        """
+        now = datetime.now()
+        self.writer.submit(UserSession(
+            session_id=token.session_id,
+            account_id=account_id,
+            issued_at=now,
+            expires_at=now + timedelta(seconds=lifetime),
+        ))
+
+    async def list_sessions(self, account_id: str) -> List[UserSession]:
+        """계정의 활성 세션 목록"""
+        await self.writer.flush()
+        return await self.repository.find_active(account_id, datetime.now())
+
+    async def is_active(self, session_id: Optional[str]) -> bool:
+        if session_id is None:
+            return False
+        await self.writer.flush()
+        session = await self.repository.find_by_id(session_id)
+        return session is not None and session.expires_at > datetime.now()
+
+    async def revoke(self, session_id: str) -> None:
+        """세션 하나를 폐기합니다. (없는 세션이면 무시)"""
+        await self.writer.flush()
+        if self.shared_state is not None:
+            # 세션의 access token(sid)도 DB 조회 없이 모든 worker 에서 바로 거절합니다.
+            self.shared_state.revoke(session_id, self.revocation_ttl)
+        try:
+            await self.repository.delete(session_id)
+        except NotFoundException:
+            pass
+
+    async def consume(self, session_id: Optional[str]) -> bool:
+        """refresh token rotation: 활성 세션이면 폐기하고 True 를 반환합니다.
+        is_active 확인 후 revoke 와 달리, 같은 refresh token 으로 동시에 요청해도 한 요청만 True 를 받습니다.
+        """
+        if session_id is None:
+            return False
+        await self.writer.flush()
+        if not await self.repository.delete_active(session_id, datetime.now()):
+            return False
+        if self.shared_state is not None:
+            self.shared_state.revoke(session_id, self.revocation_ttl)
+        return True
+
+    async def revoke_all(self, account_id: str) -> int:
+        """계정의 모든 세션을 폐기합니다. (모든 기기 로그아웃)
+
+        Returns:
+            int: 폐기한 세션 개수
+        """
+        await self.writer.flush()
+        if self.shared_state is not None:
+            self.shared_state.set_watermark(account_id, time.time(), self.revocation_ttl)
+        return await self.repository.delete_by_account(account_id)
+
+    async def cleanup_expired(self) -> int:
+        """만료된 세션을 cleanup_chunk 개씩 나눠서 모두 삭제합니다.
+
+        Returns:
+            int: 삭제한 세션 개수
+        """
+        total = 0
+        while True:
+            count = await self.repository.delete_expired(datetime.now(), self.cleanup_chunk)
+            total += count
+            if count < self.cleanup_chunk:
+                return total
+            # chunk 사이에 다른 요청이 DB 를 쓸 수 있도록 양보
+            await asyncio.sleep(0)
+
+    async def _cleanup_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.cleanup_interval)
+            try:
+                await self.cleanup_expired()
+            except Exception:
+                logger.exception("만료 세션 정리에 실패했습니다.")
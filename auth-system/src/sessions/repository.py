@@ -0,0 +1,70 @@
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import delete, select
+
+from src.abstracts.database.repository import BaseRepository, instrumented
+from src.domain import UserSession
+from src.sessions.models import SessionEntity
+
+
+class SessionRepository(BaseRepository):
+    entity = SessionEntity
+
+    async def warmup(self) -> None:
+        # refresh 시 세션 확인(find_by_id)
+        await self.find_by_id("__warmup__")
+
+    async def find_active(self, account_id: str, now: datetime) -> List[UserSession]:
+        """만료되지 않은 계정의 세션 목록"""
+        async with self.session_manager.session(read_only=True) as session:
+            stmt = self._get_joined_select().filter(
+                SessionEntity.account_id == account_id,
+                SessionEntity.expires_at > now,
+            ).order_by(SessionEntity.issued_at)
+            entities = (await session.execute(stmt)).scalars().all()
+            return [entity.to_domain() for entity in entities]
+
+    @instrumented("delete_active")
+    async def delete_active(self, session_id: str, now: datetime) -> bool:
+        """만료되지 않은 세션을 조건부 DELETE 한 번으로 삭제합니다.
+        같은 세션을 동시에 삭제해도 한 요청만 True 를 받습니다.
+
+        Returns:
+            bool: 삭제했으면 True, 없거나 만료되었으면 False
+        """
+        async with self.session_manager.session() as session:
+            stmt = delete(SessionEntity).filter(
+                SessionEntity.session_id == session_id,
+                SessionEntity.expires_at > now,
+            )
+            deleted = (await session.execute(stmt)).rowcount == 1
+            await session.commit()
+            return deleted
+
+    @instrumented("delete_by_account")
+    async def delete_by_account(self, account_id: str) -> int:
+        """계정의 모든 세션을 account_id index 를 타는 DELETE 한 번으로 삭제합니다.
+
+        Returns:
+            int: 삭제된 세션 개수
+        """
+        async with self.session_manager.session() as session:
+            stmt = delete(SessionEntity).filter(SessionEntity.account_id == account_id)
+            count = (await session.execute(stmt)).rowcount
+            await session.commit()
+            return count
+
+    @instrumented("delete_expired")
+    async def delete_expired(self, now: datetime, limit: int) -> int:
+        """만료된 세션을 최대 limit 개 삭제합니다. (긴 lock 을 피하기 위해 나눠서 호출)
+
+        Returns:
+            int: 삭제된 세션 개수
+        """
+        async with self.session_manager.session() as session:
+            expired = select(SessionEntity.session_id).filter(SessionEntity.expires_at <= now).limit(limit)
+            stmt = delete(SessionEntity).filter(SessionEntity.session_id.in_(expired))
+            count = (await session.execute(stmt)).rowcount
+            await session.commit()
+            return count
@@ -1,5 +1,30 @@
+from functools import lru_cache
+from typing import Dict, Optional
+
 from pydantic_settings import BaseSettings
-from pydantic import Field
+from pydantic import BaseModel, Field, model_validator
+
+from src.domain import DEFAULT_TENANT
+from src.exceptions import UnknownTenantException
+
+
+class TenantSettings(BaseModel):
+    """tenant 별로 Settings 에서 바꿀 값 (None 이면 기본 설정을 사용합니다.)
+
+    database 나 schema 를 나누면 tenant 마다 engine 과 connection pool 이 따로 생기고,
+    key 를 지정하면 tenant 마다 다른 key 로 토큰을 서명합니다.
+    """
+    db_type: Optional[str] = None
+    db_host: Optional[str] = None
+    db_name: Optional[str] = None
+    db_user: Optional[str] = None
+    db_password: Optional[str] = None
+    db_schema: Optional[str] = None
+    db_pool_size: Optional[int] = None
+    db_max_overflow: Optional[int] = None
+    db_pool_timeout: Optional[float] = None
+    private_key: Optional[bytes] = None
+    private_key_file: Optional[str] = None
 
 
 class Settings(BaseSettings):
@@ -30,8 +55,54 @@ class Settings(BaseSettings):
         description="디비 패스워드 이름"
     )
 
-    private_key: bytes = Field(
-        description='Private Pem Contents'
+    db_schema: Optional[str] = Field(
+        description="postgresql search_path 로 사용할 schema (tenant 별 schema 분리)",
+        default=None,
+    )
+
+    db_pool_size: Optional[int] = Field(
+        description="connection pool 크기 (None 이면 SQLAlchemy 기본값)",
+        default=None,
+    )
+
+    db_max_overflow: Optional[int] = Field(
+        description="pool 크기를 넘어서 추가로 열 수 있는 connection 수 (None 이면 SQLAlchemy 기본값)",
+        default=None,
+    )
+
+    db_pool_timeout: Optional[float] = Field(
+        description="pool 에서 connection 을 기다리는 최대 시간(초) (None 이면 SQLAlchemy 기본값)",
+        default=None,
+    )
+
+    db_warmup_connections: int = Field(
+        description="시작 시 미리 열어 둘 DB connection 수 (pool 크기보다 크면 나머지는 닫힙니다.)",
+        default=5,
+    )
+
+    private_key: Optional[bytes] = Field(
+        description='Private Pem Contents',
+        default=None,
+    )
+
+    private_key_file: Optional[str] = Field(
+        description="Private Pem 파일 경로 (mount 된 secret), 있으면 private_key 대신 사용하고 파일이 바뀌면 다시 읽습니다.",
+        default=None,
+    )
+
+    shared_state_name: Optional[str] = Field(
+        description="worker 들이 공유하는 토큰 검증 상태 shared memory 이름 (writer process 가 만든 segment)",
+        default=None,
+    )
+
+    shared_state_socket: Optional[str] = Field(
+        description="검증 상태 writer daemon (paip-auth-state-writer) 의 socket 경로, worker 는 세션 폐기를 여기로 보냅니다.",
+        default=None,
+    )
+
+    tenants: Dict[str, TenantSettings] = Field(
+        description='tenant 별 설정 (JSON) ex. {"acme": {"db_name": "paip-auth-acme", "db_pool_size": 5}}',
+        default_factory=dict,
     )
 
     access_token_lifetime: int = Field(
@@ -43,3 +114,30 @@ class Settings(BaseSettings):
         description="Refresh Token 수명(단위 초)",
         default=2592000,  # 한달
     )
+
+    @model_validator(mode="after")
+    def check_private_key_source(self) -> "Settings":
+        if self.private_key is None and self.private_key_file is None:
+            raise ValueError("private_key 또는 private_key_file 이 필요합니다.")
+        return self
+
+    def for_tenant(self, tenant: str) -> "Settings":
+        """tenant 의 설정을 덮어쓴 Settings
+
+        Raises:
+            UnknownTenantException: 설정에 없는 tenant 일 때 발생합니다.
+        """
+        if tenant not in self.tenants:
+            if tenant == DEFAULT_TENANT:
+                return self
+            raise UnknownTenantException(f"등록되지 않은 tenant 입니다. {tenant}")
+        update = self.tenants[tenant].model_dump(exclude_none=True)
+        if "private_key" in update:
+            update.setdefault("private_key_file", None)
+        return self.model_copy(update={**update, "tenants": {}})
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """환경 변수를 한 번만 읽고 검증한 Settings (프로세스 전체 공유)"""
+    return Settings()
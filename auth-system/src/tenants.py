@@ -0,0 +1,94 @@
+"""tenant 별 DB engine 과 서명 key
+
+한 tenant 의 bulk 작업이 connection pool 을 모두 차지하면 다른 tenant 의 로그인까지 느려집니다.
+tenant 마다 SessionManager(engine, connection pool)와 TokenManager(서명 key)를 따로 만들어서 서로 격리합니다.
+
+- 설정: Settings.tenants 에 tenant 별로 database/schema, pool 크기, key 를 지정합니다. (settings.for_tenant)
+- 토큰: tenant claim 으로 검증할 TokenManager 를 고르고, 그 tenant 의 key 로 서명을 검증합니다.
+- metric: DB_SESSION_* metric 에 tenant label 이 붙어서 tenant 별 pool 대기 시간을 비교할 수 있습니다.
+
+shared state 의 계정 watermark 는 account_id 로만 찾기 때문에 tenant 를 구분하지 않습니다.
+(같은 account_id 가 여러 tenant 에 있으면 모두 로그아웃되는 쪽으로 동작합니다.)
+"""
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from src.abstracts.database.base import SessionManager
+from src.domain import DEFAULT_TENANT, TENANT_CLAIM
+from src.exceptions import InvalidTokenException, UnknownTenantException
+from src.tokens.manager import TokenManager, peek_claims
+
+if TYPE_CHECKING:
+    from src.settings import Settings
+    from src.tokens.shared_state import SharedStateReader
+
+
+class TenantRegistry:
+    """tenant 별 SessionManager, TokenManager 를 처음 사용할 때 만들고 재사용합니다."""
+
+    def __init__(self, settings: "Settings", shared_state: Optional["SharedStateReader"] = None):
+        """
+        Args:
+            settings: 기본 설정 (tenants 에 tenant 별 설정)
+            shared_state: 모든 tenant 의 TokenManager 가 사용할 검증 상태
+        """
+        self.settings = settings
+        self.shared_state = shared_state
+        self._session_managers: Dict[str, SessionManager] = {}
+        self._token_managers: Dict[str, TokenManager] = {}
+
+    @property
+    def tenants(self) -> List[str]:
+        """설정된 tenant 목록 (기본 tenant 포함)"""
+        return [DEFAULT_TENANT, *(tenant for tenant in self.settings.tenants if tenant != DEFAULT_TENANT)]
+
+    def session_manager(self, tenant: str = DEFAULT_TENANT) -> SessionManager:
+        """tenant 의 database/schema 에 연결하는 SessionManager (tenant 마다 engine, pool 이 따로 있습니다.)
+
+        Raises:
+            UnknownTenantException: 설정에 없는 tenant 일 때 발생합니다.
+        """
+        if (session_manager := self._session_managers.get(tenant)) is None:
+            session_manager = SessionManager(self.settings.for_tenant(tenant), tenant=tenant)
+            self._session_managers[tenant] = session_manager
+        return session_manager
+
+    def token_manager(self, tenant: str = DEFAULT_TENANT) -> TokenManager:
+        """tenant 의 key 로 서명하고, tenant claim 을 담는 TokenManager
+
+        Raises:
+            UnknownTenantException: 설정에 없는 tenant 일 때 발생합니다.
+            InvalidKeyException: tenant 의 private key 를 읽거나 파싱할 수 없을 때 발생합니다.
+        """
+        if (token_manager := self._token_managers.get(tenant)) is None:
+            token_manager = TokenManager(self.settings.for_tenant(tenant), shared_state=self.shared_state,
+                                         tenant=tenant)
+            self._token_managers[tenant] = token_manager
+        return token_manager
+
+    def verify_access_token(self, access_token: str) -> Dict:
+        """토큰의 tenant claim 에 해당하는 tenant 의 key 로 access token 을 검증합니다.
+
+        Raises:
+            ExpiredTokenException: access token이 만료되었을 경우 발생합니다.
+            InvalidTokenException: 검증에 실패했거나 설정에 없는 tenant 의 토큰일 때 발생합니다.
+        """
+        tenant = DEFAULT_TENANT
+        if self.settings.tenants:
+            tenant = peek_claims(access_token).get(TENANT_CLAIM, DEFAULT_TENANT)
+        try:
+            if not isinstance(tenant, str):
+                raise UnknownTenantException(f"tenant claim 이 문자열이 아닙니다. {tenant!r}")
+            token_manager = self.token_manager(tenant)
+        except UnknownTenantException:
+            raise InvalidTokenException("등록되지 않은 tenant 의 토큰 입니다")
+        return token_manager.verify_access_token(access_token)
+
+    def reload_keys(self) -> None:
+        """만들어 둔 모든 tenant 의 key 파일을 다시 읽습니다. (SIGHUP)"""
+        for token_manager in self._token_managers.values():
+            token_manager.keys.reload()
+
+    async def dispose(self) -> None:
+        """모든 tenant 의 connection pool 을 닫습니다."""
+        for session_manager in self._session_managers.values():
+            await session_manager.dispose()
@@ -1,6 +1,14 @@
-from Crypto.PublicKey import RSA
-from Crypto.Cipher import PKCS1_OAEP
-from Crypto.Cipher.PKCS1_OAEP import PKCS1OAEP_Cipher
+import os
+from typing import TYPE_CHECKING, Callable, Dict, Generic, Tuple, TypeVar
+
+if TYPE_CHECKING:
+    from Crypto.PublicKey import RSA
+    from Crypto.Cipher.PKCS1_OAEP import PKCS1OAEP_Cipher
+
+# PyCryptodome 은 파일 암호화/서명(envelope, signature)에서만 사용하기 때문에 함수 안에서 import 합니다.
+# 토큰 발급/검증 hot path 는 PyJWT 가 사용하는 cryptography 하나만 불러옵니다.
+
+T = TypeVar("T")
 
 
 def load_pem(fpath: str):
@@ -8,19 +16,51 @@ def load_pem(fpath: str):
         return f.read()
 
 
-def load_rsa_key(fpath: str) -> RSA.RsaKey:
+def load_rsa_key(fpath: str) -> "RSA.RsaKey":
     """rsa key 불러오기"""
+    from Crypto.PublicKey import RSA
+
     pem_file = load_pem(fpath)
     return RSA.import_key(pem_file)
 
 
-def load_rsa_cipher(fpath: str) -> PKCS1OAEP_Cipher:
+def load_rsa_cipher(fpath: str) -> "PKCS1OAEP_Cipher":
     """키 정보 불러오기"""
+    from Crypto.Cipher import PKCS1_OAEP
+
     key = load_rsa_key(fpath)
     return PKCS1_OAEP.new(key)
 
 
 def private_pem2public_pem(private_pem: bytes) -> bytes:
-    """private key에서 public key로 전환 """
-    key_pair = RSA.import_key(private_pem)
-    return key_pair.public_key().export_key()
+    """private key에서 public key로 전환 (PyCryptodome export_key 와 같은 SubjectPublicKeyInfo PEM)"""
+    from cryptography.hazmat.primitives import serialization
+
+    private_key = serialization.load_pem_private_key(private_pem, password=None)
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    return public_pem.rstrip(b"\n")
+
+
+class KeyFileCache(Generic[T]):
+    """key 파일 경로별로 loader 결과를 캐시합니다.
+    파일의 mtime, size 가 바뀌면 (key 교체) 다시 불러옵니다.
+    """
+
+    def __init__(self, loader: Callable[[str], T]):
+        self._loader = loader
+        self._cache: Dict[str, Tuple[Tuple[int, int], T]] = {}
+
+    def get(self, fpath: str) -> T:
+        stat = os.stat(fpath)
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(fpath)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        value = self._loader(fpath)
+        self._cache[fpath] = (version, value)
+        return value
+
+    def clear(self) -> None:
+        self._cache.clear()
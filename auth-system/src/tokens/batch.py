@@ -0,0 +1,83 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from Crypto.PublicKey import RSA
+
+from src.tokens.auth import load_pem
+from src.tokens.signature import Verifier
+
+SignedPair = Tuple[bytes, bytes]
+
+# worker process 마다 한 번만 파싱한 Verifier
+_worker_verifier: Optional[Verifier] = None
+
+
+def _init_worker(public_pem: bytes) -> None:
+    global _worker_verifier
+    _worker_verifier = Verifier(RSA.import_key(public_pem))
+
+
+def _verify_chunk(pairs: List[SignedPair]) -> List[bool]:
+    return [_worker_verifier.verify(message, signature) for message, signature in pairs]
+
+
+def _chunked(pairs: Iterable[SignedPair], chunk_size: int) -> Iterator[List[SignedPair]]:
+    iterator = iter(pairs)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def verify_batch_by_rsa(
+        pairs: Iterable[SignedPair],
+        public_key_path: str,
+        chunk_size: int = 256,
+        max_workers: Optional[int] = None,
+        fail_fast: bool = False,
+) -> Iterator[bool]:
+    """(message, signature) 쌍들을 여러 process 에서 나눠 검증하고, 입력 순서대로 결과를 내보냅니다.
+    key 는 한 번만 읽고, worker 마다 한 번만 파싱합니다.
+    pairs 는 chunk 단위로 필요한 만큼만 읽기 때문에 수백만 건도 메모리를 일정하게 사용합니다.
+
+    Args:
+        pairs: (message, signature) iterable
+        public_key_path: public key 경로
+        chunk_size: worker 에 한 번에 넘기는 쌍의 개수
+        max_workers: process 개수, 0 이면 현재 process 에서 검증합니다. (기본값: cpu 개수)
+        fail_fast: True 면 처음 실패한 결과(False)를 내보낸 뒤 멈춥니다.
+
+    Returns:
+        Iterator[bool]: 각 쌍의 검증 결과
+    """
+    public_pem = load_pem(public_key_path)
+    if max_workers == 0:
+        yield from _verify_inline(pairs, public_pem, fail_fast)
+        return
+
+    max_workers = max_workers or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers, initializer=_init_worker, initargs=(public_pem,))
+    try:
+        chunks = _chunked(pairs, chunk_size)
+        # 결과 순서를 지키면서 worker 가 놀지 않을 만큼만 미리 제출합니다.
+        pending = deque(executor.submit(_verify_chunk, chunk) for chunk in islice(chunks, max_workers * 2))
+        while pending:
+            results = pending.popleft().result()
+            if chunk := next(chunks, None):
+                pending.append(executor.submit(_verify_chunk, chunk))
+            for result in results:
+                yield result
+                if fail_fast and not result:
+                    return
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _verify_inline(pairs: Iterable[SignedPair], public_pem: bytes, fail_fast: bool) -> Iterator[bool]:
+    verifier = Verifier(RSA.import_key(public_pem))
+    for message, signature in pairs:
+        result = verifier.verify(message, signature)
+        yield result
+        if fail_fast and not result:
+            return
@@ -0,0 +1,221 @@
+"""Envelope 암호화
+
+RSA-OAEP 는 작은 데이터(2048 bit key 기준 약 190 byte)만 암호화할 수 있고 연산도 비쌉니다.
+그래서 실제 데이터는 임의의 data key 로 AES-GCM 암호화하고, data key 만 RSA 로 감싸서(wrap) 함께 저장합니다.
+
+단건 포맷
+    MAGIC(4) | wrapped key 길이(2) | wrapped key | nonce(12) | tag(16) | ciphertext
+
+스트림 포맷
+    MAGIC(4) | wrapped key 길이(2) | wrapped key | chunk 크기(4) | nonce prefix(8)
+    이후 chunk 마다: final 여부(1) | ciphertext 길이(4) | ciphertext | tag(16)
+    chunk nonce 는 nonce prefix + chunk 순번(4) 이고, header 와 final 여부를 AAD 로 인증하기 때문에
+    chunk 순서 변경, 마지막 chunk 잘라내기를 검출합니다.
+    ciphertext 길이는 tag 를 확인하기 전에 읽는 값이라, header 의 chunk 크기(최대 MAX_CHUNK_SIZE)보다 크면
+    읽기 전에 거절합니다.
+"""
+import struct
+from collections import OrderedDict
+from typing import BinaryIO, Optional, Tuple
+
+from Crypto.Cipher import AES, PKCS1_OAEP
+from Crypto.Hash import SHA256
+from Crypto.PublicKey import RSA
+from Crypto.Random import get_random_bytes
+
+from src.exceptions import CryptoException
+
+MAGIC = b"PEV1"
+STREAM_MAGIC = b"PES2"
+DATA_KEY_SIZE = 32
+NONCE_SIZE = 12
+NONCE_PREFIX_SIZE = 8
+TAG_SIZE = 16
+CHUNK_SIZE = 1024 * 1024
+MAX_CHUNK_SIZE = 64 * 1024 * 1024
+
+_KEY_LENGTH = struct.Struct(">H")
+_FRAME_HEADER = struct.Struct(">?I")
+_COUNTER = struct.Struct(">I")
+_CHUNK_SIZE = struct.Struct(">I")
+
+
+class EnvelopeEncryptor:
+    """공개키로 data key 를 감싸서 암호화합니다.
+
+    RSA wrap 비용을 줄이기 위해 같은 data key 를 rotate_after 건까지 재사용합니다.
+    (AES-GCM nonce 는 매번 새로 만들기 때문에 안전합니다.)
+    """
+
+    def __init__(self, public_key: RSA.RsaKey, rotate_after: int = 1024):
+        self._rsa_cipher = PKCS1_OAEP.new(public_key, hashAlgo=SHA256)
+        self._rotate_after = rotate_after
+        self._data_key: Optional[Tuple[bytes, bytes]] = None
+        self._used = 0
+
+    def encrypt(self, plaintext: bytes) -> bytes:
+        """plaintext 를 단건 포맷으로 암호화합니다."""
+        data_key, header = self._current_data_key()
+        nonce = get_random_bytes(NONCE_SIZE)
+        cipher = AES.new(data_key, AES.MODE_GCM, nonce=nonce)
+        cipher.update(header)
+        ciphertext, tag = cipher.encrypt_and_digest(plaintext)
+        return b"".join([header, nonce, tag, ciphertext])
+
+    def encrypt_stream(self, src: BinaryIO, dst: BinaryIO, chunk_size: int = CHUNK_SIZE) -> int:
+        """src 를 chunk_size 단위로 읽어 스트림 포맷으로 dst 에 씁니다.
+        스트림마다 새 data key 를 사용합니다.
+
+        Returns:
+            int: 암호화한 평문 byte 수
+
+        Raises:
+            ValueError: chunk_size 가 1 ~ MAX_CHUNK_SIZE 범위가 아닐 때 발생합니다.
+        """
+        if not 0 < chunk_size <= MAX_CHUNK_SIZE:
+            raise ValueError(f"chunk_size 는 1 ~ {MAX_CHUNK_SIZE} 사이여야 합니다.")
+        data_key = get_random_bytes(DATA_KEY_SIZE)
+        header = b"".join([
+            _header(STREAM_MAGIC, self._rsa_cipher.encrypt(data_key)),
+            _CHUNK_SIZE.pack(chunk_size),
+            get_random_bytes(NONCE_PREFIX_SIZE),
+        ])
+        dst.write(header)
+
+        total = 0
+        counter = 0
+        chunk = src.read(chunk_size)
+        while True:
+            next_chunk = src.read(chunk_size)
+            final = not next_chunk
+            cipher = AES.new(data_key, AES.MODE_GCM, nonce=header[-NONCE_PREFIX_SIZE:] + _COUNTER.pack(counter))
+            cipher.update(header + bytes([final]))
+            ciphertext, tag = cipher.encrypt_and_digest(chunk)
+            dst.write(_FRAME_HEADER.pack(final, len(ciphertext)))
+            dst.write(ciphertext)
+            dst.write(tag)
+            total += len(chunk)
+            if final:
+                return total
+            chunk = next_chunk
+            counter += 1
+
+    def _current_data_key(self) -> Tuple[bytes, bytes]:
+        if self._data_key is None or self._used >= self._rotate_after:
+            data_key = get_random_bytes(DATA_KEY_SIZE)
+            self._data_key = (data_key, _header(MAGIC, self._rsa_cipher.encrypt(data_key)))
+            self._used = 0
+        self._used += 1
+        return self._data_key
+
+
+class EnvelopeDecryptor:
+    """개인키로 data key 를 풀어서 복호화합니다.
+    같은 data key 로 암호화된 데이터를 반복해서 복호화할 때 RSA 연산을 생략하도록 풀린 data key 를 LRU 로 캐시합니다.
+    """
+
+    def __init__(self, private_key: RSA.RsaKey, cache_size: int = 1024):
+        if not private_key.has_private():
+            raise ValueError("복호화에는 private key 가 필요합니다.")
+        self._rsa_cipher = PKCS1_OAEP.new(private_key, hashAlgo=SHA256)
+        self._cache_size = cache_size
+        self._cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+        self.unwrap_count = 0
+
+    def decrypt(self, blob: bytes) -> bytes:
+        """단건 포맷을 복호화합니다.
+
+        Raises:
+            CryptoException: 포맷이 잘못되었거나, 키가 다르거나, 데이터가 변조되었을 때 발생합니다.
+        """
+        wrapped_key, offset = _parse_header(MAGIC, blob)
+        header = blob[:offset]
+        nonce = blob[offset:offset + NONCE_SIZE]
+        tag = blob[offset + NONCE_SIZE:offset + NONCE_SIZE + TAG_SIZE]
+        ciphertext = blob[offset + NONCE_SIZE + TAG_SIZE:]
+        if len(tag) != TAG_SIZE:
+            raise CryptoException("암호문이 잘렸습니다.")
+
+        cipher = AES.new(self._unwrap(wrapped_key), AES.MODE_GCM, nonce=nonce)
+        cipher.update(header)
+        try:
+            return cipher.decrypt_and_verify(ciphertext, tag)
+        except ValueError:
+            raise CryptoException("암호문 검증에 실패했습니다.")
+
+    def decrypt_stream(self, src: BinaryIO, dst: BinaryIO) -> int:
+        """스트림 포맷을 chunk 단위로 복호화해서 dst 에 씁니다.
+        검증에 실패하면 그 전까지 쓴 내용은 신뢰하면 안 됩니다.
+
+        Returns:
+            int: 복호화한 평문 byte 수
+
+        Raises:
+            CryptoException: 포맷이 잘못되었거나, 변조되었거나, 스트림이 중간에 잘렸을 때 발생합니다.
+        """
+        prefix = _read_exactly(src, len(STREAM_MAGIC) + _KEY_LENGTH.size)
+        wrapped_key_length = _KEY_LENGTH.unpack_from(prefix, len(STREAM_MAGIC))[0]
+        header = prefix + _read_exactly(src, wrapped_key_length + _CHUNK_SIZE.size + NONCE_PREFIX_SIZE)
+        wrapped_key, offset = _parse_header(STREAM_MAGIC, header)
+        chunk_size = _CHUNK_SIZE.unpack_from(header, offset)[0]
+        if chunk_size > MAX_CHUNK_SIZE:
+            raise CryptoException("chunk 크기가 너무 큽니다.")
+        data_key = self._unwrap(wrapped_key)
+
+        total = 0
+        counter = 0
+        while True:
+            final, length = _FRAME_HEADER.unpack(_read_exactly(src, _FRAME_HEADER.size))
+            if length > chunk_size:
+                # 인증 전의 값이라 그대로 읽으면 변조된 길이만큼 메모리를 할당합니다.
+                raise CryptoException("chunk 길이가 chunk 크기보다 큽니다.")
+            ciphertext = _read_exactly(src, length)
+            tag = _read_exactly(src, TAG_SIZE)
+            cipher = AES.new(data_key, AES.MODE_GCM, nonce=header[-NONCE_PREFIX_SIZE:] + _COUNTER.pack(counter))
+            cipher.update(header + bytes([final]))
+            try:
+                plaintext = cipher.decrypt_and_verify(ciphertext, tag)
+            except ValueError:
+                raise CryptoException("암호문 검증에 실패했습니다.")
+            dst.write(plaintext)
+            total += len(plaintext)
+            if final:
+                return total
+            counter += 1
+
+    def _unwrap(self, wrapped_key: bytes) -> bytes:
+        if (data_key := self._cache.get(wrapped_key)) is not None:
+            self._cache.move_to_end(wrapped_key)
+            return data_key
+        try:
+            data_key = self._rsa_cipher.decrypt(wrapped_key)
+        except ValueError:
+            raise CryptoException("data key 를 복호화할 수 없습니다.")
+        self.unwrap_count += 1
+        self._cache[wrapped_key] = data_key
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return data_key
+
+
+def _header(magic: bytes, wrapped_key: bytes) -> bytes:
+    return magic + _KEY_LENGTH.pack(len(wrapped_key)) + wrapped_key
+
+
+def _parse_header(magic: bytes, blob: bytes) -> Tuple[bytes, int]:
+    if blob[:len(magic)] != magic:
+        raise CryptoException("envelope 포맷이 아닙니다.")
+    start = len(magic) + _KEY_LENGTH.size
+    if len(blob) < start:
+        raise CryptoException("암호문이 잘렸습니다.")
+    end = start + _KEY_LENGTH.unpack_from(blob, len(magic))[0]
+    if len(blob) < end:
+        raise CryptoException("암호문이 잘렸습니다.")
+    return bytes(blob[start:end]), end
+
+
+def _read_exactly(src: BinaryIO, size: int) -> bytes:
+    data = src.read(size)
+    if len(data) != size:
+        raise CryptoException("암호문이 잘렸습니다.")
+    return data
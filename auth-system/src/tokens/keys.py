@@ -0,0 +1,181 @@
+"""토큰 서명 key 를 한 번만 불러와서 프로세스 전체가 공유합니다.
+
+PEM 은 settings 의 private_key(환경 변수) 또는 private_key_file(mount 된 secret 파일)에서 읽고,
+읽을 때 파싱/검증해서 cryptography key 객체로 보관합니다. 토큰을 발급/검증할 때마다 PEM 을 다시 파싱하지 않습니다.
+
+key 교체 (재시작 없이)
+    - 파일이 바뀌면 (mtime, size) check_interval 초 안에 다시 불러옵니다.
+    - SIGHUP 을 받으면 바로 다시 불러옵니다. (install_reload_signal)
+    - 새 PEM 이 잘못되었으면 기존 key 를 계속 사용합니다.
+    - 교체 전에 발급한 토큰도 검증할 수 있도록 직전 key 를 하나 보관하고, 현재 key 로 검증에 실패하면 토큰 header 의 kid 로 찾습니다.
+"""
+import hashlib
+import logging
+import os
+import signal
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from src.exceptions import InvalidKeyException
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey, RSAPublicKey
+
+    from src.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class KeyPair:
+    """파싱한 RSA key 쌍"""
+    private_key: "RSAPrivateKey"
+    public_key: "RSAPublicKey"
+    private_pem: bytes
+    public_pem: bytes
+    # public key 의 sha256 앞 16자리, 토큰 header 의 kid 로 사용합니다.
+    kid: str
+
+    @classmethod
+    def from_pem(cls, private_pem: bytes) -> "KeyPair":
+        """private key PEM 을 파싱합니다.
+
+        Raises:
+            InvalidKeyException: RSA private key PEM 이 아닐 때 발생합니다.
+        """
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
+
+        try:
+            private_key = serialization.load_pem_private_key(private_pem, password=None)
+        except (ValueError, TypeError) as e:
+            raise InvalidKeyException(f"private key 를 파싱할 수 없습니다. {e}")
+        if not isinstance(private_key, RSAPrivateKey):
+            raise InvalidKeyException(f"RSA private key 가 아닙니다. {type(private_key).__name__}")
+        public_key = private_key.public_key()
+        public_pem = public_key.public_bytes(
+            serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+        ).rstrip(b"\n")
+        return cls(
+            private_key=private_key,
+            public_key=public_key,
+            private_pem=private_pem,
+            public_pem=public_pem,
+            kid=hashlib.sha256(public_pem).hexdigest()[:16],
+        )
+
+
+class KeyProvider:
+    """현재 서명 key 를 제공하고, 파일이 바뀌거나 SIGHUP 을 받으면 다시 불러옵니다."""
+
+    def __init__(self, private_pem: Optional[bytes] = None, path: Optional[str] = None,
+                 check_interval: float = 1.0):
+        """
+        Args:
+            private_pem: private key PEM (path 가 없을 때 사용)
+            path: private key PEM 파일 경로 (mount 된 secret)
+            check_interval: 파일 변경을 확인하는 최소 간격(초)
+
+        Raises:
+            InvalidKeyException: key 를 읽거나 파싱할 수 없을 때 발생합니다.
+        """
+        if path is None and not private_pem:
+            raise InvalidKeyException("private key 가 설정되지 않았습니다. (PRIVATE_KEY 또는 PRIVATE_KEY_FILE)")
+        self.path = path
+        self.check_interval = check_interval
+        self.reload_count = 0
+        self._previous: Optional[KeyPair] = None
+        self._version: Optional[Tuple[int, int]] = None
+        self._checked_at = time.monotonic()
+        if path is None:
+            self._current = KeyPair.from_pem(private_pem)
+        else:
+            self._version = _file_version(path)
+            self._current = KeyPair.from_pem(_read(path))
+
+    @property
+    def current(self) -> KeyPair:
+        """서명에 사용할 현재 key (파일이면 check_interval 마다 변경을 확인합니다.)"""
+        if self.path is not None and time.monotonic() - self._checked_at >= self.check_interval:
+            self._check_file()
+        return self._current
+
+    def key_pairs(self) -> List[KeyPair]:
+        """검증에 사용할 key 목록 (현재 key, 직전 key)"""
+        current = self.current
+        return [current] if self._previous is None else [current, self._previous]
+
+    def previous_public_key(self, kid: Optional[str]) -> Optional["RSAPublicKey"]:
+        """교체 전 key 의 kid 이면 그 public key, 아니면 None"""
+        if kid is not None and self._previous is not None and kid == self._previous.kid:
+            return self._previous.public_key
+        return None
+
+    def reload(self) -> bool:
+        """파일을 다시 읽습니다. 잘못된 key 면 기존 key 를 유지합니다.
+
+        Returns:
+            bool: key 가 바뀌었으면 True
+        """
+        if self.path is None:
+            return False
+        self._checked_at = time.monotonic()
+        try:
+            version = _file_version(self.path)
+            key_pair = KeyPair.from_pem(_read(self.path))
+        except (OSError, InvalidKeyException) as e:
+            logger.error("private key 를 다시 불러오지 못해서 기존 key 를 사용합니다. %s", e)
+            return False
+        self._version = version
+        if key_pair.kid == self._current.kid:
+            return False
+        self._previous, self._current = self._current, key_pair
+        self.reload_count += 1
+        logger.info("private key 를 교체했습니다. kid=%s (이전 kid=%s)", key_pair.kid, self._previous.kid)
+        return True
+
+    def install_reload_signal(self, loop: Optional["asyncio.AbstractEventLoop"] = None) -> None:
+        """SIGHUP 을 받으면 reload 합니다. event loop 가 있으면 loop 에서 실행합니다."""
+        if loop is not None:
+            loop.add_signal_handler(signal.SIGHUP, self.reload)
+        else:
+            signal.signal(signal.SIGHUP, lambda signum, frame: self.reload())
+
+    def _check_file(self) -> None:
+        self._checked_at = time.monotonic()
+        try:
+            version = _file_version(self.path)
+        except OSError as e:
+            # secret 교체 중에 잠깐 파일이 없을 수 있어서 기존 key 를 유지합니다.
+            logger.warning("private key 파일을 확인할 수 없습니다. %s", e)
+            return
+        if version != self._version:
+            self.reload()
+
+
+def _file_version(path: str) -> Tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+_providers: Dict[Tuple[Optional[str], Optional[bytes]], KeyProvider] = {}
+
+
+def shared_key_provider(settings: "Settings") -> KeyProvider:
+    """settings 의 key 설정이 같으면 프로세스 전체에서 같은 KeyProvider 를 반환합니다.
+
+    Raises:
+        InvalidKeyException: key 를 읽거나 파싱할 수 없을 때 발생합니다.
+    """
+    source = (settings.private_key_file, None if settings.private_key_file else settings.private_key)
+    if (provider := _providers.get(source)) is None:
+        provider = _providers[source] = KeyProvider(settings.private_key, settings.private_key_file)
+    return provider
@@ -1,30 +1,73 @@
-from typing import Dict
+import time
+import uuid
+from typing import TYPE_CHECKING, Dict, Optional, Union
 
-import jwt
-
-from src.tokens.auth import private_pem2public_pem
-from src.domain import User, Token, TokenType
+from src.lazy import lazy_import
+from src.tokens.keys import KeyProvider, shared_key_provider
+from src.domain import DEFAULT_TENANT, TENANT_CLAIM, User, Token, TokenType
 
 from datetime import datetime
 
 from src.exceptions import ExpiredTokenException, InvalidTokenException
-from src.settings import Settings
+from src.metrics import TOKEN_SECONDS, TOKEN_FAILURES
+from src.permissions import PERMISSION_CLAIM, permissions_of
+
+if TYPE_CHECKING:
+    from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
+
+    from src.settings import Settings
+    from src.tokens.shared_state import SharedStateReader
+
+# PyJWT(+ cryptography) 는 토큰을 처음 발급/검증할 때 불러옵니다. (warmup 에서 미리 불러옵니다.)
+jwt = lazy_import("jwt")
 
 
 class TokenManager:
     """토큰 관리 매니저"""
 
-    def __init__(self, settings: Settings):
+    def __init__(
+            self,
+            settings: "Settings",
+            key_provider: Optional[KeyProvider] = None,
+            shared_state: Optional["SharedStateReader"] = None,
+            tenant: str = DEFAULT_TENANT,
+    ):
         """
         TokenManager 초기화 메서드
 
         Args:
             settings: AuthSettings
+            key_provider: 서명 key (없으면 settings 의 key 설정으로 프로세스 전체가 공유하는 KeyProvider)
+            shared_state: worker 들이 공유하는 검증 상태 (폐기 목록, public key), 없으면 확인하지 않습니다.
+            tenant: 토큰의 tenant claim, 다른 tenant 의 토큰은 검증에 실패합니다.
+
+        Raises:
+            InvalidKeyException: private key 를 읽거나 파싱할 수 없을 때 발생합니다.
         """
-        self.private_key = settings.private_key
+        self.keys = key_provider or shared_key_provider(settings)
+        self.shared_state = shared_state
+        self.tenant = tenant
         self.access_token_lifetime = settings.access_token_lifetime
         self.refresh_token_lifetime = settings.refresh_token_lifetime
 
+    @property
+    def private_key(self) -> bytes:
+        """현재 private key PEM"""
+        return self.keys.current.private_pem
+
+    @property
+    def public_key(self) -> bytes:
+        """현재 private key 에서 추출한 public key PEM"""
+        return self.keys.current.public_pem
+
+    def warmup(self) -> None:
+        """PyJWT 를 불러오고 토큰을 한 번 발급/검증해서 첫 요청의 초기화 비용을 미리 냅니다."""
+        key_pair = self.keys.current
+        payload = {"account_id": "__warmup__", "user_role": "UNKNOWN", "user_group": ""}
+        access = create_jwt_token(payload, TokenType.ACCESS, key_pair.private_key, self.access_token_lifetime,
+                                  kid=key_pair.kid)
+        self._decode(access)
+
     def generate_token(self, user: User) -> Token:
         """jwt token을 생성하고, access token, refresh token을 포함하는 도메인을 반환합니다.
 
@@ -34,20 +77,33 @@ class TokenManager:
         Returns:
             Token: access token, refresh token을 포함하는 도메인
         """
-        # access token 만들기
+        started = time.perf_counter()
+        # refresh token 의 jti 를 세션 id 로 사용하고, access token 에는 sid 로 담습니다.
+        session_id = new_jti()
+        # 두 토큰을 같은 key 로 서명합니다. (PEM 이 아닌 파싱한 key 객체를 넘겨서 매번 파싱하지 않습니다.)
+        key_pair = self.keys.current
+
+        # access token 만들기 (권한 확인에 DB 조회가 필요 없도록 역할의 권한 bitset 을 함께 담습니다.)
         access = create_jwt_token(
-            user.to_jwt_payload(),
+            {**user.to_jwt_payload(), TENANT_CLAIM: self.tenant, "sid": session_id,
+             PERMISSION_CLAIM: permissions_of(user.role)},
             TokenType.ACCESS,
-            self.private_key,
-            self.access_token_lifetime
+            key_pair.private_key,
+            self.access_token_lifetime,
+            kid=key_pair.kid,
         )
 
         # refresh token 만들기
         refresh = create_jwt_token(
-            {"account_id": user.account_id}, TokenType.REFRESH, self.private_key, self.refresh_token_lifetime
+            {"account_id": user.account_id, TENANT_CLAIM: self.tenant, "jti": session_id},
+            TokenType.REFRESH,
+            key_pair.private_key,
+            self.refresh_token_lifetime,
+            kid=key_pair.kid,
         )
 
-        return Token(access=access, refresh=refresh)
+        TOKEN_SECONDS.labels("generate").observe(time.perf_counter() - started)
+        return Token(access=access, refresh=refresh, session_id=session_id)
 
     def verify_refresh_token(self, refresh_token: str) -> str:
         """요청 받은 refresh token 이 유효한지 검증합니다.
@@ -61,12 +117,61 @@ class TokenManager:
         Raises:
             ExpiredTokenException: refresh token이 만료되었을 경우 발생합니다.
         """
-        public_key = private_pem2public_pem(self.private_key)
+        return self.verify_refresh_payload(refresh_token)["account_id"]
+
+    def verify_refresh_payload(self, refresh_token: str) -> Dict:
+        """요청 받은 refresh token 을 검증하고 payload 를 반환합니다. (account_id, jti 포함)
+
+        Raises:
+            ExpiredTokenException: refresh token이 만료되었을 경우 발생합니다.
+            InvalidTokenException: 다른 tenant 의 토큰이거나 shared state 에서 폐기된 토큰일 때 발생합니다.
+        """
+        started = time.perf_counter()
         try:
-            output = jwt.decode(refresh_token, public_key, algorithms=['RS256'])
-            return output["account_id"]
+            payload = self._decode(refresh_token)
+            self._check_tenant("verify_refresh", payload)
+            self._check_revoked("verify_refresh", payload)
+            return payload
         except jwt.exceptions.ExpiredSignatureError:
+            TOKEN_FAILURES.labels("verify_refresh", ExpiredTokenException.__name__).inc()
             raise ExpiredTokenException("리프레시 토큰이 만료되었습니다.")
+        finally:
+            TOKEN_SECONDS.labels("verify_refresh").observe(time.perf_counter() - started)
+
+    def _decode(self, token: str) -> Dict:
+        try:
+            return jwt.decode(token, self.keys.current.public_key, algorithms=['RS256'])
+        except jwt.exceptions.InvalidSignatureError:
+            # key 교체 전에 서명한 토큰이면 header 의 kid 로 직전 key 를 찾아서 다시 검증합니다.
+            # (다른 worker 가 먼저 교체한 key 는 shared state 에서 찾습니다.)
+            kid = jwt.get_unverified_header(token).get("kid")
+            public_key = self.keys.previous_public_key(kid)
+            if public_key is None and self.shared_state is not None:
+                public_key = self.shared_state.public_key(kid)
+            if public_key is None:
+                raise
+            return jwt.decode(token, public_key, algorithms=['RS256'])
+
+    def _check_tenant(self, operation: str, payload: Dict) -> None:
+        # tenant 들이 같은 key 를 쓰더라도 다른 tenant 의 토큰으로 인증할 수 없습니다.
+        if payload.get(TENANT_CLAIM, DEFAULT_TENANT) != self.tenant:
+            TOKEN_FAILURES.labels(operation, "TenantMismatch").inc()
+            raise InvalidTokenException("다른 tenant 의 토큰 입니다")
+
+    def _check_revoked(self, operation: str, payload: Dict) -> None:
+        if self.shared_state is None:
+            return
+        try:
+            self.shared_state.check(payload)
+        except InvalidTokenException:
+            TOKEN_FAILURES.labels(operation, "RevokedTokenException").inc()
+            raise
+
+    def peek_account_id(self, token: str) -> Optional[str]:
+        """서명을 검증하지 않고 토큰의 account_id 를 꺼냅니다.
+        만료되었거나 위조된 토큰이라도 누가 요청했는지 기록할 때만 사용하고, 인증에는 사용하면 안 됩니다.
+        """
+        return peek_claims(token).get("account_id")
 
     def verify_access_token(self, access_token: str):
         """요청 받은 access token 이 유효한지 검증합니다.
@@ -81,42 +186,69 @@ class TokenManager:
             ExpiredTokenException: access token이 만료되었을 경우 발생합니다.
             InvalidTokenException: access token의 검증이 실패했을 경우 발생합니다.
         """
+        started = time.perf_counter()
         try:
-            public_key = private_pem2public_pem(self.private_key)
-            payload = jwt.decode(access_token, public_key, algorithms=['RS256'])
+            payload = self._decode(access_token)
+            self._check_tenant("verify_access", payload)
+            self._check_revoked("verify_access", payload)
             return payload
 
         except jwt.exceptions.ExpiredSignatureError:
+            TOKEN_FAILURES.labels("verify_access", ExpiredTokenException.__name__).inc()
             raise ExpiredTokenException("만료된 토큰 입니다")
 
         except jwt.exceptions.InvalidSignatureError:
+            TOKEN_FAILURES.labels("verify_access", InvalidTokenException.__name__).inc()
             raise InvalidTokenException("검증 실패 토큰 입니다")
 
+        finally:
+            TOKEN_SECONDS.labels("verify_access").observe(time.perf_counter() - started)
+
 
 def create_jwt_token(
         payload: Dict,
         token_type: TokenType,
-        private_key: bytes,
-        lifetime: int
+        private_key: Union[bytes, "RSAPrivateKey"],
+        lifetime: int,
+        kid: Optional[str] = None,
 ) -> str:
     """JWT 토큰을 생성합니다.
 
     Args:
         payload: 토큰에 포함할 정보 payload
         token_type: 토큰 유형 ex. access, refresh
-        private_key: private key
+        private_key: private key (PEM 또는 파싱한 key 객체)
         lifetime: 토큰 수명
+        kid: 서명한 key 의 id (header 에 담아서 key 교체 후에도 검증할 key 를 찾습니다.)
 
     Returns:
         str: jwt token
     """
     update_payload = {
+        "jti": new_jti(),
         **payload,
         "type": token_type.value,
         "exp": datetime.now().timestamp() + lifetime,
         "iat": datetime.now().timestamp(),
     }
 
-    jwt_token = jwt.encode(update_payload, private_key, algorithm='RS256')
+    jwt_token = jwt.encode(update_payload, private_key, algorithm='RS256', headers={"kid": kid} if kid else None)
 
     return jwt_token
+
+
+def peek_claims(token: str) -> Dict:
+    """서명을 검증하지 않고 토큰의 payload 를 꺼냅니다. (검증할 key 를 고르거나 기록할 때만 사용합니다.)
+
+    Returns:
+        Dict: payload, JWT 형식이 아니면 빈 dict
+    """
+    try:
+        return jwt.decode(token, options={"verify_signature": False})
+    except jwt.exceptions.DecodeError:
+        return {}
+
+
+def new_jti() -> str:
+    """토큰 고유 id (jti claim)"""
+    return uuid.uuid4().hex
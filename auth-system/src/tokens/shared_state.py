@@ -0,0 +1,400 @@
+"""worker process 들이 공유하는 토큰 검증 상태 (multiprocessing.shared_memory)
+
+uvicorn 을 worker 여러 개로 실행하면 worker 마다 폐기 목록과 key 를 따로 들고 있어서 서로 달라지고,
+메모리도 worker 수만큼 늘어납니다. 검증에만 쓰는 (읽기 위주) 상태를 shared memory 하나에 두고
+쓰기는 writer process 하나만, worker 는 같은 segment 를 복사 없이 (memoryview) 읽습니다.
+
+- public keys: kid 별 public key PEM (worker 는 generation 이 바뀔 때만 다시 파싱합니다.)
+- watermarks: 계정별 시각, 이 시각 이전에 발급한 토큰은 모두 폐기 (모든 기기 로그아웃)
+- revoked: 폐기한 세션/토큰 id (sid, jti)
+
+watermarks, revoked 는 key 의 64bit hash(fingerprint)를 저장하는 open addressing table 입니다.
+(false positive 확률은 항목 수 / 2^64 로 무시할 수 있습니다.) 항목마다 만료 시각이 있어서
+table 이 차면 만료된 항목을 지우고 다시 만듭니다.
+
+writer 는 seqlock 으로 씁니다. 쓰기 전후로 sequence 를 1씩 올리고 (쓰는 중에는 홀수),
+reader 는 읽기 전후 sequence 가 같고 짝수일 때만 결과를 사용합니다. reader 는 lock 을 잡지 않습니다.
+table 마다 두 벌이 있어서, 만료 항목 정리(rebuild)는 쓰지 않는 쪽에 새로 만든 뒤 header 의 active 만 바꿉니다.
+그래서 sequence 가 홀수인 시간은 항목 하나를 쓰거나 active 를 바꾸는 동안뿐입니다.
+reader 는 event loop 위에서 읽기 때문에 오래 기다리지 않습니다. read_retries 번 다시 읽어도 (처음 몇 번 이후에는 time.sleep(0) 으로
+CPU 를 양보) 짝수를 보지 못하면 (writer 가 쓰다가 종료된 경우 등) 기다리지 않고 그대로 읽습니다.
+
+writer process 는 src.tokens.state_writer 의 daemon (paip-auth-state-writer) 하나입니다.
+
+layout
+    header (64 bytes) | keys (key_region_size) | watermarks (2 * capacity * 24) | revoked (2 * capacity * 24)
+"""
+import hashlib
+import logging
+import struct
+import time
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from src.exceptions import InvalidTokenException
+from src.log_sampling import SampledLogger
+
+if TYPE_CHECKING:
+    from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
+
+    from src.tokens.keys import KeyPair
+
+logger = logging.getLogger(__name__)
+_error_logger = SampledLogger(logger)
+
+MAGIC = b"PAIPVST2"
+# magic, sequence, key generation, key bytes, key region size, watermark capacity, revoked capacity
+_HEADER = struct.Struct("<8sQIIIII")
+HEADER_SIZE = 64
+_SEQUENCE_OFFSET = 8
+_GENERATION_OFFSET = 16
+# table 별로 reader 가 읽는 쪽 (0 또는 1)
+_ACTIVE_OFFSET = 40
+_ACTIVE = struct.Struct("<I")
+WATERMARKS = 0
+REVOKED = 1
+# fingerprint, value, expires_at
+_ENTRY = struct.Struct("<Qdd")
+_KEY_HEADER = struct.Struct("<16sI")
+# table 이 이 비율보다 차면 만료된 항목을 정리합니다. (linear probing 이 길어지지 않도록)
+MAX_LOAD = 0.5
+# reader 가 writer 의 쓰기가 끝나기를 기다리는 최대 시간(초)
+READ_RETRIES = 100
+# 이 횟수 이후에는 다시 읽기 전에 time.sleep(0) 으로 writer 에게 CPU 를 양보합니다.
+_SPIN_RETRIES = 10
+
+
+def fingerprint(key: str) -> int:
+    """key 의 64bit hash (0 은 빈 칸 표시라 사용하지 않습니다.)"""
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little") | 1
+
+
+class _Layout:
+    def __init__(self, key_region_size: int, watermark_capacity: int, revoked_capacity: int):
+        for capacity in (watermark_capacity, revoked_capacity):
+            if capacity <= 0 or capacity & (capacity - 1):
+                raise ValueError(f"capacity 는 2의 거듭제곱이어야 합니다. {capacity}")
+        self.key_region_size = key_region_size
+        self.watermark_capacity = watermark_capacity
+        self.revoked_capacity = revoked_capacity
+        self.keys_offset = HEADER_SIZE
+        self.watermarks_offset = self.keys_offset + key_region_size
+        self.revoked_offset = self.watermarks_offset + 2 * watermark_capacity * _ENTRY.size
+        self.size = self.revoked_offset + 2 * revoked_capacity * _ENTRY.size
+        # table 별 (첫 번째 벌의 offset, capacity)
+        self.tables = [(self.watermarks_offset, watermark_capacity), (self.revoked_offset, revoked_capacity)]
+
+    def table_offset(self, table: int, active: int) -> int:
+        offset, capacity = self.tables[table]
+        return offset + active * capacity * _ENTRY.size
+
+
+def _active(buf, table: int) -> int:
+    return _ACTIVE.unpack_from(buf, _ACTIVE_OFFSET + table * _ACTIVE.size)[0]
+
+
+def _lookup(buf, layout: _Layout, table: int, fp: int) -> Optional[Tuple[float, float]]:
+    # active 도 seqlock 안에서 읽어야 rebuild 중인 (쓰지 않는) 쪽을 읽지 않습니다.
+    offset = layout.table_offset(table, _active(buf, table))
+    capacity = layout.tables[table][1]
+    mask = capacity - 1
+    slot = fp & mask
+    for _ in range(capacity):
+        entry_fp, value, expires_at = _ENTRY.unpack_from(buf, offset + slot * _ENTRY.size)
+        if entry_fp == fp:
+            return value, expires_at
+        if entry_fp == 0:
+            return None
+        slot = (slot + 1) & mask
+    return None
+
+
+def _key_pems(buf, offset: int) -> Dict[str, bytes]:
+    length = struct.unpack_from("<I", buf, _GENERATION_OFFSET + 4)[0]
+    position, end = offset, offset + length
+    pems = {}
+    while position < end:
+        kid, size = _KEY_HEADER.unpack_from(buf, position)
+        position += _KEY_HEADER.size
+        pems[kid.decode()] = bytes(buf[position:position + size])
+        position += size
+    return pems
+
+
+def _entries(buf, offset: int, capacity: int) -> Iterator[Tuple[int, float, float]]:
+    for slot in range(capacity):
+        entry = _ENTRY.unpack_from(buf, offset + slot * _ENTRY.size)
+        if entry[0] != 0:
+            yield entry
+
+
+class SharedStateWriter:
+    """shared memory segment 를 만들고 갱신하는 유일한 writer"""
+
+    def __init__(
+            self,
+            name: Optional[str] = None,
+            key_region_size: int = 16 * 1024,
+            watermark_capacity: int = 1 << 16,
+            revoked_capacity: int = 1 << 18,
+    ):
+        """
+        Args:
+            name: segment 이름 (None 이면 자동 생성, reader 에게 name 을 전달합니다.)
+            key_region_size: public key PEM 을 저장할 공간(bytes)
+            watermark_capacity: watermark table 칸 수 (2의 거듭제곱)
+            revoked_capacity: revoked table 칸 수 (2의 거듭제곱)
+
+        Raises:
+            ValueError: 같은 이름의 segment 가 있는데 크기(layout)가 다를 때 발생합니다.
+        """
+        self.layout = _Layout(key_region_size, watermark_capacity, revoked_capacity)
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=self.layout.size)
+        except FileExistsError:
+            # 이전 writer 가 종료되면서 남긴 segment, worker 들이 이미 연결해 있으므로 새로 만들지 않고 이어서 씁니다.
+            self.shm = shared_memory.SharedMemory(name=name)
+            _resource_tracker().unregister(self.shm._name, "shared_memory")
+            self.name = self.shm.name
+            self._buf = self.shm.buf
+            self._resume()
+            return
+        # writer process 가 종료되어도 resource_tracker 가 segment 를 지우지 않게 합니다. (worker 는 계속 읽습니다.)
+        _resource_tracker().unregister(self.shm._name, "shared_memory")
+        self.name = self.shm.name
+        self._buf = self.shm.buf
+        _HEADER.pack_into(self._buf, 0, MAGIC, 0, 0, 0, key_region_size, watermark_capacity, revoked_capacity)
+        self._counts = [0, 0]
+
+    def publish_keys(self, key_pairs: Iterable["KeyPair"]) -> None:
+        """검증에 사용할 public key 목록을 교체합니다. (현재 key, 직전 key)
+
+        Raises:
+            ValueError: key_region_size 보다 클 때 발생합니다.
+        """
+        region = bytearray()
+        for key_pair in key_pairs:
+            region += _KEY_HEADER.pack(key_pair.kid.encode(), len(key_pair.public_pem)) + key_pair.public_pem
+        if len(region) > self.layout.key_region_size:
+            raise ValueError(f"public key 가 key 영역보다 큽니다. {len(region)} > {self.layout.key_region_size}")
+        with self._writing():
+            start = self.layout.keys_offset
+            self._buf[start:start + len(region)] = region
+            generation = struct.unpack_from("<I", self._buf, _GENERATION_OFFSET)[0] + 1
+            struct.pack_into("<II", self._buf, _GENERATION_OFFSET, generation, len(region))
+
+    def set_watermark(self, account_id: str, issued_before: float, ttl: float) -> None:
+        """account_id 의 issued_before 이전에 발급한 토큰을 모두 폐기합니다.
+
+        Args:
+            account_id: 사용자 계정
+            issued_before: 이 시각(timestamp) 이전에 발급한 토큰을 폐기
+            ttl: 이 항목을 유지할 시간(초), 폐기할 토큰의 최대 수명
+        """
+        self._put(WATERMARKS, fingerprint(account_id), issued_before, issued_before + ttl)
+
+    def revoke(self, token_id: str, ttl: float) -> None:
+        """세션/토큰 id (sid, jti) 를 폐기합니다.
+
+        Args:
+            token_id: 폐기할 id
+            ttl: 이 항목을 유지할 시간(초), 폐기할 토큰의 남은 수명
+        """
+        now = time.time()
+        self._put(REVOKED, fingerprint(token_id), now, now + ttl)
+
+    def compact(self, now: Optional[float] = None) -> int:
+        """만료된 항목을 지우고 table 을 다시 만듭니다. (reader 는 그동안 기존 table 을 읽습니다.)
+
+        Returns:
+            int: 지운 항목 수
+        """
+        now = time.time() if now is None else now
+        return sum(self._rebuild(table, now) for table in (WATERMARKS, REVOKED))
+
+    def close(self, unlink: bool = True) -> None:
+        """segment 를 닫습니다. unlink 하면 reader 가 모두 닫은 뒤 segment 가 해제되고,
+        unlink 하지 않으면 다시 시작한 writer 가 이어서 쓸 수 있도록 남겨 둡니다.
+        """
+        self._buf = None
+        self.shm.close()
+        if unlink:
+            # unlink 가 resource_tracker 에서 지우기 때문에 다시 등록해 둡니다.
+            _resource_tracker().register(self.shm._name, "shared_memory")
+            self.shm.unlink()
+
+    def _put(self, table: int, fp: int, value: float, expires_at: float) -> None:
+        capacity = self.layout.tables[table][1]
+        if self._counts[table] + 1 > capacity * MAX_LOAD:
+            self._rebuild(table, time.time())
+            if self._counts[table] + 1 > capacity * MAX_LOAD:
+                raise OverflowError(f"shared state table 이 가득 찼습니다. (capacity {capacity})")
+        offset = self.layout.table_offset(table, _active(self._buf, table))
+        with self._writing():
+            mask = capacity - 1
+            slot = fp & mask
+            while True:
+                position = offset + slot * _ENTRY.size
+                entry_fp, old_value, old_expires_at = _ENTRY.unpack_from(self._buf, position)
+                if entry_fp == fp:
+                    _ENTRY.pack_into(self._buf, position, fp, max(value, old_value), max(expires_at, old_expires_at))
+                    return
+                if entry_fp == 0:
+                    _ENTRY.pack_into(self._buf, position, fp, value, expires_at)
+                    self._counts[table] += 1
+                    return
+                slot = (slot + 1) & mask
+
+    def _rebuild(self, table: int, now: float) -> int:
+        # reader 가 읽지 않는 쪽에 새 table 을 만들고, seqlock 안에서는 active 만 바꿉니다.
+        capacity = self.layout.tables[table][1]
+        active = _active(self._buf, table)
+        entries = list(_entries(self._buf, self.layout.table_offset(table, active), capacity))
+        alive = [entry for entry in entries if entry[2] > now]
+        rebuilt = bytearray(capacity * _ENTRY.size)
+        mask = capacity - 1
+        for fp, value, expires_at in alive:
+            slot = fp & mask
+            while _ENTRY.unpack_from(rebuilt, slot * _ENTRY.size)[0] != 0:
+                slot = (slot + 1) & mask
+            _ENTRY.pack_into(rebuilt, slot * _ENTRY.size, fp, value, expires_at)
+        offset = self.layout.table_offset(table, 1 - active)
+        self._buf[offset:offset + len(rebuilt)] = rebuilt
+        with self._writing():
+            _ACTIVE.pack_into(self._buf, _ACTIVE_OFFSET + table * _ACTIVE.size, 1 - active)
+        self._counts[table] = len(alive)
+        return len(entries) - len(alive)
+
+    def _resume(self) -> None:
+        magic, sequence, _, _, *sizes = _HEADER.unpack_from(self._buf, 0)
+        layout = self.layout
+        if magic != MAGIC or sizes != [layout.key_region_size, layout.watermark_capacity, layout.revoked_capacity]:
+            self._buf = None
+            self.shm.close()
+            raise ValueError(f"같은 이름의 segment 가 다른 형식입니다. {self.name}")
+        if sequence % 2:
+            # 쓰다가 종료된 writer 의 seqlock 을 풀어 줍니다. (reader 는 그동안 기다리지 않고 읽고 있었습니다.)
+            struct.pack_into("<Q", self._buf, _SEQUENCE_OFFSET, sequence + 1)
+        self._counts = [
+            sum(1 for _ in _entries(self._buf, layout.table_offset(table, _active(self._buf, table)), capacity))
+            for table, (_, capacity) in enumerate(layout.tables)
+        ]
+
+    @contextmanager
+    def _writing(self):
+        # seqlock: 쓰는 동안 sequence 를 홀수로 둡니다.
+        sequence = struct.unpack_from("<Q", self._buf, _SEQUENCE_OFFSET)[0]
+        struct.pack_into("<Q", self._buf, _SEQUENCE_OFFSET, sequence + 1)
+        try:
+            yield
+        finally:
+            struct.pack_into("<Q", self._buf, _SEQUENCE_OFFSET, sequence + 2)
+
+
+class SharedStateReader:
+    """worker 에서 shared memory segment 를 복사 없이 읽습니다."""
+
+    def __init__(self, name: str, read_retries: int = READ_RETRIES):
+        """
+        Args:
+            name: writer 가 만든 segment 이름
+            read_retries: writer 의 쓰기가 끝나기를 기다리며 다시 읽는 최대 횟수, 넘으면 기다리지 않고 그대로 읽습니다.
+
+        Raises:
+            FileNotFoundError: segment 가 없을 때 발생합니다.
+            ValueError: 검증 상태 segment 가 아닐 때 발생합니다.
+        """
+        # reader 가 종료될 때 resource_tracker 가 segment 를 지우지 않도록 track 하지 않습니다.
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # Python 3.13 미만은 track 인자가 없어서, 연결한 뒤 등록을 지웁니다. (writer 도 자신의 등록을 지웁니다.)
+            self.shm = shared_memory.SharedMemory(name=name)
+            _resource_tracker().unregister(self.shm._name, "shared_memory")
+        self._buf = self.shm.buf
+        magic, _, _, _, key_region_size, watermark_capacity, revoked_capacity = _HEADER.unpack_from(self._buf, 0)
+        if magic != MAGIC:
+            raise ValueError(f"검증 상태 shared memory 가 아닙니다. {name}")
+        self.layout = _Layout(key_region_size, watermark_capacity, revoked_capacity)
+        self.read_retries = read_retries
+        self._keys_generation = -1
+        self._keys: Dict[str, "RSAPublicKey"] = {}
+        # read_retries 동안 끝나지 않은 쓰기의 sequence (writer 가 쓰다가 종료되었으면 계속 같은 값입니다.)
+        self._stuck_sequence: Optional[int] = None
+
+    def watermark(self, account_id: str) -> Optional[float]:
+        """account_id 의 watermark (없으면 None)"""
+        entry, _ = self._read(_lookup, self.layout, WATERMARKS, fingerprint(account_id))
+        return None if entry is None else entry[0]
+
+    def is_revoked(self, token_id: str) -> bool:
+        entry, _ = self._read(_lookup, self.layout, REVOKED, fingerprint(token_id))
+        return entry is not None
+
+    def check(self, payload: Dict) -> None:
+        """토큰 payload 가 폐기되었는지 확인합니다.
+
+        Raises:
+            InvalidTokenException: 계정 watermark 이전에 발급했거나, sid/jti 가 폐기된 토큰일 때 발생합니다.
+        """
+        watermark = self.watermark(payload["account_id"]) if "account_id" in payload else None
+        if watermark is not None and payload.get("iat", 0) < watermark:
+            raise InvalidTokenException("폐기된 토큰 입니다")
+        for claim in ("sid", "jti"):
+            if (token_id := payload.get(claim)) is not None and self.is_revoked(token_id):
+                raise InvalidTokenException("폐기된 토큰 입니다")
+
+    def public_key(self, kid: Optional[str]) -> Optional["RSAPublicKey"]:
+        """writer 가 게시한 kid 의 public key (generation 이 바뀔 때만 다시 파싱합니다.)"""
+        generation = struct.unpack_from("<I", self._buf, _GENERATION_OFFSET)[0]
+        if generation != self._keys_generation:
+            pems, consistent = self._read(_key_pems, self.layout.keys_offset)
+            if consistent:
+                self._keys = self._load_keys(pems)
+                self._keys_generation = generation
+            # writer 가 key 를 쓰다가 멈췄으면 반쯤 쓴 PEM 대신 이전 key 를 계속 사용합니다.
+        return self._keys.get(kid)
+
+    def close(self) -> None:
+        self._buf = None
+        self.shm.close()
+
+    @staticmethod
+    def _load_keys(pems: Dict[str, bytes]) -> Dict[str, "RSAPublicKey"]:
+        from cryptography.hazmat.primitives import serialization
+
+        return {kid: serialization.load_pem_public_key(pem) for kid, pem in pems.items()}
+
+    def _read(self, read, *args) -> Tuple[Any, bool]:
+        """seqlock: 읽기 전후 sequence 가 같은 짝수일 때의 결과를 사용합니다.
+
+        writer 가 read_retries 번 다시 읽는 동안 쓰기를 끝내지 않으면 (쓰다가 종료된 writer 등) 기다리지 않고 그대로 읽습니다.
+        이때 쓰던 항목 하나만 틀릴 수 있고, 같은 sequence 에서는 다시 기다리지 않습니다.
+
+        Returns:
+            Tuple[Any, bool]: 읽은 결과, seqlock 으로 일관되게 읽었는지 여부
+        """
+        buf = self._buf
+        for retry in range(self.read_retries):
+            before = struct.unpack_from("<Q", buf, _SEQUENCE_OFFSET)[0]
+            if before % 2 == 0:
+                result = read(buf, *args)
+                if struct.unpack_from("<Q", buf, _SEQUENCE_OFFSET)[0] == before:
+                    return result, True
+            elif before == self._stuck_sequence:
+                return read(buf, *args), False
+            if retry >= _SPIN_RETRIES:
+                time.sleep(0)
+        before = struct.unpack_from("<Q", buf, _SEQUENCE_OFFSET)[0]
+        if before % 2:
+            self._stuck_sequence = before
+        _error_logger.error("stale", "shared state writer 가 %d번 읽는 동안 쓰기를 끝내지 않았습니다. (sequence %d)",
+                            self.read_retries, before)
+        return read(buf, *args), False
+
+
+def _resource_tracker():
+    from multiprocessing import resource_tracker
+
+    return resource_tracker
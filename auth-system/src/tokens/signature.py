@@ -1,6 +1,16 @@
+import mmap
+import os
+from typing import AsyncIterable, BinaryIO, Union
+
+from Crypto.PublicKey import RSA
 from Crypto.Signature import pkcs1_15
 from Crypto.Hash import SHA256
-from src.tokens.auth import load_rsa_key
+from src.tokens.auth import load_rsa_key, KeyFileCache
+
+# 스트리밍 해시에 사용하는 chunk 크기, 이 크기만큼만 메모리에 올립니다.
+CHUNK_SIZE = 1024 * 1024
+
+StreamSource = Union[str, os.PathLike, BinaryIO]
 
 
 def load_sig_scheme(key_path: str):
@@ -8,31 +18,130 @@ def load_sig_scheme(key_path: str):
     return pkcs1_15.new(key)
 
 
-def sign_data_by_rsa(message: bytes, private_key_path: str) -> bytes:
-    """
-    서명하기
+class Signer:
+    """개인키를 한 번만 파싱해서 재사용하는 서명 객체"""
+
+    def __init__(self, private_key: RSA.RsaKey):
+        if not private_key.has_private():
+            raise ValueError("서명에는 private key 가 필요합니다.")
+        self._sig_scheme = pkcs1_15.new(private_key)
+
+    @classmethod
+    def from_file(cls, private_key_path: str) -> "Signer":
+        return cls(load_rsa_key(private_key_path))
+
+    def sign(self, message: bytes) -> bytes:
+        """message 의 sha256 digest 에 서명합니다."""
+        return self._sig_scheme.sign(SHA256.new(message))
+
+    def sign_stream(self, source: StreamSource) -> bytes:
+        """파일 경로나 file object 를 chunk 단위로 해시해서 서명합니다.
+        sign(파일 전체 내용) 과 같은 서명을 만들지만 메모리는 CHUNK_SIZE 만큼만 사용합니다.
+        """
+        return self._sig_scheme.sign(digest_stream(source))
+
+    async def sign_async_stream(self, chunks: AsyncIterable[bytes]) -> bytes:
+        """비동기 byte iterator 를 받는 대로 해시해서 서명합니다."""
+        return self._sig_scheme.sign(await digest_async_stream(chunks))
+
+
+class Verifier:
+    """공개키를 한 번만 파싱해서 재사용하는 검증 객체"""
+
+    def __init__(self, public_key: RSA.RsaKey):
+        self._sig_scheme = pkcs1_15.new(public_key)
+
+    @classmethod
+    def from_file(cls, public_key_path: str) -> "Verifier":
+        return cls(load_rsa_key(public_key_path))
+
+    def verify(self, message: bytes, signature: bytes) -> bool:
+        """signature 가 message 에 대한 올바른 서명인지 검증합니다."""
+        return self._verify_digest(SHA256.new(message), signature)
+
+    def verify_stream(self, source: StreamSource, signature: bytes) -> bool:
+        """파일 경로나 file object 를 chunk 단위로 해시해서 검증합니다."""
+        return self._verify_digest(digest_stream(source), signature)
+
+    async def verify_async_stream(self, chunks: AsyncIterable[bytes], signature: bytes) -> bool:
+        """비동기 byte iterator 를 받는 대로 해시해서 검증합니다."""
+        return self._verify_digest(await digest_async_stream(chunks), signature)
+
+    def _verify_digest(self, digest, signature: bytes) -> bool:
+        try:
+            self._sig_scheme.verify(digest, signature)
+            return True
+        except ValueError:
+            return False
+
+
+def digest_stream(source: StreamSource):
+    """파일 경로 또는 file object 의 sha256 digest 를 chunk 단위로 계산합니다.
+    로컬 파일 경로는 mmap 으로 읽어서 복사 없이 해시합니다.
     """
-    # hash A -> B 로 나오는데 A' 를 넣
+    if not isinstance(source, (str, os.PathLike)):
+        digest = SHA256.new()
+        while chunk := source.read(CHUNK_SIZE):
+            digest.update(chunk)
+        return digest
+
+    digest = SHA256.new()
+    with open(source, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return digest
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                for offset in range(0, len(view), CHUNK_SIZE):
+                    digest.update(view[offset:offset + CHUNK_SIZE])
+    return digest
+
+
+async def digest_async_stream(chunks: AsyncIterable[bytes]):
+    """비동기 byte iterator 의 sha256 digest 를 계산합니다."""
+    digest = SHA256.new()
+    async for chunk in chunks:
+        digest.update(chunk)
+    return digest
+
 
-    # RS256 HS256
+_signers = KeyFileCache(Signer.from_file)
+_verifiers = KeyFileCache(Verifier.from_file)
 
-    # hash (message, secrete) ->
 
-    # sha 256 적용
-    digest = SHA256.new(message)
-    sig_scheme = load_sig_scheme(private_key_path)
-    return sig_scheme.sign(digest)
+def get_signer(private_key_path: str) -> Signer:
+    """key 파일별로 캐시된 Signer 를 반환합니다. (파일이 교체되면 다시 불러옵니다.)"""
+    return _signers.get(private_key_path)
+
+
+def get_verifier(public_key_path: str) -> Verifier:
+    """key 파일별로 캐시된 Verifier 를 반환합니다. (파일이 교체되면 다시 불러옵니다.)"""
+    return _verifiers.get(public_key_path)
+
+
+def sign_data_by_rsa(message: bytes, private_key_path: str) -> bytes:
+    """
+    서명하기
+    """
+    # sha 256 적용 후 서명, key 파싱은 get_signer 에서 캐시
+    return get_signer(private_key_path).sign(message)
 
 
 def verify_data_by_rsa(message: bytes, signature, public_key_path: str) -> bool:
     """
     검증하기
     """
-    digset = SHA256.new(message)
-    sig_scheme = load_sig_scheme(public_key_path)
+    return get_verifier(public_key_path).verify(message, signature)
+
+
+def sign_stream_by_rsa(source: StreamSource, private_key_path: str) -> bytes:
+    """
+    큰 파일 서명하기 (sign_data_by_rsa 와 같은 서명)
+    """
+    return get_signer(private_key_path).sign_stream(source)
+
 
-    try:
-        sig_scheme.verify(digset, signature)
-        return True
-    except ValueError:
-        return False
+def verify_stream_by_rsa(source: StreamSource, signature, public_key_path: str) -> bool:
+    """
+    큰 파일 검증하기
+    """
+    return get_verifier(public_key_path).verify_stream(source, signature)
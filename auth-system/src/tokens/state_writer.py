@@ -0,0 +1,314 @@
+"""검증 상태 (shared memory) writer daemon
+
+SharedStateWriter 는 process 하나만 있어야 합니다. 이 daemon 이 settings.shared_state_name 의 segment 를 만들고
+- 모든 tenant 의 public key 를 게시합니다. (SIGHUP 을 받거나 key 파일이 바뀌면 다시 게시합니다.)
+- compact_interval 마다 만료된 항목을 정리합니다.
+- worker 의 SessionRegistry 가 StateWriterClient 로 보내는 폐기(revoke, watermark)를 Unix domain socket 으로 받아서 씁니다.
+
+요청 frame 은 src.verifier.protocol 과 같은 header 를 쓰고, 응답은 없습니다. (worker 는 기다리지 않고 보냅니다.)
+```
+REVOKE     | op (u8) | length (u32) | ttl (f64) | token id (utf-8)
+WATERMARK  | op (u8) | length (u32) | issued_before (f64) | ttl (f64) | account id (utf-8)
+```
+폐기의 기준은 DB (세션 삭제) 이고, shared state 는 access token 을 바로 거절하기 위한 것이라
+연결이 끊긴 동안 보내지 못한 폐기는 access token 이 만료될 때까지만 늦어집니다.
+
+paip-auth-state-writer --socket /run/paip-auth/state.sock
+"""
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import stat
+import struct
+import sys
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from src.log_sampling import SampledLogger
+from src.verifier.protocol import HEADER, MAX_FRAME, ProtocolError, parse_frames
+
+from src.tokens.shared_state import SharedStateWriter
+
+logger = logging.getLogger(__name__)
+_error_logger = SampledLogger(logger)
+
+READ_SIZE = 64 * 1024
+DEFAULT_SOCKET = "/run/paip-auth/state.sock"
+
+# 요청 op
+REVOKE = 1
+WATERMARK = 2
+
+_REVOKE = struct.Struct("!d")
+_WATERMARK = struct.Struct("!dd")
+
+
+def encode_revoke(token_id: str, ttl: float) -> bytes:
+    body = _REVOKE.pack(ttl) + token_id.encode()
+    return HEADER.pack(REVOKE, len(body)) + body
+
+
+def encode_watermark(account_id: str, issued_before: float, ttl: float) -> bytes:
+    body = _WATERMARK.pack(issued_before, ttl) + account_id.encode()
+    return HEADER.pack(WATERMARK, len(body)) + body
+
+
+class StateWriterServer:
+    """worker 들이 보내는 폐기를 받아서 SharedStateWriter 로 씁니다."""
+
+    def __init__(self, writer: SharedStateWriter, path: str, mode: int = 0o660):
+        """
+        Args:
+            writer: 이 process 의 SharedStateWriter
+            path: socket 파일 경로
+            mode: socket 파일 권한 (worker 와 같은 group 만 접근)
+        """
+        self.writer = writer
+        self.path = path
+        self.mode = mode
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: Dict[asyncio.StreamWriter, asyncio.Task] = {}
+
+    async def start(self) -> None:
+        """socket 을 열고 요청을 받기 시작합니다. (이전 실행이 남긴 socket 파일은 지웁니다.)"""
+        if os.path.exists(self.path) and stat.S_ISSOCK(os.stat(self.path).st_mode):
+            os.unlink(self.path)
+        self._server = await asyncio.start_unix_server(self._handle, self.path, limit=READ_SIZE)
+        os.chmod(self.path, self.mode)
+
+    async def stop(self) -> None:
+        """새 연결을 받지 않고, 열린 연결을 닫은 뒤 socket 파일을 지웁니다."""
+        if self._server is None:
+            return
+        self._server.close()
+        handlers = list(self._connections.values())
+        for writer in list(self._connections):
+            writer.close()
+        await asyncio.gather(*handlers, return_exceptions=True)
+        await self._server.wait_closed()
+        self._server = None
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def apply(self, op: int, body: bytes) -> None:
+        """요청 frame 하나를 씁니다. 잘못된 요청이나 쓰기 오류는 그 요청만 버리고 기록합니다."""
+        try:
+            if op == REVOKE:
+                (ttl,) = _REVOKE.unpack_from(body)
+                self.writer.revoke(body[_REVOKE.size:].decode(), ttl)
+            elif op == WATERMARK:
+                issued_before, ttl = _WATERMARK.unpack_from(body)
+                self.writer.set_watermark(body[_WATERMARK.size:].decode(), issued_before, ttl)
+            else:
+                _error_logger.error(op, "지원하지 않는 요청입니다. %s", op)
+        except Exception as e:
+            # OverflowError(table 가득 참), struct.error, UnicodeDecodeError 등
+            reason = type(e).__name__
+            _error_logger.exception(reason, "폐기를 shared state 에 쓰지 못했습니다.")
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._connections[writer] = asyncio.current_task()
+        buffer = bytearray()
+        try:
+            while chunk := await reader.read(READ_SIZE):
+                buffer += chunk
+                frames, consumed = parse_frames(buffer, MAX_FRAME)
+                del buffer[:consumed]
+                for op, body in frames:
+                    self.apply(op, body)
+        except ProtocolError as e:
+            logger.error("잘못된 요청이라 연결을 끊습니다. %s", e)
+        except ConnectionError:
+            pass
+        finally:
+            del self._connections[writer]
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+class StateWriterClient:
+    """worker 에서 writer daemon 으로 폐기를 보냅니다. SessionRegistry 의 shared_state 로 사용합니다.
+    ```
+    client = StateWriterClient("/run/paip-auth/state.sock")
+    await client.start()
+    registry = SessionRegistry(repository, shared_state=client)
+    ```
+    SharedStateWriter 와 같은 revoke, set_watermark 를 기다리지 않고 보냅니다.
+    연결되어 있지 않으면 max_pending 개까지 모아 두었다가 (넘으면 오래된 것부터 버립니다) 다시 연결되면 보냅니다.
+    """
+
+    def __init__(self, path: str, max_pending: int = 10000, reconnect_interval: float = 1.0):
+        """
+        Args:
+            path: writer daemon 의 socket 파일 경로
+            max_pending: 연결되지 않은 동안 모아 둘 최대 요청 수
+            reconnect_interval: 다시 연결하기 전에 기다리는 시간(초)
+        """
+        self.path = path
+        self.reconnect_interval = reconnect_interval
+        self._pending: Deque[bytes] = deque(maxlen=max_pending)
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._task: Optional[asyncio.Task] = None
+        self._connected = asyncio.Event()
+
+    @property
+    def connected(self) -> bool:
+        return self._writer is not None
+
+    async def start(self) -> None:
+        """연결을 유지하는 background task 를 시작합니다."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """연결을 닫습니다. (보내지 못한 요청은 버립니다.)"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def wait_connected(self, timeout: Optional[float] = None) -> None:
+        """연결될 때까지 기다립니다.
+
+        Raises:
+            asyncio.TimeoutError: timeout 안에 연결되지 않았을 때 발생합니다.
+        """
+        await asyncio.wait_for(self._connected.wait(), timeout)
+
+    def revoke(self, token_id: str, ttl: float) -> None:
+        self._send(encode_revoke(token_id, ttl))
+
+    def set_watermark(self, account_id: str, issued_before: float, ttl: float) -> None:
+        self._send(encode_watermark(account_id, issued_before, ttl))
+
+    def _send(self, frame: bytes) -> None:
+        if self._writer is not None and not self._writer.is_closing():
+            self._writer.write(frame)
+            return
+        if len(self._pending) == self._pending.maxlen:
+            _error_logger.error("dropped", "writer daemon 에 연결되지 않아 오래된 폐기 요청을 버립니다.")
+        self._pending.append(frame)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                reader, writer = await asyncio.open_unix_connection(self.path)
+            except OSError as e:
+                _error_logger.error("connect", "writer daemon 에 연결할 수 없습니다. %s", e)
+                await asyncio.sleep(self.reconnect_interval)
+                continue
+            try:
+                writer.write(b"".join(self._pending))
+                self._pending.clear()
+                self._writer = writer
+                self._connected.set()
+                # daemon 은 응답하지 않기 때문에, read 가 끝나면 연결이 끊긴 것입니다.
+                await reader.read()
+            except ConnectionError:
+                pass
+            finally:
+                self._writer = None
+                self._connected.clear()
+                writer.close()
+            await asyncio.sleep(self.reconnect_interval)
+
+
+def _key_pairs(registry) -> List:
+    return [key_pair for tenant in registry.tenants for key_pair in registry.token_manager(tenant).keys.key_pairs()]
+
+
+class KeyPublisher:
+    """모든 tenant 의 검증 key 를 shared state 에 게시합니다. (kid 목록이 바뀔 때만)"""
+
+    def __init__(self, writer: SharedStateWriter, registry):
+        """
+        Args:
+            writer: SharedStateWriter
+            registry: TenantRegistry
+        """
+        self.writer = writer
+        self.registry = registry
+        self._published: Optional[Tuple[str, ...]] = None
+
+    def publish(self, reload: bool = False) -> bool:
+        """key 를 게시합니다.
+
+        Args:
+            reload: key 파일을 다시 읽을지 여부 (SIGHUP)
+
+        Returns:
+            bool: 게시했으면 True
+        """
+        if reload:
+            self.registry.reload_keys()
+        key_pairs = _key_pairs(self.registry)
+        kids = tuple(key_pair.kid for key_pair in key_pairs)
+        if kids == self._published:
+            return False
+        self.writer.publish_keys(key_pairs)
+        self._published = kids
+        logger.info("검증 key 를 게시했습니다. %s", ", ".join(kids))
+        return True
+
+
+async def serve(path: str, mode: int, compact_interval: float) -> None:
+    """writer daemon 을 SIGTERM/SIGINT 를 받을 때까지 실행합니다.
+
+    Raises:
+        ValueError: shared_state_name 설정이 없을 때 발생합니다.
+    """
+    from src.settings import get_settings
+    from src.tenants import TenantRegistry
+
+    settings = get_settings()
+    if not settings.shared_state_name:
+        raise ValueError("shared_state_name 설정이 필요합니다.")
+    writer = SharedStateWriter(settings.shared_state_name)
+    publisher = KeyPublisher(writer, TenantRegistry(settings))
+    publisher.publish()
+
+    server = StateWriterServer(writer, path, mode)
+    await server.start()
+    loop = asyncio.get_running_loop()
+    stopped = asyncio.Event()
+    loop.add_signal_handler(signal.SIGHUP, lambda: publisher.publish(reload=True))
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, stopped.set)
+    logger.info("검증 상태 writer 를 시작했습니다. %s (%s)", writer.name, path)
+    try:
+        while not stopped.is_set():
+            try:
+                await asyncio.wait_for(stopped.wait(), compact_interval)
+            except asyncio.TimeoutError:
+                # 바뀐 key 파일은 KeyProvider 가 읽어 둡니다.
+                publisher.publish()
+                removed = writer.compact()
+                logger.debug("만료된 항목 %d개를 정리했습니다.", removed)
+    finally:
+        await server.stop()
+        # worker 들이 계속 읽을 수 있도록 segment 는 남겨 둡니다. (다시 시작한 writer 가 이어서 씁니다.)
+        writer.close(unlink=False)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="paip-auth-state-writer", description="토큰 검증 상태 (shared memory) writer daemon")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help=f"socket 파일 경로 (기본값: {DEFAULT_SOCKET})")
+    parser.add_argument("--mode", type=lambda value: int(value, 8), default=0o660, help="socket 파일 권한 (8진수)")
+    parser.add_argument("--compact-interval", type=float, default=60.0, help="만료된 항목을 정리하는 간격(초)")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(serve(args.socket, args.mode, args.compact_interval))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,296 @@
+"""사용자 대량 import/export (CSV, JSONL)
+
+파일은 한 줄씩 읽고 쓰기 때문에 사용자 수와 관계없이 메모리를 일정하게 사용합니다.
+
+import
+    chunk_size 개씩 읽어서 비밀번호를 process pool 에서 hash 하고, 하나의 INSERT 로 저장합니다.
+    chunk 를 저장하는 동안 다음 chunk 의 hash 를 미리 계산합니다.
+    chunk 를 commit 할 때마다 checkpoint 파일에 저장한 행 수를 기록하기 때문에,
+    중간에 실패하면 같은 checkpoint 로 다시 실행해서 마지막으로 commit 한 chunk 다음부터 이어서 저장합니다.
+    commit 한 뒤 checkpoint 를 기록하기 전에 종료되었을 수 있으므로, 이어서 저장하는 첫 chunk 는
+    이미 있는 사용자를 건너뜁니다. (ON CONFLICT DO NOTHING)
+
+export
+    account_id 순서의 keyset pagination 으로 chunk_size 명씩 조회해서 씁니다.
+"""
+import asyncio
+import csv
+import json
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import islice
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.domain import User, UserRole
+from src.users.password import DEFAULT_ITERATIONS, hash_passwords, is_hashed
+
+if TYPE_CHECKING:
+    # hash worker process 가 SQLAlchemy 를 불러오지 않도록 타입 검사에만 사용합니다.
+    from src.users.repository import UserRepository
+
+FORMATS = ("csv", "jsonl")
+FIELDS = ("account_id", "name", "role", "group", "email", "phone", "signup_at", "password")
+
+UserRow = Tuple[User, Optional[str]]
+
+
+@dataclass
+class BulkProgress:
+    rows: int
+    elapsed: float
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+
+@dataclass
+class Checkpoint:
+    """import 를 이어서 실행하기 위한 진행 상황 (source 파일에서 commit 한 행 수)"""
+    source: str
+    rows: int
+
+    @staticmethod
+    def load(fpath: str) -> Optional["Checkpoint"]:
+        if not os.path.exists(fpath):
+            return None
+        with open(fpath) as f:
+            return Checkpoint(**json.load(f))
+
+    def save(self, fpath: str) -> None:
+        # 중간에 종료되어도 checkpoint 가 깨지지 않도록 임시 파일에 쓰고 교체합니다.
+        tmp_path = f"{fpath}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"source": self.source, "rows": self.rows}, f)
+        os.replace(tmp_path, fpath)
+
+
+def detect_format(fpath: str, fmt: Optional[str] = None) -> str:
+    """fmt 가 없으면 확장자로 포맷을 결정합니다.
+
+    Raises:
+        ValueError: 지원하지 않는 포맷일 때 발생합니다.
+    """
+    fmt = fmt or os.path.splitext(fpath)[1].lstrip(".").lower()
+    if fmt not in FORMATS:
+        raise ValueError(f"지원하지 않는 포맷입니다. {fmt} (지원: {', '.join(FORMATS)})")
+    return fmt
+
+
+def read_rows(fpath: str, fmt: Optional[str] = None) -> Iterator[Dict[str, str]]:
+    """파일에서 한 행씩 dict 로 읽습니다."""
+    fmt = detect_format(fpath, fmt)
+    with open(fpath, newline="", encoding="utf-8") as f:
+        if fmt == "csv":
+            yield from csv.DictReader(f)
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def row_to_user(row: Dict[str, str]) -> UserRow:
+    """파일의 한 행을 (사용자, 비밀번호)로 변환합니다. 비어 있는 값은 User.new 와 같은 기본값을 사용합니다.
+
+    Raises:
+        ValueError: account_id 가 없을 때 발생합니다.
+    """
+    if not row.get("account_id"):
+        raise ValueError(f"account_id 가 없습니다. {row}")
+    signup_at = row.get("signup_at")
+    user = User(
+        account_id=row["account_id"],
+        name=row.get("name") or None,
+        role=UserRole.from_text(row["role"]) if row.get("role") else UserRole.PENDING,
+        group=row.get("group") or "default",
+        email=row.get("email") or None,
+        phone=row.get("phone") or None,
+        signup_at=datetime.fromisoformat(signup_at) if signup_at else datetime.now(),
+    )
+    return user, row.get("password") or None
+
+
+def user_to_row(user: User, password: Optional[str]) -> Dict[str, Optional[str]]:
+    return {
+        "account_id": user.account_id,
+        "name": user.name,
+        "role": user.role.value,
+        "group": user.group,
+        "email": user.email,
+        "phone": user.phone,
+        "signup_at": user.signup_at.isoformat() if user.signup_at else None,
+        "password": password,
+    }
+
+
+class UserImporter:
+    """CSV/JSONL 파일의 사용자를 chunk 단위로 저장합니다.
+    ```
+    importer = UserImporter(UserRepository(session_manager), chunk_size=1000)
+    await importer.run("users.csv", checkpoint_path="users.csv.checkpoint")
+    ```
+    """
+
+    def __init__(
+            self,
+            repository: "UserRepository",
+            chunk_size: int = 1000,
+            max_workers: Optional[int] = None,
+            iterations: int = DEFAULT_ITERATIONS,
+            progress: Callable[[BulkProgress], None] = lambda progress: None,
+    ):
+        """
+        Args:
+            repository: "UserRepository"
+            chunk_size: 한 번의 INSERT(commit) 로 저장할 사용자 수
+            max_workers: 비밀번호 hash process 개수, 0 이면 현재 process 에서 hash 합니다. (기본값: cpu 개수)
+            iterations: 비밀번호 hash 반복 횟수
+            progress: chunk 를 commit 할 때마다 호출할 함수
+        """
+        self.repository = repository
+        self.chunk_size = chunk_size
+        self.max_workers = (os.cpu_count() or 1) if max_workers is None else max_workers
+        self.iterations = iterations
+        self.progress = progress
+
+    async def run(self, fpath: str, fmt: Optional[str] = None, checkpoint_path: Optional[str] = None) -> BulkProgress:
+        """파일의 사용자를 모두 저장합니다. 모두 저장하면 checkpoint 파일을 삭제합니다.
+
+        Args:
+            fpath: CSV 또는 JSONL 파일 경로
+            fmt: 파일 포맷, 없으면 확장자로 결정합니다.
+            checkpoint_path: 진행 상황을 기록할 파일 경로, 있으면 기록된 행 다음부터 저장합니다.
+
+        Returns:
+            BulkProgress: 이번 실행에서 저장한 행 수와 소요 시간
+
+        Raises:
+            ValueError: checkpoint 가 다른 파일의 것일 때 발생합니다.
+            DBIntegrityException: 이미 존재하는 사용자가 있을 때 발생합니다. (실패한 chunk 는 저장하지 않습니다.)
+                이어서 저장하는 첫 chunk 에서는 이미 존재하는 사용자를 건너뜁니다.
+        """
+        source = os.path.abspath(fpath)
+        checkpoint = Checkpoint(source, 0)
+        if checkpoint_path is not None and (saved := Checkpoint.load(checkpoint_path)) is not None:
+            if saved.source != source:
+                raise ValueError(f"다른 파일의 checkpoint 입니다. {saved.source}")
+            checkpoint = saved
+
+        rows = islice(read_rows(fpath, fmt), checkpoint.rows, None)
+        chunks = _chunked((row_to_user(row) for row in rows), self.chunk_size)
+        executor = ProcessPoolExecutor(self.max_workers) if self.max_workers > 0 else None
+        started = time.perf_counter()
+        imported = 0
+        # checkpoint 다음 chunk 는 지난 실행에서 commit 만 하고 checkpoint 를 기록하지 못했을 수 있습니다.
+        resumed = checkpoint.rows > 0
+        pending: Optional[asyncio.Future] = None
+        try:
+            if chunk := next(chunks, None):
+                pending = asyncio.ensure_future(self._hash_chunk(executor, chunk))
+            while pending is not None:
+                users = await pending
+                # 현재 chunk 를 저장하는 동안 다음 chunk 를 hash 합니다.
+                next_chunk = next(chunks, None)
+                pending = asyncio.ensure_future(self._hash_chunk(executor, next_chunk)) if next_chunk else None
+                await self.repository.create_users(users, if_absent=resumed)
+                resumed = False
+
+                imported += len(users)
+                checkpoint.rows += len(users)
+                if checkpoint_path is not None:
+                    checkpoint.save(checkpoint_path)
+                self.progress(BulkProgress(imported, time.perf_counter() - started))
+        finally:
+            if pending is not None:
+                pending.cancel()
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+        if checkpoint_path is not None and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        return BulkProgress(imported, time.perf_counter() - started)
+
+    async def _hash_chunk(self, executor: Optional[Executor], chunk: List[UserRow]) -> List[UserRow]:
+        """평문 비밀번호만 hash 합니다. (export 한 hash 는 그대로 사용)"""
+        targets = [i for i, (_, password) in enumerate(chunk) if password is not None and not is_hashed(password)]
+        passwords = [chunk[i][1] for i in targets]
+        if executor is None:
+            hashed = await asyncio.to_thread(hash_passwords, passwords, self.iterations)
+        else:
+            loop = asyncio.get_running_loop()
+            size = -(-len(passwords) // self.max_workers) or 1
+            parts = await asyncio.gather(*(
+                loop.run_in_executor(executor, hash_passwords, passwords[i:i + size], self.iterations)
+                for i in range(0, len(passwords), size)
+            ))
+            hashed = [password for part in parts for password in part]
+
+        users = list(chunk)
+        for i, password in zip(targets, hashed):
+            users[i] = (users[i][0], password)
+        return users
+
+
+class UserExporter:
+    """사용자를 account_id 순서로 CSV/JSONL 파일에 씁니다."""
+
+    def __init__(
+            self,
+            repository: "UserRepository",
+            chunk_size: int = 1000,
+            include_password: bool = False,
+            progress: Callable[[BulkProgress], None] = lambda progress: None,
+    ):
+        """
+        Args:
+            repository: "UserRepository"
+            chunk_size: 한 번에 조회할 사용자 수
+            include_password: 비밀번호 hash 를 함께 쓸지 여부 (다른 DB 로 옮길 때 사용)
+            progress: chunk 를 쓸 때마다 호출할 함수
+        """
+        self.repository = repository
+        self.chunk_size = chunk_size
+        self.include_password = include_password
+        self.progress = progress
+
+    async def run(self, fpath: str, fmt: Optional[str] = None) -> BulkProgress:
+        """모든 사용자를 파일에 씁니다.
+
+        Returns:
+            BulkProgress: 쓴 행 수와 소요 시간
+        """
+        fmt = detect_format(fpath, fmt)
+        fields = FIELDS if self.include_password else tuple(field for field in FIELDS if field != "password")
+        started = time.perf_counter()
+        exported = 0
+        with open(fpath, "w", newline="", encoding="utf-8") as f:
+            write = _csv_writer(f, fields) if fmt == "csv" else _jsonl_writer(f, fields)
+            after = None
+            while page := await self.repository.find_page(after, self.chunk_size):
+                for user, password in page:
+                    write(user_to_row(user, password))
+                after = page[-1][0].account_id
+                exported += len(page)
+                self.progress(BulkProgress(exported, time.perf_counter() - started))
+        return BulkProgress(exported, time.perf_counter() - started)
+
+
+def _csv_writer(f, fields: Tuple[str, ...]) -> Callable[[Dict], None]:
+    writer = csv.DictWriter(f, fields, extrasaction="ignore")
+    writer.writeheader()
+    return writer.writerow
+
+
+def _jsonl_writer(f, fields: Tuple[str, ...]) -> Callable[[Dict], None]:
+    def write(row: Dict) -> None:
+        f.write(json.dumps({field: row[field] for field in fields}, ensure_ascii=False) + "\n")
+    return write
+
+
+def _chunked(items: Iterable, chunk_size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
@@ -0,0 +1,79 @@
+"""사용자 대량 import/export CLI
+
+paip-auth-users import users.csv --checkpoint users.csv.checkpoint   # 실패하면 같은 명령으로 이어서 실행
+paip-auth-users export users.jsonl --chunk-size 5000
+"""
+import argparse
+import asyncio
+import os
+import sys
+from typing import TYPE_CHECKING, Optional
+
+from src.users.bulk import BulkProgress, UserExporter, UserImporter, FORMATS
+from src.users.password import DEFAULT_ITERATIONS
+
+if TYPE_CHECKING:
+    from src.settings import Settings
+
+
+def load_settings(db_type: Optional[str] = None) -> "Settings":
+    # --help 나 인자 오류는 pydantic-settings, SQLAlchemy 를 불러오지 않고 바로 끝나도록 사용할 때 import 합니다.
+    from src.settings import Settings
+
+    # import/export 에는 private key 가 필요 없어서, 환경 변수에 없으면 빈 값으로 둡니다.
+    has_key = "PRIVATE_KEY" in os.environ or "PRIVATE_KEY_FILE" in os.environ
+    overrides = {} if has_key else {"private_key": b""}
+    if db_type:
+        overrides["db_type"] = db_type
+    return Settings(**overrides)
+
+
+def print_progress(progress: BulkProgress) -> None:
+    print(f"{progress.rows:>12,} rows  {progress.rows_per_sec:>12,.1f} rows/s", file=sys.stderr, flush=True)
+
+
+async def run(args: argparse.Namespace) -> BulkProgress:
+    from src.abstracts.database.base import SessionManager
+    from src.users.repository import UserRepository
+
+    session_manager = SessionManager(load_settings(args.db_type))
+    try:
+        if args.create_database:
+            await session_manager.create_database()
+        repository = UserRepository(session_manager)
+        if args.command == "import":
+            importer = UserImporter(repository, args.chunk_size, args.workers, args.iterations, print_progress)
+            return await importer.run(args.file, args.format, args.checkpoint)
+        exporter = UserExporter(repository, args.chunk_size, args.include_password, print_progress)
+        return await exporter.run(args.file, args.format)
+    finally:
+        # event loop 가 닫히기 전에 pool 의 connection 을 닫습니다.
+        await session_manager.dispose()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="paip-auth-users", description="paip auth 사용자 import/export")
+    parser.add_argument("--db-type", help="DB 접속 정보 (기본값: 환경 변수 DB_TYPE)")
+    parser.add_argument("--create-database", action="store_true", help="테이블 생성 (sqlite 테스트 용도)")
+    parser.add_argument("--format", choices=FORMATS, help="파일 포맷 (기본값: 확장자)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="한 번에 저장/조회할 사용자 수")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = commands.add_parser("import", help="CSV/JSONL 파일의 사용자를 저장")
+    import_parser.add_argument("file")
+    import_parser.add_argument("--checkpoint", help="진행 상황 파일, 있으면 마지막으로 저장한 chunk 다음부터 이어서 저장")
+    import_parser.add_argument("--workers", type=int, help="비밀번호 hash process 개수 (기본값: cpu 개수)")
+    import_parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS, help="비밀번호 hash 반복 횟수")
+
+    export_parser = commands.add_parser("export", help="사용자를 CSV/JSONL 파일로 저장")
+    export_parser.add_argument("file")
+    export_parser.add_argument("--include-password", action="store_true", help="비밀번호 hash 포함")
+
+    args = parser.parse_args(argv)
+    progress = asyncio.run(run(args))
+    print(f"{args.command}: {progress.rows:,} rows, {progress.elapsed:.1f}s, {progress.rows_per_sec:,.1f} rows/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
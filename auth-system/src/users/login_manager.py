@@ -1,43 +1,147 @@
-from src.domain import User, LoginRequest, Token
-from src.exceptions import DBIntegrityException, AlreadyExistsException
+import asyncio
+import functools
+from typing import Callable, Dict, Optional, Tuple
+
+from src.audit.logger import AuditLogger
+from src.domain import User, LoginRequest, Token, AuditEvent, AuditEventType
+from src.exceptions import AlreadyExistsException, NotFoundException, UnAuthorizedException
+from src.limiter import AdaptiveLimiter
+from src.metrics import LOGIN_RESULTS
+from src.sessions.registry import SessionRegistry
 from src.tokens.manager import TokenManager
+from src.users.password import DEFAULT_ITERATIONS, hash_password, is_hashed, verify_password
 from src.users.repository import UserRepository
 from src.common import validate_active_user
 
+# 느린 로그인(비밀번호 hash)이 refresh 를 막지 않도록 budget 을 나눕니다.
+LOGIN_BUDGET = "login"
+REFRESH_BUDGET = "refresh"
+
+
+def default_limiters(login_latency: float = 1.0, refresh_latency: float = 0.25) -> Dict[str, AdaptiveLimiter]:
+    """login/sign_up, refresh budget 의 AdaptiveLimiter
+
+    Args:
+        login_latency: login, sign_up 의 목표 지연 시간(초), 비밀번호 hash 시간보다 커야 합니다.
+        refresh_latency: refresh 의 목표 지연 시간(초)
+    """
+    return {
+        LOGIN_BUDGET: AdaptiveLimiter(LOGIN_BUDGET, login_latency),
+        REFRESH_BUDGET: AdaptiveLimiter(REFRESH_BUDGET, refresh_latency),
+    }
+
+
+def limited(budget: str):
+    """LoginManager.limiters 에 budget 이 있으면 그 limiter 안에서 실행합니다.
+    limit 을 넘은 요청은 metric/audit 기록 없이 바로 OverloadedException 으로 거절합니다. (recorded 보다 바깥에 둡니다.)
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            limiter = self.limiters.get(budget)
+            if limiter is None:
+                return await func(self, *args, **kwargs)
+            async with limiter.acquire():
+                return await func(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def recorded(operation: str, event_type: AuditEventType, subject: Callable[..., Tuple[Optional[str], Optional[str]]]):
+    """LoginManager 처리 결과(성공 또는 실패한 exception 이름)를 metric 과 audit log 로 기록합니다.
+
+    Args:
+        operation: metric label
+        event_type: audit 이벤트 유형
+        subject: 메서드 인자를 받아 (account_id, client_ip) 를 반환하는 함수
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            try:
+                result = await func(self, *args, **kwargs)
+            except BaseException as e:
+                # CancelledError 등 BaseException 도 성공이 아니라 그 이름으로 기록합니다.
+                await _record(self, operation, event_type, subject(self, *args, **kwargs), type(e).__name__,
+                              wait=isinstance(e, Exception))
+                raise
+            await _record(self, operation, event_type, subject(self, *args, **kwargs), "success", wait=True)
+            return result
+        return wrapper
+    return decorator
+
+
+async def _record(manager: "LoginManager", operation: str, event_type: AuditEventType,
+                  subject: Tuple[Optional[str], Optional[str]], outcome: str, wait: bool) -> None:
+    LOGIN_RESULTS.labels(operation, outcome).inc()
+    if manager.audit_logger is None:
+        return
+    account_id, client_ip = subject
+    event = AuditEvent.new(event_type, account_id, client_ip, outcome)
+    if wait:
+        await manager.audit_logger.record(event)
+    else:
+        # 취소 중인 task 는 await 하지 않고 queue 에 넣기만 합니다. (가득 차 있으면 버립니다.)
+        manager.audit_logger.record_nowait(event)
+
 
 class LoginManager:
     """로그인 매니저"""
 
-    def __init__(self, user_repository: UserRepository, token_manager: TokenManager):
+    def __init__(
+            self,
+            user_repository: UserRepository,
+            token_manager: TokenManager,
+            session_registry: Optional[SessionRegistry] = None,
+            audit_logger: Optional[AuditLogger] = None,
+            password_iterations: int = DEFAULT_ITERATIONS,
+            limiters: Optional[Dict[str, AdaptiveLimiter]] = None,
+    ):
         """LoginManager 초기화 메서드
 
         Args:
             user_repository: UserRepository
             token_manager: TokenManager
+            session_registry: 발급한 세션을 기록할 SessionRegistry (없으면 기록하지 않음)
+            audit_logger: 인증 이벤트를 기록할 AuditLogger (없으면 기록하지 않음)
+            password_iterations: 가입 시 비밀번호 hash 반복 횟수
+            limiters: budget(LOGIN_BUDGET, REFRESH_BUDGET)별 동시 처리 limiter (없는 budget 은 제한하지 않음)
         """
         self.user_repository = user_repository
         self.token_manager = token_manager
+        self.session_registry = session_registry
+        self.audit_logger = audit_logger
+        self.password_iterations = password_iterations
+        self.limiters = limiters or {}
 
-    async def sign_up(self, user: User, password: str) -> Token:
+    @limited(LOGIN_BUDGET)
+    @recorded("sign_up", AuditEventType.SIGN_UP,
+              lambda self, user, password, client_ip=None: (user.account_id, client_ip))
+    async def sign_up(self, user: User, password: str, client_ip: Optional[str] = None) -> Token:
         """사용자의 정보와 비밀번호로 사용자의 정보 저장을 요청합니다.
         사용자의 정보로 토큰 생성 요청 후 토큰을 반환합니다.
 
         Args:
             user: 사용자 정보를 포함하는 도메인
             password: 사용자 비밀번호
+            client_ip: 요청한 client ip (audit log 용)
 
         Returns:
             Token: access token, refresh token을 포함하는 도메인
 
         Raises:
             AlreadyExistException: 아이디가 DB에 이미 존재할 때 발생합니다.
+            OverloadedException: login budget 의 limit 을 넘었을 때 발생합니다.
         """
-        try:
-            await self.user_repository.create_user(user, password)
-            return self.token_manager.generate_token(user)
-        except DBIntegrityException:
+        hashed = await asyncio.to_thread(hash_password, password, self.password_iterations)
+        # 중복 가입(재시도 포함)은 예외 없이 INSERT 한 번으로 판단합니다.
+        if not await self.user_repository.create_if_absent(user, password=hashed):
             raise AlreadyExistsException("이미 존재하는 유저 아이디입니다.")
+        return self._issue_token(user)
 
+    @limited(LOGIN_BUDGET)
+    @recorded("login", AuditEventType.LOGIN,
+              lambda self, login_request: (login_request.account_id, login_request.client_ip))
     async def login(self, login_request: LoginRequest) -> Token:
         """사용자의 login 정보로 사용자의 정보를 요청하고, 해당 정보로 토큰을 반환합니다.
 
@@ -46,20 +150,53 @@ class LoginManager:
 
         Returns:
             Token: access token, refresh token을 포함하는 도메인
+
+        Raises:
+            NotFoundException: 아이디 또는 비밀번호가 일치하지 않을 때 발생합니다.
+            UnAuthorizedException: 탈퇴한 계정일 때 발생합니다.
+            OverloadedException: login budget 의 limit 을 넘었을 때 발생합니다.
         """
-        user = await self.user_repository.find_by(account_id=login_request.account_id, password=login_request.password)
+        found = await self.user_repository.find_with_password(login_request.account_id)
+        if found is None or not await _verify_password(login_request.password, found[1]):
+            raise NotFoundException("아이디 또는 비밀번호가 일치하지 않습니다.")
+        user = found[0]
         validate_active_user(user)
-        return self.token_manager.generate_token(user=user)
+        return self._issue_token(user)
 
-    async def refresh(self, refresh_token: str) -> Token:
+    @limited(REFRESH_BUDGET)
+    @recorded("refresh", AuditEventType.REFRESH,
+              lambda self, refresh_token, client_ip=None: (
+                  self.token_manager.peek_account_id(refresh_token), client_ip))
+    async def refresh(self, refresh_token: str, client_ip: Optional[str] = None) -> Token:
         """요청받은 refresh 토큰을 검증하고, 새로운 토큰을 반환합니다.
 
         Args:
             refresh_token: refresh token
+            client_ip: 요청한 client ip (audit log 용)
 
         Returns:
             Token: access token, refresh token을 포함하는 도메인
+
+        Raises:
+            UnAuthorizedException: 폐기(로그아웃)된 세션의 refresh token 일 때 발생합니다.
+            OverloadedException: refresh budget 의 limit 을 넘었을 때 발생합니다.
         """
-        account_id = self.token_manager.verify_refresh_token(refresh_token)
-        user = await self.user_repository.get_by_id(account_id)
-        return self.token_manager.generate_token(user)
+        payload = self.token_manager.verify_refresh_payload(refresh_token)
+        # refresh token 은 한 번만 사용 (rotation), 세션을 폐기한 요청만 새 토큰을 받습니다.
+        if self.session_registry is not None and not await self.session_registry.consume(payload.get("jti")):
+            raise UnAuthorizedException("로그아웃된 세션입니다.")
+        user = await self.user_repository.get_by_id(payload["account_id"])
+        return self._issue_token(user)
+
+    def _issue_token(self, user: User) -> Token:
+        token = self.token_manager.generate_token(user)
+        if self.session_registry is not None:
+            self.session_registry.record(user.account_id, token, self.token_manager.refresh_token_lifetime)
+        return token
+
+
+async def _verify_password(password: Optional[str], stored: Optional[str]) -> bool:
+    if is_hashed(stored):
+        # hash 검증은 수백 ms 걸리기 때문에 event loop 를 막지 않도록 thread 에서 실행합니다. (hashlib 은 GIL 을 놓습니다.)
+        return await asyncio.to_thread(verify_password, password, stored)
+    return verify_password(password, stored)
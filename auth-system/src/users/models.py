@@ -1,13 +1,16 @@
 from datetime import datetime
+from typing import Optional
 
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, DateTime, Index, func
 
-from src.domains import User, UserRole
+from src.domain import User, UserAuth, UserRole
 
 from src.abstracts.database.base import Base, DomainKey
 
 
 class UserEntity(Base):
+    # UserAuth 를 만들기 위해 필요한 컬럼 목록 (projection 조회용)
+    AUTH_COLUMNS = ("account_id", "user_role", "user_group")
 
     __tablename__ = "users"
 
@@ -16,17 +19,26 @@ class UserEntity(Base):
 
     username = Column(String, nullable=True)
 
-    user_group = Column(String, nullable=True)
-    user_role = Column(String, nullable=True)
+    user_group = Column(String, nullable=True, index=True)
+    user_role = Column(String, nullable=True, index=True)
 
     user_email = Column(String, nullable=True)
     user_phone = Column(String, nullable=True)
 
-    signup_at = Column(DateTime, nullable=True,
-                       default=lambda: datetime.now)
+    # 가입일 범위 조회(signup_at__gte 등)와 최근 가입 순 정렬에 사용합니다.
+    signup_at = Column(DateTime, nullable=True, index=True,
+                       default=datetime.now)
+
+    __table_args__ = (
+        # 이메일은 대소문자 구분 없이 unique, 조회 시 lower(user_email) 로 비교해야 index 를 탑니다.
+        Index("ux_users_user_email_lower", func.lower(user_email), unique=True),
+        # account_id__startswith 는 COLLATE "C" 범위로 비교하기 때문에, PostgreSQL 에서는 같은 collation 의 index 가 필요합니다.
+        # (SQLite 는 primary key index 가 이미 binary collation 입니다.)
+        Index("ix_users_account_id_c", account_id.collate("C")).ddl_if(dialect="postgresql"),
+    )
 
     @staticmethod
-    def from_domain(domain: User, password: str):
+    def from_domain(domain: User, password: Optional[str] = None):
         return UserEntity(
             account_id=domain.account_id,
             password=password,
@@ -58,3 +70,11 @@ class UserEntity(Base):
 
     def primary_key(self) -> DomainKey:
         return self.account_id
+
+    @staticmethod
+    def to_user_auth(account_id: str, user_role: str, user_group: str) -> UserAuth:
+        return UserAuth(
+            account_id=account_id,
+            role=UserRole.from_text(user_role),
+            group=user_group,
+        )
@@ -0,0 +1,60 @@
+"""비밀번호 hash (PBKDF2-HMAC-SHA256)
+
+저장 포맷
+    pbkdf2_sha256$반복 횟수$salt(base64)$hash(base64)
+
+반복 횟수를 함께 저장하기 때문에 기본값을 올려도 기존 hash 는 그대로 검증됩니다.
+hash 하기 전에 저장된 (평문) 비밀번호도 검증할 수 있도록 verify_password 는 평문 비교를 지원합니다.
+"""
+import base64
+import hashlib
+import hmac
+import os
+from typing import List, Optional
+
+ALGORITHM = "pbkdf2_sha256"
+DEFAULT_ITERATIONS = 600_000
+SALT_SIZE = 16
+
+
+def hash_password(password: str, iterations: int = DEFAULT_ITERATIONS, salt: Optional[bytes] = None) -> str:
+    """비밀번호를 저장 포맷으로 hash 합니다. (CPU 를 오래 쓰기 때문에 event loop 밖에서 호출해야 합니다.)"""
+    salt = salt if salt is not None else os.urandom(SALT_SIZE)
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, iterations)
+    return "$".join([ALGORITHM, str(iterations), _b64encode(salt), _b64encode(digest)])
+
+
+def hash_passwords(passwords: List[str], iterations: int = DEFAULT_ITERATIONS) -> List[str]:
+    """여러 비밀번호를 hash 합니다. (process pool 에 chunk 단위로 넘기는 용도)"""
+    return [hash_password(password, iterations) for password in passwords]
+
+
+def is_hashed(stored: Optional[str]) -> bool:
+    return stored is not None and stored.startswith(ALGORITHM + "$")
+
+
+def verify_password(password: Optional[str], stored: Optional[str]) -> bool:
+    """입력한 비밀번호가 저장된 비밀번호와 같은지 확인합니다.
+
+    Args:
+        password: 입력한 비밀번호
+        stored: 저장된 hash (또는 hash 하기 전에 저장된 평문)
+
+    Returns:
+        bool: 일치 여부
+    """
+    if password is None or stored is None:
+        return False
+    if not is_hashed(stored):
+        return hmac.compare_digest(password.encode(), stored.encode())
+    try:
+        _, iterations, salt, digest = stored.split("$")
+        expected = base64.b64decode(digest)
+        actual = hashlib.pbkdf2_hmac("sha256", password.encode(), base64.b64decode(salt), int(iterations))
+    except ValueError:
+        return False
+    return hmac.compare_digest(actual, expected)
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii")
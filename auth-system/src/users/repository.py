@@ -1,6 +1,121 @@
-from src.abstracts.database.repository import BaseRepository
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import func
+
+from src.abstracts.database.repository import BaseRepository, entity_values, insert_many, instrumented
+from src.domain import User, UserAuth, UserRole
 from src.users.models import UserEntity
 
 
 class UserRepository(BaseRepository):
     entity = UserEntity
+
+    @instrumented("create_user")
+    async def create_user(self, user: User, password: str) -> None:
+        """비밀번호와 함께 사용자를 저장합니다. (password 는 hash 한 값을 그대로 저장합니다.)
+
+        Raises:
+            DBIntegrityException: 이미 존재하는 아이디일 때 발생합니다.
+        """
+        async with self.session_manager.session() as session:
+            session.add(UserEntity.from_domain(user, password))
+            await session.commit()
+
+    @instrumented("create_users")
+    async def create_users(self, users: Sequence[Tuple[User, Optional[str]]], if_absent: bool = False) -> None:
+        """(사용자, 비밀번호 hash) 목록을 하나의 INSERT (executemany) 로 저장합니다.
+
+        Args:
+            users: (사용자, 비밀번호 hash) 목록
+            if_absent: True 면 이미 존재하는 아이디나 이메일의 사용자는 건너뜁니다. (ON CONFLICT DO NOTHING)
+
+        Raises:
+            DBIntegrityException: if_absent 가 아닌데 이미 존재하는 아이디나 이메일이 있을 때 발생합니다. (하나도 저장하지 않습니다.)
+        """
+        if not users:
+            return
+        async with self.session_manager.session() as session:
+            values = [entity_values(UserEntity.from_domain(user, password)) for user, password in users]
+            await insert_many(await session.connection(), UserEntity, values, if_absent)
+            await session.commit()
+
+    @instrumented("find_with_password")
+    async def find_with_password(self, account_id: str) -> Optional[Tuple[User, Optional[str]]]:
+        """로그인 검증용으로 사용자와 저장된 비밀번호 hash 를 함께 조회합니다."""
+        if page := await self._find_page(account_id=account_id):
+            return page[0]
+
+    @instrumented("find_page")
+    async def find_page(self, after: Optional[str], limit: int) -> List[Tuple[User, Optional[str]]]:
+        """account_id 순서로 after 다음의 사용자를 최대 limit 명 조회합니다. (keyset pagination)
+        OFFSET 과 달리 뒤 페이지로 갈수록 느려지지 않습니다.
+
+        Args:
+            after: 이전 페이지의 마지막 account_id, 첫 페이지는 None
+            limit: 최대 사용자 수
+
+        Returns:
+            List[Tuple[User, Optional[str]]]: (사용자, 비밀번호 hash) 목록
+        """
+        criteria = {"account_id__gt": after} if after is not None else {}
+        return await self._find_page(order_by="account_id", limit=limit, **criteria)
+
+    async def _find_page(self, **kwargs) -> List[Tuple[User, Optional[str]]]:
+        return await self.find_projection(_to_user_with_password, USER_COLUMNS, **kwargs)
+
+    async def warmup(self) -> None:
+        # 로그인(find_with_password), 토큰 재발급(get_by_id), 인증 정보 조회(find_user_auth)
+        await self.find_with_password(WARMUP_ACCOUNT_ID)
+        await self.find_by_id(WARMUP_ACCOUNT_ID)
+        await self.find_user_auth(WARMUP_ACCOUNT_ID)
+
+    async def find_user_auth(self, account_id: str) -> Optional[UserAuth]:
+        """전체 User 를 만들지 않고 인증 정보(UserAuth)만 조회합니다."""
+        if user_auths := await self.find_user_auths(account_id=account_id):
+            return user_auths[0]
+
+    async def find_user_auths(self, **kwargs) -> List[UserAuth]:
+        """조건에 맞는 사용자들의 인증 정보(UserAuth)만 조회합니다."""
+        return await self.find_projection(UserEntity.to_user_auth, UserEntity.AUTH_COLUMNS, **kwargs)
+
+    async def count_by_role(self, **kwargs) -> Dict[UserRole, int]:
+        """역할별 사용자 수 (관리자 대시보드용)"""
+        counts = await self.count_by("user_role", **kwargs)
+        # 대소문자가 다르거나 알 수 없는 값(NULL 포함)은 같은 UserRole 로 바뀌기 때문에 더합니다.
+        by_role: Dict[UserRole, int] = {}
+        for role, count in counts.items():
+            user_role = UserRole.from_text(role or "")
+            by_role[user_role] = by_role.get(user_role, 0) + count
+        return by_role
+
+    async def find_by_email(self, email: str) -> Optional[User]:
+        """이메일로 사용자를 조회합니다. (대소문자 구분 없음)"""
+        async with self.session_manager.session(read_only=True) as session:
+            stmt = self._find_by_email_select(email)
+            if entity := (await session.execute(stmt)).scalars().one_or_none():
+                return entity.to_domain()
+
+    def _find_by_email_select(self, email: str):
+        return self._get_joined_select().filter(func.lower(UserEntity.user_email) == email.lower())
+
+
+# warmup 조회에 사용하는 존재하지 않는 계정
+WARMUP_ACCOUNT_ID = "__warmup__"
+
+USER_COLUMNS = (
+    "account_id", "username", "user_role", "user_group", "user_email", "user_phone", "signup_at", "password",
+)
+
+
+def _to_user_with_password(account_id, name, role, group, email, phone, signup_at, password) \
+        -> Tuple[User, Optional[str]]:
+    user = User(
+        account_id=account_id,
+        name=name,
+        role=UserRole.from_text(role),
+        group=group,
+        email=email,
+        phone=phone,
+        signup_at=signup_at,
+    )
+    return user, password
@@ -0,0 +1,108 @@
+"""로컬 토큰 검증 daemon client
+
+```
+async with VerifierClient("/run/paip-auth/verify.sock") as client:
+    verified = await client.verify(access_token)            # 실패하면 InvalidTokenException
+    results = await client.verify_many(access_tokens)       # 한 번에 보내고 순서대로 받습니다.
+```
+연결 하나를 여러 task 가 같이 사용해도 됩니다. 요청은 응답을 기다리지 않고 보내고 (pipelining),
+응답은 보낸 순서대로 오기 때문에 기다리는 future 를 순서대로 완료합니다.
+"""
+import asyncio
+from collections import deque
+from typing import Deque, List, Optional, Sequence, Union
+
+from src.exceptions import InvalidTokenException, PaipAuthException, VerifierException
+from src.verifier.protocol import ProtocolError, VerifiedToken, decode_response, encode_request, parse_frames
+
+READ_SIZE = 64 * 1024
+
+
+class VerifierClient:
+    """Unix domain socket 연결 하나"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._pending: Deque[asyncio.Future] = deque()
+        self._read_task: Optional[asyncio.Task] = None
+
+    async def connect(self) -> "VerifierClient":
+        self._reader, self._writer = await asyncio.open_unix_connection(self.path, limit=READ_SIZE)
+        self._read_task = asyncio.create_task(self._read_responses())
+        return self
+
+    async def close(self) -> None:
+        if self._writer is None:
+            return
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+        await self._read_task
+        self._writer = None
+
+    async def __aenter__(self) -> "VerifierClient":
+        return await self.connect()
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def verify(self, token: str) -> VerifiedToken:
+        """access token 을 검증합니다.
+
+        Raises:
+            ExpiredTokenException: 만료된 토큰일 때 발생합니다.
+            InvalidTokenException: 검증에 실패했을 때 발생합니다.
+            VerifierException: daemon 이 오류로 검증하지 못했을 때 발생합니다.
+            ConnectionError: daemon 과 연결이 끊겼을 때 발생합니다.
+        """
+        (future,) = self._send([token])
+        await self._writer.drain()
+        result = await future
+        if isinstance(result, PaipAuthException):
+            raise result
+        return result
+
+    async def verify_many(
+            self, tokens: Sequence[str]) -> List[Union[VerifiedToken, InvalidTokenException, VerifierException]]:
+        """토큰들을 한 번에 보내고 검증 결과를 순서대로 반환합니다. (실패한 토큰은 exception 객체)
+
+        Raises:
+            ConnectionError: daemon 과 연결이 끊겼을 때 발생합니다.
+        """
+        futures = self._send(tokens)
+        await self._writer.drain()
+        return list(await asyncio.gather(*futures))
+
+    def _send(self, tokens: Sequence[str]) -> List[asyncio.Future]:
+        if self._writer is None or self._read_task.done():
+            raise ConnectionError("검증 daemon 에 연결되어 있지 않습니다.")
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in tokens]
+        self._pending.extend(futures)
+        self._writer.write(b"".join(encode_request(token) for token in tokens))
+        return futures
+
+    async def _read_responses(self) -> None:
+        buffer = bytearray()
+        error: Exception = ConnectionError("검증 daemon 과 연결이 끊겼습니다.")
+        try:
+            while chunk := await self._reader.read(READ_SIZE):
+                buffer += chunk
+                frames, consumed = parse_frames(buffer)
+                del buffer[:consumed]
+                for status, body in frames:
+                    future = self._pending.popleft()
+                    if not future.done():
+                        future.set_result(decode_response(status, body))
+        except (ConnectionError, ProtocolError, IndexError) as e:
+            error = ConnectionError(f"검증 daemon 과 연결이 끊겼습니다. {e!r}")
+        finally:
+            while self._pending:
+                future = self._pending.popleft()
+                if not future.done():
+                    future.set_exception(error)
+
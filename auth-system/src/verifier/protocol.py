@@ -0,0 +1,119 @@
+"""로컬 토큰 검증 daemon 의 binary 요청/응답 형식
+
+모든 frame 은 header(5 bytes, network byte order) 다음에 body 가 옵니다.
+```
+요청  | op (u8)     | length (u32) | token (utf-8)
+응답  | status (u8) | length (u32) | OK 면 claims, 아니면 오류 메시지 (utf-8)
+claims | exp (f64) | perm (u64) | account_id, user_role, user_group, tenant, sid (각각 u16 길이 + utf-8)
+```
+응답은 요청 순서대로 보내기 때문에, client 는 응답을 기다리지 않고 요청을 여러 개 이어서 보낼 수 있습니다. (pipelining)
+"""
+import struct
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple, Union
+
+from src.domain import DEFAULT_TENANT, TENANT_CLAIM
+from src.exceptions import ExpiredTokenException, InvalidTokenException, VerifierException
+from src.permissions import permissions_from_payload
+
+HEADER = struct.Struct("!BI")
+_CLAIMS = struct.Struct("!dQ")
+_STRING = struct.Struct("!H")
+# 이보다 긴 frame 은 토큰이 아니라고 보고 연결을 끊습니다.
+MAX_FRAME = 16 * 1024
+
+# 요청 op
+VERIFY_ACCESS = 1
+
+# 응답 status
+OK = 0
+EXPIRED = 1
+INVALID = 2
+BAD_REQUEST = 3
+# daemon 내부 오류 (토큰 문제가 아니므로 sidecar 는 다시 시도하거나 fail closed 로 처리합니다.)
+SERVER_ERROR = 4
+
+STATUS_NAMES = {OK: "ok", EXPIRED: "expired", INVALID: "invalid", BAD_REQUEST: "bad_request", SERVER_ERROR: "error"}
+
+
+class ProtocolError(Exception):
+    """frame 형식이 잘못되었을 때"""
+
+
+@dataclass(frozen=True)
+class VerifiedToken:
+    """검증에 성공한 access token 의 claim"""
+    account_id: str
+    role: str
+    group: str
+    tenant: str
+    permissions: int
+    expires_at: float
+    session_id: Optional[str] = None
+
+
+def encode_request(token: str, op: int = VERIFY_ACCESS) -> bytes:
+    body = token.encode()
+    return HEADER.pack(op, len(body)) + body
+
+
+def encode_response(status: int, body: bytes) -> bytes:
+    return HEADER.pack(status, len(body)) + body
+
+
+def encode_claims(payload: Dict) -> bytes:
+    """검증한 payload 에서 sidecar 가 사용하는 claim 만 담습니다."""
+    parts = [_CLAIMS.pack(payload.get("exp", 0.0), permissions_from_payload(payload))]
+    for value in (payload.get("account_id"), payload.get("user_role"), payload.get("user_group"),
+                  payload.get(TENANT_CLAIM, DEFAULT_TENANT), payload.get("sid")):
+        data = (value or "").encode()
+        parts.append(_STRING.pack(len(data)))
+        parts.append(data)
+    return b"".join(parts)
+
+
+def decode_claims(body: bytes) -> VerifiedToken:
+    expires_at, permissions = _CLAIMS.unpack_from(body, 0)
+    position = _CLAIMS.size
+    values = []
+    for _ in range(5):
+        (length,) = _STRING.unpack_from(body, position)
+        position += _STRING.size
+        values.append(body[position:position + length].decode())
+        position += length
+    account_id, role, group, tenant, session_id = values
+    return VerifiedToken(account_id, role, group, tenant, permissions, expires_at, session_id or None)
+
+
+def decode_response(status: int, body: bytes) -> Union[VerifiedToken, InvalidTokenException, VerifierException]:
+    """응답 frame 을 검증 결과로 바꿉니다. (실패하면 발생시킬 exception 을 반환합니다.)"""
+    if status == OK:
+        return decode_claims(body)
+    if status == EXPIRED:
+        return ExpiredTokenException(body.decode())
+    if status == SERVER_ERROR:
+        return VerifierException(body.decode())
+    return InvalidTokenException(body.decode())
+
+
+def parse_frames(buffer: bytearray, max_frame: int = MAX_FRAME) -> Tuple[list, int]:
+    """buffer 에 있는 완전한 frame 들을 꺼냅니다.
+
+    Returns:
+        Tuple[list, int]: [(op 또는 status, body)], 사용한 bytes 수 (남은 bytes 는 다음 read 와 이어 붙입니다.)
+
+    Raises:
+        ProtocolError: frame 이 max_frame 보다 길 때 발생합니다.
+    """
+    frames = []
+    position, end = 0, len(buffer)
+    while end - position >= HEADER.size:
+        code, length = HEADER.unpack_from(buffer, position)
+        if length > max_frame:
+            raise ProtocolError(f"frame 이 너무 깁니다. {length} > {max_frame}")
+        start = position + HEADER.size
+        if end - start < length:
+            break
+        frames.append((code, bytes(buffer[start:start + length])))
+        position = start + length
+    return frames, position
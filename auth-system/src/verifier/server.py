@@ -0,0 +1,169 @@
+"""SIDECAR 역할 서비스를 위한 로컬 토큰 검증 daemon (Unix domain socket)
+
+HTTP/JSON introspection 은 검증할 때마다 TCP, HTTP parsing, JSON 변환, sidecar 자신의 인증 비용이 듭니다.
+같은 host 의 sidecar 는 Unix domain socket 으로 binary frame (src.verifier.protocol) 을 보내고,
+daemon 은 TokenManager(또는 TenantRegistry)의 verify_access_token 으로 검증합니다.
+
+- 접근 제어: socket 파일 권한(mode)으로 제한합니다. (sidecar 와 같은 group 만 접근)
+- pipelining: 한 번 read 한 데이터에 있는 요청을 모두 처리하고 응답을 한 번에 write 합니다.
+- 요청 하나를 처리하다 예상하지 못한 오류가 나도 그 요청에만 SERVER_ERROR 로 응답하고 연결은 유지합니다.
+
+paip-auth-verifier --socket /run/paip-auth/verify.sock
+"""
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import stat
+import sys
+from typing import Callable, Dict, List, Optional
+
+from src.exceptions import ExpiredTokenException, InvalidTokenException
+from src.lazy import lazy_import
+from src.log_sampling import SampledLogger
+from src.metrics import VERIFIER_REQUESTS
+from src.verifier.protocol import (
+    BAD_REQUEST, EXPIRED, INVALID, MAX_FRAME, OK, SERVER_ERROR, STATUS_NAMES, VERIFY_ACCESS,
+    ProtocolError, encode_claims, encode_response, parse_frames,
+)
+
+jwt = lazy_import("jwt")
+
+logger = logging.getLogger(__name__)
+_error_logger = SampledLogger(logger)
+
+READ_SIZE = 64 * 1024
+DEFAULT_SOCKET = "/run/paip-auth/verify.sock"
+
+
+class VerificationServer:
+    """Unix domain socket 으로 access token 검증 요청을 받습니다."""
+
+    def __init__(self, verify: Callable[[str], Dict], path: str, mode: int = 0o660, max_frame: int = MAX_FRAME):
+        """
+        Args:
+            verify: access token 을 검증하고 payload 를 반환하는 함수 (TokenManager/TenantRegistry.verify_access_token)
+            path: socket 파일 경로
+            mode: socket 파일 권한
+            max_frame: 요청 frame 의 최대 길이, 넘으면 연결을 끊습니다.
+        """
+        self.verify = verify
+        self.path = path
+        self.mode = mode
+        self.max_frame = max_frame
+        self._server: Optional[asyncio.AbstractServer] = None
+        # 연결별 (writer, handler task), stop 할 때 연결을 닫고 handler 가 끝나기를 기다립니다.
+        self._connections: Dict[asyncio.StreamWriter, asyncio.Task] = {}
+
+    async def start(self) -> None:
+        """socket 을 열고 요청을 받기 시작합니다. (이전 실행이 남긴 socket 파일은 지웁니다.)"""
+        if os.path.exists(self.path) and stat.S_ISSOCK(os.stat(self.path).st_mode):
+            os.unlink(self.path)
+        self._server = await asyncio.start_unix_server(self._handle, self.path, limit=READ_SIZE)
+        os.chmod(self.path, self.mode)
+
+    async def stop(self) -> None:
+        """새 연결을 받지 않고, 열린 연결을 닫은 뒤 socket 파일을 지웁니다."""
+        if self._server is None:
+            return
+        self._server.close()
+        handlers = list(self._connections.values())
+        for writer in list(self._connections):
+            writer.close()
+        await asyncio.gather(*handlers, return_exceptions=True)
+        await self._server.wait_closed()
+        self._server = None
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def respond(self, op: int, body: bytes) -> bytes:
+        """요청 frame 하나를 처리하고 응답 frame 을 반환합니다."""
+        status, response = self._verify(op, body)
+        VERIFIER_REQUESTS.labels(STATUS_NAMES[status]).inc()
+        return encode_response(status, response)
+
+    def _verify(self, op: int, body: bytes):
+        if op != VERIFY_ACCESS:
+            return BAD_REQUEST, f"지원하지 않는 요청입니다. {op}".encode()
+        try:
+            return OK, encode_claims(self.verify(body.decode()))
+        except ExpiredTokenException as e:
+            return EXPIRED, e.message.encode()
+        except InvalidTokenException as e:
+            return INVALID, e.message.encode()
+        except UnicodeDecodeError:
+            return BAD_REQUEST, "토큰이 utf-8 이 아닙니다.".encode()
+        except jwt.exceptions.InvalidTokenError:
+            return INVALID, "잘못된 토큰 입니다".encode()
+        except Exception as e:
+            # 한 요청의 오류로 연결을 끊으면 같은 연결로 pipelining 한 다른 요청도 모두 실패합니다.
+            reason = type(e).__name__
+            _error_logger.exception(reason, "토큰 검증 중 오류가 발생했습니다.")
+            return SERVER_ERROR, f"토큰 검증 중 오류가 발생했습니다. {reason}".encode()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._connections[writer] = asyncio.current_task()
+        buffer = bytearray()
+        try:
+            while chunk := await reader.read(READ_SIZE):
+                buffer += chunk
+                frames, consumed = parse_frames(buffer, self.max_frame)
+                del buffer[:consumed]
+                if frames:
+                    writer.write(b"".join(self.respond(op, body) for op, body in frames))
+                    await writer.drain()
+        except ProtocolError as e:
+            VERIFIER_REQUESTS.labels(STATUS_NAMES[BAD_REQUEST]).inc()
+            writer.write(encode_response(BAD_REQUEST, str(e).encode()))
+        except ConnectionError:
+            pass
+        finally:
+            del self._connections[writer]
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+async def serve(path: str, mode: int) -> None:
+    """설정(환경 변수)의 key 로 검증하는 daemon 을 SIGTERM/SIGINT 를 받을 때까지 실행합니다."""
+    from src.settings import get_settings
+    from src.tenants import TenantRegistry
+
+    settings = get_settings()
+    shared_state = None
+    if settings.shared_state_name:
+        from src.tokens.shared_state import SharedStateReader
+
+        shared_state = SharedStateReader(settings.shared_state_name)
+    registry = TenantRegistry(settings, shared_state=shared_state)
+    registry.token_manager().warmup()
+
+    server = VerificationServer(registry.verify_access_token, path, mode)
+    await server.start()
+    loop = asyncio.get_running_loop()
+    stopped = asyncio.Event()
+    loop.add_signal_handler(signal.SIGHUP, registry.reload_keys)
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, stopped.set)
+    logger.info("토큰 검증 daemon 을 시작했습니다. %s", path)
+    try:
+        await stopped.wait()
+    finally:
+        await server.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="paip-auth-verifier", description="로컬 토큰 검증 daemon (Unix domain socket)")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help=f"socket 파일 경로 (기본값: {DEFAULT_SOCKET})")
+    parser.add_argument("--mode", type=lambda value: int(value, 8), default=0o660, help="socket 파일 권한 (8진수)")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(serve(args.socket, args.mode))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
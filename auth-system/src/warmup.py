@@ -0,0 +1,69 @@
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Iterable, Optional
+
+from src.abstracts.database.base import SessionManager
+from src.abstracts.database.repository import BaseRepository
+from src.metrics import WARMUP_SECONDS
+from src.tokens.manager import TokenManager
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WarmupReport:
+    """warmup 단계별 소요 시간(초)"""
+    steps: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def total(self) -> float:
+        return sum(self.steps.values())
+
+    async def measure(self, step: str, operation: Callable[[], Awaitable]) -> None:
+        started = time.perf_counter()
+        await operation()
+        elapsed = self.steps[step] = time.perf_counter() - started
+        WARMUP_SECONDS.labels(step).observe(elapsed)
+        logger.info("warmup %s: %.1fms", step, elapsed * 1000)
+
+
+async def warmup(
+        session_manager: SessionManager,
+        connections: int,
+        token_manager: Optional[TokenManager] = None,
+        repositories: Iterable[BaseRepository] = (),
+) -> WarmupReport:
+    """첫 요청이 초기화 비용을 내지 않도록 시작할 때 미리 실행합니다.
+
+    1. db_connections: connection 을 connections 개 열어서 pool 에 넣어 둡니다.
+    2. statements: repository 의 hot path 쿼리를 실행해서 compiled cache 에 올려 둡니다.
+    3. keys: key 를 파싱하고 토큰을 한 번 발급/검증합니다.
+
+    Args:
+        session_manager: SessionManager
+        connections: 미리 열어 둘 connection 수
+        token_manager: TokenManager (없으면 keys 단계를 건너뜁니다.)
+        repositories: warmup 을 실행할 repository 목록
+
+    Returns:
+        WarmupReport: 단계별 소요 시간
+
+    Raises:
+        DatabaseException: DB 에 접속할 수 없을 때 발생합니다.
+    """
+    report = WarmupReport()
+    await report.measure("db_connections", lambda: session_manager.prewarm(connections))
+
+    async def compile_statements():
+        for repository in repositories:
+            await repository.warmup()
+    await report.measure("statements", compile_statements)
+
+    if token_manager is not None:
+        async def parse_keys():
+            token_manager.warmup()
+        await report.measure("keys", parse_keys)
+
+    logger.info("warmup 완료: %.1fms", report.total * 1000)
+    return report
@@ -0,0 +1,167 @@
+import asyncio
+import logging
+import os
+import tempfile
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.abstracts.database.base import SessionManager
+from src.exceptions import DatabaseException, DBIntegrityException, NotFoundException
+from src.metrics import DB_SESSION_ACQUIRE_SECONDS, DB_SESSION_ERRORS, DB_SESSION_SECONDS
+from src.settings import Settings
+
+
+@pytest.fixture(autouse=True)
+def clear_metrics():
+    DB_SESSION_ERRORS.clear()
+    DB_SESSION_SECONDS.clear()
+    DB_SESSION_ACQUIRE_SECONDS.clear()
+
+
+@pytest.fixture
+def rollbacks(monkeypatch):
+    calls = []
+    rollback = AsyncSession.rollback
+
+    async def spy(self):
+        calls.append(self)
+        await rollback(self)
+    monkeypatch.setattr(AsyncSession, "rollback", spy)
+    return calls
+
+
+async def test_read_only_session_skips_rollback(given_database, rollbacks, caplog):
+    with pytest.raises(NotFoundException):
+        async with given_database.session(read_only=True) as session:
+            await session.execute(text("SELECT 1"))
+            raise NotFoundException("없음")
+
+    assert rollbacks == []
+    assert DB_SESSION_SECONDS.count("default", "rejected") == 1
+    assert "Traceback" not in caplog.text
+
+
+async def test_session_rolls_back_domain_exception(given_database, rollbacks, caplog):
+    with pytest.raises(NotFoundException):
+        async with given_database.session() as session:
+            await session.execute(text("SELECT 1"))
+            raise NotFoundException("없음")
+
+    assert len(rollbacks) == 1
+    assert "Traceback" not in caplog.text
+    assert DB_SESSION_ERRORS.value("default", "NotFoundException") == 0
+
+
+async def test_session_skips_rollback_without_transaction(given_database, rollbacks):
+    with pytest.raises(NotFoundException):
+        async with given_database.session():
+            raise NotFoundException("없음")
+
+    assert rollbacks == []
+
+
+async def test_session_wraps_unexpected_exception(given_database, rollbacks, caplog):
+    caplog.set_level(logging.ERROR)
+    for _ in range(3):
+        with pytest.raises(DatabaseException):
+            async with given_database.session(read_only=True) as session:
+                await session.execute(text("SELECT 1"))
+                raise RuntimeError("boom")
+
+    # 예상하지 못한 exception 은 read_only 여도 rollback 하고, 모두 세지만 로그는 한 번만 남깁니다.
+    assert len(rollbacks) == 3
+    assert DB_SESSION_ERRORS.value("default", "RuntimeError") == 3
+    assert DB_SESSION_SECONDS.count("default", "error") == 3
+    assert caplog.text.count("Traceback") <= 1
+
+
+async def test_acquire_time_includes_pool_wait(given_private_pem):
+    fpath = tempfile.mktemp(suffix=".db")
+    db = SessionManager(Settings(db_type=f"sqlite+aiosqlite:///{fpath}", private_key=given_private_pem,
+                                 db_pool_size=1, db_max_overflow=0))
+    released = asyncio.Event()
+
+    async def hold_connection():
+        async with db.session() as session:
+            await session.execute(text("SELECT 1"))
+            await released.wait()
+
+    try:
+        holder = asyncio.create_task(hold_connection())
+        await asyncio.sleep(0.05)
+        asyncio.get_running_loop().call_later(0.2, released.set)
+        # pool 의 connection 하나를 holder 가 쓰고 있어서, 첫 query 에서 반납될 때까지 기다립니다.
+        async with db.session() as session:
+            await session.execute(text("SELECT 1"))
+        await holder
+    finally:
+        await db.dispose()
+        os.remove(fpath)
+
+    assert DB_SESSION_ACQUIRE_SECONDS.count("default") == 2
+    assert DB_SESSION_ACQUIRE_SECONDS.sum("default") >= 0.1
+
+
+async def test_prewarm_opens_connections_concurrently(given_file_database, monkeypatch):
+    connect = given_file_database.connect
+    connecting = []
+    max_connecting = 0
+
+    async def slow_connect():
+        nonlocal max_connecting
+        connecting.append(None)
+        max_connecting = max(max_connecting, len(connecting))
+        await asyncio.sleep(0.01)
+        connecting.pop()
+        return await connect()
+    monkeypatch.setattr(given_file_database, "connect", slow_connect)
+
+    assert await given_file_database.prewarm(3) == 3
+
+    assert max_connecting == 3
+    assert given_file_database._engine.pool.checkedin() == 3
+
+
+async def test_prewarm_closes_opened_connections_on_failure(given_file_database, monkeypatch):
+    connect = given_file_database.connect
+    calls = []
+    opened = []
+
+    async def failing_connect():
+        calls.append(None)
+        if len(calls) == 2:
+            raise DatabaseException("접속 실패")
+        opened.append(await connect())
+        return opened[-1]
+    monkeypatch.setattr(given_file_database, "connect", failing_connect)
+
+    with pytest.raises(DatabaseException):
+        await given_file_database.prewarm(3)
+
+    assert len(opened) == 2
+    assert all(connection.closed for connection in opened)
+
+
+async def test_prewarm_wraps_connection_error(given_file_database, monkeypatch):
+    async def refused():
+        raise ConnectionRefusedError("Connection refused")
+    monkeypatch.setattr(given_file_database, "connect", refused)
+
+    with pytest.raises(DatabaseException):
+        await given_file_database.prewarm(2)
+
+
+async def test_session_records_integrity_error_as_rejected(given_database):
+    async with given_database.session() as session:
+        await session.execute(text("CREATE TABLE unique_names (name TEXT PRIMARY KEY)"))
+        await session.execute(text("INSERT INTO unique_names VALUES ('paicm')"))
+        await session.commit()
+
+    with pytest.raises(DBIntegrityException):
+        async with given_database.session() as session:
+            await session.execute(text("INSERT INTO unique_names VALUES ('paicm')"))
+
+    assert DB_SESSION_SECONDS.count("default", "rejected") == 1
+    assert DB_SESSION_SECONDS.count("default", "error") == 0
@@ -0,0 +1,122 @@
+import asyncio
+
+import pytest
+
+from src.abstracts.batching import BatchWriter
+
+
+class RecordingWriter:
+    def __init__(self, fail: bool = False):
+        self.batches = []
+        self.fail = fail
+
+    async def __call__(self, batch):
+        if self.fail:
+            raise RuntimeError("DB 에러")
+        self.batches.append(list(batch))
+
+
+@pytest.fixture
+def given_recording_writer():
+    return RecordingWriter()
+
+
+async def test_write_by_batch_size(given_recording_writer):
+    writer = BatchWriter("test", given_recording_writer, batch_size=3, linger_ms=1000)
+    await writer.start()
+
+    for i in range(7):
+        writer.submit(i)
+    await asyncio.sleep(0.01)
+
+    assert given_recording_writer.batches == [[0, 1, 2], [3, 4, 5]]
+    await writer.stop()
+    assert given_recording_writer.batches == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+async def test_write_after_linger(given_recording_writer):
+    writer = BatchWriter("test", given_recording_writer, batch_size=100, linger_ms=5)
+    await writer.start()
+
+    writer.submit(1)
+    writer.submit(2)
+    await asyncio.sleep(0.05)
+
+    assert given_recording_writer.batches == [[1, 2]]
+    await writer.stop()
+
+
+async def test_flush_does_not_wait_linger(given_recording_writer):
+    writer = BatchWriter("test", given_recording_writer, batch_size=100, linger_ms=10_000)
+    await writer.start()
+
+    writer.submit(1)
+    await asyncio.wait_for(writer.flush(), timeout=1)
+
+    assert given_recording_writer.batches == [[1]]
+    await writer.stop()
+
+
+async def test_flush_without_start(given_recording_writer):
+    writer = BatchWriter("test", given_recording_writer, batch_size=2)
+
+    for i in range(3):
+        writer.submit(i)
+    await writer.flush()
+
+    assert given_recording_writer.batches == [[0, 1], [2]]
+
+
+async def test_failed_write_does_not_stop_writer():
+    recording_writer = RecordingWriter(fail=True)
+    writer = BatchWriter("test", recording_writer, batch_size=1)
+    await writer.start()
+
+    writer.submit(1)
+    await writer.flush()
+    recording_writer.fail = False
+    writer.submit(2)
+    await writer.stop()
+
+    assert recording_writer.batches == [[2]]
+
+
+async def test_submit_drops_when_queue_is_full(given_recording_writer):
+    writer = BatchWriter("test", given_recording_writer, batch_size=10, max_queue_size=2)
+
+    assert [writer.submit(i) for i in range(3)] == [True, True, False]
+    await writer.flush()
+
+    assert given_recording_writer.batches == [[0, 1]]
+
+
+async def test_put_waits_when_queue_is_full(given_recording_writer):
+    writer = BatchWriter("test", given_recording_writer, batch_size=1, linger_ms=0, max_queue_size=1)
+    await writer.start()
+
+    for i in range(5):
+        await asyncio.wait_for(writer.put(i), timeout=1)
+    await writer.stop()
+
+    assert given_recording_writer.batches == [[i] for i in range(5)]
+
+
+async def test_flush_does_not_wait_items_submitted_after():
+    batches = []
+    submitting = True
+
+    async def write(batch):
+        batches.append(list(batch))
+        # 저장하는 동안에도 submit 이 계속 들어와서 queue 가 비는 때가 없습니다.
+        if submitting:
+            writer.submit(len(batches))
+
+    writer = BatchWriter("test", write, batch_size=10, linger_ms=5)
+    await writer.start()
+
+    writer.submit("before")
+    await asyncio.wait_for(writer.flush(), timeout=1)
+
+    assert batches[0] == ["before"]
+    submitting = False
+    await writer.stop()
@@ -3,10 +3,11 @@ from typing import Optional, Tuple
 import pytest
 
 from sqlalchemy import Column, Integer, String
+from sqlalchemy.dialects import postgresql
 from dataclasses import dataclass
 
 from src.abstracts.database.base import Base, Domain, DomainKey
-from src.abstracts.database.repository import BaseRepository
+from src.abstracts.database.repository import BaseRepository, create_field_criteria
 from src.exceptions import AlreadyExistsException, NotFoundException
 
 
@@ -240,3 +241,130 @@ async def test_find_by(given_sample_repository):
     domain_list = await given_sample_repository.find_by(name="cm")
     assert domain0 in domain_list
     assert len(domain_list) == 1
+
+
+async def test_find_by_operators(given_sample2_repository):
+    await given_sample2_repository.create_many([Sample2Domain(i % 2, i, f"cm{i}") for i in range(12)])
+
+    async def find_ids(**kwargs):
+        return [domain.compid1 for domain in await given_sample2_repository.find_by(order_by="compid1", **kwargs)]
+
+    assert await find_ids(compid1__in=[1, 3, 20]) == [1, 3]
+    assert await find_ids(compid1__in=[]) == []
+    assert await find_ids(compid1__gte=3, compid1__lt=6) == [3, 4, 5]
+    assert await find_ids(compid1__gt=9) == [10, 11]
+    assert await find_ids(compid1__lte=1) == [0, 1]
+    assert await find_ids(compid0__ne=0, compid1__lt=5) == [1, 3]
+    assert await find_ids(name__startswith="cm1") == [1, 10, 11]
+    assert await find_ids(name__startswith="") == list(range(12))
+    assert await find_ids(name__isnull=True) == []
+
+
+async def test_find_by_order_by_and_limit(given_sample2_repository):
+    await given_sample2_repository.create_many([Sample2Domain(i % 2, i, f"cm{i}") for i in range(5)])
+
+    found = await given_sample2_repository.find_by(order_by=["compid0", "-compid1"], limit=3)
+    assert [(domain.compid0, domain.compid1) for domain in found] == [(0, 4), (0, 2), (0, 0)]
+    rows = await given_sample2_repository.find_columns(["compid1"], order_by="-compid1", limit=2, compid0=1)
+    assert rows == [(3,), (1,)]
+
+
+async def test_find_by_invalid_filter(given_sample_repository):
+    with pytest.raises(ValueError):
+        await given_sample_repository.find_by(missing=1)
+    with pytest.raises(ValueError):
+        await given_sample_repository.find_by(name__like="cm%")
+    with pytest.raises(ValueError):
+        await given_sample_repository.find_by(order_by="-missing")
+
+
+def test_create_field_criteria_is_sargable():
+    [prefix] = create_field_criteria(SampleEntity, {"name__startswith": "cm"})
+    compiled = prefix.compile(compile_kwargs={"literal_binds": True})
+    # 컬럼에 함수(lower, substr 등)나 LIKE 를 쓰지 않고 범위 조건으로 비교해야 index 를 탑니다.
+    assert str(compiled) == "samples.name >= 'cm' AND samples.name < 'cn'"
+    # 범위의 끝(다음 문자)은 code point 순서에서만 맞기 때문에 PostgreSQL 에서는 COLLATE "C" 로 비교합니다.
+    compiled = prefix.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    assert str(compiled) == """samples.name COLLATE "C" >= 'cm' AND samples.name COLLATE "C" < 'cn'"""
+
+    [in_criteria] = create_field_criteria(SampleEntity, {"sample_id__in": [1, 2]})
+    assert str(in_criteria.compile(compile_kwargs={"literal_binds": True})) == "samples.sample_id IN (1, 2)"
+
+
+async def test_find_columns(given_sample_repository):
+    domain0 = SampleDomain(None, "cm")
+    domain1 = SampleDomain(None, "cm2")
+    await given_sample_repository.create(domain0)
+    await given_sample_repository.create(domain1)
+    rows = await given_sample_repository.find_columns(["name", "sample_id"], name="cm2")
+    assert rows == [("cm2", domain1.sample_id)]
+
+
+async def test_find_projection(given_sample_repository):
+    domain = SampleDomain(None, "cm")
+    await given_sample_repository.create(domain)
+    names = await given_sample_repository.find_projection(lambda name: name.upper(), ["name"])
+    assert names == ["CM"]
+
+
+async def test_create_many(given_sample2_repository):
+    domains = [Sample2Domain(1, i, f"cm{i}") for i in range(3)]
+
+    await given_sample2_repository.create_many(domains)
+
+    assert sorted(await given_sample2_repository.find_all(), key=lambda d: d.compid1) == domains
+
+
+@pytest.mark.parametrize("names", [[None, "cm1", "cm2"], ["cm0", "cm1", None]])
+async def test_create_many_with_null(given_sample2_repository, names):
+    # None 인 값이 섞여 있어도 모든 row 를 같은 컬럼으로 저장합니다.
+    domains = [Sample2Domain(1, i, name) for i, name in enumerate(names)]
+
+    await given_sample2_repository.create_many(domains)
+
+    assert sorted(await given_sample2_repository.find_all(), key=lambda d: d.compid1) == domains
+
+
+async def test_create_many_with_autoincrement(given_sample_repository):
+    await given_sample_repository.create_many([SampleDomain(None, "a"), SampleDomain(10, "b"), SampleDomain(None, "c")])
+
+    found = sorted(await given_sample_repository.find_all(), key=lambda d: d.name)
+    assert [d.name for d in found] == ["a", "b", "c"]
+    assert found[1].sample_id == 10
+    assert all(d.sample_id is not None for d in found)
+
+
+async def test_create_if_absent(given_sample2_repository):
+    domain = Sample2Domain(0, 0, "cm")
+
+    assert await given_sample2_repository.create_if_absent(domain) is True
+    assert await given_sample2_repository.create_if_absent(Sample2Domain(0, 0, "other")) is False
+    # unique 컬럼 충돌도 저장하지 않습니다.
+    assert await given_sample2_repository.create_if_absent(Sample2Domain(0, 1, "cm")) is False
+    assert await given_sample2_repository.find_all() == [domain]
+
+
+async def test_exists(given_sample_repository):
+    await given_sample_repository.create(SampleDomain(None, "cm"))
+
+    assert await given_sample_repository.exists(name="cm")
+    assert not await given_sample_repository.exists(name="other")
+    assert await given_sample_repository.exists()
+
+
+async def test_count(given_sample2_repository):
+    assert await given_sample2_repository.count() == 0
+
+    await given_sample2_repository.create_many([Sample2Domain(i % 2, i, f"cm{i}") for i in range(5)])
+
+    assert await given_sample2_repository.count() == 5
+    assert await given_sample2_repository.count(compid0=1) == 2
+
+
+async def test_count_by(given_sample2_repository):
+    await given_sample2_repository.create_many([Sample2Domain(i % 2, i, f"cm{i}") for i in range(5)])
+
+    assert await given_sample2_repository.count_by("compid0") == {0: 3, 1: 2}
+    assert await given_sample2_repository.count_by("compid0", compid1=4) == {0: 1}
+    with pytest.raises(ValueError):
+        await given_sample2_repository.count_by("missing")
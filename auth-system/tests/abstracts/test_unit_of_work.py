@@ -0,0 +1,127 @@
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.abstracts.database.unit_of_work import UnitOfWork
+from src.domain import GroupMembership, UserRole, UserSession
+from src.exceptions import DBIntegrityException, NotFoundException
+from src.groups.repository import MembershipRepository
+from src.sessions.repository import SessionRepository
+from src.users.repository import UserRepository
+
+
+@pytest.fixture
+def given_user_repository(given_database):
+    return UserRepository(given_database)
+
+
+@pytest.fixture
+def given_session_repository(given_database):
+    return SessionRepository(given_database)
+
+
+def given_session(session_id, account_id="paicm"):
+    now = datetime.now()
+    return UserSession(session_id, account_id, now, now + timedelta(hours=1))
+
+
+async def test_commit_across_repositories(given_database, given_user_repository, given_session_repository, given_user):
+    await given_user_repository.create_user(given_user, "password")
+    await given_session_repository.create(given_session("old"))
+
+    async with UnitOfWork(given_database) as uow:
+        uow.create(given_session_repository, given_session("s1"))
+        uow.create(given_session_repository, given_session("s2"))
+        uow.update(given_user_repository, replace(given_user, role=UserRole.VIP, name="새이름"))
+        uow.delete(given_session_repository, "old")
+        assert uow.pending == 4
+
+    assert uow.pending == 0
+    user, password = await given_user_repository.find_with_password(given_user.account_id)
+    assert (user.role, user.name) == (UserRole.VIP, "새이름")
+    # entity.update 가 바꾸지 않는 컬럼은 그대로
+    assert password == "password"
+    assert sorted(s.session_id for s in await given_session_repository.find_all()) == ["s1", "s2"]
+
+
+async def test_update_missing_row_rolls_back_everything(given_database, given_user_repository,
+                                                       given_session_repository, given_user):
+    uow = UnitOfWork(given_database)
+    uow.create(given_session_repository, given_session("s1"))
+    uow.update(given_user_repository, given_user)
+
+    with pytest.raises(NotFoundException):
+        await uow.commit()
+
+    assert await given_session_repository.find_all() == []
+    assert uow.pending == 0
+
+
+async def test_integrity_error_rolls_back_everything(given_database, given_session_repository):
+    await given_session_repository.create(given_session("s1"))
+    uow = UnitOfWork(given_database)
+    uow.create(given_session_repository, given_session("s2"))
+    uow.create(given_session_repository, given_session("s1"))
+
+    with pytest.raises(DBIntegrityException):
+        await uow.commit()
+
+    assert [s.session_id for s in await given_session_repository.find_all()] == ["s1"]
+
+
+async def test_exception_in_block_discards_staged(given_database, given_session_repository):
+    with pytest.raises(RuntimeError):
+        async with UnitOfWork(given_database) as uow:
+            uow.create(given_session_repository, given_session("s1"))
+            raise RuntimeError("중단")
+
+    assert await given_session_repository.find_all() == []
+
+
+async def test_same_row_cannot_be_staged_twice(given_database, given_session_repository):
+    uow = UnitOfWork(given_database)
+    uow.create(given_session_repository, given_session("s1"))
+
+    with pytest.raises(ValueError):
+        uow.delete(given_session_repository, "s1")
+
+
+async def test_delete_composite_key(given_database):
+    repository = MembershipRepository(given_database)
+    await repository.create_many([GroupMembership("paicm", "a"), GroupMembership("paicm", "b")])
+
+    async with UnitOfWork(given_database) as uow:
+        uow.delete(repository, ["paicm", "a"])
+
+    assert await repository.find_all_memberships() == [GroupMembership("paicm", "b")]
+
+
+@pytest.mark.parametrize("sane_multi_rowcount", [True, False])
+async def test_delete_missing_row_without_multi_rowcount(given_database, given_session_repository,
+                                                         monkeypatch, sane_multi_rowcount):
+    # asyncpg 처럼 executemany 의 rowcount 를 믿을 수 없는 driver 도 없는 row 를 찾아냅니다.
+    monkeypatch.setattr(given_database._engine.dialect, "supports_sane_multi_rowcount", sane_multi_rowcount)
+    await given_session_repository.create_many([given_session("s1"), given_session("s2")])
+
+    uow = UnitOfWork(given_database)
+    for session_id in ("s1", "missing", "s2"):
+        uow.delete(given_session_repository, session_id)
+    with pytest.raises(NotFoundException):
+        await uow.commit()
+
+    async with UnitOfWork(given_database) as uow:
+        uow.delete(given_session_repository, "s1")
+        uow.delete(given_session_repository, "s2")
+    assert await given_session_repository.find_all() == []
+
+
+async def test_create_users_with_null_columns(given_database, given_user_repository, given_user):
+    no_email = replace(given_user, account_id="no-email", email=None, phone=None)
+
+    async with UnitOfWork(given_database) as uow:
+        uow.create(given_user_repository, given_user, password="password")
+        uow.create(given_user_repository, no_email, password=None)
+
+    assert await given_user_repository.find_with_password("paicm") == (given_user, "password")
+    assert await given_user_repository.find_with_password("no-email") == (no_email, None)
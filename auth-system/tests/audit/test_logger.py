@@ -0,0 +1,132 @@
+import asyncio
+import json
+import os
+import tempfile
+
+import pytest
+
+from src.audit.logger import AuditLogger, JsonlAuditSink
+from src.audit.repository import AuditRepository
+from src.domain import AuditEvent, AuditEventType, LoginRequest
+from src.exceptions import NotFoundException
+from src.metrics import BATCH_ITEMS
+from src.users.login_manager import LoginManager
+from src.users.repository import UserRepository
+
+
+@pytest.fixture
+async def given_audit_repository(given_file_database):
+    yield AuditRepository(given_file_database)
+
+
+@pytest.fixture
+def given_jsonl_path():
+    fpath = tempfile.mktemp(suffix=".jsonl")
+    yield fpath
+    if os.path.exists(fpath):
+        os.remove(fpath)
+
+
+@pytest.fixture
+async def given_audit_logger(given_audit_repository, given_jsonl_path):
+    audit_logger = AuditLogger(given_audit_repository, batch_size=10, linger_ms=5,
+                               sink=JsonlAuditSink(given_jsonl_path))
+    await audit_logger.start()
+    yield audit_logger
+    await audit_logger.stop()
+
+
+@pytest.fixture
+def given_login_manager(given_file_database, given_token_manager, given_audit_logger):
+    return LoginManager(UserRepository(given_file_database), given_token_manager, audit_logger=given_audit_logger,
+                        password_iterations=1000)
+
+
+async def test_login_events_are_recorded(given_login_manager, given_audit_logger, given_audit_repository,
+                                         given_user):
+    token = await given_login_manager.sign_up(given_user, "password", client_ip="10.0.0.1")
+    await given_login_manager.login(LoginRequest(given_user.account_id, "password", client_ip="10.0.0.2"))
+    with pytest.raises(NotFoundException):
+        await given_login_manager.login(LoginRequest(given_user.account_id, "wrong", client_ip="10.0.0.3"))
+    await given_login_manager.refresh(token.refresh, client_ip="10.0.0.4")
+
+    await given_audit_logger.flush()
+    events = sorted(await given_audit_repository.find_all(), key=lambda event: event.audit_id)
+
+    assert [(event.event_type, event.account_id, event.client_ip, event.outcome) for event in events] == [
+        (AuditEventType.SIGN_UP, "paicm", "10.0.0.1", "success"),
+        (AuditEventType.LOGIN, "paicm", "10.0.0.2", "success"),
+        (AuditEventType.LOGIN, "paicm", "10.0.0.3", "NotFoundException"),
+        (AuditEventType.REFRESH, "paicm", "10.0.0.4", "success"),
+    ]
+
+
+async def test_mixed_null_batch(given_audit_logger, given_audit_repository):
+    # 한 batch 에 client_ip, account_id 가 없는 이벤트가 섞여 있어도 모두 그대로 저장합니다.
+    await given_audit_logger.record(AuditEvent.new(AuditEventType.LOGIN, None, None, "NotFoundException"))
+    await given_audit_logger.record(AuditEvent.new(AuditEventType.LOGIN, "paicm", "10.0.0.1", "success"))
+    await given_audit_logger.record(AuditEvent.new(AuditEventType.REFRESH, "paicm", None, "success"))
+
+    await given_audit_logger.flush()
+    events = sorted(await given_audit_repository.find_all(), key=lambda event: event.audit_id)
+
+    assert [(event.account_id, event.client_ip) for event in events] == [
+        (None, None), ("paicm", "10.0.0.1"), ("paicm", None),
+    ]
+
+
+async def test_cancelled_login_is_not_recorded_as_success(given_login_manager, given_audit_logger,
+                                                          given_audit_repository, given_user):
+    blocked = asyncio.Event()
+
+    async def find_with_password(account_id):
+        await blocked.wait()
+    given_login_manager.user_repository.find_with_password = find_with_password
+
+    task = asyncio.create_task(given_login_manager.login(LoginRequest("paicm", "password", client_ip="10.0.0.5")))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    await given_audit_logger.flush()
+    events = await given_audit_repository.find_all()
+    assert [(event.client_ip, event.outcome) for event in events] == [("10.0.0.5", "CancelledError")]
+
+
+async def test_jsonl_sink(given_audit_logger, given_jsonl_path):
+    await given_audit_logger.record(AuditEvent.new(AuditEventType.LOGIN, "paicm", "10.0.0.1", "success"))
+    await given_audit_logger.record(AuditEvent.new(AuditEventType.LOGIN, "paicm", "10.0.0.1", "success"))
+
+    await given_audit_logger.flush()
+
+    with open(given_jsonl_path, encoding="utf-8") as f:
+        lines = [json.loads(line) for line in f]
+    assert len(lines) == 2
+    assert lines[0]["event_type"] == "LOGIN"
+    assert lines[0]["client_ip"] == "10.0.0.1"
+
+
+async def test_drop_when_queue_is_full(given_audit_repository):
+    audit_logger = AuditLogger(given_audit_repository, max_queue_size=2)
+    before = BATCH_ITEMS.value("audit", "dropped")
+
+    results = [
+        await audit_logger.record(AuditEvent.new(AuditEventType.LOGIN, "paicm", None, "success")) for _ in range(3)
+    ]
+
+    assert results == [True, True, False]
+    assert BATCH_ITEMS.value("audit", "dropped") == before + 1
+    await audit_logger.stop()
+    assert len(await given_audit_repository.find_all()) == 2
+
+
+async def test_flush_on_stop(given_audit_repository):
+    audit_logger = AuditLogger(given_audit_repository, linger_ms=10_000, backpressure=True, max_queue_size=1)
+    await audit_logger.start()
+
+    for _ in range(5):
+        await audit_logger.record(AuditEvent.new(AuditEventType.SIGN_UP, "paicm", None, "success"))
+    await audit_logger.stop()
+
+    assert len(await given_audit_repository.find_all()) == 5
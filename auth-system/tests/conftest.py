@@ -2,8 +2,10 @@ import pytest
 from Crypto.PublicKey import RSA
 import tempfile
 import os
+from datetime import datetime
 
 from src.abstracts.database.base import SessionManager
+from src.domain import User, UserRole
 from src.settings import Settings
 from src.tokens.manager import TokenManager
 
@@ -24,6 +26,19 @@ async def given_database(given_auth_settings) -> SessionManager:
     await db.drop_database()
 
 
+@pytest.fixture
+async def given_file_database(given_private_pem) -> SessionManager:
+    """in-memory sqlite 는 connection 하나를 공유하기 때문에,
+    background writer 처럼 여러 session 이 동시에 쓰는 테스트는 파일 DB 를 사용합니다."""
+    fpath = tempfile.mktemp(suffix=".db")
+    db = SessionManager(Settings(db_type=f"sqlite+aiosqlite:///{fpath}", private_key=given_private_pem))
+    await db.create_database()
+    yield db
+    await db.drop_database()
+    await db._engine.dispose()
+    os.remove(fpath)
+
+
 @pytest.fixture
 def given_private_key():
     return RSA.generate(1024)
@@ -65,3 +80,16 @@ def given_public_pem_file(given_public_key):
 @pytest.fixture
 def given_token_manager(given_auth_settings) -> TokenManager:
     return TokenManager(given_auth_settings)
+
+
+@pytest.fixture
+def given_user():
+    return User(
+        account_id="paicm",
+        name="김채민",
+        role=UserRole.ADMIN,
+        group="paip",
+        email="pai-cm@publicai.co.kr",
+        phone="010-1234-1234",
+        signup_at=datetime.now()
+    )
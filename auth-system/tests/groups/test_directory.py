@@ -0,0 +1,70 @@
+import pytest
+
+from src.domain import Group
+from src.exceptions import AlreadyExistsException, NotFoundException
+from src.groups.directory import GroupDirectory
+from src.groups.repository import GroupRepository, MembershipRepository
+
+
+@pytest.fixture
+async def given_directory(given_database):
+    directory = GroupDirectory(GroupRepository(given_database), MembershipRepository(given_database))
+    await directory.load()
+    yield directory
+
+
+async def test_changes_are_saved_and_indexed(given_directory):
+    await given_directory.save_group(Group("company", "회사"))
+    await given_directory.save_group(Group("dev", "개발", "company"))
+    await given_directory.add_member("paicm", "dev")
+
+    assert given_directory.is_member("paicm", "company")
+
+    await given_directory.load()
+
+    assert given_directory.is_member("paicm", "company")
+    assert given_directory.groups_of("paicm") == {"dev", "company"}
+
+
+async def test_invalid_changes_are_not_saved(given_directory):
+    await given_directory.save_group(Group("company", "회사"))
+    await given_directory.save_group(Group("dev", "개발", "company"))
+
+    with pytest.raises(ValueError):
+        await given_directory.save_group(Group("company", "회사", "dev"))
+    with pytest.raises(NotFoundException):
+        await given_directory.add_member("paicm", "missing")
+    with pytest.raises(ValueError):
+        await given_directory.delete_group("company")
+
+    assert (await given_directory.group_repository.get_by_id("company")).parent_id is None
+
+
+async def test_add_member_twice(given_directory):
+    await given_directory.save_group(Group("company", "회사"))
+    await given_directory.add_member("paicm", "company")
+
+    with pytest.raises(AlreadyExistsException):
+        await given_directory.add_member("paicm", "company")
+
+
+async def test_delete_group_removes_memberships(given_directory):
+    await given_directory.save_group(Group("company", "회사"))
+    await given_directory.add_member("paicm", "company")
+
+    await given_directory.delete_group("company")
+    await given_directory.load()
+
+    assert given_directory.groups_of("paicm") == frozenset()
+    assert await given_directory.membership_repository.find_all_memberships() == []
+
+
+async def test_remove_member(given_directory):
+    await given_directory.save_group(Group("company", "회사"))
+    await given_directory.add_member("paicm", "company")
+
+    await given_directory.remove_member("paicm", "company")
+
+    assert not given_directory.is_member("paicm", "company")
+    with pytest.raises(NotFoundException):
+        await given_directory.remove_member("paicm", "company")
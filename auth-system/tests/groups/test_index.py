@@ -0,0 +1,88 @@
+import pytest
+
+from src.domain import Group, GroupMembership
+from src.exceptions import NotFoundException
+from src.groups.index import GroupIndex
+
+
+@pytest.fixture
+def given_index():
+    # company > dev > (backend, frontend), company > sales
+    groups = [
+        Group("backend", "백엔드", "dev"),
+        Group("company", "회사"),
+        Group("dev", "개발", "company"),
+        Group("frontend", "프론트엔드", "dev"),
+        Group("sales", "영업", "company"),
+    ]
+    memberships = [
+        GroupMembership("paicm", "backend"),
+        GroupMembership("paicm", "sales"),
+        GroupMembership("kim", "frontend"),
+    ]
+    return GroupIndex.build(groups, memberships)
+
+
+def test_is_member_includes_ancestor_groups(given_index):
+    assert given_index.is_member("paicm", "backend")
+    assert given_index.is_member("paicm", "dev")
+    assert given_index.is_member("paicm", "company")
+    assert given_index.is_member("paicm", "sales")
+    assert not given_index.is_member("paicm", "frontend")
+    assert not given_index.is_member("unknown", "company")
+    assert given_index.groups_of("kim") == {"frontend", "dev", "company"}
+
+
+def test_build_detects_cycle():
+    with pytest.raises(ValueError):
+        GroupIndex.build([Group("a", "a", "b"), Group("b", "b", "a")], [])
+
+
+def test_build_unknown_parent():
+    with pytest.raises(NotFoundException):
+        GroupIndex.build([Group("a", "a", "missing")], [])
+
+
+def test_remove_membership_keeps_other_paths(given_index):
+    given_index.add_membership(GroupMembership("paicm", "frontend"))
+
+    given_index.remove_membership(GroupMembership("paicm", "backend"))
+
+    assert given_index.is_member("paicm", "dev")
+    assert not given_index.is_member("paicm", "backend")
+
+    given_index.remove_membership(GroupMembership("paicm", "frontend"))
+    given_index.remove_membership(GroupMembership("paicm", "sales"))
+
+    assert given_index.groups_of("paicm") == frozenset()
+
+
+def test_move_group_refreshes_subtree_members(given_index):
+    given_index.put_group(Group("dev", "개발", "sales"))
+
+    assert given_index.ancestors_of("backend") == {"backend", "dev", "sales", "company"}
+    assert given_index.is_member("kim", "sales")
+
+    given_index.put_group(Group("dev", "개발", None))
+
+    assert not given_index.is_member("kim", "sales")
+    assert not given_index.is_member("kim", "company")
+
+
+def test_put_group_rejects_cycle(given_index):
+    with pytest.raises(ValueError):
+        given_index.put_group(Group("company", "회사", "backend"))
+    with pytest.raises(ValueError):
+        given_index.put_group(Group("dev", "개발", "dev"))
+
+    assert given_index.ancestors_of("backend") == {"backend", "dev", "company"}
+
+
+def test_remove_group(given_index):
+    with pytest.raises(ValueError):
+        given_index.remove_group("dev")
+
+    given_index.remove_group("sales")
+
+    assert "sales" not in given_index
+    assert given_index.groups_of("paicm") == {"backend", "dev", "company"}
@@ -0,0 +1,127 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.domain import LoginRequest, UserSession
+from src.exceptions import UnAuthorizedException
+from src.sessions.registry import SessionRegistry
+from src.sessions.repository import SessionRepository
+from src.users.login_manager import LoginManager
+from src.users.repository import UserRepository
+
+
+@pytest.fixture
+async def given_session_repository(given_file_database):
+    yield SessionRepository(given_file_database)
+
+
+@pytest.fixture
+async def given_session_registry(given_session_repository):
+    registry = SessionRegistry(given_session_repository, batch_size=10, linger_ms=5)
+    await registry.start()
+    yield registry
+    await registry.stop()
+
+
+@pytest.fixture
+def given_login_manager(given_file_database, given_token_manager, given_session_registry):
+    return LoginManager(UserRepository(given_file_database), given_token_manager, given_session_registry,
+                        password_iterations=1000)
+
+
+async def test_login_records_session(given_login_manager, given_session_registry, given_user):
+    token = await given_login_manager.sign_up(given_user, "password")
+    token2 = await given_login_manager.login(LoginRequest(given_user.account_id, "password"))
+
+    sessions = await given_session_registry.list_sessions(given_user.account_id)
+
+    assert [session.session_id for session in sessions] == [token.session_id, token2.session_id]
+
+
+async def test_revoke_all_logs_out_every_device(given_login_manager, given_session_registry, given_user):
+    token = await given_login_manager.sign_up(given_user, "password")
+    await given_login_manager.login(LoginRequest(given_user.account_id, "password"))
+
+    assert await given_session_registry.revoke_all(given_user.account_id) == 2
+
+    assert await given_session_registry.list_sessions(given_user.account_id) == []
+    with pytest.raises(UnAuthorizedException):
+        await given_login_manager.refresh(token.refresh)
+
+
+async def test_refresh_rotates_session(given_login_manager, given_session_registry, given_user):
+    token = await given_login_manager.sign_up(given_user, "password")
+
+    new_token = await given_login_manager.refresh(token.refresh)
+
+    sessions = await given_session_registry.list_sessions(given_user.account_id)
+    assert [session.session_id for session in sessions] == [new_token.session_id]
+    with pytest.raises(UnAuthorizedException):
+        await given_login_manager.refresh(token.refresh)
+
+
+async def test_concurrent_refresh_issues_one_token(given_login_manager, given_session_registry, given_user):
+    token = await given_login_manager.sign_up(given_user, "password")
+
+    results = await asyncio.gather(*(given_login_manager.refresh(token.refresh) for _ in range(5)),
+                                   return_exceptions=True)
+
+    issued = [result for result in results if not isinstance(result, Exception)]
+    assert len(issued) == 1
+    assert all(isinstance(result, UnAuthorizedException) for result in results if result not in issued)
+    sessions = await given_session_registry.list_sessions(given_user.account_id)
+    assert [session.session_id for session in sessions] == [issued[0].session_id]
+
+
+async def test_cleanup_expired_in_chunks(given_session_repository):
+    registry = SessionRegistry(given_session_repository, cleanup_chunk=3)
+    now = datetime.now()
+    await given_session_repository.create_many([
+        UserSession(f"expired-{i}", "paicm", now - timedelta(days=2), now - timedelta(days=1)) for i in range(7)
+    ] + [
+        UserSession("active", "paicm", now, now + timedelta(days=1))
+    ])
+
+    assert await registry.cleanup_expired() == 7
+
+    sessions = await registry.list_sessions("paicm")
+    assert [session.session_id for session in sessions] == ["active"]
+
+
+async def test_revocations_are_published_to_shared_state(given_session_repository, given_user):
+    from src.tokens.shared_state import SharedStateReader, SharedStateWriter
+
+    writer = SharedStateWriter(watermark_capacity=16, revoked_capacity=16)
+    reader = SharedStateReader(writer.name)
+    registry = SessionRegistry(given_session_repository, shared_state=writer, revocation_ttl=60)
+    await registry.start()
+    try:
+        await registry.revoke("session-1")
+        await registry.revoke_all(given_user.account_id)
+
+        assert reader.is_revoked("session-1")
+        assert reader.watermark(given_user.account_id) is not None
+    finally:
+        await registry.stop()
+        reader.close()
+        writer.close()
+
+
+async def test_consume_while_sessions_are_submitted(given_login_manager, given_session_registry, given_user):
+    token = await given_login_manager.sign_up(given_user, "password")
+
+    async def login_forever():
+        now = datetime.now()
+        i = 0
+        while True:
+            given_session_registry.writer.submit(UserSession(f"login-{i}", "other", now, now + timedelta(days=1)))
+            i += 1
+            await asyncio.sleep(0)
+
+    submitter = asyncio.create_task(login_forever())
+    try:
+        await asyncio.sleep(0.01)
+        assert await asyncio.wait_for(given_session_registry.consume(token.session_id), timeout=3) is True
+    finally:
+        submitter.cancel()
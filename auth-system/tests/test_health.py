@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+
+from src.abstracts.database.base import SessionManager
+from src.health import HealthChecker
+from src.settings import Settings
+
+
+@pytest.fixture
+def given_health_checker(given_database):
+    return HealthChecker(given_database, ttl=60)
+
+
+@pytest.fixture
+def given_unreachable_database(given_private_pem):
+    return SessionManager(Settings(db_type="sqlite+aiosqlite:////nonexistent/dir/auth.db", private_key=given_private_pem))
+
+
+async def test_readiness_requires_warmup(given_health_checker):
+    assert not (await given_health_checker.readiness()).ok
+
+    given_health_checker.mark_warmed_up()
+
+    status = await given_health_checker.readiness()
+    assert status.ok
+    assert status.to_dict()["status"] == "ok"
+
+
+async def test_ping_is_cached_and_shared(given_health_checker):
+    given_health_checker.mark_warmed_up()
+
+    results = await asyncio.gather(*(given_health_checker.readiness() for _ in range(10)))
+    await given_health_checker.readiness()
+
+    assert all(status.ok for status in results)
+    assert given_health_checker.ping_count == 1
+
+
+async def test_ping_again_after_ttl(given_database):
+    health_checker = HealthChecker(given_database, ttl=0)
+
+    await health_checker.check_database()
+    await health_checker.check_database()
+
+    assert health_checker.ping_count == 2
+
+
+async def test_unreachable_database(given_unreachable_database):
+    health_checker = HealthChecker(given_unreachable_database)
+    health_checker.mark_warmed_up()
+
+    readiness = await health_checker.readiness()
+    liveness = await health_checker.liveness()
+
+    assert not readiness.ok
+    assert readiness.database is False
+    assert readiness.error
+    assert liveness.ok
+
+
+async def test_ping_error_marks_database_unavailable(given_database, monkeypatch):
+    health_checker = HealthChecker(given_database, ttl=0)
+    health_checker.mark_warmed_up()
+    assert (await health_checker.readiness()).ok
+
+    async def refused():
+        raise ConnectionRefusedError("Connection refused")
+    monkeypatch.setattr(given_database, "connect", refused)
+
+    readiness = await health_checker.readiness()
+
+    assert not readiness.ok
+    assert readiness.database is False
+    assert "Connection refused" in readiness.error
+
+
+async def test_unexpected_ping_error_marks_database_unavailable(given_health_checker, monkeypatch):
+    given_health_checker.mark_warmed_up()
+
+    async def broken():
+        raise RuntimeError("boom")
+    monkeypatch.setattr(given_health_checker.session_manager, "ping", broken)
+
+    readiness = await given_health_checker.readiness()
+
+    assert not readiness.ok
+    assert readiness.database is False
+    assert "boom" in readiness.error
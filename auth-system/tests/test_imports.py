@@ -0,0 +1,61 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from src.lazy import lazy_import
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def loaded_modules(code: str):
+    """새 interpreter 에서 code 를 실행한 뒤 실제로 실행(import)된 모듈 이름 목록"""
+    script = (
+        f"{code}\n"
+        "import json, sys\n"
+        "from importlib.util import _LazyModule\n"
+        "print(json.dumps([name for name, module in sys.modules.items() if not isinstance(module, _LazyModule)]))"
+    )
+    completed = subprocess.run([sys.executable, "-c", script], cwd=PROJECT_DIR, capture_output=True, text=True,
+                               check=True)
+    return set(json.loads(completed.stdout))
+
+
+def test_token_manager_import_is_light():
+    modules = loaded_modules("import src.tokens.manager")
+
+    assert "src.tokens.manager" in modules
+    for heavy in ["Crypto", "cryptography", "jwt", "pydantic_settings", "sqlalchemy"]:
+        assert heavy not in modules
+
+
+def test_token_hot_path_uses_single_crypto_backend(given_private_pem):
+    code = (
+        "from types import SimpleNamespace\n"
+        "from src.tokens.manager import TokenManager\n"
+        f"manager = TokenManager(SimpleNamespace(private_key={given_private_pem!r}, private_key_file=None, "
+        "access_token_lifetime=60, refresh_token_lifetime=60))\n"
+        "manager.warmup()\n"
+    )
+    modules = loaded_modules(code)
+
+    assert "jwt" in modules
+    assert "cryptography" in modules
+    assert "Crypto" not in modules
+
+
+def test_users_cli_import_does_not_load_database():
+    modules = loaded_modules("import src.users.cli")
+
+    assert "sqlalchemy" not in modules
+    assert "pydantic_settings" not in modules
+
+
+def test_lazy_import():
+    json_module = lazy_import("json")
+    assert json_module is sys.modules["json"]
+
+    with pytest.raises(ModuleNotFoundError):
+        lazy_import("not_installed_module")
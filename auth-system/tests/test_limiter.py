@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from src.exceptions import DatabaseException, NotFoundException, OverloadedException
+from src.limiter import AdaptiveLimiter
+from src.metrics import LIMITER_REJECTIONS
+
+
+@pytest.fixture
+def given_clock(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr("src.limiter.time.monotonic", lambda: now[0])
+    return now
+
+
+async def test_rejects_over_limit_immediately():
+    LIMITER_REJECTIONS.clear()
+    limiter = AdaptiveLimiter("test", target_latency=1.0, initial_limit=2, min_retry_after=0.5)
+    release = asyncio.Event()
+
+    async def hold():
+        async with limiter.acquire():
+            await release.wait()
+
+    tasks = [asyncio.create_task(hold()) for _ in range(2)]
+    await asyncio.sleep(0)
+    with pytest.raises(OverloadedException) as e:
+        async with limiter.acquire():
+            pass
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert e.value.retry_after == 1.0
+    assert LIMITER_REJECTIONS.value("test") == 1
+    assert limiter.in_flight == 0
+
+
+async def _run(limiter: AdaptiveLimiter, clock, latency: float, error: Exception = None):
+    async with limiter.acquire():
+        clock[0] += latency
+        if error is not None:
+            raise error
+
+
+async def test_slow_requests_decrease_limit(given_clock):
+    limiter = AdaptiveLimiter("test", target_latency=0.1, initial_limit=10, min_limit=2)
+
+    await _run(limiter, given_clock, 0.5)
+    assert limiter.limit == 9
+    # 최근 지연 시간 안에 끝난 요청은 한 번 더 줄이지 않습니다.
+    await _run(limiter, given_clock, 0.0)
+    assert limiter.limit == 9
+
+    for _ in range(50):
+        await _run(limiter, given_clock, 1.0)
+    assert limiter.limit == 2
+
+
+async def test_database_errors_decrease_limit(given_clock):
+    limiter = AdaptiveLimiter("test", target_latency=0.1, initial_limit=10)
+
+    with pytest.raises(NotFoundException):
+        await _run(limiter, given_clock, 0.01, NotFoundException("없음"))
+    assert limiter.limit == 10
+    with pytest.raises(DatabaseException):
+        await _run(limiter, given_clock, 0.01, DatabaseException("pool timeout"))
+    assert limiter.limit == 9
+
+
+async def test_fast_requests_increase_limit_when_busy(given_clock):
+    limiter = AdaptiveLimiter("test", target_latency=0.1, initial_limit=1, max_limit=2)
+
+    for _ in range(20):
+        await _run(limiter, given_clock, 0.01)
+
+    assert limiter.limit == 2
+
+    idle = AdaptiveLimiter("test", target_latency=0.1, initial_limit=10)
+    await _run(idle, given_clock, 0.01)
+    assert idle.limit == 10
+
+
+async def test_overloaded_exception_handler():
+    from webapp.errors import overloaded_exception_handler
+
+    response = await overloaded_exception_handler(None, OverloadedException("요청이 많습니다.", retry_after=1.2))
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "2"
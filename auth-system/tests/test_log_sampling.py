@@ -0,0 +1,31 @@
+import logging
+
+from src.log_sampling import SampledLogger
+
+
+def test_sampled_logger(caplog, monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr("src.log_sampling.time.monotonic", lambda: now[0])
+    sampled = SampledLogger(logging.getLogger("test"), interval=10)
+
+    assert sampled.error("a", "실패 %s", 1) is True
+    assert sampled.error("a", "실패 %s", 2) is False
+    assert sampled.error("a", "실패 %s", 3) is False
+    assert sampled.error("b", "다른 실패") is True
+    now[0] = 10.0
+    assert sampled.error("a", "실패 %s", 4) is True
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages == ["실패 1", "다른 실패", "실패 4 (직전 10초 동안 2건 생략)"]
+
+
+def test_sampled_logger_exception(caplog):
+    sampled = SampledLogger(logging.getLogger("test"))
+    for _ in range(5):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            sampled.exception(ValueError, "실패")
+
+    assert len(caplog.records) == 1
+    assert caplog.records[0].exc_info is not None
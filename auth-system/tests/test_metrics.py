@@ -0,0 +1,93 @@
+import pytest
+
+from src.metrics import Registry
+
+
+@pytest.fixture
+def given_registry():
+    return Registry()
+
+
+def test_counter_render(given_registry):
+    counter = given_registry.counter("logins", "로그인 횟수", ["outcome"])
+
+    counter.labels("success").inc()
+    counter.labels("success").inc()
+    counter.labels('bad"reason').inc(3)
+
+    text = given_registry.render()
+    assert "# TYPE logins counter" in text
+    assert 'logins_total{outcome="success"} 2.0' in text
+    assert 'logins_total{outcome="bad\\"reason"} 3.0' in text
+    assert counter.value("success") == 2
+
+
+def test_counter_without_labels(given_registry):
+    counter = given_registry.counter("requests", "요청 횟수")
+
+    counter.inc()
+
+    assert "requests_total 1.0" in given_registry.render()
+
+
+def test_histogram_render_cumulative_buckets(given_registry):
+    histogram = given_registry.histogram("latency", "지연 시간", buckets=[0.1, 1.0])
+
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(2.0)
+
+    text = given_registry.render()
+    assert 'latency_bucket{le="0.1"} 1' in text
+    assert 'latency_bucket{le="1.0"} 2' in text
+    assert 'latency_bucket{le="+Inf"} 3' in text
+    assert "latency_sum 2.55" in text
+    assert "latency_count 3" in text
+    assert histogram.count() == 3
+    assert histogram.sum() == pytest.approx(2.55)
+
+
+def test_wrong_label_count(given_registry):
+    histogram = given_registry.histogram("latency", "지연 시간", ["operation"])
+
+    with pytest.raises(ValueError):
+        histogram.labels("a", "b")
+
+
+def test_duplicated_metric(given_registry):
+    given_registry.counter("requests", "요청 횟수")
+
+    with pytest.raises(ValueError):
+        given_registry.counter("requests", "요청 횟수")
+
+
+async def test_repository_and_session_metrics(given_database):
+    from src.metrics import REGISTRY, REPOSITORY_SECONDS, REPOSITORY_ERRORS
+    from src.users.repository import UserRepository
+
+    repository = UserRepository(given_database)
+    before = REPOSITORY_SECONDS.count("users", "find_by_id")
+
+    await repository.find_by_id("unknown")
+    with pytest.raises(Exception):
+        await repository.get_by_id("unknown")
+
+    assert REPOSITORY_SECONDS.count("users", "find_by_id") == before + 1
+    assert REPOSITORY_ERRORS.value("users", "get_by_id", "NotFoundException") >= 1
+    assert "paip_auth_db_session_seconds_count" in REGISTRY.render()
+
+
+async def test_create_user_metrics(given_database, given_user):
+    from src.exceptions import DBIntegrityException
+    from src.metrics import REPOSITORY_SECONDS, REPOSITORY_ERRORS
+    from src.users.repository import UserRepository
+
+    repository = UserRepository(given_database)
+    before = REPOSITORY_SECONDS.count("users", "create_user")
+
+    await repository.create_user(given_user, "hash")
+    with pytest.raises(DBIntegrityException):
+        await repository.create_user(given_user, "hash")
+
+    assert REPOSITORY_SECONDS.count("users", "create_user") == before + 2
+    assert REPOSITORY_ERRORS.value("users", "create_user", "DBIntegrityException") >= 1
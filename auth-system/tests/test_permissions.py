@@ -0,0 +1,69 @@
+import pytest
+from fastapi import HTTPException
+
+from src.domain import UserRole
+from src.exceptions import ForbiddenException
+from src.permissions import (
+    Permission, ROLE_PERMISSIONS, compile_policy, permissions_of, has_permissions,
+    permissions_from_payload, check_permissions, combine, PERMISSION_CLAIM,
+)
+from webapp.dependencies import require_permissions
+
+
+def test_every_role_is_compiled():
+    assert set(ROLE_PERMISSIONS) == set(UserRole)
+
+
+def test_role_inherits_parent_permissions():
+    member = permissions_of(UserRole.MEMBER)
+    admin = permissions_of(UserRole.ADMIN)
+
+    assert has_permissions(member, Permission.READ_PROFILE | Permission.READ_DATA)
+    assert not has_permissions(member, Permission.WRITE_DATA)
+    assert has_permissions(admin, member | Permission.MANAGE_DATA | Permission.MANAGE_USERS)
+    assert not has_permissions(admin, Permission.ISSUE_TOKEN)
+
+
+def test_withdrawal_has_no_permissions():
+    assert permissions_of(UserRole.WITHDRAWAL) == 0
+    assert not has_permissions(permissions_of(UserRole.WITHDRAWAL), Permission.READ_PROFILE)
+
+
+def test_compile_policy_detects_cycle():
+    policy = {
+        UserRole.MEMBER: ((UserRole.VIP,), Permission.READ_DATA),
+        UserRole.VIP: ((UserRole.MEMBER,), Permission.WRITE_DATA),
+    }
+
+    with pytest.raises(ValueError):
+        compile_policy(policy)
+
+
+def test_compile_policy_unknown_parent():
+    with pytest.raises(ValueError):
+        compile_policy({UserRole.MEMBER: ((UserRole.VIP,), Permission.READ_DATA)})
+
+
+def test_permissions_from_payload_falls_back_to_role():
+    assert permissions_from_payload({PERMISSION_CLAIM: int(Permission.READ_DATA)}) == Permission.READ_DATA
+    assert permissions_from_payload({"user_role": "VIP"}) == permissions_of(UserRole.VIP)
+
+
+def test_check_permissions_reports_missing():
+    granted = permissions_of(UserRole.MEMBER)
+
+    check_permissions(granted, Permission.READ_DATA)
+    with pytest.raises(ForbiddenException) as e:
+        check_permissions(granted, combine([Permission.READ_DATA, Permission.MANAGE_USERS]))
+    assert "MANAGE_USERS" in e.value.message
+
+
+def test_require_permissions_dependency():
+    dependency = require_permissions(Permission.WRITE_DATA)
+    vip_payload = {"account_id": "paicm", PERMISSION_CLAIM: permissions_of(UserRole.VIP)}
+    member_payload = {"account_id": "paicm", PERMISSION_CLAIM: permissions_of(UserRole.MEMBER)}
+
+    assert dependency(vip_payload) is vip_payload
+    with pytest.raises(HTTPException) as e:
+        dependency(member_payload)
+    assert e.value.status_code == 403
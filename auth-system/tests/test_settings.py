@@ -0,0 +1,47 @@
+import pytest
+from pydantic import ValidationError
+
+from src.exceptions import UnknownTenantException
+from src.settings import Settings, get_settings
+
+
+def test_settings_requires_private_key(monkeypatch):
+    monkeypatch.delenv("PRIVATE_KEY", raising=False)
+    monkeypatch.delenv("PRIVATE_KEY_FILE", raising=False)
+
+    with pytest.raises(ValidationError):
+        Settings()
+
+
+def test_settings_private_key_file(monkeypatch):
+    monkeypatch.delenv("PRIVATE_KEY", raising=False)
+    monkeypatch.setenv("PRIVATE_KEY_FILE", "/run/secrets/private.pem")
+
+    assert Settings().private_key_file == "/run/secrets/private.pem"
+
+
+def test_get_settings_is_cached(monkeypatch, given_private_pem):
+    monkeypatch.setenv("PRIVATE_KEY", given_private_pem.decode())
+    get_settings.cache_clear()
+    try:
+        assert get_settings() is get_settings()
+    finally:
+        get_settings.cache_clear()
+
+
+def test_settings_for_tenant(given_private_pem):
+    settings = Settings(private_key=given_private_pem, tenants={"acme": {"db_name": "paip-auth-acme", "db_pool_size": 5}})
+
+    acme = settings.for_tenant("acme")
+
+    assert (acme.db_name, acme.db_pool_size, acme.db_host) == ("paip-auth-acme", 5, settings.db_host)
+    assert settings.for_tenant("default") is settings
+    with pytest.raises(UnknownTenantException):
+        settings.for_tenant("unknown")
+
+
+def test_settings_tenants_from_env(monkeypatch, given_private_pem):
+    monkeypatch.setenv("PRIVATE_KEY", given_private_pem.decode())
+    monkeypatch.setenv("TENANTS", '{"acme": {"db_schema": "acme"}}')
+
+    assert Settings().for_tenant("acme").db_schema == "acme"
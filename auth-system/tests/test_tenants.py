@@ -0,0 +1,89 @@
+import os
+import tempfile
+
+import pytest
+from Crypto.PublicKey import RSA
+
+from src.exceptions import InvalidTokenException, NotFoundException
+from src.metrics import DB_SESSION_SECONDS
+from src.settings import Settings
+from src.tenants import TenantRegistry
+from src.users.repository import UserRepository
+
+
+@pytest.fixture
+async def given_tenant_registry(given_private_pem):
+    fpaths = {tenant: tempfile.mktemp(suffix=".db") for tenant in ("default", "acme", "globex")}
+    acme_pem = RSA.generate(1024).export_key()
+    settings = Settings(
+        db_type=f"sqlite+aiosqlite:///{fpaths['default']}",
+        private_key=given_private_pem,
+        tenants={
+            "acme": {"db_type": f"sqlite+aiosqlite:///{fpaths['acme']}", "db_pool_size": 2,
+                     "private_key": acme_pem},
+            # key 를 지정하지 않으면 기본 key 로 서명합니다.
+            "globex": {"db_type": f"sqlite+aiosqlite:///{fpaths['globex']}"},
+        },
+    )
+    registry = TenantRegistry(settings)
+    for tenant in registry.tenants:
+        await registry.session_manager(tenant).create_database()
+    yield registry
+    await registry.dispose()
+    for fpath in fpaths.values():
+        os.remove(fpath)
+
+
+def test_tenants(given_tenant_registry):
+    assert given_tenant_registry.tenants == ["default", "acme", "globex"]
+    assert given_tenant_registry.session_manager("acme") is given_tenant_registry.session_manager("acme")
+    assert given_tenant_registry.session_manager("acme")._engine is not given_tenant_registry.session_manager()._engine
+    assert given_tenant_registry.session_manager("acme")._engine.pool.size() == 2
+
+
+async def test_tenant_data_is_isolated(given_tenant_registry, given_user):
+    await UserRepository(given_tenant_registry.session_manager("acme")).create_user(given_user, "password")
+
+    assert (await UserRepository(given_tenant_registry.session_manager("acme")).get_by_id(given_user.account_id))
+    with pytest.raises(NotFoundException):
+        await UserRepository(given_tenant_registry.session_manager("globex")).get_by_id(given_user.account_id)
+
+
+async def test_session_metrics_per_tenant(given_tenant_registry, given_user):
+    DB_SESSION_SECONDS.clear()
+
+    await UserRepository(given_tenant_registry.session_manager("acme")).create_user(given_user, "password")
+
+    assert DB_SESSION_SECONDS.count("acme", "ok") >= 1
+    assert DB_SESSION_SECONDS.count("globex", "ok") == 0
+
+
+def test_verify_access_token_with_tenant_key(given_tenant_registry, given_user):
+    token = given_tenant_registry.token_manager("acme").generate_token(given_user)
+
+    payload = given_tenant_registry.verify_access_token(token.access)
+
+    assert payload["tenant"] == "acme"
+    assert given_tenant_registry.token_manager("acme").keys.current.kid != \
+        given_tenant_registry.token_manager().keys.current.kid
+    with pytest.raises(InvalidTokenException):
+        given_tenant_registry.token_manager().verify_access_token(token.access)
+
+
+def test_token_of_other_tenant_with_same_key_is_rejected(given_tenant_registry, given_user):
+    token = given_tenant_registry.token_manager("globex").generate_token(given_user)
+
+    assert given_tenant_registry.verify_access_token(token.access)["tenant"] == "globex"
+    with pytest.raises(InvalidTokenException):
+        given_tenant_registry.token_manager().verify_access_token(token.access)
+    with pytest.raises(InvalidTokenException):
+        given_tenant_registry.token_manager().verify_refresh_payload(token.refresh)
+
+
+def test_token_of_unknown_tenant_is_rejected(given_private_pem, given_user):
+    other = TenantRegistry(Settings(private_key=given_private_pem, tenants={"unknown": {}}))
+    token = other.token_manager("unknown").generate_token(given_user)
+    registry = TenantRegistry(Settings(private_key=given_private_pem, tenants={"acme": {}}))
+
+    with pytest.raises(InvalidTokenException):
+        registry.verify_access_token(token.access)
@@ -0,0 +1,26 @@
+from src.metrics import WARMUP_SECONDS
+from src.sessions.repository import SessionRepository
+from src.users.repository import UserRepository
+from src.warmup import warmup
+
+
+async def test_warmup_reports_each_step(given_file_database, given_token_manager):
+    WARMUP_SECONDS.clear()
+
+    report = await warmup(
+        given_file_database,
+        3,
+        given_token_manager,
+        [UserRepository(given_file_database), SessionRepository(given_file_database)],
+    )
+
+    assert list(report.steps) == ["db_connections", "statements", "keys"]
+    assert report.total == sum(report.steps.values())
+    assert WARMUP_SECONDS.count("keys") == 1
+    assert given_file_database._engine.pool.checkedin() == 3
+
+
+async def test_warmup_without_token_manager(given_database):
+    report = await warmup(given_database, 1)
+
+    assert list(report.steps) == ["db_connections", "statements"]
@@ -0,0 +1,35 @@
+import pytest
+
+from src.tokens.batch import verify_batch_by_rsa
+from src.tokens.signature import Signer
+
+
+@pytest.fixture
+def given_pairs(given_private_key):
+    signer = Signer(given_private_key)
+    messages = [f"message-{i}".encode() for i in range(20)]
+    return [(message, signer.sign(message)) for message in messages]
+
+
+@pytest.mark.parametrize("max_workers", [0, 2])
+def test_verify_batch(given_pairs, given_public_pem_file, max_workers):
+    given_pairs[3] = (b"fraud", given_pairs[3][1])
+
+    results = list(verify_batch_by_rsa(iter(given_pairs), given_public_pem_file, chunk_size=3,
+                                       max_workers=max_workers))
+
+    assert results == [i != 3 for i in range(20)]
+
+
+@pytest.mark.parametrize("max_workers", [0, 2])
+def test_verify_batch_fail_fast(given_pairs, given_public_pem_file, max_workers):
+    given_pairs[5] = (given_pairs[5][0], b"wrong")
+
+    results = list(verify_batch_by_rsa(given_pairs, given_public_pem_file, chunk_size=3,
+                                       max_workers=max_workers, fail_fast=True))
+
+    assert results == [True] * 5 + [False]
+
+
+def test_verify_batch_empty(given_public_pem_file):
+    assert list(verify_batch_by_rsa([], given_public_pem_file, max_workers=2)) == []
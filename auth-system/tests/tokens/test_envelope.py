@@ -0,0 +1,148 @@
+import io
+import os
+import struct
+
+import pytest
+from Crypto.PublicKey import RSA
+
+from src.exceptions import CryptoException
+from src.tokens.envelope import EnvelopeEncryptor, EnvelopeDecryptor, MAX_CHUNK_SIZE
+
+
+@pytest.fixture
+def given_encryptor(given_public_key):
+    return EnvelopeEncryptor(given_public_key)
+
+
+@pytest.fixture
+def given_decryptor(given_private_key):
+    return EnvelopeDecryptor(given_private_key)
+
+
+def test_encrypt_and_decrypt(given_encryptor, given_decryptor):
+    given_text = "안녕 김채민".encode("utf-8")
+
+    blob = given_encryptor.encrypt(given_text)
+
+    assert given_text not in blob
+    assert given_decryptor.decrypt(blob) == given_text
+
+
+def test_encrypt_larger_than_rsa_limit(given_encryptor, given_decryptor):
+    given_data = os.urandom(10_000)
+
+    assert given_decryptor.decrypt(given_encryptor.encrypt(given_data)) == given_data
+
+
+def test_decrypt_tampered(given_encryptor, given_decryptor):
+    blob = bytearray(given_encryptor.encrypt(b"paip"))
+    blob[-1] ^= 1
+
+    with pytest.raises(CryptoException):
+        given_decryptor.decrypt(bytes(blob))
+
+
+def test_decrypt_with_other_key(given_encryptor):
+    blob = given_encryptor.encrypt(b"paip")
+
+    with pytest.raises(CryptoException):
+        EnvelopeDecryptor(RSA.generate(1024)).decrypt(blob)
+
+
+def test_decrypt_not_envelope(given_decryptor):
+    with pytest.raises(CryptoException):
+        given_decryptor.decrypt(b"not envelope")
+
+
+def test_data_key_is_cached(given_encryptor, given_decryptor):
+    blobs = [given_encryptor.encrypt(f"field-{i}".encode()) for i in range(10)]
+
+    for _ in range(3):
+        assert [given_decryptor.decrypt(blob) for blob in blobs] == [f"field-{i}".encode() for i in range(10)]
+
+    assert given_decryptor.unwrap_count == 1
+
+
+def test_data_key_rotation(given_public_key, given_decryptor):
+    encryptor = EnvelopeEncryptor(given_public_key, rotate_after=2)
+
+    for i in range(5):
+        given_decryptor.decrypt(encryptor.encrypt(b"paip"))
+
+    assert given_decryptor.unwrap_count == 3
+
+
+@pytest.mark.parametrize("size", [0, 1, 100, 4096])
+def test_stream_encrypt_and_decrypt(given_encryptor, given_decryptor, size):
+    given_data = os.urandom(size)
+    encrypted = io.BytesIO()
+
+    assert given_encryptor.encrypt_stream(io.BytesIO(given_data), encrypted, chunk_size=64) == size
+
+    decrypted = io.BytesIO()
+    encrypted.seek(0)
+    assert given_decryptor.decrypt_stream(encrypted, decrypted) == size
+    assert decrypted.getvalue() == given_data
+
+
+def test_stream_truncated(given_encryptor, given_decryptor):
+    encrypted = io.BytesIO()
+    given_encryptor.encrypt_stream(io.BytesIO(os.urandom(1000)), encrypted, chunk_size=100)
+    # 마지막 chunk(1 + 4 + 100 + 16 byte)를 잘라냄
+    truncated = encrypted.getvalue()[:-121]
+
+    with pytest.raises(CryptoException):
+        given_decryptor.decrypt_stream(io.BytesIO(truncated), io.BytesIO())
+
+
+def test_stream_chunk_reordered(given_encryptor, given_decryptor):
+    encrypted = io.BytesIO()
+    given_encryptor.encrypt_stream(io.BytesIO(os.urandom(300)), encrypted, chunk_size=100)
+    data = encrypted.getvalue()
+    frame_size = 1 + 4 + 100 + 16
+    header_size = len(data) - frame_size * 3
+    frames = [data[header_size + i * frame_size:header_size + (i + 1) * frame_size] for i in range(3)]
+    reordered = data[:header_size] + frames[1] + frames[0] + frames[2]
+
+    with pytest.raises(CryptoException):
+        given_decryptor.decrypt_stream(io.BytesIO(reordered), io.BytesIO())
+
+
+class RecordingReader(io.BytesIO):
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.max_read = 0
+
+    def read(self, size=-1):
+        self.max_read = max(self.max_read, size)
+        return super().read(size)
+
+
+def test_stream_rejects_oversized_frame_before_reading(given_encryptor, given_decryptor):
+    encrypted = io.BytesIO()
+    given_encryptor.encrypt_stream(io.BytesIO(os.urandom(100)), encrypted, chunk_size=100)
+    data = bytearray(encrypted.getvalue())
+    header_size = len(data) - (1 + 4 + 100 + 16)
+    # 인증 전에 읽는 ciphertext 길이를 4 GiB 로 변조
+    struct.pack_into(">I", data, header_size + 1, 0xFFFFFFFF)
+    src = RecordingReader(bytes(data))
+
+    with pytest.raises(CryptoException):
+        given_decryptor.decrypt_stream(src, io.BytesIO())
+    assert src.max_read < 1024
+
+
+def test_stream_rejects_oversized_chunk_size(given_encryptor, given_decryptor):
+    encrypted = io.BytesIO()
+    given_encryptor.encrypt_stream(io.BytesIO(os.urandom(100)), encrypted, chunk_size=100)
+    data = bytearray(encrypted.getvalue())
+    header_size = len(data) - (1 + 4 + 100 + 16)
+    struct.pack_into(">I", data, header_size - 8 - 4, MAX_CHUNK_SIZE + 1)
+
+    with pytest.raises(CryptoException):
+        given_decryptor.decrypt_stream(io.BytesIO(bytes(data)), io.BytesIO())
+
+
+def test_stream_chunk_size_limit(given_encryptor):
+    with pytest.raises(ValueError):
+        given_encryptor.encrypt_stream(io.BytesIO(b"paip"), io.BytesIO(), chunk_size=MAX_CHUNK_SIZE + 1)
@@ -0,0 +1,118 @@
+import os
+import signal
+
+import jwt
+import pytest
+from Crypto.PublicKey import RSA
+
+from src.exceptions import InvalidKeyException, InvalidTokenException
+from src.settings import Settings
+from src.tokens.keys import KeyPair, KeyProvider, shared_key_provider
+from src.tokens.manager import TokenManager
+
+
+def write(fpath, pem: bytes):
+    with open(fpath, "wb") as f:
+        f.write(pem)
+    # 같은 크기의 key 로 바꿔도 변경을 알 수 있도록 mtime 을 확실히 바꿉니다.
+    stat = os.stat(fpath)
+    os.utime(fpath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def given_key_file(tmp_path, given_private_pem):
+    fpath = str(tmp_path / "private.pem")
+    write(fpath, given_private_pem)
+    return fpath
+
+
+def test_key_pair_from_pem(given_private_pem, given_public_pem):
+    key_pair = KeyPair.from_pem(given_private_pem)
+
+    assert key_pair.public_pem == given_public_pem
+    assert len(key_pair.kid) == 16
+
+
+@pytest.mark.parametrize("pem", [b"", b"not a pem"])
+def test_key_pair_from_invalid_pem(pem):
+    with pytest.raises(InvalidKeyException):
+        KeyPair.from_pem(pem)
+
+
+def test_key_provider_requires_key():
+    with pytest.raises(InvalidKeyException):
+        KeyProvider()
+
+
+def test_key_provider_reloads_changed_file(given_key_file, given_private_pem):
+    provider = KeyProvider(path=given_key_file, check_interval=0)
+    old = provider.current
+    new_pem = RSA.generate(1024).export_key()
+
+    write(given_key_file, new_pem)
+
+    assert provider.current.private_pem == new_pem
+    assert provider.previous_public_key(old.kid) is old.public_key
+    assert provider.previous_public_key(provider.current.kid) is None
+    assert provider.reload_count == 1
+
+
+def test_key_provider_keeps_key_when_new_file_is_invalid(given_key_file, given_private_pem):
+    provider = KeyProvider(path=given_key_file, check_interval=0)
+
+    write(given_key_file, b"broken")
+    assert provider.current.private_pem == given_private_pem
+    os.remove(given_key_file)
+    assert provider.current.private_pem == given_private_pem
+
+
+def test_key_provider_checks_file_at_interval(given_key_file):
+    provider = KeyProvider(path=given_key_file, check_interval=3600)
+    old = provider.current
+
+    write(given_key_file, RSA.generate(1024).export_key())
+
+    assert provider.current is old
+    assert provider.reload() is True
+    assert provider.current is not old
+
+
+def test_key_provider_reloads_on_sighup(given_key_file):
+    provider = KeyProvider(path=given_key_file, check_interval=3600)
+    new_pem = RSA.generate(1024).export_key()
+    write(given_key_file, new_pem)
+    previous = signal.getsignal(signal.SIGHUP)
+    try:
+        provider.install_reload_signal()
+        os.kill(os.getpid(), signal.SIGHUP)
+    finally:
+        signal.signal(signal.SIGHUP, previous)
+
+    assert provider.current.private_pem == new_pem
+
+
+def test_token_manager_verifies_tokens_signed_before_rotation(given_key_file, given_user):
+    settings = Settings(private_key_file=given_key_file)
+    token_manager = TokenManager(settings, KeyProvider(path=given_key_file, check_interval=0))
+    before = token_manager.generate_token(given_user)
+
+    write(given_key_file, RSA.generate(1024).export_key())
+    after = token_manager.generate_token(given_user)
+
+    assert jwt.get_unverified_header(before.access)["kid"] != jwt.get_unverified_header(after.access)["kid"]
+    assert token_manager.verify_access_token(before.access)["account_id"] == given_user.account_id
+    assert token_manager.verify_access_token(after.access)["account_id"] == given_user.account_id
+
+
+def test_token_manager_rejects_token_of_unknown_key(given_token_manager, given_user):
+    other = TokenManager(Settings(private_key=RSA.generate(1024).export_key()))
+    token = other.generate_token(given_user)
+
+    with pytest.raises(InvalidTokenException):
+        given_token_manager.verify_access_token(token.access)
+
+
+def test_shared_key_provider(given_auth_settings, given_key_file):
+    assert shared_key_provider(given_auth_settings) is shared_key_provider(given_auth_settings.model_copy())
+    assert TokenManager(given_auth_settings).keys is TokenManager(given_auth_settings).keys
+    assert shared_key_provider(Settings(private_key_file=given_key_file)).path == given_key_file
@@ -0,0 +1,211 @@
+import multiprocessing
+import time
+
+import pytest
+from Crypto.PublicKey import RSA
+
+from src.exceptions import InvalidTokenException
+from src.tokens.keys import KeyPair, KeyProvider
+from src.tokens.manager import TokenManager
+from src.tokens import shared_state
+from src.tokens.shared_state import SharedStateReader, SharedStateWriter
+
+
+@pytest.fixture
+def given_writer():
+    writer = SharedStateWriter(key_region_size=4096, watermark_capacity=16, revoked_capacity=16)
+    yield writer
+    writer.close()
+
+
+@pytest.fixture
+def given_reader(given_writer):
+    reader = SharedStateReader(given_writer.name)
+    yield reader
+    reader.close()
+
+
+def test_watermark_and_revoke(given_writer, given_reader):
+    given_writer.set_watermark("paicm", 100.0, ttl=60)
+    given_writer.revoke("session-1", ttl=60)
+
+    assert given_reader.watermark("paicm") == 100.0
+    assert given_reader.watermark("other") is None
+    assert given_reader.is_revoked("session-1")
+    assert not given_reader.is_revoked("session-2")
+
+
+def test_watermark_keeps_latest(given_writer, given_reader):
+    given_writer.set_watermark("paicm", 200.0, ttl=60)
+    given_writer.set_watermark("paicm", 100.0, ttl=60)
+
+    assert given_reader.watermark("paicm") == 200.0
+
+
+def test_check(given_writer, given_reader):
+    given_writer.set_watermark("paicm", 100.0, ttl=60)
+    given_writer.revoke("session-1", ttl=60)
+
+    given_reader.check({"account_id": "paicm", "iat": 101.0, "sid": "session-2"})
+    with pytest.raises(InvalidTokenException):
+        given_reader.check({"account_id": "paicm", "iat": 99.0, "sid": "session-2"})
+    with pytest.raises(InvalidTokenException):
+        given_reader.check({"account_id": "other", "iat": 99.0, "jti": "session-1"})
+
+
+def test_compact_removes_expired(given_writer, given_reader):
+    given_writer.revoke("expired", ttl=-1)
+    given_writer.revoke("alive", ttl=60)
+
+    assert given_writer.compact() == 1
+    assert not given_reader.is_revoked("expired")
+    assert given_reader.is_revoked("alive")
+
+
+def test_full_table_drops_expired_or_overflows(given_writer, given_reader):
+    # capacity 16, MAX_LOAD 0.5 -> 8 개까지
+    for i in range(8):
+        given_writer.revoke(f"expired-{i}", ttl=-1)
+    given_writer.revoke("alive", ttl=60)
+
+    assert given_reader.is_revoked("alive")
+    assert not given_reader.is_revoked("expired-0")
+
+    for i in range(7):
+        given_writer.revoke(f"alive-{i}", ttl=60)
+    with pytest.raises(OverflowError):
+        given_writer.revoke("one-more", ttl=60)
+
+
+def test_compact_switches_tables(given_writer, given_reader):
+    given_writer.revoke("alive", ttl=60)
+    now = time.time()
+    given_writer.set_watermark("paicm", now, ttl=60)
+
+    # 쓰지 않는 쪽에 새로 만들고 바꾸기 때문에, 여러 번 정리해도 reader 는 같은 값을 읽습니다.
+    for _ in range(3):
+        given_writer.compact()
+        assert given_reader.is_revoked("alive")
+        assert given_reader.watermark("paicm") == now
+
+    given_writer.revoke("after-compact", ttl=60)
+    assert given_reader.is_revoked("after-compact")
+
+
+def test_reader_does_not_fail_when_writer_dies_mid_write(given_writer, given_private_pem, monkeypatch):
+    key_pair = KeyPair.from_pem(given_private_pem)
+    given_writer.publish_keys([key_pair])
+    given_writer.revoke("session-1", ttl=60)
+    reader = SharedStateReader(given_writer.name, read_retries=50)
+    yields = []
+    monkeypatch.setattr(shared_state.time, "sleep", yields.append)
+    try:
+        assert reader.public_key(key_pair.kid) is not None
+        # sequence 를 홀수로 둔 채 writer 가 종료된 상황
+        writing = given_writer._writing()
+        writing.__enter__()
+
+        assert reader.is_revoked("session-1")
+        # 처음 몇 번은 바로 다시 읽고, 그 뒤로는 CPU 를 양보하며 read_retries 번까지만 다시 읽습니다.
+        assert yields == [0] * (50 - shared_state._SPIN_RETRIES)
+        # 같은 sequence 에서는 다시 기다리지 않습니다.
+        yields.clear()
+        assert not reader.is_revoked("session-2")
+        assert reader.public_key(key_pair.kid) is not None
+        assert yields == []
+    finally:
+        reader.close()
+
+
+def test_restarted_writer_resumes_segment(given_writer, given_reader):
+    given_writer.revoke("session-1", ttl=60)
+    writing = given_writer._writing()
+    writing.__enter__()
+
+    # 쓰다가 종료된 writer 대신 새 writer 가 같은 segment 를 이어서 씁니다. (reader 는 그대로)
+    restarted = SharedStateWriter(given_writer.name, key_region_size=4096, watermark_capacity=16, revoked_capacity=16)
+    try:
+        restarted.revoke("session-2", ttl=60)
+
+        assert given_reader.is_revoked("session-1")
+        assert given_reader.is_revoked("session-2")
+        assert restarted._counts == [0, 2]
+        with pytest.raises(ValueError):
+            SharedStateWriter(given_writer.name, key_region_size=4096, watermark_capacity=32, revoked_capacity=16)
+    finally:
+        restarted.close(unlink=False)
+
+
+def test_public_keys(given_writer, given_reader, given_private_pem):
+    key_pair = KeyPair.from_pem(given_private_pem)
+    assert given_reader.public_key(key_pair.kid) is None
+
+    given_writer.publish_keys([key_pair])
+
+    assert given_reader.public_key(key_pair.kid).public_numbers() == key_pair.public_key.public_numbers()
+    assert given_reader.public_key("unknown") is None
+
+
+def test_reader_rejects_other_segment(given_writer):
+    from multiprocessing import shared_memory
+
+    other = shared_memory.SharedMemory(create=True, size=4096)
+    try:
+        with pytest.raises(ValueError):
+            SharedStateReader(other.name)
+    finally:
+        other.close()
+        other.unlink()
+
+
+def _revoked_in_child(name, token_id, queue):
+    reader = SharedStateReader(name)
+    queue.put(reader.is_revoked(token_id))
+    reader.close()
+
+
+def test_reader_in_other_process(given_writer):
+    given_writer.revoke("session-1", ttl=60)
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+
+    process = context.Process(target=_revoked_in_child, args=(given_writer.name, "session-1", queue))
+    process.start()
+    process.join(timeout=30)
+
+    assert queue.get(timeout=1) is True
+    assert process.exitcode == 0
+
+
+def test_token_manager_rejects_revoked_tokens(given_auth_settings, given_writer, given_reader, given_user):
+    token_manager = TokenManager(given_auth_settings, shared_state=given_reader)
+    token = token_manager.generate_token(given_user)
+    assert token_manager.verify_access_token(token.access)["account_id"] == given_user.account_id
+
+    given_writer.revoke(token.session_id, ttl=60)
+
+    with pytest.raises(InvalidTokenException):
+        token_manager.verify_access_token(token.access)
+    with pytest.raises(InvalidTokenException):
+        token_manager.verify_refresh_payload(token.refresh)
+
+
+def test_token_manager_rejects_tokens_before_watermark(given_auth_settings, given_writer, given_reader, given_user):
+    token_manager = TokenManager(given_auth_settings, shared_state=given_reader)
+    token = token_manager.generate_token(given_user)
+
+    given_writer.set_watermark(given_user.account_id, time.time(), ttl=60)
+
+    with pytest.raises(InvalidTokenException):
+        token_manager.verify_access_token(token.access)
+    assert token_manager.verify_access_token(token_manager.generate_token(given_user).access)
+
+
+def test_token_manager_finds_key_rotated_by_other_worker(given_auth_settings, given_writer, given_reader, given_user):
+    rotated = KeyProvider(RSA.generate(2048).export_key())
+    given_writer.publish_keys(rotated.key_pairs())
+    token = TokenManager(given_auth_settings, key_provider=rotated).generate_token(given_user)
+
+    token_manager = TokenManager(given_auth_settings, shared_state=given_reader)
+
+    assert token_manager.verify_access_token(token.access)["account_id"] == given_user.account_id
@@ -11,7 +11,12 @@ jwt: header message signature (H.P.S)
 base64 를 통해 h 와 p 는 나온다
 """
 import json
-from src.tokens.signature import sign_data_by_rsa, verify_data_by_rsa
+import os
+
+import pytest
+from Crypto.PublicKey import RSA
+
+from src.tokens.signature import sign_data_by_rsa, verify_data_by_rsa, Signer, Verifier, get_signer, get_verifier
 
 
 def test_generate_signature_and_verify(given_private_pem_file, given_public_pem_file):
@@ -62,3 +67,37 @@ def test_scenario2_client_is_thief(given_private_pem_file, given_public_pem_file
 
     # 검증하고 싶은 곳: api gateway
     assert verify_data_by_rsa(fraud_message, signature, given_public_pem_file) is False
+
+
+def test_signer_and_verifier(given_private_key, given_public_key):
+    given_message = b"paip"
+    signer = Signer(given_private_key)
+    verifier = Verifier(given_public_key)
+
+    signature = signer.sign(given_message)
+
+    assert verifier.verify(given_message, signature) is True
+    assert verifier.verify(b"fraud", signature) is False
+
+
+def test_signer_requires_private_key(given_public_key):
+    with pytest.raises(ValueError):
+        Signer(given_public_key)
+
+
+def test_get_signer_is_cached(given_private_pem_file):
+    assert get_signer(given_private_pem_file) is get_signer(given_private_pem_file)
+
+
+def test_get_verifier_reloads_replaced_key_file(given_public_pem_file):
+    verifier = get_verifier(given_public_pem_file)
+    new_key = RSA.generate(1024)
+    with open(given_public_pem_file, "wb") as f:
+        f.write(new_key.public_key().export_key())
+    stat = os.stat(given_public_pem_file)
+    os.utime(given_public_pem_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    new_verifier = get_verifier(given_public_pem_file)
+
+    assert new_verifier is not verifier
+    assert new_verifier.verify(b"paip", Signer(new_key).sign(b"paip")) is True
@@ -0,0 +1,67 @@
+import io
+import os
+import tempfile
+
+import pytest
+
+from src.tokens import signature
+from src.tokens.signature import Signer, Verifier, sign_data_by_rsa, sign_stream_by_rsa, verify_stream_by_rsa
+
+
+@pytest.fixture
+def given_small_chunk(monkeypatch):
+    monkeypatch.setattr(signature, "CHUNK_SIZE", 7)
+
+
+@pytest.fixture
+def given_data_file():
+    given_data = os.urandom(1000)
+    fpath = tempfile.mktemp()
+    with open(fpath, "wb") as f:
+        f.write(given_data)
+    yield fpath, given_data
+    os.remove(fpath)
+
+
+def test_sign_stream_path_equals_sign(given_small_chunk, given_data_file, given_private_pem_file,
+                                      given_public_pem_file):
+    fpath, given_data = given_data_file
+
+    signature_value = sign_stream_by_rsa(fpath, given_private_pem_file)
+
+    assert signature_value == sign_data_by_rsa(given_data, given_private_pem_file)
+    assert verify_stream_by_rsa(fpath, signature_value, given_public_pem_file) is True
+
+
+def test_sign_stream_file_object(given_small_chunk, given_private_key, given_public_key):
+    given_data = os.urandom(1000)
+    signer = Signer(given_private_key)
+
+    signature_value = signer.sign_stream(io.BytesIO(given_data))
+
+    assert Verifier(given_public_key).verify(given_data, signature_value) is True
+    assert Verifier(given_public_key).verify_stream(io.BytesIO(given_data[:-1]), signature_value) is False
+
+
+def test_sign_stream_empty_file(given_private_key, given_public_key):
+    fpath = tempfile.mktemp()
+    open(fpath, "wb").close()
+    try:
+        signature_value = Signer(given_private_key).sign_stream(fpath)
+    finally:
+        os.remove(fpath)
+
+    assert Verifier(given_public_key).verify(b"", signature_value) is True
+
+
+async def test_sign_async_stream(given_private_key, given_public_key):
+    given_chunks = [b"paip", b"-", b"auth"]
+
+    async def chunks():
+        for chunk in given_chunks:
+            yield chunk
+
+    signature_value = await Signer(given_private_key).sign_async_stream(chunks())
+
+    assert Verifier(given_public_key).verify(b"paip-auth", signature_value) is True
+    assert await Verifier(given_public_key).verify_async_stream(chunks(), signature_value) is True
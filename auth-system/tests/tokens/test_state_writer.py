@@ -0,0 +1,107 @@
+import asyncio
+import time
+
+import pytest
+
+from src.sessions.registry import SessionRegistry
+from src.sessions.repository import SessionRepository
+from src.tenants import TenantRegistry
+from src.tokens.shared_state import SharedStateReader, SharedStateWriter
+from src.tokens.state_writer import KeyPublisher, StateWriterClient, StateWriterServer, encode_revoke
+from src.verifier.protocol import HEADER
+
+
+@pytest.fixture
+def given_writer():
+    writer = SharedStateWriter(key_region_size=4096, watermark_capacity=16, revoked_capacity=16)
+    yield writer
+    writer.close()
+
+
+@pytest.fixture
+def given_reader(given_writer):
+    reader = SharedStateReader(given_writer.name)
+    yield reader
+    reader.close()
+
+
+@pytest.fixture
+async def given_server(tmp_path, given_writer):
+    server = StateWriterServer(given_writer, str(tmp_path / "state.sock"))
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest.fixture
+async def given_client(given_server):
+    client = StateWriterClient(given_server.path, reconnect_interval=0.01)
+    await client.start()
+    await client.wait_connected(timeout=5)
+    yield client
+    await client.stop()
+
+
+async def eventually(condition, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        await asyncio.sleep(0.01)
+
+
+async def test_client_sends_revocations(given_client, given_reader):
+    issued_before = time.time()
+
+    given_client.revoke("session-1", 60)
+    given_client.set_watermark("paicm", issued_before, 60)
+
+    await eventually(lambda: given_reader.is_revoked("session-1"))
+    await eventually(lambda: given_reader.watermark("paicm") == issued_before)
+
+
+async def test_client_keeps_requests_until_connected(tmp_path, given_writer, given_reader):
+    client = StateWriterClient(str(tmp_path / "state.sock"), reconnect_interval=0.01)
+    await client.start()
+    try:
+        # daemon 이 아직 없을 때 보낸 폐기도 연결되면 보냅니다.
+        client.revoke("session-1", 60)
+        server = StateWriterServer(given_writer, client.path)
+        await server.start()
+        try:
+            await client.wait_connected(timeout=5)
+            await eventually(lambda: given_reader.is_revoked("session-1"))
+        finally:
+            await server.stop()
+    finally:
+        await client.stop()
+
+
+async def test_bad_request_keeps_connection(given_client, given_reader):
+    # 지원하지 않는 op, 길이가 모자란 body 는 버리고 다음 요청을 처리합니다.
+    given_client._send(HEADER.pack(9, 0))
+    given_client._send(HEADER.pack(1, 3) + b"abc")
+    given_client._send(encode_revoke("session-1", 60))
+
+    await eventually(lambda: given_reader.is_revoked("session-1"))
+    assert given_client.connected
+
+
+async def test_session_registry_revokes_through_daemon(given_client, given_reader, given_file_database):
+    registry = SessionRegistry(SessionRepository(given_file_database), shared_state=given_client, revocation_ttl=60)
+    await registry.start()
+    try:
+        await registry.revoke("session-1")
+    finally:
+        await registry.stop()
+
+    await eventually(lambda: given_reader.is_revoked("session-1"))
+
+
+def test_key_publisher_publishes_when_keys_change(given_auth_settings, given_writer, given_reader):
+    registry = TenantRegistry(given_auth_settings)
+    publisher = KeyPublisher(given_writer, registry)
+    kid = registry.token_manager().keys.current.kid
+
+    assert publisher.publish() is True
+    assert publisher.publish() is False
+    assert given_reader.public_key(kid) is not None
@@ -5,6 +5,7 @@ import jwt
 
 from src.domain import TokenType, User, UserRole
 from src.exceptions import ExpiredTokenException
+from src.permissions import PERMISSION_CLAIM, Permission, has_permissions, permissions_of
 from src.tokens.manager import create_jwt_token
 
 
@@ -95,3 +96,23 @@ def test_verify_refresh_token_with_expired(given_token_manager, given_private_pe
 
     with pytest.raises(ExpiredTokenException):
         given_token_manager.verify_refresh_token(refresh_token)
+
+
+def test_generate_token_session_id(given_user, given_public_pem, given_token_manager):
+    token = given_token_manager.generate_token(given_user)
+
+    access = jwt.decode(token.access, given_public_pem, algorithms=['RS256'])
+    refresh = jwt.decode(token.refresh, given_public_pem, algorithms=['RS256'])
+
+    assert refresh["jti"] == token.session_id
+    assert access["sid"] == token.session_id
+    assert access["jti"] != refresh["jti"]
+
+
+def test_generate_token_permission_claim(given_user, given_token_manager):
+    token = given_token_manager.generate_token(given_user)
+
+    payload = given_token_manager.verify_access_token(token.access)
+
+    assert payload[PERMISSION_CLAIM] == permissions_of(UserRole.ADMIN)
+    assert has_permissions(payload[PERMISSION_CLAIM], Permission.MANAGE_USERS)
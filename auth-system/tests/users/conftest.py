@@ -0,0 +1,14 @@
+import pytest
+
+from src.users.login_manager import LoginManager
+from src.users.repository import UserRepository
+
+
+@pytest.fixture
+async def given_user_repository(given_database):
+    yield UserRepository(given_database)
+
+
+@pytest.fixture
+def given_login_manager(given_user_repository, given_token_manager):
+    return LoginManager(given_user_repository, given_token_manager, password_iterations=1000)
@@ -0,0 +1,166 @@
+import csv
+import json
+import os
+
+import pytest
+
+from src.domain import LoginRequest, User, UserRole
+from src.exceptions import DBIntegrityException
+from src.users.bulk import Checkpoint, UserExporter, UserImporter, read_rows
+from src.users.cli import main
+from src.users.password import is_hashed
+
+ITERATIONS = 1000
+
+
+def write_rows(fpath, rows):
+    if fpath.endswith(".csv"):
+        with open(fpath, "w", newline="") as f:
+            writer = csv.DictWriter(f, ["account_id", "name", "role", "email", "password"])
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        with open(fpath, "w") as f:
+            f.writelines(json.dumps(row) + "\n" for row in rows)
+
+
+def given_rows(count, start=0):
+    return [
+        {"account_id": f"user-{i:04d}", "name": f"사용자{i}", "role": "MEMBER",
+         "email": f"user-{i}@publicai.co.kr", "password": f"password-{i}"}
+        for i in range(start, start + count)
+    ]
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".jsonl"])
+async def test_import_users(tmp_path, suffix, given_user_repository, given_login_manager):
+    fpath = str(tmp_path / f"users{suffix}")
+    write_rows(fpath, given_rows(25))
+    progress = []
+
+    importer = UserImporter(given_user_repository, chunk_size=10, max_workers=0, iterations=ITERATIONS,
+                            progress=progress.append)
+    result = await importer.run(fpath)
+
+    assert result.rows == 25
+    assert [p.rows for p in progress] == [10, 20, 25]
+    user, password = await given_user_repository.find_with_password("user-0007")
+    assert user.role == UserRole.MEMBER
+    assert is_hashed(password)
+    assert await given_login_manager.login(LoginRequest("user-0007", "password-7"))
+
+
+async def test_import_with_process_pool(tmp_path, given_user_repository):
+    fpath = str(tmp_path / "users.csv")
+    write_rows(fpath, given_rows(20))
+
+    importer = UserImporter(given_user_repository, chunk_size=8, max_workers=2, iterations=ITERATIONS)
+
+    assert (await importer.run(fpath)).rows == 20
+    assert len(await given_user_repository.find_page(None, 100)) == 20
+
+
+async def test_import_resumes_from_checkpoint(tmp_path, given_user_repository):
+    fpath = str(tmp_path / "users.jsonl")
+    checkpoint_path = str(tmp_path / "users.checkpoint")
+    # 3번째 chunk 에 이미 저장된 사용자(user-0000)가 있어서 실패
+    write_rows(fpath, given_rows(20) + given_rows(1))
+    importer = UserImporter(given_user_repository, chunk_size=10, max_workers=0, iterations=ITERATIONS)
+
+    with pytest.raises(DBIntegrityException):
+        await importer.run(fpath, checkpoint_path=checkpoint_path)
+    assert Checkpoint.load(checkpoint_path).rows == 20
+
+    # 잘못된 행을 고치고 다시 실행하면 commit 한 20행 다음부터 저장
+    write_rows(fpath, given_rows(20) + given_rows(5, start=20))
+    result = await importer.run(fpath, checkpoint_path=checkpoint_path)
+
+    assert result.rows == 5
+    assert not os.path.exists(checkpoint_path)
+    assert len(await given_user_repository.find_page(None, 100)) == 25
+
+
+async def test_resume_after_commit_without_checkpoint(tmp_path, given_user_repository):
+    fpath = str(tmp_path / "users.csv")
+    checkpoint_path = str(tmp_path / "users.checkpoint")
+    importer = UserImporter(given_user_repository, chunk_size=10, max_workers=0, iterations=ITERATIONS)
+    write_rows(fpath, given_rows(20))
+    await importer.run(fpath)
+    # 두 번째 chunk 를 commit 한 뒤 checkpoint 를 기록하기 전에 종료된 상황
+    write_rows(fpath, given_rows(25))
+    Checkpoint(os.path.abspath(fpath), 10).save(checkpoint_path)
+
+    result = await importer.run(fpath, checkpoint_path=checkpoint_path)
+
+    assert result.rows == 15
+    assert not os.path.exists(checkpoint_path)
+    assert len(await given_user_repository.find_page(None, 100)) == 25
+
+
+async def test_checkpoint_of_other_file(tmp_path, given_user_repository):
+    fpath = str(tmp_path / "users.csv")
+    checkpoint_path = str(tmp_path / "users.checkpoint")
+    write_rows(fpath, given_rows(1))
+    Checkpoint(str(tmp_path / "other.csv"), 10).save(checkpoint_path)
+
+    with pytest.raises(ValueError):
+        await UserImporter(given_user_repository, max_workers=0).run(fpath, checkpoint_path=checkpoint_path)
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".jsonl"])
+async def test_export_round_trip(tmp_path, suffix, given_user_repository):
+    source = str(tmp_path / f"source{suffix}")
+    exported = str(tmp_path / f"exported{suffix}")
+    write_rows(source, given_rows(23))
+    await UserImporter(given_user_repository, max_workers=0, iterations=ITERATIONS).run(source)
+
+    result = await UserExporter(given_user_repository, chunk_size=5, include_password=True).run(exported)
+
+    rows = list(read_rows(exported))
+    assert result.rows == 23
+    assert [row["account_id"] for row in rows] == [f"user-{i:04d}" for i in range(23)]
+    assert all(is_hashed(row["password"]) for row in rows)
+
+
+async def test_export_without_password(tmp_path, given_user_repository, given_user: User):
+    await given_user_repository.create_user(given_user, "secret")
+    fpath = str(tmp_path / "users.jsonl")
+
+    await UserExporter(given_user_repository).run(fpath)
+
+    [row] = read_rows(fpath)
+    assert "password" not in row
+    assert row["account_id"] == given_user.account_id
+
+
+def test_cli_import_and_export(tmp_path, capsys):
+    db_url = f"sqlite+aiosqlite:///{tmp_path / 'users.db'}"
+    source = str(tmp_path / "users.csv")
+    exported = str(tmp_path / "users.jsonl")
+    write_rows(source, given_rows(12))
+
+    assert main(["--db-type", db_url, "--create-database", "--chunk-size", "5",
+                 "import", source, "--workers", "0", "--iterations", str(ITERATIONS)]) == 0
+    assert main(["--db-type", db_url, "export", exported]) == 0
+
+    assert len(list(read_rows(exported))) == 12
+    assert "import: 12 rows" in capsys.readouterr().out
+
+
+def test_cli_disposes_engine(tmp_path, monkeypatch):
+    from src.abstracts.database.base import SessionManager
+
+    disposed = []
+    dispose = SessionManager.dispose
+
+    async def spy(self):
+        disposed.append(self)
+        await dispose(self)
+    monkeypatch.setattr(SessionManager, "dispose", spy)
+    db_url = f"sqlite+aiosqlite:///{tmp_path / 'users.db'}"
+
+    assert main(["--db-type", db_url, "--create-database", "export", str(tmp_path / "users.jsonl")]) == 0
+    with pytest.raises(FileNotFoundError):
+        main(["--db-type", db_url, "import", str(tmp_path / "missing.csv"), "--workers", "0"])
+
+    assert len(disposed) == 2
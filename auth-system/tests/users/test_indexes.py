@@ -0,0 +1,161 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from src.abstracts.database.base import SessionManager
+from src.domain import User, UserRole
+from src.exceptions import DBIntegrityException
+from src.users.models import UserEntity
+from src.users.repository import UserRepository
+
+
+@pytest.fixture
+async def given_user_repository(given_database):
+    repository = UserRepository(given_database)
+    for i in range(20):
+        await repository.create(User(
+            account_id=f"user-{i}",
+            name=f"사용자{i}",
+            role=UserRole.MEMBER,
+            group=f"group-{i % 3}",
+            email=f"user-{i}@publicai.co.kr",
+            phone="010-1234-1234",
+            signup_at=datetime.now(),
+        ))
+    yield repository
+
+
+async def explain_sqlite(session_manager: SessionManager, stmt) -> str:
+    conn = await session_manager.connect()
+    try:
+        compiled = stmt.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True})
+        rows = (await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}")).all()
+        return " ".join(row[-1] for row in rows)
+    finally:
+        await conn.close()
+
+
+@pytest.mark.parametrize("field, value, index_name", [
+    ("user_role", "MEMBER", "ix_users_user_role"),
+    ("user_group", "group-1", "ix_users_user_group"),
+])
+async def test_find_by_uses_index_on_sqlite(given_user_repository, field, value, index_name):
+    stmt = given_user_repository._find_by_select(**{field: value})
+
+    plan = await explain_sqlite(given_user_repository.session_manager, stmt)
+
+    assert f"USING INDEX {index_name}" in plan
+
+
+@pytest.mark.parametrize("kwargs, index_name", [
+    ({"user_group__in": ["group-1", "group-2"]}, "ix_users_user_group"),
+    ({"signup_at__gte": datetime(2024, 1, 1), "signup_at__lt": datetime(2025, 1, 1)}, "ix_users_signup_at"),
+    ({"account_id__startswith": "user-1"}, "sqlite_autoindex_users_1"),
+])
+async def test_find_by_operators_use_index_on_sqlite(given_user_repository, kwargs, index_name):
+    stmt = given_user_repository._find_by_select(**kwargs)
+
+    plan = await explain_sqlite(given_user_repository.session_manager, stmt)
+
+    assert f"SEARCH users USING INDEX {index_name}" in plan
+
+
+async def test_find_by_order_by_uses_index_on_sqlite(given_user_repository):
+    stmt = given_user_repository._find_by_select(order_by="-signup_at", limit=10)
+
+    plan = await explain_sqlite(given_user_repository.session_manager, stmt)
+
+    # index 순서대로 읽기 때문에 따로 정렬하지 않습니다.
+    assert "USING INDEX ix_users_signup_at" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+async def test_find_by_startswith(given_user_repository):
+    users = await given_user_repository.find_by(account_id__startswith="user-1", order_by="account_id")
+
+    assert [user.account_id for user in users] == ["user-1"] + [f"user-{i}" for i in range(10, 20)]
+
+
+async def test_find_by_email_uses_index_on_sqlite(given_user_repository):
+    stmt = given_user_repository._find_by_email_select("USER-1@publicai.co.kr")
+
+    plan = await explain_sqlite(given_user_repository.session_manager, stmt)
+
+    assert "USING INDEX ux_users_user_email_lower" in plan
+
+
+@pytest.mark.parametrize("field", ["user_role", "user_group"])
+def test_find_by_filter_matches_index_on_postgresql(field):
+    """PostgreSQL 은 서버 없이 plan 을 볼 수 없으므로, index 컬럼과 find_by 조건이 같은 식인지 확인"""
+    index = next(index for index in UserEntity.__table__.indexes if index.name == f"ix_users_{field}")
+    ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+    stmt = UserRepository(None)._find_by_select(**{field: "x"})
+    where = str(stmt.whereclause.compile(dialect=postgresql.dialect()))
+
+    assert f"ON users ({field})" in ddl
+    assert where.startswith(f"users.{field} = %({field}_1)s")
+
+
+def test_find_by_email_matches_index_on_postgresql():
+    index = next(index for index in UserEntity.__table__.indexes if index.name == "ux_users_user_email_lower")
+    ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+    stmt = UserRepository(None)._find_by_email_select("x")
+    where = str(stmt.whereclause.compile(dialect=postgresql.dialect()))
+
+    assert "CREATE UNIQUE INDEX ux_users_user_email_lower ON users (lower(user_email))" in ddl
+    assert where.startswith("lower(users.user_email) = ")
+
+
+async def test_find_by_email_is_case_insensitive(given_user_repository):
+    user = await given_user_repository.find_by_email("USER-3@PublicAI.co.kr")
+
+    assert user.account_id == "user-3"
+
+
+async def test_create_indexes_on_existing_database(given_auth_settings):
+    session_manager = SessionManager(given_auth_settings)
+    conn = await session_manager.connect()
+    await conn.exec_driver_sql(
+        "CREATE TABLE users (account_id VARCHAR PRIMARY KEY, password VARCHAR, username VARCHAR, "
+        "user_group VARCHAR, user_role VARCHAR, user_email VARCHAR, user_phone VARCHAR, signup_at DATETIME)"
+    )
+    await conn.commit()
+    await conn.close()
+
+    created = await session_manager.create_indexes()
+
+    assert set(created) == {
+        "ix_users_user_role", "ix_users_user_group", "ix_users_signup_at", "ux_users_user_email_lower",
+    }
+    assert await session_manager.create_indexes() == []
+
+
+async def test_create_indexes_with_duplicated_email(given_auth_settings):
+    session_manager = SessionManager(given_auth_settings)
+    conn = await session_manager.connect()
+    await conn.exec_driver_sql(
+        "CREATE TABLE users (account_id VARCHAR PRIMARY KEY, password VARCHAR, username VARCHAR, "
+        "user_group VARCHAR, user_role VARCHAR, user_email VARCHAR, user_phone VARCHAR, signup_at DATETIME)"
+    )
+    await conn.exec_driver_sql(
+        "INSERT INTO users (account_id, user_email) VALUES ('a', 'cm@paip.kr'), ('b', 'CM@paip.kr')"
+    )
+    await conn.commit()
+    await conn.close()
+
+    with pytest.raises(DBIntegrityException):
+        await session_manager.create_indexes()
+
+
+def test_startswith_matches_index_on_postgresql():
+    """prefix 범위는 COLLATE "C" 로 비교하고, 같은 식의 index 가 PostgreSQL 에만 있어야 합니다."""
+    index = next(index for index in UserEntity.__table__.indexes if index.name == "ix_users_account_id_c")
+    ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+    stmt = UserRepository(None)._find_by_select(account_id__startswith="user-")
+    where = str(stmt.whereclause.compile(dialect=postgresql.dialect()))
+
+    assert 'ON users ((account_id COLLATE "C"))' in ddl
+    assert where.startswith('users.account_id COLLATE "C" >= ')
+    assert index._ddl_if.dialect == "postgresql"
@@ -0,0 +1,117 @@
+import asyncio
+from dataclasses import replace
+
+import pytest
+
+from src.domain import LoginRequest, Token, UserRole
+from src.exceptions import AlreadyExistsException, NotFoundException, OverloadedException, UnAuthorizedException
+from src.metrics import DB_SESSION_SECONDS, LOGIN_RESULTS
+from src.users.login_manager import LOGIN_BUDGET, LoginManager, default_limiters
+from src.users.password import is_hashed
+from src.users.repository import UserRepository
+
+
+@pytest.fixture(autouse=True)
+def clear_login_results():
+    LOGIN_RESULTS.clear()
+
+
+async def test_sign_up_and_login(given_login_manager, given_user, given_token_manager):
+    await given_login_manager.sign_up(given_user, "password")
+
+    token = await given_login_manager.login(LoginRequest(given_user.account_id, "password"))
+
+    payload = given_token_manager.verify_access_token(token.access)
+    assert payload["account_id"] == given_user.account_id
+    assert LOGIN_RESULTS.value("sign_up", "success") == 1
+    assert LOGIN_RESULTS.value("login", "success") == 1
+
+
+async def test_sign_up_duplicate(given_login_manager, given_user):
+    await given_login_manager.sign_up(given_user, "password")
+
+    with pytest.raises(AlreadyExistsException):
+        await given_login_manager.sign_up(given_user, "password")
+    assert LOGIN_RESULTS.value("sign_up", "AlreadyExistsException") == 1
+
+
+async def test_sign_up_duplicate_does_not_rollback(given_login_manager, given_user, caplog):
+    await given_login_manager.sign_up(given_user, "password")
+    DB_SESSION_SECONDS.clear()
+
+    with pytest.raises(AlreadyExistsException):
+        await given_login_manager.sign_up(replace(given_user, name="다른 사람"), "other")
+    assert DB_SESSION_SECONDS.count("default", "error") == 0
+    assert "rollback" not in caplog.text
+
+
+async def test_sign_up_concurrently(given_file_database, given_token_manager, given_user):
+    login_manager = LoginManager(UserRepository(given_file_database), given_token_manager, password_iterations=1000)
+    same = [login_manager.sign_up(given_user, f"password{i}") for i in range(20)]
+    distinct = [login_manager.sign_up(replace(given_user, account_id=f"user-{i}", email=f"user-{i}@paip.kr"), "pw")
+                for i in range(20)]
+
+    results = await asyncio.gather(*same, *distinct, return_exceptions=True)
+
+    same_results, distinct_results = results[:20], results[20:]
+    assert sum(isinstance(result, Token) for result in same_results) == 1
+    assert all(isinstance(result, AlreadyExistsException) for result in same_results if not isinstance(result, Token))
+    assert all(isinstance(result, Token) for result in distinct_results)
+    assert await login_manager.user_repository.count() == 21
+
+
+async def test_login_with_wrong_password(given_login_manager, given_user):
+    await given_login_manager.sign_up(given_user, "password")
+
+    with pytest.raises(NotFoundException):
+        await given_login_manager.login(LoginRequest(given_user.account_id, "wrong"))
+    assert LOGIN_RESULTS.value("login", "NotFoundException") == 1
+
+
+async def test_login_withdrawal_user(given_login_manager, given_user):
+    given_user.role = UserRole.WITHDRAWAL
+    await given_login_manager.sign_up(given_user, "password")
+
+    with pytest.raises(UnAuthorizedException):
+        await given_login_manager.login(LoginRequest(given_user.account_id, "password"))
+    assert LOGIN_RESULTS.value("login", "UnAuthorizedException") == 1
+
+
+async def test_refresh(given_login_manager, given_user):
+    token = await given_login_manager.sign_up(given_user, "password")
+
+    new_token = await given_login_manager.refresh(token.refresh)
+
+    assert new_token.access
+    assert LOGIN_RESULTS.value("refresh", "success") == 1
+
+
+async def test_sign_up_stores_hashed_password(given_login_manager, given_user_repository, given_user):
+    await given_login_manager.sign_up(given_user, "password")
+
+    _, stored = await given_user_repository.find_with_password(given_user.account_id)
+
+    assert is_hashed(stored)
+    assert "password" not in stored
+
+
+async def test_login_with_plain_password_saved_before_hashing(given_login_manager, given_user_repository, given_user):
+    await given_user_repository.create_user(given_user, "password")
+
+    assert await given_login_manager.login(LoginRequest(given_user.account_id, "password"))
+    with pytest.raises(NotFoundException):
+        await given_login_manager.login(LoginRequest(given_user.account_id, "wrong"))
+
+
+async def test_login_budgets_are_separate(given_user_repository, given_token_manager, given_user):
+    limiters = default_limiters()
+    login_manager = LoginManager(given_user_repository, given_token_manager, password_iterations=1000,
+                                 limiters=limiters)
+    token = await login_manager.sign_up(given_user, "password")
+    limiters[LOGIN_BUDGET].in_flight = int(limiters[LOGIN_BUDGET].limit)
+
+    with pytest.raises(OverloadedException):
+        await login_manager.login(LoginRequest(given_user.account_id, "password"))
+    assert await login_manager.refresh(token.refresh)
+    # 거절한 요청은 처리 결과로 기록하지 않습니다.
+    assert LOGIN_RESULTS.value("login", "OverloadedException") == 0
@@ -0,0 +1,32 @@
+from src.users.password import hash_password, hash_passwords, is_hashed, verify_password
+
+
+def test_hash_and_verify():
+    stored = hash_password("password", iterations=1000)
+
+    assert is_hashed(stored)
+    assert stored.split("$")[1] == "1000"
+    assert verify_password("password", stored)
+    assert not verify_password("wrong", stored)
+
+
+def test_hash_uses_random_salt():
+    assert hash_password("password", iterations=1000) != hash_password("password", iterations=1000)
+
+
+def test_hash_passwords():
+    hashed = hash_passwords(["a", "b"], iterations=1000)
+
+    assert verify_password("a", hashed[0])
+    assert verify_password("b", hashed[1])
+
+
+def test_verify_plain_password_saved_before_hashing():
+    assert verify_password("password", "password")
+    assert not verify_password("password", "other")
+    assert not verify_password(None, "password")
+    assert not verify_password("password", None)
+
+
+def test_verify_broken_hash():
+    assert not verify_password("password", "pbkdf2_sha256$broken")
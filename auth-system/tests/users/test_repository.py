@@ -0,0 +1,75 @@
+from dataclasses import replace
+
+from sqlalchemy import text
+
+from src.domain import UserRole, UserAuth
+
+
+async def test_find_user_auth(given_user_repository, given_user):
+    await given_user_repository.create(given_user)
+
+    user_auth = await given_user_repository.find_user_auth(given_user.account_id)
+
+    assert user_auth == UserAuth(account_id="paicm", role=UserRole.ADMIN, group="paip")
+    assert user_auth == given_user.to_user_auth()
+
+
+async def test_find_user_auth_not_found(given_user_repository, given_user):
+    await given_user_repository.create(given_user)
+
+    assert await given_user_repository.find_user_auth("unknown") is None
+
+
+async def test_find_user_auths_by_group(given_user_repository, given_user):
+    await given_user_repository.create(given_user)
+
+    user_auths = await given_user_repository.find_user_auths(user_group="paip")
+
+    assert [user_auth.account_id for user_auth in user_auths] == ["paicm"]
+
+
+async def test_count_by_role(given_user_repository, given_user):
+    await given_user_repository.create(given_user)
+    await given_user_repository.create(replace(given_user, account_id="kim", email="kim@publicai.co.kr",
+                                               role=UserRole.MEMBER))
+    await given_user_repository.create(replace(given_user, account_id="lee", email="lee@publicai.co.kr",
+                                               role=UserRole.MEMBER))
+
+    assert await given_user_repository.count_by_role() == {UserRole.ADMIN: 1, UserRole.MEMBER: 2}
+    assert await given_user_repository.count_by_role(user_group="other") == {}
+
+
+async def test_count_by_role_merges_same_role(given_user_repository, given_user):
+    # 저장된 값이 달라도 같은 UserRole 로 읽히는 사용자는 합쳐서 셉니다.
+    users = [
+        (replace(given_user, account_id=f"user-{i}", email=f"user-{i}@publicai.co.kr"), None) for i in range(4)
+    ]
+    await given_user_repository.create_users(users)
+    async with given_user_repository.session_manager.session() as session:
+        await session.execute(text("UPDATE users SET user_role = 'admin' WHERE account_id = 'user-1'"))
+        await session.execute(text("UPDATE users SET user_role = 'bogus' WHERE account_id = 'user-2'"))
+        await session.execute(text("UPDATE users SET user_role = NULL WHERE account_id = 'user-3'"))
+        await session.commit()
+
+    assert await given_user_repository.count_by_role() == {UserRole.ADMIN: 2, UserRole.UNKNOWN: 2}
+
+
+async def test_create_users_with_null_columns(given_user_repository, given_user):
+    # 이메일, 전화번호, 비밀번호가 없는 사용자가 섞여 있어도 모두 그대로 저장합니다.
+    no_contact = replace(given_user, account_id="no-contact", email=None, phone=None)
+    users = [(given_user, "hash"), (no_contact, None), (replace(given_user, account_id="other", email="o@x.kr"), "hash")]
+
+    await given_user_repository.create_users(users)
+
+    assert await given_user_repository.find_with_password("paicm") == (given_user, "hash")
+    assert await given_user_repository.find_with_password("no-contact") == (no_contact, None)
+
+
+async def test_create_users_if_absent(given_user_repository, given_user):
+    await given_user_repository.create_users([(given_user, "hash")])
+    other = replace(given_user, account_id="other", email="other@publicai.co.kr")
+
+    await given_user_repository.create_users([(given_user, "changed"), (other, None)], if_absent=True)
+
+    assert await given_user_repository.find_with_password("paicm") == (given_user, "hash")
+    assert await given_user_repository.find_with_password("other") == (other, None)
@@ -0,0 +1,49 @@
+import pytest
+
+from src.exceptions import ExpiredTokenException, InvalidTokenException, VerifierException
+from src.permissions import Permission
+from src.verifier.protocol import (
+    EXPIRED, INVALID, OK, SERVER_ERROR, VERIFY_ACCESS, ProtocolError, VerifiedToken,
+    decode_response, encode_claims, encode_request, encode_response, parse_frames,
+)
+
+
+def test_claims_round_trip():
+    payload = {"account_id": "paicm", "user_role": "SIDECAR", "user_group": "paip", "tenant": "acme",
+               "sid": "session-1", "perm": int(Permission.VERIFY_TOKEN), "exp": 1700000000.5}
+
+    verified = decode_response(OK, encode_claims(payload))
+
+    assert verified == VerifiedToken("paicm", "SIDECAR", "paip", "acme", int(Permission.VERIFY_TOKEN),
+                                     1700000000.5, "session-1")
+
+
+def test_claims_without_optional_claims():
+    verified = decode_response(OK, encode_claims({"account_id": "paicm", "user_role": "MEMBER", "exp": 1.0}))
+
+    assert verified.tenant == "default"
+    assert verified.session_id is None
+    assert verified.permissions != 0
+
+
+def test_error_responses():
+    assert isinstance(decode_response(EXPIRED, "만료".encode()), ExpiredTokenException)
+    assert decode_response(INVALID, "실패".encode()).message == "실패"
+    # daemon 오류는 잘못된 토큰과 구분합니다.
+    assert not isinstance(decode_response(SERVER_ERROR, "오류".encode()), InvalidTokenException)
+    assert isinstance(decode_response(SERVER_ERROR, "오류".encode()), VerifierException)
+
+
+def test_parse_frames_keeps_partial_frame():
+    data = encode_request("a.b.c") + encode_request("d.e.f")
+    buffer = bytearray(data[:-2])
+
+    frames, consumed = parse_frames(buffer)
+
+    assert frames == [(VERIFY_ACCESS, b"a.b.c")]
+    assert consumed == len(encode_request("a.b.c"))
+
+
+def test_parse_frames_rejects_large_frame():
+    with pytest.raises(ProtocolError):
+        parse_frames(bytearray(encode_response(OK, b"x" * 100)), max_frame=10)
@@ -0,0 +1,118 @@
+import asyncio
+import os
+import stat
+
+import pytest
+
+from src.domain import TokenType
+from src.exceptions import ExpiredTokenException, InvalidTokenException, VerifierException
+from src.metrics import VERIFIER_REQUESTS
+from src.tokens.manager import create_jwt_token
+from src.verifier.client import VerifierClient
+from src.verifier.protocol import BAD_REQUEST, encode_request
+from src.verifier.server import VerificationServer
+
+
+@pytest.fixture
+async def given_server(tmp_path, given_token_manager):
+    server = VerificationServer(given_token_manager.verify_access_token, str(tmp_path / "verify.sock"), max_frame=4096)
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest.fixture
+async def given_client(given_server):
+    async with VerifierClient(given_server.path) as client:
+        yield client
+
+
+async def test_server_socket(given_server):
+    assert stat.S_IMODE(os.stat(given_server.path).st_mode) == 0o660
+
+    await given_server.stop()
+
+    assert not os.path.exists(given_server.path)
+
+
+async def test_verify(given_client, given_token_manager, given_user):
+    token = given_token_manager.generate_token(given_user)
+
+    verified = await given_client.verify(token.access)
+
+    assert (verified.account_id, verified.role, verified.tenant) == (given_user.account_id, "ADMIN", "default")
+    assert verified.session_id == token.session_id
+
+
+async def test_verify_failures(given_client, given_private_pem):
+    VERIFIER_REQUESTS.clear()
+    expired = create_jwt_token({"account_id": "paicm"}, TokenType.ACCESS, given_private_pem, -10)
+
+    with pytest.raises(ExpiredTokenException):
+        await given_client.verify(expired)
+    with pytest.raises(InvalidTokenException):
+        await given_client.verify("not a token")
+
+    assert VERIFIER_REQUESTS.value("expired") == 1
+    assert VERIFIER_REQUESTS.value("invalid") == 1
+
+
+async def test_verify_many_keeps_order(given_client, given_token_manager, given_user):
+    tokens = [given_token_manager.generate_token(given_user).access for _ in range(50)]
+    tokens[10] = "not a token"
+
+    results = await given_client.verify_many(tokens)
+
+    assert isinstance(results[10], InvalidTokenException)
+    assert [result.account_id for i, result in enumerate(results) if i != 10] == [given_user.account_id] * 49
+
+
+async def test_concurrent_requests_share_connection(given_client, given_token_manager, given_user):
+    tokens = [given_token_manager.generate_token(given_user) for _ in range(20)]
+
+    results = await asyncio.gather(*(given_client.verify(token.access) for token in tokens))
+
+    assert [result.session_id for result in results] == [token.session_id for token in tokens]
+
+
+async def test_unexpected_error_keeps_connection(tmp_path, given_token_manager, given_user):
+    VERIFIER_REQUESTS.clear()
+    tokens = {name: given_token_manager.generate_token(given_user).access for name in ("a", "c")}
+
+    def verify(token):
+        if token == "boom":
+            raise TimeoutError("DB 응답이 없습니다.")
+        return given_token_manager.verify_access_token(tokens[token])
+
+    server = VerificationServer(verify, str(tmp_path / "verify.sock"))
+    await server.start()
+    try:
+        async with VerifierClient(server.path) as client:
+            results = await client.verify_many(["a", "boom", "c"])
+            # 오류가 난 요청만 실패하고, 같은 연결로 계속 요청할 수 있습니다.
+            with pytest.raises(VerifierException):
+                await client.verify("boom")
+            assert (await client.verify("a")).account_id == given_user.account_id
+    finally:
+        await server.stop()
+
+    assert [type(result) for result in results] == [type(results[0]), VerifierException, type(results[0])]
+    assert results[0].account_id == results[2].account_id == given_user.account_id
+    assert VERIFIER_REQUESTS.value("error") == 2
+
+
+async def test_large_frame_closes_connection(given_server):
+    reader, writer = await asyncio.open_unix_connection(given_server.path)
+    writer.write(encode_request("x" * 5000))
+
+    response = await reader.read()
+
+    assert response[0] == BAD_REQUEST
+    writer.close()
+
+
+async def test_stop_closes_connections(given_server, given_client, given_token_manager, given_user):
+    await given_server.stop()
+
+    with pytest.raises(ConnectionError):
+        await given_client.verify(given_token_manager.generate_token(given_user).access)
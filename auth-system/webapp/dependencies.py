@@ -0,0 +1,96 @@
+from functools import lru_cache
+from typing import Callable, Dict, Optional
+
+import jwt
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from src.abstracts.database.base import SessionManager
+from src.exceptions import ForbiddenException, InvalidTokenException
+from src.health import HealthChecker
+from src.permissions import Permission, check_permissions, combine, permissions_from_payload
+from src.sessions.registry import SessionRegistry
+from src.sessions.repository import SessionRepository
+from src.settings import get_settings
+from src.tenants import TenantRegistry
+from src.tokens.manager import TokenManager
+from src.tokens.shared_state import SharedStateReader
+from src.tokens.state_writer import StateWriterClient
+
+bearer = HTTPBearer()
+
+
+@lru_cache
+def get_shared_state() -> Optional[SharedStateReader]:
+    """writer process 가 만든 검증 상태 segment 에 연결합니다. (설정이 없으면 None)"""
+    if name := get_settings().shared_state_name:
+        return SharedStateReader(name)
+    return None
+
+
+@lru_cache
+def get_state_writer_client() -> Optional[StateWriterClient]:
+    """세션 폐기를 검증 상태 writer daemon 으로 보내는 client (설정이 없으면 None)"""
+    if path := get_settings().shared_state_socket:
+        return StateWriterClient(path)
+    return None
+
+
+@lru_cache
+def get_tenant_registry() -> TenantRegistry:
+    return TenantRegistry(get_settings(), shared_state=get_shared_state())
+
+
+def get_token_manager() -> TokenManager:
+    """기본 tenant 의 TokenManager"""
+    return get_tenant_registry().token_manager()
+
+
+def get_session_manager() -> SessionManager:
+    """기본 tenant 의 SessionManager"""
+    return get_tenant_registry().session_manager()
+
+
+@lru_cache
+def get_session_registry() -> SessionRegistry:
+    """기본 tenant 의 SessionRegistry, 폐기한 세션은 writer daemon 을 거쳐 모든 worker 가 바로 거절합니다."""
+    return SessionRegistry(SessionRepository(get_session_manager()), shared_state=get_state_writer_client(),
+                           revocation_ttl=get_settings().access_token_lifetime)
+
+
+@lru_cache
+def get_health_checker() -> HealthChecker:
+    return HealthChecker(get_session_manager())
+
+
+def get_token_payload(
+        credentials: HTTPAuthorizationCredentials = Depends(bearer),
+        tenant_registry: TenantRegistry = Depends(get_tenant_registry),
+) -> Dict:
+    """Authorization 헤더의 access token 을 토큰의 tenant key 로 검증하고 payload 를 반환합니다."""
+    try:
+        return tenant_registry.verify_access_token(credentials.credentials)
+    except InvalidTokenException as e:
+        raise HTTPException(status.HTTP_401_UNAUTHORIZED, e.message)
+    except jwt.exceptions.InvalidTokenError:
+        raise HTTPException(status.HTTP_401_UNAUTHORIZED, "잘못된 토큰 입니다")
+
+
+def require_permissions(*permissions: Permission) -> Callable[..., Dict]:
+    """access token 의 perm claim 에 permissions 가 모두 있어야 통과하는 dependency 를 만듭니다.
+    ```
+    @router.delete("/users/{account_id}")
+    def delete_user(payload: Dict = Depends(require_permissions(Permission.MANAGE_USERS))):
+        ...
+    ```
+    """
+    required = combine(permissions)
+
+    def dependency(payload: Dict = Depends(get_token_payload)) -> Dict:
+        try:
+            check_permissions(permissions_from_payload(payload), required)
+        except ForbiddenException as e:
+            raise HTTPException(status.HTTP_403_FORBIDDEN, e.message)
+        return payload
+
+    return dependency
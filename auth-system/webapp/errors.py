@@ -0,0 +1,19 @@
+import math
+
+from fastapi import Request, status
+from fastapi.responses import JSONResponse
+
+from src.exceptions import OverloadedException
+
+
+async def overloaded_exception_handler(request: Request, exc: OverloadedException) -> JSONResponse:
+    """limiter 가 거절한 요청을 503 과 Retry-After(초) header 로 응답합니다.
+    ```
+    app.add_exception_handler(OverloadedException, overloaded_exception_handler)
+    ```
+    """
+    return JSONResponse(
+        {"detail": exc.message},
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": str(max(1, math.ceil(exc.retry_after)))},
+    )
@@ -0,0 +1,42 @@
+import asyncio
+import signal
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+
+from src.sessions.repository import SessionRepository
+from src.users.repository import UserRepository
+from src.warmup import warmup
+from webapp.dependencies import (
+    get_health_checker, get_session_manager, get_session_registry, get_settings, get_state_writer_client,
+    get_tenant_registry, get_token_manager,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """시작할 때 warmup 을 실행하고, 끝나면 readiness probe 가 성공하도록 표시합니다.
+    SIGHUP 을 받으면 모든 tenant 의 private key 파일을 다시 읽습니다. (재시작 없이 key 교체)
+    세션 폐기를 보낼 검증 상태 writer daemon 연결과 SessionRegistry 도 시작하고, 끝나면 멈춥니다.
+    ```
+    app = FastAPI(lifespan=lifespan)
+    ```
+    """
+    session_manager = get_session_manager()
+    asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, get_tenant_registry().reload_keys)
+    app.state.warmup_report = await warmup(
+        session_manager,
+        get_settings().db_warmup_connections,
+        get_token_manager(),
+        [UserRepository(session_manager), SessionRepository(session_manager)],
+    )
+    if (state_writer_client := get_state_writer_client()) is not None:
+        await state_writer_client.start()
+    session_registry = get_session_registry()
+    await session_registry.start()
+    get_health_checker().mark_warmed_up()
+    yield
+    await session_registry.stop()
+    if state_writer_client is not None:
+        await state_writer_client.stop()
+    await get_tenant_registry().dispose()
@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+
+from src.health import HealthChecker, HealthStatus
+from webapp.dependencies import get_health_checker
+
+router = APIRouter(prefix="/health", tags=["health"])
+
+
+def _response(status: HealthStatus) -> JSONResponse:
+    return JSONResponse(status.to_dict(), status_code=200 if status.ok else 503)
+
+
+@router.get("/live")
+async def get_liveness(health_checker: HealthChecker = Depends(get_health_checker)) -> JSONResponse:
+    """프로세스가 살아 있는지 반환합니다. (DB 상태와 관계없이 200)"""
+    return _response(await health_checker.liveness())
+
+
+@router.get("/ready")
+async def get_readiness(health_checker: HealthChecker = Depends(get_health_checker)) -> JSONResponse:
+    """요청을 받을 준비가 되었는지 반환합니다. (warmup 전이거나 DB 에 접속할 수 없으면 503)"""
+    return _response(await health_checker.readiness())
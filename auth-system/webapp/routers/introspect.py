@@ -0,0 +1,31 @@
+from typing import Dict
+
+import jwt
+from fastapi import APIRouter, Depends
+from pydantic import BaseModel
+
+from src.exceptions import InvalidTokenException
+from src.permissions import Permission
+from src.tenants import TenantRegistry
+from webapp.dependencies import get_tenant_registry, require_permissions
+
+router = APIRouter(tags=["introspect"])
+
+
+class IntrospectRequest(BaseModel):
+    token: str
+
+
+@router.post("/introspect")
+def introspect(
+        request: IntrospectRequest,
+        caller: Dict = Depends(require_permissions(Permission.VERIFY_TOKEN)),
+        tenant_registry: TenantRegistry = Depends(get_tenant_registry),
+) -> Dict:
+    """token 이 유효하면 active 와 payload 를, 아니면 active=false 를 반환합니다. (RFC 7662 형식)
+    같은 host 의 sidecar 는 HTTP 대신 Unix domain socket 검증 daemon(src.verifier)을 사용하는 것이 빠릅니다.
+    """
+    try:
+        return {"active": True, **tenant_registry.verify_access_token(request.token)}
+    except (InvalidTokenException, jwt.exceptions.InvalidTokenError):
+        return {"active": False}